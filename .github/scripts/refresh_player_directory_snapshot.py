@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.metadata
+import json
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from nbadb.extract.registry import registry
+from nbadb.orchestrate import player_directory_snapshot as snapshot
+from nbadb.orchestrate.seasons import season_string
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+
+async def fetch_player_directory(*, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> pl.DataFrame:
+    """Fetch the unscoped CommonAllPlayers directory without the static fallback.
+
+    The static ``nba_api`` player list carries no year windows, so a snapshot
+    built from it would silently drop every player; fail instead.
+    """
+    extractor = registry.get("common_all_players")()
+    return await extractor.extract(
+        is_only_current_season=0,
+        allow_static_fallback=False,
+        timeout=timeout,
+    )
+
+
+def refresh_snapshot(directory: pl.DataFrame, *, output_path: Path) -> dict[str, Any]:
+    """Write the snapshot parquet and return the values the module constants must match."""
+    if {"person_id", "from_year", "to_year"} - set(directory.columns):
+        msg = "common_all_players response is missing person_id/from_year/to_year"
+        raise ValueError(msg)
+    windows = snapshot.write_player_year_windows(directory, output_path)
+    complete_through_year = int(windows.select(pl.col("to_year").max()).item())
+    return {
+        "path": str(output_path),
+        "rows": windows.height,
+        "dropped_rows": directory.height - windows.height,
+        "SNAPSHOT_NBA_API_VERSION": importlib.metadata.version("nba_api"),
+        "SNAPSHOT_COMPLETE_THROUGH_SEASON": season_string(complete_through_year),
+        "SNAPSHOT_COMPLETE_THROUGH_YEAR": complete_through_year,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Regenerate the CommonAllPlayers year-window snapshot parquet."
+    )
+    parser.add_argument("--output-path", type=Path, default=snapshot.SNAPSHOT_PATH)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SECONDS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    directory = asyncio.run(fetch_player_directory(timeout=args.timeout))
+    summary = refresh_snapshot(directory, output_path=args.output_path)
+    print(json.dumps(summary, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,7 @@ from __future__ import annotations
 import chainlit as cl
 
 from nbadb.chat.runtime import ChatRuntime, build_runtime
+from nbadb.chat.sql import DEFAULT_PAGE_SIZE
 
 
 @cl.on_chat_start
@@ -48,13 +49,23 @@ async def on_message(message: cl.Message) -> None:
         await cl.Message(content=f"Saved finding: {record.title}").send()
         return
 
-    response = runtime.ask(content, limit=25)
+    response = await runtime.ask_async(content, limit=25, session_id=cl.context.session.id)
     cl.user_session.set("last_response", response)
     elements: list[cl.Element] = []
     if response.sql:
         elements.append(cl.Text(name="SQL", content=response.sql, display="side"))
-    if response.rows:
-        table = response.render_text().splitlines()
-        elements.append(cl.Text(name="Rows", content="\n".join(table), display="inline"))
+    if response.row_count:
+        table = response.render_text(limit=DEFAULT_PAGE_SIZE)
+        elements.append(cl.Text(name="Rows", content=table, display="inline"))
 
-    await cl.Message(content=response.render_text(verbose=True), elements=elements).send()
+    await cl.Message(
+        content=response.render_text(verbose=True, limit=DEFAULT_PAGE_SIZE),
+        elements=elements,
+    ).send()
+
+
+@cl.on_chat_end
+async def on_chat_end() -> None:
+    runtime = cl.user_session.get("runtime")
+    if isinstance(runtime, ChatRuntime):
+        runtime.cancel_session(cl.context.session.id)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -11,8 +12,8 @@ server = FastMCP(SERVER_NAME)
 
 
 @server.tool()
-def search_catalog(query: str, limit: int = 12) -> list[dict[str, Any]]:
-    return catalog_tools.search_catalog(query, limit=limit)
+async def search_catalog(query: str, limit: int = 12) -> list[dict[str, Any]]:
+    return await asyncio.to_thread(catalog_tools.search_catalog, query, limit=limit)
 
 
 if __name__ == "__main__":
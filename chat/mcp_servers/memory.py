@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -12,13 +13,14 @@ server = FastMCP(SERVER_NAME)
 
 
 @server.tool()
-def remember_preference(
+async def remember_preference(
     key: str,
     value: Any,
     session_id: str | None = None,
     notes: str | None = None,
 ) -> dict[str, Any]:
-    record = memory_tools.remember_preference(
+    record = await asyncio.to_thread(
+        memory_tools.remember_preference,
         MemoryStore(),
         key,
         value,
@@ -29,17 +31,19 @@ def remember_preference(
 
 
 @server.tool()
-def list_preferences() -> list[dict[str, Any]]:
-    return [record.model_dump() for record in memory_tools.list_preferences(MemoryStore())]
+async def list_preferences() -> list[dict[str, Any]]:
+    records = await asyncio.to_thread(memory_tools.list_preferences, MemoryStore())
+    return [record.model_dump() for record in records]
 
 
 @server.tool()
-def save_trajectory(
+async def save_trajectory(
     archetype: str,
     payload: dict[str, Any],
     session_id: str | None = None,
 ) -> dict[str, Any]:
-    record = memory_tools.save_trajectory(
+    record = await asyncio.to_thread(
+        memory_tools.save_trajectory,
         MemoryStore(),
         archetype,
         payload,
@@ -49,19 +53,23 @@ def save_trajectory(
 
 
 @server.tool()
-def search_trajectories(
+async def search_trajectories(
     query: str,
     limit: int = 10,
 ) -> list[dict[str, Any]]:
-    return [
-        record.model_dump()
-        for record in memory_tools.search_trajectories(MemoryStore(), query, limit=limit)
-    ]
+    records = await asyncio.to_thread(
+        memory_tools.search_trajectories,
+        MemoryStore(),
+        query,
+        limit=limit,
+    )
+    return [record.model_dump() for record in records]
 
 
 @server.tool()
-def forget_memory(key: str, session_id: str, confirm: bool = False) -> bool:
-    return memory_tools.forget_memory(
+async def forget_memory(key: str, session_id: str, confirm: bool = False) -> bool:
+    return await asyncio.to_thread(
+        memory_tools.forget_memory,
         MemoryStore(),
         key,
         session_id=session_id,
@@ -1,54 +1,199 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import duckdb
 
 from nbadb.chat.catalog import (
     SemanticCatalog,
     default_catalog,
+    export_table_index,
     load_agent_catalog_export,
 )
+from nbadb.core.config import get_settings
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Mapping
 
 _SCD2_TABLES = frozenset({"dim_player", "dim_team_history"})
 _SCD2_GUIDANCE = {
     "dim_player": "Filter is_current = TRUE when joining for present-day player names.",
     "dim_team_history": "Filter is_current = TRUE when joining for present-day team identity.",
 }
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({"a", "an", "and", "by", "for", "in", "of", "on", "the", "to", "who"})
+
+# One prompt token is approximated as four characters.
+_CHARS_PER_TOKEN = 4
+
+_COLUMNS_SQL = (
+    "SELECT table_name, column_name, data_type "
+    "FROM information_schema.columns "
+    "WHERE table_schema = 'main' "
+    "AND table_name NOT LIKE '\\_%' ESCAPE '\\' "
+    "ORDER BY table_name, ordinal_position"
+)
+
+
+def _tokens(value: str) -> frozenset[str]:
+    normalized = value.casefold().replace("_", " ").replace("-", " ")
+    return frozenset(_TOKEN_PATTERN.findall(normalized)) - _STOPWORDS
+
+
+@dataclass(frozen=True)
+class TableSummary:
+    """Compact, pre-tokenized description of one warehouse table."""
+
+    name: str
+    columns: tuple[tuple[str, str], ...]
+    name_tokens: frozenset[str]
+    column_tokens: frozenset[str]
+    intents: tuple[str, ...] = ()
+    grain: str | None = None
+
+    def render(self) -> str:
+        lines = [f"\n{self.name}:"]
+        if self.grain:
+            lines.append(f"  grain: {self.grain}")
+        lines.extend(f"  - {name} ({dtype})" for name, dtype in self.columns)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class SchemaIndex:
+    """Table/column index for one version of the warehouse file."""
+
+    tables: tuple[TableSummary, ...]
+    export: Mapping[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def table_names(self) -> tuple[str, ...]:
+        return tuple(table.name for table in self.tables)
+
+    def get(self, name: str) -> TableSummary | None:
+        for table in self.tables:
+            if table.name == name:
+                return table
+        return None
+
+    def rank(
+        self,
+        question: str | None,
+        *,
+        hinted: tuple[str, ...] = (),
+    ) -> tuple[TableSummary, ...]:
+        """Order tables by relevance to *question*; catalog hints rank first."""
+        if not question:
+            return self.tables
+        question_tokens = _tokens(question)
+        normalized = question.casefold()
+        hint_rank = {table: index for index, table in enumerate(hinted)}
+
+        def score(table: TableSummary) -> tuple[float, str]:
+            value = 0.0
+            if table.name in hint_rank:
+                value += 100.0 - hint_rank[table.name]
+            if any(intent.casefold() in normalized for intent in table.intents):
+                value += 10.0
+            value += 3.0 * len(question_tokens & table.name_tokens)
+            value += 1.0 * len(question_tokens & table.column_tokens)
+            return (-value, table.name)
+
+        return tuple(sorted(self.tables, key=score))
+
+
+def _build_schema_index(duckdb_path: Path) -> SchemaIndex:
+    with duckdb.connect(str(duckdb_path), read_only=True) as conn:
+        rows = conn.execute(_COLUMNS_SQL).fetchall()
+    export = load_agent_catalog_export()
+    export_tables = export_table_index(export)
+    columns_by_table: dict[str, list[tuple[str, str]]] = {}
+    for table_name, column_name, data_type in rows:
+        columns_by_table.setdefault(table_name, []).append((column_name, data_type))
+    summaries: list[TableSummary] = []
+    for table_name in sorted(columns_by_table):
+        columns = tuple(columns_by_table[table_name])
+        metadata = export_tables.get(table_name, {})
+        intents = metadata.get("agent_intents", ())
+        grain = metadata.get("grain")
+        summaries.append(
+            TableSummary(
+                name=table_name,
+                columns=columns,
+                name_tokens=_tokens(table_name),
+                column_tokens=frozenset().union(*(_tokens(name) for name, _ in columns)),
+                intents=tuple(str(intent) for intent in intents)
+                if isinstance(intents, (list, tuple))
+                else (),
+                grain=str(grain) if grain else None,
+            )
+        )
+    return SchemaIndex(tables=tuple(summaries), export=export)
+
+
+@lru_cache(maxsize=8)
+def _cached_schema_index(path: str, mtime_ns: int, size: int) -> SchemaIndex:
+    return _build_schema_index(Path(path))
+
+
+def schema_index(duckdb_path: Path) -> SchemaIndex:
+    """Return the schema index for the current version of *duckdb_path*.
+
+    The index is keyed on the file's mtime and size, so it is built once per
+    warehouse write and every later lookup is a cache hit.
+    """
+    try:
+        stat = duckdb_path.stat()
+    except OSError:
+        return _build_schema_index(duckdb_path)
+    return _cached_schema_index(str(duckdb_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
 
 class SchemaContext:
-    def __init__(self, duckdb_path: Path, catalog: SemanticCatalog | None = None) -> None:
+    def __init__(
+        self,
+        duckdb_path: Path,
+        catalog: SemanticCatalog | None = None,
+        *,
+        max_tokens: int | None = None,
+    ) -> None:
         self._path = duckdb_path
         self._catalog = catalog or default_catalog()
+        self._max_tokens = max_tokens
 
-    def get_tables(self) -> list[str]:
-        from nbadb.core.db import get_user_tables
+    @property
+    def max_tokens(self) -> int:
+        if self._max_tokens is None:
+            self._max_tokens = get_settings().chat_context_max_tokens
+        return self._max_tokens
 
-        with duckdb.connect(str(self._path), read_only=True) as conn:
-            return get_user_tables(conn)
+    def _index(self) -> SchemaIndex:
+        return schema_index(self._path)
+
+    def get_tables(self) -> list[str]:
+        return list(self._index().table_names)
 
     def get_columns(self, table_name: str) -> list[tuple[str, str]]:
-        with duckdb.connect(str(self._path), read_only=True) as conn:
-            result = conn.execute(
-                "SELECT column_name, data_type "
-                "FROM information_schema.columns "
-                "WHERE table_name = ? "
-                "ORDER BY ordinal_position",
-                [table_name],
-            ).fetchall()
-            return [(row[0], row[1]) for row in result]
+        table = self._index().get(table_name)
+        return list(table.columns) if table is not None else []
 
     def build_prompt_context(self, question: str | None = None) -> str:
-        tables = self.get_tables()
-        if not tables:
+        """Render schema context for *question* within the configured token budget.
+
+        Tables are ranked by catalog hints, export intents, and token overlap
+        with the question; tables that do not fit the budget are summarized
+        by name only.
+        """
+        index = self._index()
+        if not index.tables:
             return "No tables found in the database."
         lines: list[str] = ["Available tables and columns:"]
+        hinted: tuple[str, ...] = ()
         if question:
-            export = load_agent_catalog_export()
             entries = self._catalog.relevant_entries(question)
             if entries:
                 lines.append("\nRelevant semantic hints:")
@@ -56,19 +201,55 @@ class SchemaContext:
                     lines.append(f"- {entry.name}: {entry.description}")
                     for caveat in entry.scd2_notes():
                         lines.append(f"  Caveat: {caveat}")
-            export_lines = self._catalog.export_context_lines(question, export=export)
+            export_lines = self._catalog.export_context_lines(question, export=index.export)
             if export_lines:
                 lines.append("\nExport grain context:")
                 for line in export_lines:
                     lines.append(f"- {line}")
-        scd2_present = sorted(_SCD2_TABLES.intersection(tables))
+            hinted = tuple(dict.fromkeys(table for entry in entries for table in entry.tables))
+        scd2_present = sorted(_SCD2_TABLES.intersection(index.table_names))
         if scd2_present:
             lines.append("\nSCD2 join guidance:")
             for table in scd2_present:
                 lines.append(f"- {table}: {_SCD2_GUIDANCE[table]}")
-        for table in tables:
-            cols = self.get_columns(table)
-            col_strs = [f"  - {name} ({dtype})" for name, dtype in cols]
-            lines.append(f"\n{table}:")
-            lines.extend(col_strs)
+
+        budget = self.max_tokens * _CHARS_PER_TOKEN - sum(len(line) + 1 for line in lines)
+        ranked = index.rank(question, hinted=hinted)
+        # Room for the name-only summary, so a rendered table never crowds it out.
+        summary_reserve = len(_omitted_header(len(ranked))) + len(f"\n+{len(ranked)} more")
+        omitted: list[str] = []
+        for position, table in enumerate(ranked):
+            block = table.render()
+            needed = len(block) + 1 + (summary_reserve if position < len(ranked) - 1 else 0)
+            if omitted or needed > budget:
+                omitted.append(table.name)
+                continue
+            lines.append(block)
+            budget -= len(block) + 1
+        if omitted:
+            header = _omitted_header(len(omitted))
+            lines.append(header)
+            lines.append(_fit_names(omitted, budget - len(header) - 2))
         return "\n".join(lines)
+
+
+def _omitted_header(count: int) -> str:
+    return f"\nOther tables ({count}, columns omitted):"
+
+
+def _fit_names(names: list[str], budget: int) -> str:
+    """Join *names* within *budget* characters, ending with ``+N more`` when cut."""
+    joined = ", ".join(names)
+    if len(joined) <= budget:
+        return joined
+    reserve = len(f", +{len(names)} more")
+    shown: list[str] = []
+    used = 0
+    for name in names:
+        cost = len(name) + (2 if shown else 0)
+        if used + cost + reserve > budget:
+            break
+        shown.append(name)
+        used += cost
+    remaining = f"+{len(names) - len(shown)} more"
+    return ", ".join([*shown, remaining])
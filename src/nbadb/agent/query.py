@@ -131,7 +131,18 @@ class QueryAgent:
     def ask(self, question: str, limit: int = 10) -> str:
         return self.ask_result(question, limit=limit).render_text()
 
-    def ask_result(self, question: str, limit: int = 10) -> QueryResponse:
+    def ask_result(
+        self,
+        question: str,
+        limit: int = 10,
+        *,
+        conn: duckdb.DuckDBPyConnection | None = None,
+    ) -> QueryResponse:
+        """Answer *question*, optionally on a caller-owned read-only connection.
+
+        When *conn* is given it is used as-is and left open, so pooled callers
+        such as ``AsyncQueryService`` must configure it read-only themselves.
+        """
         max_rows = _clamp_ask_limit(limit)
         plan = self._match_pattern(question)
         if plan is None:
@@ -154,7 +165,7 @@ class QueryAgent:
                 metadata=self._response_metadata(plan, plan.sql),
             )
         sql = self._guard.wrap_with_limit(plan.sql, max_rows=max_rows)
-        return self._execute(question=question, plan=plan, sql=sql, max_rows=max_rows)
+        return self._execute(question=question, plan=plan, sql=sql, max_rows=max_rows, conn=conn)
 
     def _response_metadata(self, plan: QueryPlan, sql: str) -> dict[str, object]:
         metadata: dict[str, object] = {"sql_hash": _sql_hash(sql)}
@@ -173,37 +184,38 @@ class QueryAgent:
             return _plan_from_entry(entry)
         return None
 
-    def _execute(self, *, question: str, plan: QueryPlan, sql: str, max_rows: int) -> QueryResponse:
+    def _execute(
+        self,
+        *,
+        question: str,
+        plan: QueryPlan,
+        sql: str,
+        max_rows: int,
+        conn: duckdb.DuckDBPyConnection | None = None,
+    ) -> QueryResponse:
         started = perf_counter()
         metadata = self._response_metadata(plan, sql)
         try:
-            with duckdb.connect(str(self._path), read_only=True) as conn:
-                conn.execute("SET enable_external_access = false")
-                dry_run_error = self._guard.dry_run(conn, sql)
-                if dry_run_error:
-                    return QueryResponse(
-                        question=question,
-                        route=plan.route,
-                        sql=sql,
-                        tables=plan.tables,
-                        error=dry_run_error,
-                        max_rows=max_rows,
-                        metadata=metadata,
-                    )
-                result = conn.execute(sql)
-                columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-                elapsed_ms = (perf_counter() - started) * 1000
-                return QueryResponse(
+            if conn is not None:
+                return self._run_query(
+                    conn,
+                    question=question,
+                    plan=plan,
+                    sql=sql,
+                    max_rows=max_rows,
+                    metadata=metadata,
+                    started=started,
+                )
+            with duckdb.connect(str(self._path), read_only=True) as own_conn:
+                own_conn.execute("SET enable_external_access = false")
+                return self._run_query(
+                    own_conn,
                     question=question,
-                    route=plan.route,
+                    plan=plan,
                     sql=sql,
-                    columns=tuple(columns),
-                    rows=tuple(tuple(row) for row in rows),
-                    tables=plan.tables,
                     max_rows=max_rows,
-                    elapsed_ms=elapsed_ms,
                     metadata=metadata,
+                    started=started,
                 )
         except duckdb.Error:
             return QueryResponse(
@@ -215,3 +227,41 @@ class QueryAgent:
                 max_rows=max_rows,
                 metadata=metadata,
             )
+
+    def _run_query(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        *,
+        question: str,
+        plan: QueryPlan,
+        sql: str,
+        max_rows: int,
+        metadata: dict[str, object],
+        started: float,
+    ) -> QueryResponse:
+        dry_run_error = self._guard.dry_run(conn, sql)
+        if dry_run_error:
+            return QueryResponse(
+                question=question,
+                route=plan.route,
+                sql=sql,
+                tables=plan.tables,
+                error=dry_run_error,
+                max_rows=max_rows,
+                metadata=metadata,
+            )
+        result = conn.execute(sql)
+        columns = [desc[0] for desc in result.description]
+        table = result.to_arrow_table()
+        elapsed_ms = (perf_counter() - started) * 1000
+        return QueryResponse(
+            question=question,
+            route=plan.route,
+            sql=sql,
+            columns=tuple(columns),
+            arrow=table,
+            tables=plan.tables,
+            max_rows=max_rows,
+            elapsed_ms=elapsed_ms,
+            metadata=metadata,
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from nbadb.chat.catalog.models import (
     CatalogEntry,
     SemanticCatalog,
+    clear_catalog_cache,
     default_agent_catalog_export_path,
     default_catalog,
     export_table_index,
@@ -13,6 +14,7 @@ from nbadb.chat.catalog.models import (
 __all__ = [
     "CatalogEntry",
     "SemanticCatalog",
+    "clear_catalog_cache",
     "default_agent_catalog_export_path",
     "default_catalog",
     "export_table_index",
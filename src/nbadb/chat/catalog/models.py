@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -46,10 +51,13 @@ class CatalogEntry:
     sql_template: str = ""
     patterns: tuple[re.Pattern[str], ...] = field(default_factory=tuple, compare=False)
 
+    @cached_property
+    def _term_tokens(self) -> tuple[tuple[str, ...], ...]:
+        return tuple(_tokens(term) for term in (self.name, *self.aliases, *self.metrics))
+
     def matches(self, question: str) -> bool:
         question_tokens = _tokens(question)
-        terms = (self.name, *self.aliases, *self.metrics)
-        if any(_contains_token_sequence(question_tokens, _tokens(term)) for term in terms):
+        if any(_contains_token_sequence(question_tokens, term) for term in self._term_tokens):
             return True
         return any(pattern.search(question) for pattern in self.patterns)
 
@@ -81,8 +89,8 @@ class SemanticCatalog:
             export_tables = export_table_index()
             normalized = question.casefold()
             for table_name, metadata in export_tables.items():
-                intents = metadata.get("agent_intents", [])
-                if not isinstance(intents, list):
+                intents = metadata.get("agent_intents", ())
+                if not isinstance(intents, (list, tuple)):
                     continue
                 if (
                     any(str(intent).casefold() in normalized for intent in intents)
@@ -95,7 +103,7 @@ class SemanticCatalog:
         self,
         question: str,
         *,
-        export: dict[str, Any] | None = None,
+        export: Mapping[str, Any] | None = None,
     ) -> tuple[str, ...]:
         export_tables = export_table_index(export)
         lines: list[str] = []
@@ -242,16 +250,17 @@ def _builtin_entries() -> tuple[CatalogEntry, ...]:
         ),
         CatalogEntry(
             name="shot chart",
-            description="Player shot locations from fact_shot_chart.",
-            tables=("fact_shot_chart", "dim_player"),
+            description="Player shot locations binned on a court grid (agg_shot_chart_bins).",
+            tables=("agg_shot_chart_bins", "dim_player"),
             aliases=("shot chart", "shot locations", "shooting zones"),
-            metrics=("shot_zone_basic", "shot_made_flag"),
+            metrics=("shot_zone_basic", "attempts", "makes"),
             route="shot_chart",
             sql_template=(
-                "SELECT p.full_name, s.shot_zone_basic, COUNT(*) AS attempts, "
-                "SUM(s.shot_made_flag) AS makes "
-                "FROM fact_shot_chart s "
+                "SELECT p.full_name, s.shot_zone_basic, SUM(s.attempts) AS attempts, "
+                "SUM(s.makes) AS makes "
+                "FROM agg_shot_chart_bins s "
                 "JOIN dim_player p ON s.player_id = p.player_id AND p.is_current = TRUE "
+                "WHERE s.resolution_ft = 1 "
                 "GROUP BY p.full_name, s.shot_zone_basic "
                 "ORDER BY attempts DESC"
             ),
@@ -554,32 +563,121 @@ def default_agent_catalog_export_path() -> Path:
     return _EXPORT_JSON
 
 
-def load_agent_catalog_export(path: Path | None = None) -> dict[str, Any]:
-    export_path = path or default_agent_catalog_export_path()
-    if not export_path.exists():
-        return {"version": 1, "table_count": 0, "tables": []}
-    payload = json.loads(export_path.read_text(encoding="utf-8"))
+def _file_version(path: Path) -> tuple[str, int, int] | None:
+    """Cache key for *path*: resolved location plus mtime and size, or ``None`` if missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_EMPTY_EXPORT: Mapping[str, Any] = _freeze({"version": 1, "table_count": 0, "tables": []})
+
+
+@lru_cache(maxsize=8)
+def _cached_export(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
-        return {"version": 1, "table_count": 0, "tables": []}
-    return payload
+        return _EMPTY_EXPORT
+    return _freeze(payload)
+
+
+def load_agent_catalog_export(path: Path | None = None) -> Mapping[str, Any]:
+    """Return the parsed agent catalog export as a read-only mapping.
+
+    Parsing is cached per file version, so repeated calls only ``stat`` the
+    file until it is regenerated.
+    """
+    version = _file_version(path or default_agent_catalog_export_path())
+    if version is None:
+        return _EMPTY_EXPORT
+    return _cached_export(*version)
 
 
-def export_table_index(export: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
-    payload = export or load_agent_catalog_export()
-    tables = payload.get("tables", [])
-    if not isinstance(tables, list):
+def _build_table_index(export: Mapping[str, Any]) -> dict[str, Mapping[str, Any]]:
+    tables = export.get("tables", ())
+    if not isinstance(tables, (list, tuple)):
         return {}
-    indexed: dict[str, dict[str, Any]] = {}
+    indexed: dict[str, Mapping[str, Any]] = {}
     for item in tables:
-        if isinstance(item, dict) and item.get("table"):
+        if isinstance(item, Mapping) and item.get("table"):
             indexed[str(item["table"])] = item
     return indexed
 
 
+@lru_cache(maxsize=8)
+def _cached_table_index(path: str, mtime_ns: int, size: int) -> Mapping[str, Mapping[str, Any]]:
+    return MappingProxyType(_build_table_index(_cached_export(path, mtime_ns, size)))
+
+
+# Indexes of explicitly passed exports, keyed on the export's identity.  Each
+# entry keeps its export alive, so the id cannot be reused while cached.
+_EXPORT_INDEX_CACHE_SIZE = 8
+_export_indexes: OrderedDict[int, tuple[Mapping[str, Any], Mapping[str, Mapping[str, Any]]]] = (
+    OrderedDict()
+)
+_export_indexes_lock = threading.Lock()
+
+
+def _export_index(export: Mapping[str, Any]) -> Mapping[str, Mapping[str, Any]]:
+    key = id(export)
+    with _export_indexes_lock:
+        cached = _export_indexes.get(key)
+        if cached is not None and cached[0] is export:
+            _export_indexes.move_to_end(key)
+            return cached[1]
+    index = MappingProxyType(_build_table_index(export))
+    with _export_indexes_lock:
+        _export_indexes[key] = (export, index)
+        _export_indexes.move_to_end(key)
+        while len(_export_indexes) > _EXPORT_INDEX_CACHE_SIZE:
+            _export_indexes.popitem(last=False)
+    return index
+
+
+def export_table_index(
+    export: Mapping[str, Any] | None = None,
+) -> Mapping[str, Mapping[str, Any]]:
+    """Index *export* (default: the generated export on disk) by table name.
+
+    Exports from :func:`load_agent_catalog_export` are shared per file
+    version and read-only, so an explicit export is indexed once and cached
+    on its identity; the default export is cached per file version.
+    """
+    if export:
+        return _export_index(export)
+    version = _file_version(default_agent_catalog_export_path())
+    if version is None:
+        return MappingProxyType({})
+    return _cached_table_index(*version)
+
+
+@lru_cache(maxsize=8)
+def _cached_catalog(path: str, mtime_ns: int, size: int) -> SemanticCatalog:
+    return _build_catalog(Path(path))
+
+
 def load_catalog(path: Path | None = None) -> SemanticCatalog:
-    entries = {entry.route: entry for entry in _builtin_entries() if entry.route}
+    """Return the semantic catalog, cached per version of its JSON overrides file."""
     catalog_path = path or _DEFAULT_JSON
-    if catalog_path.exists():
+    version = _file_version(catalog_path)
+    if version is None:
+        return _build_catalog(None)
+    return _cached_catalog(*version)
+
+
+def _build_catalog(catalog_path: Path | None) -> SemanticCatalog:
+    entries = {entry.route: entry for entry in _builtin_entries() if entry.route}
+    if catalog_path is not None:
         payload = json.loads(catalog_path.read_text(encoding="utf-8"))
         for item in payload.get("entries", []):
             if not isinstance(item, dict):
@@ -606,3 +704,12 @@ def load_catalog(path: Path | None = None) -> SemanticCatalog:
 
 def default_catalog() -> SemanticCatalog:
     return load_catalog()
+
+
+def clear_catalog_cache() -> None:
+    """Drop every cached catalog and export parse (e.g. after editing files in place)."""
+    _cached_export.cache_clear()
+    _cached_table_index.cache_clear()
+    _cached_catalog.cache_clear()
+    with _export_indexes_lock:
+        _export_indexes.clear()
@@ -20,7 +20,7 @@ def search_catalog(query: str, *, limit: int = 12) -> list[dict[str, Any]]:
                 {
                     "table": table,
                     "grain": metadata.get("grain"),
-                    "agent_intents": metadata.get("agent_intents", []),
+                    "agent_intents": list(metadata.get("agent_intents", ())),
                 }
             )
         hits.append(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
 from nbadb.chat.runtime.core import ChatRuntime, build_runtime
+from nbadb.chat.runtime.service import AsyncQueryService, get_query_service
 
-__all__ = ["ChatRuntime", "build_runtime"]
+__all__ = ["AsyncQueryService", "ChatRuntime", "build_runtime", "get_query_service"]
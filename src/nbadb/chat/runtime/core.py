@@ -6,11 +6,13 @@ from typing import TYPE_CHECKING
 from nbadb.agent.query import QueryAgent
 from nbadb.chat.artifacts import ArtifactStore
 from nbadb.chat.memory import FindingRecord, MemoryStore
+from nbadb.chat.runtime.service import get_query_service
 from nbadb.core.config import get_settings
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from nbadb.chat.runtime.service import AsyncQueryService
     from nbadb.chat.sql import QueryResponse
 
 
@@ -19,10 +21,34 @@ class ChatRuntime:
     duckdb_path: Path
     memory_store: MemoryStore = field(default_factory=MemoryStore)
     artifact_store: ArtifactStore = field(default_factory=ArtifactStore)
+    query_service: AsyncQueryService | None = None
 
     def ask(self, question: str, *, limit: int = 10) -> QueryResponse:
         return QueryAgent(self.duckdb_path).ask_result(question, limit=limit)
 
+    def _query_service(self) -> AsyncQueryService:
+        return self.query_service or get_query_service(self.duckdb_path)
+
+    async def ask_async(
+        self,
+        question: str,
+        *,
+        limit: int = 10,
+        session_id: str | None = None,
+        timeout: float | None = None,
+    ) -> QueryResponse:
+        """Answer *question* on the shared worker pool without blocking the event loop."""
+        return await self._query_service().ask(
+            question,
+            limit=limit,
+            session_id=session_id,
+            timeout=timeout,
+        )
+
+    def cancel_session(self, session_id: str | None) -> int:
+        """Interrupt any in-flight questions for a disconnected session."""
+        return self._query_service().cancel_session(session_id)
+
     def promote_to_finding(
         self,
         response: QueryResponse,
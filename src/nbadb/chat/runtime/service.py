@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING
+
+import duckdb
+from loguru import logger
+
+from nbadb.agent.query import QueryAgent
+from nbadb.chat.sql import QueryResponse
+from nbadb.core.config import get_settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_ANONYMOUS_SESSION = "_anonymous"
+
+
+@dataclass
+class _QueryJob:
+    """A single question in flight; lets the event loop interrupt its worker."""
+
+    question: str
+    limit: int
+    cancelled: bool = False
+    _conn: duckdb.DuckDBPyConnection | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def attach(self, conn: duckdb.DuckDBPyConnection) -> bool:
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._conn = conn
+            return True
+
+    def detach(self) -> None:
+        with self._lock:
+            self._conn = None
+
+    def interrupt(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self._conn is not None:
+                self._conn.interrupt()
+
+
+class AsyncQueryService:
+    """Run ``QueryAgent`` questions off the event loop on read-only connections.
+
+    Each question opens its own read-only DuckDB connection and closes it when
+    done, so an idle service never holds the file open against writers; the
+    worker pool bounds how many are open at once.  Every worker thread has its
+    own ``QueryAgent``.  Each session may only have ``session_concurrency``
+    questions in flight, so a single analyst cannot monopolise the pool;
+    questions without a session id are never throttled against each other.
+    Questions that exceed ``timeout`` seconds, or whose caller is cancelled
+    (e.g. the chat user disconnects), are interrupted inside DuckDB and their
+    worker is freed.
+    """
+
+    def __init__(
+        self,
+        duckdb_path: Path,
+        *,
+        max_workers: int = 4,
+        session_concurrency: int = 1,
+        timeout: float | None = 30.0,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if session_concurrency < 1:
+            raise ValueError("session_concurrency must be >= 1")
+        self._path = duckdb_path
+        self._max_workers = max_workers
+        self._session_concurrency = session_concurrency
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="nbadb-chat-query",
+        )
+        self._agents = threading.local()
+        self._anonymous_ids = itertools.count()
+        self._session_slots: dict[str, asyncio.Semaphore] = {}
+        self._session_tasks: dict[str, set[asyncio.Task[object]]] = {}
+        self._closed = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _query_agent(self) -> QueryAgent:
+        """The calling worker thread's agent, created on its first question."""
+        agent = getattr(self._agents, "agent", None)
+        if agent is None:
+            agent = QueryAgent(self._path)
+            self._agents.agent = agent
+        return agent
+
+    def _open_connection(self) -> duckdb.DuckDBPyConnection:
+        conn = duckdb.connect(str(self._path), read_only=True)
+        conn.execute("SET enable_external_access = false")
+        return conn
+
+    def _run_job(self, job: _QueryJob) -> QueryResponse:
+        if job.cancelled:
+            return _cancelled_response(job.question)
+        conn = self._open_connection()
+        try:
+            if not job.attach(conn):
+                return _cancelled_response(job.question)
+            try:
+                return self._query_agent().ask_result(job.question, limit=job.limit, conn=conn)
+            finally:
+                job.detach()
+        finally:
+            conn.close()
+
+    def _session_slot(self, session_id: str) -> asyncio.Semaphore:
+        slot = self._session_slots.get(session_id)
+        if slot is None:
+            slot = asyncio.Semaphore(self._session_concurrency)
+            self._session_slots[session_id] = slot
+        return slot
+
+    async def ask(
+        self,
+        question: str,
+        *,
+        limit: int = 10,
+        session_id: str | None = None,
+        timeout: float | None = None,
+    ) -> QueryResponse:
+        """Answer *question* without blocking the running event loop."""
+        if self._closed:
+            raise RuntimeError("AsyncQueryService is closed")
+        session_key = (
+            session_id
+            if session_id is not None
+            else f"{_ANONYMOUS_SESSION}-{next(self._anonymous_ids)}"
+        )
+        effective_timeout = self._timeout if timeout is None else timeout
+        task = asyncio.current_task()
+        tasks = self._session_tasks.setdefault(session_key, set())
+        if task is not None:
+            tasks.add(task)
+        try:
+            async with self._session_slot(session_key):
+                job = _QueryJob(question=question, limit=limit)
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self._executor, self._run_job, job)
+                try:
+                    return await asyncio.wait_for(asyncio.shield(future), effective_timeout)
+                except TimeoutError:
+                    job.interrupt()
+                    future.cancel()
+                    logger.warning(
+                        "chat query timed out after {}s (session={})",
+                        effective_timeout,
+                        session_key,
+                    )
+                    return _timeout_response(question, effective_timeout)
+                except asyncio.CancelledError:
+                    job.interrupt()
+                    future.cancel()
+                    raise
+        finally:
+            if task is not None:
+                tasks.discard(task)
+            if not tasks:
+                self._session_tasks.pop(session_key, None)
+                self._session_slots.pop(session_key, None)
+
+    def cancel_session(self, session_id: str | None) -> int:
+        """Cancel every in-flight question for *session_id*; return how many were cancelled.
+
+        Questions asked without a session id cannot be addressed, so ``None``
+        cancels nothing.
+        """
+        if session_id is None:
+            return 0
+        tasks = self._session_tasks.get(session_id, set())
+        cancelled = 0
+        for task in list(tasks):
+            if task.cancel():
+                cancelled += 1
+        self._session_slots.pop(session_id, None)
+        return cancelled
+
+    def close(self) -> None:
+        """Stop accepting questions; running questions close their own connections."""
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _timeout_response(question: str, timeout: float | None) -> QueryResponse:
+    return QueryResponse(
+        question=question,
+        route="timeout",
+        error=f"Query timed out after {timeout:g}s. Try a narrower question.",
+    )
+
+
+def _cancelled_response(question: str) -> QueryResponse:
+    return QueryResponse(question=question, route="cancelled", error="Query was cancelled.")
+
+
+@cache
+def get_query_service(duckdb_path: Path) -> AsyncQueryService:
+    """Return the process-wide query service for *duckdb_path*.
+
+    Every chat session on a server shares this service, so the worker pool
+    bounds total DuckDB concurrency for the whole process.
+    """
+    settings = get_settings()
+    return AsyncQueryService(
+        duckdb_path,
+        max_workers=settings.chat_query_workers,
+        session_concurrency=settings.chat_session_concurrency,
+        timeout=settings.chat_query_timeout,
+    )
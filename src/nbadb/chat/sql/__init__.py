@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from nbadb.chat.sql.models import QueryResponse
+from nbadb.chat.sql.models import DEFAULT_PAGE_SIZE, QueryPage, QueryResponse
 
-__all__ = ["QueryResponse"]
+__all__ = ["DEFAULT_PAGE_SIZE", "QueryPage", "QueryResponse"]
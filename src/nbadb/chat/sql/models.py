@@ -1,16 +1,43 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_PAGE_SIZE = 50
+
+
+@dataclass(frozen=True)
+class QueryPage:
+    """One window of a query result, addressed by row offset."""
+
+    columns: tuple[str, ...]
+    rows: tuple[tuple[Any, ...], ...]
+    offset: int
+    total_rows: int
+
+    @property
+    def next_offset(self) -> int | None:
+        """Cursor for the following page, or ``None`` when this is the last page."""
+        end = self.offset + len(self.rows)
+        return end if end < self.total_rows else None
 
 
 @dataclass(frozen=True)
 class QueryResponse:
+    """Answer to a chat question plus SQL provenance.
+
+    Results are held column-oriented in ``arrow`` and only converted to
+    Python values for the page being rendered or serialized; build small
+    responses from row tuples with :meth:`from_rows`.
+    """
+
     question: str
     route: str
     sql: str | None = None
     columns: tuple[str, ...] = ()
-    rows: tuple[tuple[Any, ...], ...] = ()
     tables: tuple[str, ...] = ()
     warnings: tuple[str, ...] = ()
     error: str | None = None
@@ -18,16 +45,97 @@ class QueryResponse:
     max_rows: int | None = None
     elapsed_ms: float | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    arrow: pa.Table | None = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        question: str,
+        route: str,
+        *,
+        columns: tuple[str, ...],
+        rows: tuple[tuple[Any, ...], ...],
+        **kwargs: Any,
+    ) -> QueryResponse:
+        """Build a response from row tuples, stored as Arrow like agent results."""
+        import pyarrow as pa
+
+        table = pa.Table.from_pylist(
+            [dict(zip(columns, row, strict=True)) for row in rows],
+            schema=None if rows else pa.schema([(name, pa.null()) for name in columns]),
+        )
+        return cls(question=question, route=route, columns=columns, arrow=table, **kwargs)
+
+    @property
+    def rows(self) -> tuple[tuple[Any, ...], ...]:
+        """Every row as Python tuples; prefer :meth:`page` for large results."""
+        return self.fetch_rows()
 
     @property
     def row_count(self) -> int:
-        return len(self.rows)
+        return self.arrow.num_rows if self.arrow is not None else 0
 
     @property
     def ok(self) -> bool:
         return self.error is None
 
-    def render_text(self, *, verbose: bool = False) -> str:
+    def fetch_rows(self, offset: int = 0, limit: int | None = None) -> tuple[tuple[Any, ...], ...]:
+        """Return rows ``[offset, offset + limit)`` as Python tuples."""
+        if self.arrow is None:
+            return ()
+        window = self.arrow.slice(max(offset, 0), limit)
+        if window.num_rows == 0:
+            return ()
+        columns = [column.to_pylist() for column in window.columns]
+        return tuple(zip(*columns, strict=True))
+
+    def page(self, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> QueryPage:
+        """Return one page of rows; pass ``QueryPage.next_offset`` to continue."""
+        return QueryPage(
+            columns=self.columns,
+            rows=self.fetch_rows(offset, limit),
+            offset=max(offset, 0),
+            total_rows=self.row_count,
+        )
+
+    def to_columnar_json(self, offset: int = 0, limit: int | None = None) -> dict[str, Any]:
+        """Serialize a window of the result as column-oriented JSON."""
+        offset = max(offset, 0)
+        data: dict[str, list[Any]] = {name: [] for name in self.columns}
+        returned = 0
+        if self.arrow is not None:
+            window = self.arrow.slice(offset, limit)
+            data = {name: window.column(name).to_pylist() for name in window.column_names}
+            returned = window.num_rows
+        end = offset + returned
+        return {
+            "columns": list(self.columns),
+            "data": data,
+            "offset": offset,
+            "row_count": self.row_count,
+            "next_offset": end if end < self.row_count else None,
+        }
+
+    def to_arrow_ipc(self) -> bytes:
+        """Serialize the full result as an Arrow IPC stream."""
+        import pyarrow as pa
+
+        table = self.arrow
+        if table is None:
+            table = pa.table({name: pa.array([], pa.null()) for name in self.columns})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def render_text(
+        self,
+        *,
+        verbose: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> str:
+        """Render the answer; only rows ``[offset, offset + limit)`` are formatted."""
         if self.error is not None:
             text = self.error
         elif self.schema_context is not None:
@@ -36,10 +144,10 @@ class QueryResponse:
                 "Here is the schema context for a more specific follow-up:\n\n"
                 f"{self.schema_context}"
             )
-        elif not self.rows:
+        elif self.row_count == 0:
             text = "No results found."
         else:
-            text = self._render_table()
+            text = self._render_table(offset=offset, limit=limit)
 
         if not verbose:
             return text
@@ -59,10 +167,14 @@ class QueryResponse:
             details.append(f"- warning: {warning}")
         return "\n".join(details)
 
-    def _render_table(self) -> str:
+    def _render_table(self, *, offset: int = 0, limit: int | None = None) -> str:
+        page = self.page(offset, self.row_count if limit is None else limit)
         header = " | ".join(self.columns)
         separator = "-+-".join("-" * len(column) for column in self.columns)
         lines = [header, separator]
-        for row in self.rows:
+        for row in page.rows:
             lines.append(" | ".join(str(value) for value in row))
+        remaining = self.row_count - page.offset - len(page.rows)
+        if remaining > 0:
+            lines.append(f"... {remaining:,} more rows")
         return "\n".join(lines)
@@ -13,6 +13,7 @@ from nbadb.cli.commands import (  # noqa: E402, F401
     ask,
     audit_models,
     backfill,
+    benchmark,
     chat,
     daily,
     docs_autogen,
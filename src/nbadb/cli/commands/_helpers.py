@@ -295,8 +295,10 @@ def _write_gh_step_summary(
 def _run_quality_checks(settings: NbaDbSettings) -> None:
     """Run DataScanner checks on the database after a pipeline run.
 
-    Runs ``missing_table`` and ``data_quality`` categories.  Warns on
-    findings but never raises — quality issues are informational only.
+    Runs ``missing_table`` and ``data_quality`` categories, then checks the
+    loaded tables against their recorded schema versions and their pandera
+    contracts.  Warns on findings but never raises — quality issues are
+    informational only.
     """
     import duckdb
 
@@ -319,6 +321,20 @@ def _run_quality_checks(settings: NbaDbSettings) -> None:
         typer.echo(f"  {s['error']} errors, {s['warning']} warnings, {s['info']} info")
         for f in report.filter(severity="error"):
             typer.echo(f"  ERROR: {f.message}", err=True)
+
+        from nbadb.transform.quality import DataQualityMonitor
+
+        monitor = DataQualityMonitor(conn)
+        drifts = monitor.check_loaded_schema_drifts()
+        drifted = [result for result in drifts if not result.passed]
+        typer.echo(f"  Schema drift: {len(drifted)}/{len(drifts)} tracked tables changed")
+        for result in drifted:
+            typer.echo(f"  DRIFT: {result.message}", err=True)
+        contracts = monitor.check_loaded_schema_contracts()
+        broken = [result for result in contracts if not result.passed]
+        typer.echo(f"  Schema contracts: {len(broken)}/{len(contracts)} tables violated")
+        for result in broken:
+            typer.echo(f"  CONTRACT: {result.message}", err=True)
     finally:
         conn.close()
 
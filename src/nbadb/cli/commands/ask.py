@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import typer
 
 from nbadb.cli.app import app
@@ -10,6 +12,12 @@ def ask(
     question: str = typer.Argument(..., help="Natural language question"),
     limit: int = typer.Option(10, "--limit", "-l", help="Maximum rows to return"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
+    output_format: str = typer.Option(
+        "text",
+        "--output-format",
+        "-f",
+        help="Output format: text, json (column-oriented) or arrow (IPC stream)",
+    ),
 ) -> None:
     """Ask a question about the NBA data."""
     from nbadb.agent.query import QueryAgent
@@ -20,8 +28,22 @@ def ask(
     if duckdb_path is None:
         typer.echo("Error: duckdb_path not configured")
         raise typer.Exit(1)
+    if output_format not in {"text", "json", "arrow"}:
+        typer.echo(f"Error: unknown output format {output_format!r}")
+        raise typer.Exit(1)
     agent = QueryAgent(duckdb_path=duckdb_path)
-    result = agent.ask_result(question, limit=limit).render_text(verbose=verbose)
+    response = agent.ask_result(question, limit=limit)
+    if output_format != "text":
+        if response.error is not None:
+            typer.echo(f"Error: {response.error}", err=True)
+            raise typer.Exit(1)
+        if output_format == "arrow":
+            typer.echo(response.to_arrow_ipc(), nl=False)
+            return
+        payload = {"route": response.route, "sql": response.sql, **response.to_columnar_json()}
+        typer.echo(json.dumps(payload, indent=2, default=str))
+        return
+    result = response.render_text(verbose=verbose)
     if not result:
         typer.echo("(no results)")
     else:
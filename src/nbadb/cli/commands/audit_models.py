@@ -8,6 +8,7 @@ import typer
 
 from nbadb.cli.app import app
 from nbadb.core.model_audit import AuditFailureError, AuditMode, AuditStrictness, ModelAuditEngine
+from nbadb.core.probe_store import DEFAULT_PROBE_STORE_DIR, ProbeCacheMode, ProbeStore
 
 ModeOption = Annotated[
     AuditMode,
@@ -47,6 +48,25 @@ RequireResultTableContractOption = Annotated[
     ),
 ]
 
+ProbeCacheOption = Annotated[
+    ProbeCacheMode,
+    typer.Option(
+        "--probe-cache",
+        help=(
+            "Probe payload store: off, record live probes, replay offline, or differential "
+            "(re-plan, replay unchanged extractors and re-probe the rest)."
+        ),
+        case_sensitive=False,
+    ),
+]
+ProbeCacheDirOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--probe-cache-dir",
+        help=f"Probe payload store directory (default: {DEFAULT_PROBE_STORE_DIR}).",
+    ),
+]
+
 
 @app.command("audit-models")
 def audit_models(
@@ -55,9 +75,16 @@ def audit_models(
     output_dir: OutputDirOption = None,
     baseline: BaselineOption = None,
     require_result_table_contract: RequireResultTableContractOption = False,
+    probe_cache: ProbeCacheOption = ProbeCacheMode.OFF,
+    probe_cache_dir: ProbeCacheDirOption = None,
 ) -> None:
     """Generate end-to-end model audit artifacts for nba_api coverage."""
-    engine = ModelAuditEngine()
+    probe_store = (
+        None
+        if probe_cache == ProbeCacheMode.OFF
+        else ProbeStore(probe_cache_dir or DEFAULT_PROBE_STORE_DIR, probe_cache)
+    )
+    engine = ModelAuditEngine(probe_store=probe_store)
     try:
         written = engine.write(
             mode=mode,
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from nbadb.cli.app import app
+from nbadb.cli.commands._helpers import _setup_logging
+from nbadb.cli.options import VerboseOption  # noqa: TC001
+from nbadb.core.benchmark import (
+    BENCHMARK_CASES,
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_THRESHOLD,
+    BenchmarkReport,
+    compare_reports,
+    iter_benchmarks,
+)
+from nbadb.core.synthetic import SyntheticUniverse
+
+console = Console()
+
+
+@app.command("benchmark")
+def benchmark(
+    case: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--case",
+            "-c",
+            help=f"Case(s) to run (default: all): {', '.join(BENCHMARK_CASES)}",
+        ),
+    ] = None,
+    seed: Annotated[int, typer.Option("--seed", help="Synthetic universe seed")] = 0,
+    seasons: Annotated[int, typer.Option("--seasons", min=1, help="Seasons to fabricate")] = 1,
+    games: Annotated[
+        int, typer.Option("--games", min=1, help="Games per season to fabricate")
+    ] = 40,
+    teams: Annotated[int, typer.Option("--teams", min=2, help="Teams in the league")] = 10,
+    players_per_team: Annotated[
+        int, typer.Option("--players-per-team", min=1, help="Roster size per team")
+    ] = 8,
+    events_per_game: Annotated[
+        int, typer.Option("--events-per-game", min=1, help="Play-by-play events per game")
+    ] = 200,
+    latency_ms: Annotated[
+        float,
+        typer.Option("--latency-ms", min=0.0, help="Simulated latency per extractor call"),
+    ] = 5.0,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", min=1, help="Concurrent extractor calls")
+    ] = 8,
+    baseline: Annotated[
+        Path,
+        typer.Option("--baseline", "-b", help="Baseline JSON to compare against or write"),
+    ] = DEFAULT_BASELINE_PATH,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            "-t",
+            min=0.0,
+            help="Relative change in wall time, peak RSS or rows/s that counts as a regression",
+        ),
+    ] = DEFAULT_THRESHOLD,
+    update_baseline: Annotated[
+        bool,
+        typer.Option("--update-baseline", help="Write this run as the new baseline"),
+    ] = False,
+    verbose: VerboseOption = False,
+) -> None:
+    """Benchmark extraction, staging, transforms, validation, loaders and chat offline."""
+    _setup_logging(verbose)
+    unknown = sorted(set(case or ()) - set(BENCHMARK_CASES))
+    if unknown:
+        typer.echo(f"Unknown case(s): {', '.join(unknown)}", err=True)
+        raise typer.Exit(2)
+
+    universe = SyntheticUniverse(
+        seed=seed,
+        seasons=seasons,
+        games_per_season=games,
+        teams=teams,
+        players_per_team=players_per_team,
+        events_per_game=events_per_game,
+    )
+    latency_seconds = latency_ms / 1000
+    report = BenchmarkReport(scale=universe.scale, latency_seconds=latency_seconds)
+    if not verbose:
+        # Per-frame schema warnings would flood the terminal and skew the timings.
+        logger.disable("nbadb")
+    try:
+        with tempfile.TemporaryDirectory(prefix="nbadb-benchmark-") as workdir:
+            for measurement in iter_benchmarks(
+                universe,
+                Path(workdir),
+                cases=case,
+                latency_seconds=latency_seconds,
+                concurrency=concurrency,
+            ):
+                report.measurements.append(measurement)
+                typer.echo(f"  {measurement.case}: {measurement.wall_seconds:.2f}s")
+    finally:
+        logger.enable("nbadb")
+
+    tbl = Table(title="Benchmarks")
+    tbl.add_column("Case", style="cyan", no_wrap=True)
+    tbl.add_column("Wall (s)", justify="right")
+    tbl.add_column("Peak RSS (MiB)", justify="right")
+    tbl.add_column("Rows", justify="right")
+    tbl.add_column("Rows/s", justify="right")
+    tbl.add_column("Errors", justify="right")
+    for m in report.measurements:
+        tbl.add_row(
+            m.case,
+            f"{m.wall_seconds:.3f}",
+            f"{m.peak_rss_bytes / 2**20:,.0f}",
+            f"{m.rows:,}",
+            f"{m.rows_per_second:,.0f}",
+            str(m.errors),
+        )
+    console.print(tbl)
+
+    if update_baseline or not baseline.exists():
+        typer.echo(f"Baseline written: {report.write(baseline)}")
+        return
+
+    try:
+        regressions = compare_reports(BenchmarkReport.load(baseline), report, threshold=threshold)
+    except ValueError as exc:
+        typer.echo(f"Cannot compare with {baseline}: {exc}", err=True)
+        raise typer.Exit(2) from None
+    if regressions:
+        typer.echo(f"{len(regressions)} regression(s) beyond {threshold:.0%}:", err=True)
+        for regression in regressions:
+            typer.echo(f"  {regression.describe()}", err=True)
+        raise typer.Exit(1)
+    typer.echo(f"No regressions beyond {threshold:.0%} against {baseline}")
@@ -38,7 +38,7 @@ def live_snapshot(
     snapshot_at: str | None = _SNAPSHOT_AT_OPTION,
     verbose: VerboseOption = False,
 ) -> None:
-    """Append a live snapshot for active games or explicit game ids."""
+    """Merge changed live rows for active games or explicit game ids."""
     _setup_logging(verbose)
     settings = _build_settings(data_dir)
     warehouse = LiveSnapshotWarehouse(settings=settings)
@@ -58,7 +58,10 @@ def live_snapshot(
             f"{len(result.game_ids)} games | "
             f"{result.star_tables_loaded} star tables | "
             f"{result.star_rows_loaded:,} rows"
+            + (f" | {len(result.skipped_game_ids)} unchanged" if result.skipped_game_ids else "")
         )
+    elif result.skipped_game_ids:
+        typer.echo(f"live-snapshot complete: {len(result.skipped_game_ids)} games unchanged")
     else:
         typer.echo("live-snapshot complete: no active live games")
 
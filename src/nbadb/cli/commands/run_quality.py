@@ -43,6 +43,8 @@ def run_quality(
     conn = duckdb.connect(str(db_path), read_only=True)
     try:
         monitor = DataQualityMonitor(conn)
+        monitor.check_loaded_schema_drifts()
+        monitor.check_loaded_schema_contracts()
         monitor.log_summary()
         summary = monitor.summary()
         failed_checks = monitor.failed()
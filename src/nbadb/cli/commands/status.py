@@ -11,6 +11,7 @@ import typer
 from nbadb.cli.app import app
 from nbadb.cli.commands._helpers import _build_settings, _open_db_readonly
 from nbadb.cli.options import DataDirOption  # noqa: TC001
+from nbadb.core.tracing import PHASES
 
 OUTPUT_PATH_OPTION = typer.Option(
     None,
@@ -46,12 +47,14 @@ def status(
                 "watermarks": _get_watermarks(conn) or [],
                 "journal": _get_journal_summary(conn) or {},
                 "metadata": _get_table_metadata(conn) or [],
+                "phases": _get_phase_breakdown(conn) or [],
             }
             typer.echo(json.dumps(data, indent=2, default=str))
         else:
             _show_watermarks(conn)
             _show_journal_summary(conn)
             _show_table_metadata(conn)
+            _show_phase_breakdown(conn)
     finally:
         conn.close()
 
@@ -522,6 +525,61 @@ def _get_table_metadata(conn: DuckDbConnection) -> list[dict[str, Any]] | None:
         return None
 
 
+def _get_phase_breakdown(conn: DuckDbConnection) -> list[dict[str, Any]] | None:
+    """Return per-phase span timings across traced runs, or None if never traced."""
+    try:
+        rows = conn.execute(
+            """
+            SELECT
+                phase,
+                COUNT(DISTINCT run_id) AS run_count,
+                COALESCE(AVG(wall_seconds), 0) AS avg_wall_seconds,
+                COALESCE(quantile_cont(wall_seconds, 0.95), 0) AS p95_wall_seconds,
+                COALESCE(SUM(wall_seconds), 0) AS total_wall_seconds,
+                COALESCE(SUM(busy_seconds), 0) AS total_busy_seconds,
+                MAX(started_at) AS last_run
+            FROM _pipeline_spans
+            GROUP BY phase
+            """
+        ).fetchall()
+    except duckdb.Error:
+        return None
+
+    order = {phase: index for index, phase in enumerate(PHASES)}
+    run_total = next((float(r[4] or 0) for r in rows if r[0] == "run"), 0.0)
+    return [
+        {
+            "phase": r[0],
+            "runs": int(r[1]),
+            "avg_seconds": round(float(r[2]), 3),
+            "p95_seconds": round(float(r[3]), 3),
+            "total_seconds": round(float(r[4]), 3),
+            "busy_seconds": round(float(r[5]), 3),
+            "share_of_run": round(float(r[4]) / run_total, 4) if run_total else None,
+            "last_run": str(r[6]) if r[6] is not None else None,
+        }
+        for r in sorted(rows, key=lambda r: (order.get(r[0], len(order)), r[0]))
+    ]
+
+
+def _show_phase_breakdown(conn: DuckDbConnection) -> None:
+    """Display per-phase wall time across traced runs."""
+    rows = _get_phase_breakdown(conn)
+    typer.echo("\n--- Phase Timing ---")
+    if rows is None:
+        typer.echo("  (no trace data; set NBADB_TRACE_ENABLED=true)")
+        return
+    if not rows:
+        typer.echo("  (empty)")
+        return
+    for r in rows:
+        share = "" if r["share_of_run"] is None else f", {r['share_of_run']:.0%} of run time"
+        typer.echo(
+            f"  {r['phase']}: avg {r['avg_seconds']:.1f}s, p95 {r['p95_seconds']:.1f}s "
+            f"over {r['runs']} runs{share}"
+        )
+
+
 def _show_watermarks(conn: DuckDbConnection) -> None:
     """Display pipeline watermarks."""
     rows = _get_watermarks(conn)
@@ -0,0 +1,522 @@
+"""Offline performance benchmarks over a :class:`SyntheticUniverse`.
+
+Each case times one stage of the pipeline against synthetic data and records
+wall time, the process's peak resident set size while the case ran, and rows
+per second.  A run is written as a JSON baseline; later runs at the same
+scale are compared against it and any case that got slower, hungrier or less
+productive by more than a threshold is reported as a regression.
+
+Cases run in order in one process and share their inputs: ``extract`` goes
+through the stats extractors with :class:`SyntheticTransport` installed,
+``staging`` persists the synthetic staging frames, ``transform`` runs every
+discovered transformer over them, ``validate`` checks staging and output
+frames against their schemas, the ``load_*`` cases write the outputs in each
+format, and ``chat`` runs every routed chat-catalog SQL template against the
+loaded DuckDB file.  Inputs a case needs from cases that were not selected
+are built untimed, as are synthetic star tables for any routed chat table
+the transforms left empty.  Peak RSS is process-wide, so it includes
+whatever earlier cases left resident.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+from loguru import logger
+
+from nbadb.core.synthetic import SyntheticTransport, SyntheticUniverse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    import polars as pl
+
+    from nbadb.chat.catalog.models import CatalogEntry
+    from nbadb.load.base import BaseLoader
+    from nbadb.orchestrate.staging_map import ParamPattern
+
+DEFAULT_BASELINE_PATH = Path("artifacts/benchmarks/baseline.json")
+DEFAULT_THRESHOLD = 0.25
+_BASELINE_VERSION = 1
+
+# Differences below these floors are noise, whatever the relative change.
+_MIN_WALL_DELTA_SECONDS = 0.05
+_MIN_RSS_DELTA_BYTES = 16 * 1024 * 1024
+
+_RSS_SAMPLE_SECONDS = 0.005
+
+# Extractors that build nba_api endpoints themselves cannot reach the
+# synthetic transport, so extract errors are expected; only an increase
+# fails.  Any error in the other cases is a regression.
+_ERRORS_EXPECTED = frozenset({"extract"})
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkMeasurement:
+    case: str
+    wall_seconds: float
+    peak_rss_bytes: int
+    rows: int
+    errors: int = 0
+    """Calls, transforms, frames, loads or queries that raised."""
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "rows_per_second": round(self.rows_per_second, 3)}
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkRegression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    def describe(self) -> str:
+        if self.metric == "errors":
+            return f"{self.case}: errors {self.baseline:,.0f} -> {self.current:,.0f}"
+        change = (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+        return (
+            f"{self.case}: {self.metric} {self.baseline:,.3f} -> {self.current:,.3f} "
+            f"({change:+.0%})"
+        )
+
+
+@dataclass(slots=True)
+class BenchmarkReport:
+    scale: dict[str, int]
+    latency_seconds: float
+    measurements: list[BenchmarkMeasurement] = field(default_factory=list)
+    recorded_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def by_case(self) -> dict[str, BenchmarkMeasurement]:
+        return {m.case: m for m in self.measurements}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _BASELINE_VERSION,
+            "recorded_at": self.recorded_at,
+            "python": sys.version.split()[0],
+            "scale": self.scale,
+            "latency_seconds": self.latency_seconds,
+            "cases": {m.case: m.to_dict() for m in self.measurements},
+        }
+
+    def write(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> BenchmarkReport:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != _BASELINE_VERSION:
+            raise ValueError(f"unsupported benchmark baseline version in {path}")
+        return cls(
+            scale=dict(payload["scale"]),
+            latency_seconds=float(payload["latency_seconds"]),
+            measurements=[
+                BenchmarkMeasurement(
+                    case=case,
+                    wall_seconds=float(entry["wall_seconds"]),
+                    peak_rss_bytes=int(entry["peak_rss_bytes"]),
+                    rows=int(entry["rows"]),
+                    errors=int(entry.get("errors", 0)),
+                )
+                for case, entry in payload["cases"].items()
+            ],
+            recorded_at=str(payload.get("recorded_at", "")),
+        )
+
+
+def compare_reports(
+    baseline: BenchmarkReport,
+    current: BenchmarkReport,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[BenchmarkRegression]:
+    """Cases in *current* that regressed against *baseline* by more than *threshold*.
+
+    Errors are not thresholded: more errors than the baseline, or any error in
+    a case that should have none, is a regression.  Raises ``ValueError`` when
+    the two runs used different scales or latency, since their numbers are not
+    comparable.
+    """
+    if baseline.scale != current.scale or baseline.latency_seconds != current.latency_seconds:
+        raise ValueError(
+            "baseline was recorded at a different scale or latency; "
+            "rerun with matching options or update the baseline"
+        )
+    regressions: list[BenchmarkRegression] = []
+    recorded = baseline.by_case()
+    for now in current.measurements:
+        then = recorded.get(now.case)
+        baseline_errors = 0 if then is None else then.errors
+        if now.errors > baseline_errors or (now.errors and now.case not in _ERRORS_EXPECTED):
+            regressions.append(BenchmarkRegression(now.case, "errors", baseline_errors, now.errors))
+        if then is None:
+            continue
+        slower = now.wall_seconds - then.wall_seconds > max(
+            then.wall_seconds * threshold, _MIN_WALL_DELTA_SECONDS
+        )
+        if slower:
+            regressions.append(
+                BenchmarkRegression(now.case, "wall_seconds", then.wall_seconds, now.wall_seconds)
+            )
+        if now.peak_rss_bytes - then.peak_rss_bytes > max(
+            then.peak_rss_bytes * threshold, _MIN_RSS_DELTA_BYTES
+        ):
+            regressions.append(
+                BenchmarkRegression(
+                    now.case, "peak_rss_bytes", then.peak_rss_bytes, now.peak_rss_bytes
+                )
+            )
+        # Rows per second only moves independently of wall time when row counts differ.
+        if now.rows != then.rows and now.rows_per_second < then.rows_per_second * (1 - threshold):
+            regressions.append(
+                BenchmarkRegression(
+                    now.case, "rows_per_second", then.rows_per_second, now.rows_per_second
+                )
+            )
+    return regressions
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+
+def _current_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _max_rss_bytes() -> int:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _PeakRss:
+    """Peak resident set size while the block runs.
+
+    Samples ``/proc/self/statm`` from a background thread; where that is
+    unavailable it falls back to ``ru_maxrss``, the peak over the whole
+    process lifetime.
+    """
+
+    def __init__(self) -> None:
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> _PeakRss:
+        if (rss := _current_rss_bytes()) is not None:
+            self.peak = rss
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._thread is None:
+            self.peak = _max_rss_bytes()
+            return
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss_bytes() or 0)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(_RSS_SAMPLE_SECONDS):
+            self.peak = max(self.peak, _current_rss_bytes() or 0)
+
+
+# ----------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class _Run:
+    universe: SyntheticUniverse
+    workdir: Path
+    latency_seconds: float
+    concurrency: int
+    staging: dict[str, pl.DataFrame] = field(default_factory=dict)
+    outputs: dict[str, pl.DataFrame] | None = None
+
+    @property
+    def duckdb_path(self) -> Path:
+        return self.workdir / "nba.duckdb"
+
+
+def _extract(run: _Run) -> tuple[int, int]:
+    from nbadb.extract.registry import registry
+    from nbadb.orchestrate.extractor_runner import _sync_extract, _sync_extract_all
+    from nbadb.orchestrate.staging_map import STAGING_MAP
+
+    registry.discover()
+    # One call per endpoint and params, as the runner dedupes multi-result entries.
+    # Live payloads come from the live CDN client, not the stats transport.
+    endpoints: dict[tuple[str, ParamPattern], bool] = {}
+    for entry in STAGING_MAP:
+        if entry.param_pattern == "live":
+            continue
+        key = (entry.endpoint_name, entry.param_pattern)
+        endpoints[key] = endpoints.get(key, False) or entry.use_multi
+    calls = [
+        (endpoint, use_multi, params)
+        for (endpoint, pattern), use_multi in endpoints.items()
+        for params in run.universe.params_for(pattern)
+    ]
+
+    def _call(call: tuple[str, bool, dict[str, Any]]) -> int | None:
+        endpoint, use_multi, params = call
+        try:
+            extractor = registry.get(endpoint)()
+            if use_multi:
+                return sum(df.height for df in _sync_extract_all(extractor, **params))
+            return _sync_extract(extractor, **params).height
+        except Exception as exc:
+            logger.debug("benchmark extract {} failed: {}", endpoint, exc)
+            return None
+
+    transport = SyntheticTransport(run.universe, latency_seconds=run.latency_seconds)
+    with transport.installed(), ThreadPoolExecutor(max_workers=run.concurrency) as pool:
+        results = list(pool.map(_call, calls))
+    return sum(r for r in results if r is not None), sum(r is None for r in results)
+
+
+def _staging(run: _Run) -> tuple[int, int]:
+    from nbadb.orchestrate.staging_batches import StagingBatchStore, StagingChunkMetadata
+
+    frames = {key: df for key, df in run.staging.items() if df.width}
+    with duckdb.connect(str(run.workdir / "staging.duckdb")) as conn:
+        result = StagingBatchStore(conn).persist_frames(
+            frames,
+            metadata=StagingChunkMetadata(
+                run_mode="benchmark",
+                lane_id="synthetic",
+                pattern="all",
+                chunk_index=0,
+                params_digest=str(run.universe.seed),
+                entries_digest=str(len(frames)),
+            ),
+            materialize=True,
+        )
+    return result.rows_persisted, 0
+
+
+def _transform(run: _Run) -> tuple[int, int]:
+    from nbadb.orchestrate.transformers import discover_all_transformers
+    from nbadb.transform.pipeline import TransformPipeline
+
+    with duckdb.connect() as conn:
+        pipeline = TransformPipeline(conn)
+        pipeline.register_all(discover_all_transformers())
+        outputs = pipeline.run(
+            {key: df.lazy() for key, df in run.staging.items()},
+            validate_output_schemas=False,
+        )
+    run.outputs = outputs
+    failures = pipeline.last_result.failure_count if pipeline.last_result else 0
+    return sum(df.height for df in outputs.values()), failures
+
+
+def _validate(run: _Run) -> tuple[int, int]:
+    from nbadb.schemas.registry import get_input_schema, get_output_schema
+
+    frames = [(key, df, get_input_schema(key)) for key, df in run.staging.items()]
+    frames += [(table, df, get_output_schema(table)) for table, df in (run.outputs or {}).items()]
+    rows = errors = 0
+    for name, df, schema_cls in frames:
+        if schema_cls is None or not df.width:
+            continue
+        try:
+            schema_cls.validate(df)
+        except Exception as exc:
+            logger.debug("benchmark validate {} failed: {}", name, exc)
+            errors += 1
+            continue
+        rows += df.height
+    return rows, errors
+
+
+def _load_with(loader: BaseLoader, run: _Run) -> tuple[int, int]:
+    rows = errors = 0
+    for table, df in (run.outputs or {}).items():
+        if df.is_empty():
+            continue
+        try:
+            loader.load(table, df)
+        except Exception as exc:
+            logger.debug("benchmark load {} failed: {}", table, exc)
+            errors += 1
+            continue
+        rows += df.height
+    return rows, errors
+
+
+def _load_duckdb(run: _Run) -> tuple[int, int]:
+    from nbadb.load.duckdb_loader import DuckDBLoader
+
+    with duckdb.connect(str(run.duckdb_path)) as conn:
+        return _load_with(DuckDBLoader(conn), run)
+
+
+def _load_sqlite(run: _Run) -> tuple[int, int]:
+    from nbadb.load.sqlite import SQLiteLoader
+
+    return _load_with(SQLiteLoader(run.workdir / "nba.sqlite"), run)
+
+
+def _load_parquet(run: _Run) -> tuple[int, int]:
+    from nbadb.load.parquet_loader import ParquetLoader
+
+    return _load_with(ParquetLoader(run.workdir / "parquet"), run)
+
+
+def _load_csv(run: _Run) -> tuple[int, int]:
+    from nbadb.load.csv_loader import CSVLoader
+
+    return _load_with(CSVLoader(run.workdir / "csv"), run)
+
+
+def _routed_chat_entries() -> list[CatalogEntry]:
+    from nbadb.chat.catalog import default_catalog
+
+    return [entry for entry in default_catalog().entries if entry.route and entry.sql_template]
+
+
+def _chat(run: _Run) -> tuple[int, int]:
+    rows = errors = 0
+    with duckdb.connect(str(run.duckdb_path), read_only=True) as conn:
+        for entry in _routed_chat_entries():
+            try:
+                rows += len(conn.execute(entry.sql_template).fetchall())
+            except duckdb.Error as exc:
+                logger.debug("benchmark chat route {} failed: {}", entry.route, exc)
+                errors += 1
+    return rows, errors
+
+
+def _seed_chat_tables(run: _Run) -> None:
+    from nbadb.core.db import DBManager
+    from nbadb.load.duckdb_loader import DuckDBLoader
+    from nbadb.orchestrate.journal import PipelineJournal
+    from nbadb.schemas.registry import get_output_schema
+    from nbadb.transform.schema_version import schema_hash_for_frame
+
+    if not run.duckdb_path.exists():
+        _load_duckdb(run)
+    tables = sorted({table for entry in _routed_chat_entries() for table in entry.tables})
+    # DBManager creates the pipeline tables routes like pipeline_inventory read.
+    with DBManager(run.workdir / "pipeline.sqlite", run.duckdb_path) as db:
+        conn = db.duckdb
+        loaded = {
+            name: rows
+            for name, rows in conn.execute(
+                "SELECT table_name, estimated_size FROM duckdb_tables()"
+            ).fetchall()
+        }
+        loader = DuckDBLoader(conn)
+        frames = {table: df for table, df in (run.outputs or {}).items() if not df.is_empty()}
+        for table in tables:
+            if loaded.get(table) or get_output_schema(table) is None:
+                continue
+            frames[table] = run.universe.star_frame(table)
+            loader.load(table, frames[table])
+        journal = PipelineJournal(conn)
+        for table, df in frames.items():
+            journal.record_table_metadata(table, df.height, schema_hash_for_frame(df))
+
+
+_NEEDS_OUTPUTS = frozenset(
+    {"validate", "load_duckdb", "load_sqlite", "load_parquet", "load_csv", "chat"}
+)
+
+
+def _prepare(case: str, run: _Run) -> None:
+    """Build *case*'s inputs, untimed, when the cases producing them did not run."""
+    if case in _NEEDS_OUTPUTS and run.outputs is None:
+        _transform(run)
+    if case == "chat":
+        _seed_chat_tables(run)
+
+
+BENCHMARK_CASES: dict[str, Callable[[_Run], tuple[int, int]]] = {
+    "extract": _extract,
+    "staging": _staging,
+    "transform": _transform,
+    "validate": _validate,
+    "load_duckdb": _load_duckdb,
+    "load_sqlite": _load_sqlite,
+    "load_parquet": _load_parquet,
+    "load_csv": _load_csv,
+    "chat": _chat,
+}
+
+
+def iter_benchmarks(
+    universe: SyntheticUniverse,
+    workdir: Path,
+    *,
+    cases: Iterable[str] | None = None,
+    latency_seconds: float = 0.0,
+    concurrency: int = 8,
+) -> Iterator[BenchmarkMeasurement]:
+    """Run the selected cases (all by default) in order, yielding each measurement."""
+    selected = list(BENCHMARK_CASES) if cases is None else list(cases)
+    unknown = sorted(set(selected) - set(BENCHMARK_CASES))
+    if unknown:
+        raise ValueError(f"unknown benchmark case(s): {', '.join(unknown)}")
+    run = _Run(universe, workdir, latency_seconds, max(1, concurrency))
+    run.staging = universe.staging_frames()
+    for case in (name for name in BENCHMARK_CASES if name in selected):
+        _prepare(case, run)
+        with _PeakRss() as rss:
+            started = time.perf_counter()
+            rows, errors = BENCHMARK_CASES[case](run)
+            wall = time.perf_counter() - started
+        yield BenchmarkMeasurement(case, round(wall, 6), rss.peak, rows, errors)
+
+
+def run_benchmarks(
+    universe: SyntheticUniverse,
+    workdir: Path,
+    *,
+    cases: Iterable[str] | None = None,
+    latency_seconds: float = 0.0,
+    concurrency: int = 8,
+) -> BenchmarkReport:
+    """Run the selected cases and collect them into a report."""
+    return BenchmarkReport(
+        scale=universe.scale,
+        latency_seconds=latency_seconds,
+        measurements=list(
+            iter_benchmarks(
+                universe,
+                workdir,
+                cases=cases,
+                latency_seconds=latency_seconds,
+                concurrency=concurrency,
+            )
+        ),
+    )
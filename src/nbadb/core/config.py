@@ -61,7 +61,7 @@ class NbaDbSettings(BaseSettings):
         "video_details_asset": 2,
         "win_probability": 1,
     }
-    discovery_concurrency: int = 2
+    discovery_concurrency: int = 8  # in-flight discovery calls; pacing comes from rate_limit
 
     daily_lookback_days: int = 7
     pbp_chunk_size: int = 500
@@ -139,6 +139,9 @@ class NbaDbSettings(BaseSettings):
         "player_history": 2.0,
         "team_history": 2.0,
     }
+    # Weighted fair share of the global rate when families queue together
+    # (default weight 1.0; discovery calls queue as the "discovery" family).
+    family_rate_weights: dict[str, float] = {}
     family_chunk_multipliers: dict[str, float] = {
         "default": 1.0,
         "box_score": 1.0,
@@ -191,9 +194,19 @@ class NbaDbSettings(BaseSettings):
     adaptive_rate_recovery: int = 50  # consecutive successes before rate recovery
     adaptive_chunk_min_size: int = 25
     adaptive_chunk_max_size: int = 1_000
+    adaptive_chunk_target_seconds: float = 120.0  # chunk wall time once latency is known; 0 = off
     circuit_breaker_max_wait: float = 600.0  # cap breaker-open waiting before failing fast
     extract_max_retries: int = 6  # per-extraction retry attempts
     extract_retry_base_delay: float = 2.0  # base delay in seconds (exponential backoff)
+    transform_cache_enabled: bool = True  # reuse unchanged SQL star tables across runs
+    passthrough_views: bool = False  # opt in: load passthrough/union outputs as views over staging
+    validation_chunk_rows: int = 500_000  # taller outputs validate in chunks; 0 = whole-frame
+    trace_enabled: bool = False  # record pipeline spans; writes a Chrome trace per run
+    trace_dir: Path | None = None  # defaults to <data_dir>/traces
+    chat_query_workers: int = 4  # chat queries (and read-only connections) running at once
+    chat_session_concurrency: int = 1  # in-flight chat questions allowed per session
+    chat_query_timeout: float = 30.0  # seconds before a chat query is interrupted
+    chat_context_max_tokens: int = 2_000  # schema-context budget for unmatched questions
 
     sqlite_path: Path | None = None
     duckdb_path: Path | None = None
@@ -20,6 +20,15 @@ if TYPE_CHECKING:
 _DUCKDB_LOCK_ERROR_FRAGMENT = "Could not set lock on file"
 _DUCKDB_LOCK_RETRY_ATTEMPTS = 4
 _DUCKDB_LOCK_RETRY_BASE_DELAY_SECONDS = 0.5
+_JOURNAL_KEY_COLUMNS = (
+    ("params_digest", "VARCHAR"),
+    ("season", "VARCHAR"),
+    ("season_type", "VARCHAR"),
+    ("game_id", "VARCHAR"),
+    ("player_id", "BIGINT"),
+    ("team_id", "BIGINT"),
+    ("game_date", "VARCHAR"),
+)
 
 
 class DuckDBLockError(RuntimeError):
@@ -149,6 +158,34 @@ class DBManager:
             SET retry_count = 4
             WHERE status = 'failed' AND retry_count = 0
         """)
+        # Typed key columns mirror the JSON params so journal filters and gap
+        # reports avoid per-row JSON parsing; older rows are backfilled once.
+        for column, dtype in _JOURNAL_KEY_COLUMNS:
+            self._duckdb_conn.execute(f"""
+                ALTER TABLE _extraction_journal
+                ADD COLUMN IF NOT EXISTS {column} {dtype}
+            """)
+        self._duckdb_conn.execute("""
+            UPDATE _extraction_journal
+            SET
+                params_digest = md5(COALESCE(params, '')),
+                season = CASE WHEN json_valid(params)
+                    THEN json_extract_string(params, '$.season') END,
+                season_type = CASE WHEN json_valid(params)
+                    THEN json_extract_string(params, '$.season_type') END,
+                game_id = CASE WHEN json_valid(params)
+                    THEN json_extract_string(params, '$.game_id') END,
+                player_id = CASE WHEN json_valid(params)
+                    THEN TRY_CAST(COALESCE(
+                        json_extract_string(params, '$.player_id'),
+                        json_extract_string(params, '$.person_id')
+                    ) AS BIGINT) END,
+                team_id = CASE WHEN json_valid(params)
+                    THEN TRY_CAST(json_extract_string(params, '$.team_id') AS BIGINT) END,
+                game_date = CASE WHEN json_valid(params)
+                    THEN json_extract_string(params, '$.game_date') END
+            WHERE params_digest IS NULL
+        """)
         self._duckdb_conn.execute("""
             CREATE TABLE IF NOT EXISTS _pipeline_metadata (
                 table_name VARCHAR PRIMARY KEY,
@@ -180,6 +217,20 @@ class DBManager:
                 PRIMARY KEY (run_id, table_name)
             )
         """)
+        self._duckdb_conn.execute("""
+            CREATE TABLE IF NOT EXISTS _transform_cache (
+                table_name VARCHAR PRIMARY KEY,
+                cache_key VARCHAR NOT NULL,
+                row_count BIGINT,
+                hit_count BIGINT DEFAULT 0,
+                recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # Migrate caches recorded before content hashes; rows without one never hit
+        self._duckdb_conn.execute("""
+            ALTER TABLE _transform_cache
+            ADD COLUMN IF NOT EXISTS content_hash VARCHAR
+        """)
         self._duckdb_conn.execute("""
             CREATE TABLE IF NOT EXISTS _schema_versions (
                 table_name VARCHAR NOT NULL,
@@ -232,6 +283,19 @@ class DBManager:
                 PRIMARY KEY (lane_id)
             )
         """)
+        self._duckdb_conn.execute("""
+            CREATE TABLE IF NOT EXISTS _pipeline_spans (
+                run_id VARCHAR NOT NULL,
+                run_mode VARCHAR NOT NULL,
+                phase VARCHAR NOT NULL,
+                started_at TIMESTAMP,
+                span_count BIGINT,
+                busy_seconds DOUBLE,
+                wall_seconds DOUBLE,
+                max_span_seconds DOUBLE,
+                PRIMARY KEY (run_id, phase)
+            )
+        """)
         self._duckdb_conn.execute("""
             CREATE TABLE IF NOT EXISTS _staging_chunk_journal (
                 chunk_id VARCHAR NOT NULL,
@@ -29,6 +29,13 @@ from nbadb.core.endpoint_coverage import (
     _ownership_override_for_staging_key,
     _runtime_class_to_surface_name,
 )
+from nbadb.core.extraction_failures import classify_exception
+from nbadb.core.probe_store import (
+    ProbeOutcome,
+    ProbeStore,
+    extractor_code_hash,
+    probe_key,
+)
 from nbadb.core.types import validate_sql_identifier
 from nbadb.docs_gen.lineage import LineageGenerator
 from nbadb.extract.registry import registry
@@ -377,9 +384,11 @@ class ModelAuditEngine:
         *,
         project_root: Path | None = None,
         settings: NbaDbSettings | None = None,
+        probe_store: ProbeStore | None = None,
     ) -> None:
         self.project_root = project_root.resolve() if project_root is not None else Path.cwd()
         self.settings = settings if settings is not None else get_settings()
+        self._probe_store = probe_store
         self._coverage = EndpointCoverageGenerator(project_root=self.project_root)
 
     def _discover_extractors(self) -> _ExtractorCatalog:
@@ -1652,53 +1661,83 @@ class ModelAuditEngine:
 
         return requests, synthetic_records
 
-    async def _execute_probe(self, request: ProbeRequest) -> ProbeExecution:
-        extractor_cls = registry.get(request.endpoint_name)
+    async def _extract_probe(self, extractor_cls: Any, request: ProbeRequest) -> ProbeOutcome:
         extractor = extractor_cls()
         loop = asyncio.get_running_loop()
-
         try:
             if request.use_multi:
                 frames = await loop.run_in_executor(
                     None, lambda: _sync_extract_all(extractor, **request.params)
                 )
-                if request.result_set_index is None:
-                    df = frames[0] if frames else pl.DataFrame()
-                elif request.result_set_index < len(frames):
-                    df = frames[request.result_set_index]
-                else:
-                    return ProbeExecution(
-                        record=AuditRecord(
-                            layer="LiveProbe",
-                            key=f"{request.key}:{request.probe_context}",
-                            decision=AuditDecision.VALIDATION_GAP.value,
-                            decision_reason=(
-                                f"Extractor returned {len(frames)} result sets; "
-                                f"index {request.result_set_index} was out of range."
-                            ),
-                            issues=["result_set_out_of_range"],
-                            source_kind=request.source_kind,
-                            endpoint_name=request.endpoint_name,
-                            staging_key=request.staging_key,
-                            result_set_index=request.result_set_index,
-                            details={
-                                "probe_context": request.probe_context,
-                                "params": request.params,
-                                "result_set_count": len(frames),
-                            },
-                        )
-                    )
             else:
-                df = await loop.run_in_executor(
-                    None, lambda: _sync_extract(extractor, **request.params)
-                )
+                frames = [
+                    await loop.run_in_executor(
+                        None, lambda: _sync_extract(extractor, **request.params)
+                    )
+                ]
         except Exception as exc:
+            return ProbeOutcome(
+                error_type=type(exc).__name__,
+                error_message=str(exc),
+                failure_class=classify_exception(exc),
+            )
+        return ProbeOutcome(frames=list(frames))
+
+    async def _probe_outcome(self, request: ProbeRequest) -> ProbeOutcome | None:
+        """Extract *request* live or from the probe store; ``None`` is a replay miss."""
+        extractor_cls = registry.get(request.endpoint_name)
+        store = self._probe_store
+        if store is None:
+            return await self._extract_probe(extractor_cls, request)
+
+        code_hash = extractor_code_hash(extractor_cls)
+        key = probe_key(
+            request.endpoint_name, request.params, code_hash, use_multi=request.use_multi
+        )
+        if store.replays_payloads:
+            cached = store.get(key)
+            if cached is not None or not store.live:
+                return cached
+        outcome = await self._extract_probe(extractor_cls, request)
+        store.put(
+            key,
+            endpoint_name=request.endpoint_name,
+            params=request.params,
+            code_hash=code_hash,
+            outcome=outcome,
+        )
+        return outcome
+
+    async def _execute_probe(self, request: ProbeRequest) -> ProbeExecution:
+        outcome = await self._probe_outcome(request)
+        if outcome is None:
             return ProbeExecution(
                 record=AuditRecord(
                     layer="LiveProbe",
                     key=f"{request.key}:{request.probe_context}",
                     decision=AuditDecision.VALIDATION_GAP.value,
-                    decision_reason=f"Live probe raised {type(exc).__name__}.",
+                    decision_reason=(
+                        "No recorded probe payload matches the current extractor; "
+                        "re-record the probe store."
+                    ),
+                    issues=["probe_cache_miss"],
+                    source_kind=request.source_kind,
+                    endpoint_name=request.endpoint_name,
+                    staging_key=request.staging_key,
+                    result_set_index=request.result_set_index,
+                    details={
+                        "probe_context": request.probe_context,
+                        "params": request.params,
+                    },
+                )
+            )
+        if outcome.error_type is not None:
+            return ProbeExecution(
+                record=AuditRecord(
+                    layer="LiveProbe",
+                    key=f"{request.key}:{request.probe_context}",
+                    decision=AuditDecision.VALIDATION_GAP.value,
+                    decision_reason=f"Live probe raised {outcome.error_type}.",
                     issues=["probe_exception"],
                     source_kind=request.source_kind,
                     endpoint_name=request.endpoint_name,
@@ -1707,8 +1746,36 @@ class ModelAuditEngine:
                     details={
                         "probe_context": request.probe_context,
                         "params": request.params,
-                        "error_type": type(exc).__name__,
-                        "error_message": str(exc),
+                        "error_type": outcome.error_type,
+                        "error_message": outcome.error_message,
+                    },
+                )
+            )
+
+        frames = outcome.frames
+        if not request.use_multi or request.result_set_index is None:
+            df = frames[0] if frames else pl.DataFrame()
+        elif request.result_set_index < len(frames):
+            df = frames[request.result_set_index]
+        else:
+            return ProbeExecution(
+                record=AuditRecord(
+                    layer="LiveProbe",
+                    key=f"{request.key}:{request.probe_context}",
+                    decision=AuditDecision.VALIDATION_GAP.value,
+                    decision_reason=(
+                        f"Extractor returned {len(frames)} result sets; "
+                        f"index {request.result_set_index} was out of range."
+                    ),
+                    issues=["result_set_out_of_range"],
+                    source_kind=request.source_kind,
+                    endpoint_name=request.endpoint_name,
+                    staging_key=request.staging_key,
+                    result_set_index=request.result_set_index,
+                    details={
+                        "probe_context": request.probe_context,
+                        "params": request.params,
+                        "result_set_count": len(frames),
                     },
                 )
             )
@@ -1746,10 +1813,35 @@ class ModelAuditEngine:
             dataframe=df,
         )
 
+    async def _planned_probe_requests(self) -> tuple[list[ProbeRequest], list[AuditRecord]]:
+        store = self._probe_store
+        if store is None:
+            return await self._build_probe_requests()
+        if store.replays_plan:
+            plan = store.load_plan()
+            if plan is None:
+                raise AuditFailureError(
+                    f"probe store at {store.root} has no recorded plan; "
+                    "run with --probe-cache record first"
+                )
+            registry.discover()
+            return (
+                [ProbeRequest(**request) for request in plan["requests"]],
+                [AuditRecord(**record) for record in plan["synthetic_records"]],
+            )
+        requests, synthetic_records = await self._build_probe_requests()
+        store.save_plan(
+            {
+                "requests": [asdict(request) for request in requests],
+                "synthetic_records": [record.to_dict() for record in synthetic_records],
+            }
+        )
+        return requests, synthetic_records
+
     async def _run_probes(
         self,
     ) -> tuple[list[AuditRecord], dict[str, pl.DataFrame], dict[str, Any]]:
-        requests, synthetic_records = await self._build_probe_requests()
+        requests, synthetic_records = await self._planned_probe_requests()
 
         semaphore = asyncio.Semaphore(max(1, min(self.settings.thread_pool_size, 8)))
         executions: list[ProbeExecution] = []
@@ -1783,6 +1875,9 @@ class ModelAuditEngine:
             ),
             "selected_staging_key_count": len(selected_staging_frames),
         }
+        if self._probe_store is not None:
+            self._probe_store.flush()
+            summary["probe_store"] = self._probe_store.stats()
         payload = {
             "generated_at": _now_iso(),
             "requests": [asdict(request) for request in requests],
@@ -0,0 +1,259 @@
+"""Content-addressed store of recorded model-audit probe payloads.
+
+Live probes make a model audit depend on whether stats.nba.com answers and
+what it answers with today.  A :class:`ProbeStore` records the frames each
+probe's extractor returned, keyed by endpoint, normalized params and a hash
+of the extractor source, together with the probe plan that produced them.
+Replaying the store re-runs the whole audit offline; a differential run
+rebuilds the plan from the current registry, replays every planned probe
+whose extractor is unchanged and only goes to the network for the rest.
+Transient failures (timeouts, 5xx, throttling) are never recorded, so they
+cannot be replayed as if the endpoint were broken.
+
+Layout::
+
+    <root>/manifest.json           plan + one entry per probe key
+    <root>/payloads/<key>/<i>.arrow
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import shutil
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from nbadb.core.extraction_failures import classify_error_name
+
+DEFAULT_PROBE_STORE_DIR = Path("artifacts/model-audit/probe-store")
+_MANIFEST_NAME = "manifest.json"
+_MANIFEST_VERSION = 1
+
+
+class ProbeCacheMode(StrEnum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+    DIFFERENTIAL = "differential"
+
+
+@dataclass(slots=True)
+class ProbeOutcome:
+    """What a probe's extractor produced: its frames, or the error it raised."""
+
+    frames: list[pl.DataFrame] = field(default_factory=list)
+    error_type: str | None = None
+    error_message: str | None = None
+    failure_class: str | None = None
+
+    @property
+    def transient(self) -> bool:
+        """Whether the error says more about the network than the endpoint."""
+        if self.error_type is None:
+            return False
+        failure_class = self.failure_class or classify_error_name(self.error_type)
+        return failure_class == "transport_transient"
+
+
+@cache
+def extractor_code_hash(extractor_cls: type) -> str:
+    """Hash the source of *extractor_cls* and its nbadb base classes."""
+    digest = hashlib.sha256()
+    for klass in extractor_cls.__mro__:
+        if not klass.__module__.startswith("nbadb."):
+            continue
+        try:
+            source = inspect.getsource(klass)
+        except (OSError, TypeError):
+            source = f"{klass.__module__}.{klass.__qualname__}"
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def probe_key(
+    endpoint_name: str,
+    params: dict[str, Any],
+    code_hash: str,
+    *,
+    use_multi: bool,
+) -> str:
+    normalized = json.dumps(params, sort_keys=True, default=str)
+    material = "\0".join([endpoint_name, normalized, code_hash, "multi" if use_multi else "one"])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:24]
+
+
+class ProbeStore:
+    """Records and replays probe outcomes under *root*.
+
+    ``record`` probes live and rewrites the store; ``replay`` never probes
+    and reports a miss for any key it has not seen; ``differential`` plans
+    afresh, replays hits and probes (and records) only misses.  Entries not
+    touched by a recording run are pruned on :meth:`flush`.
+    """
+
+    def __init__(self, root: Path, mode: ProbeCacheMode) -> None:
+        if mode == ProbeCacheMode.OFF:
+            raise ValueError("ProbeStore requires a mode other than 'off'")
+        self.root = root
+        self.mode = mode
+        manifest = self._read_manifest()
+        self._plan: dict[str, Any] | None = manifest.get("plan")
+        self._entries: dict[str, dict[str, Any]] = manifest.get("entries", {})
+        self._touched: set[str] = set()
+        self._plan_changes: dict[str, int] | None = None
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self.transient_skipped = 0
+
+    @property
+    def live(self) -> bool:
+        """Whether probes missing from the store may go to the network."""
+        return self.mode in {ProbeCacheMode.RECORD, ProbeCacheMode.DIFFERENTIAL}
+
+    @property
+    def replays_plan(self) -> bool:
+        """Whether the probe plan comes from the store instead of discovery."""
+        return self.mode == ProbeCacheMode.REPLAY
+
+    @property
+    def replays_payloads(self) -> bool:
+        """Whether recorded payloads are served before probing."""
+        return self.mode in {ProbeCacheMode.REPLAY, ProbeCacheMode.DIFFERENTIAL}
+
+    def load_plan(self) -> dict[str, Any] | None:
+        return self._plan
+
+    def save_plan(self, plan: dict[str, Any]) -> None:
+        """Store *plan*; a differential run also counts requests added or dropped."""
+        if self.mode == ProbeCacheMode.DIFFERENTIAL:
+            recorded = _plan_request_ids(self._plan)
+            current = _plan_request_ids(plan)
+            self._plan_changes = {
+                "added": len(current - recorded),
+                "removed": len(recorded - current),
+            }
+        self._plan = plan
+
+    def get(self, key: str) -> ProbeOutcome | None:
+        entry = self._entries.get(key)
+        if entry is None or _entry_outcome(entry).transient:
+            self.misses += 1
+            return None
+        frames = [
+            pl.read_ipc(self._payload_dir(key) / f"{index}.arrow", memory_map=False)
+            for index in range(entry["frame_count"])
+        ]
+        self.hits += 1
+        self._touched.add(key)
+        outcome = _entry_outcome(entry)
+        outcome.frames = frames
+        return outcome
+
+    def put(
+        self,
+        key: str,
+        *,
+        endpoint_name: str,
+        params: dict[str, Any],
+        code_hash: str,
+        outcome: ProbeOutcome,
+    ) -> None:
+        if outcome.transient:
+            self.transient_skipped += 1
+            return
+        payload_dir = self._payload_dir(key)
+        shutil.rmtree(payload_dir, ignore_errors=True)
+        payload_dir.mkdir(parents=True, exist_ok=True)
+        for index, frame in enumerate(outcome.frames):
+            frame.write_ipc(payload_dir / f"{index}.arrow")
+        self._entries[key] = {
+            "endpoint_name": endpoint_name,
+            "params": params,
+            "code_hash": code_hash,
+            "frame_count": len(outcome.frames),
+            "row_count": sum(frame.shape[0] for frame in outcome.frames),
+            "error_type": outcome.error_type,
+            "error_message": outcome.error_message,
+            "failure_class": outcome.failure_class,
+            "recorded_at": datetime.now(UTC).isoformat(),
+        }
+        self._touched.add(key)
+        self.recorded += 1
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {
+            "mode": self.mode.value,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+        }
+        if self.transient_skipped:
+            stats["transient_skipped"] = self.transient_skipped
+        if self._plan_changes is not None:
+            stats["plan_changes"] = self._plan_changes
+        return stats
+
+    def flush(self) -> None:
+        """Persist the manifest and drop payloads no longer referenced."""
+        if not self.live:
+            return
+        for key in sorted(set(self._entries) - self._touched):
+            del self._entries[key]
+            shutil.rmtree(self._payload_dir(key), ignore_errors=True)
+        self.root.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "version": _MANIFEST_VERSION,
+            "plan": self._plan,
+            "entries": dict(sorted(self._entries.items())),
+        }
+        (self.root / _MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True, default=str) + "\n",
+            encoding="utf-8",
+        )
+
+    def _payload_dir(self, key: str) -> Path:
+        return self.root / "payloads" / key
+
+    def _read_manifest(self) -> dict[str, Any]:
+        path = self.root / _MANIFEST_NAME
+        if not path.exists():
+            return {}
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return {}
+        return manifest
+
+
+def _entry_outcome(entry: dict[str, Any]) -> ProbeOutcome:
+    return ProbeOutcome(
+        error_type=entry.get("error_type"),
+        error_message=entry.get("error_message"),
+        failure_class=entry.get("failure_class"),
+    )
+
+
+def _plan_request_ids(plan: dict[str, Any] | None) -> set[str]:
+    if not plan:
+        return set()
+    return {
+        json.dumps(request, sort_keys=True, default=str) for request in plan.get("requests", [])
+    }
+
+
+__all__ = [
+    "DEFAULT_PROBE_STORE_DIR",
+    "ProbeCacheMode",
+    "ProbeOutcome",
+    "ProbeStore",
+    "extractor_code_hash",
+    "probe_key",
+]
@@ -0,0 +1,728 @@
+"""Deterministic synthetic NBA universe for offline runs and benchmarks.
+
+A :class:`SyntheticUniverse` fabricates a league from a seed — teams, their
+rosters and a schedule of games per season — and renders a raw frame for any
+:class:`~nbadb.orchestrate.staging_map.StagingEntry` shaped like that entry's
+input schema: every declared column in its declared dtype, values inside the
+column's range and ``isin`` checks, and identifier columns (games, teams,
+players, seasons, dates) drawn from the universe so staging tables join the
+way real ones do.  Columns the transforms read that no schema declares are
+added too, so every transformer runs on the result.
+
+:class:`SyntheticTransport` serves those frames in place of
+``BaseExtractor._call_nba_api``, so stats extractors run end to end with no
+network and an optional simulated per-call latency.
+
+The same seed and scale always produce the same frames.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from nba_api.library.http import NBAHTTP
+
+from nbadb.extract.base import BaseExtractor, _extract_season_type
+from nbadb.extract.raw_schema_registry import get_raw_schema
+from nbadb.load.layout import SORT_KEYS
+from nbadb.orchestrate.staging_batches import digest_jsonable
+from nbadb.orchestrate.staging_map import STAGING_MAP, get_by_endpoint
+from nbadb.schemas.registry import get_input_schema, get_output_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from nbadb.orchestrate.staging_map import ParamPattern, StagingEntry
+
+_FIRST_TEAM_ID = 1_610_612_737
+_FIRST_PLAYER_ID = 200_001
+_SEASON_OPENER = (10, 22)  # month, day
+_REGULAR_SEASON = "Regular Season"
+# Rows fabricated per call for result sets with no game, team or player key.
+_UNKEYED_ROWS = 10
+# Upper bound for numeric columns whose schema only declares a lower bound.
+_DEFAULT_SPAN = 100
+
+_PLAYER_SUFFIXES = ("player_id", "person_id")
+_DATE_COLUMNS = frozenset({"game_date", "date", "game_date_est"})
+_SEASON_COLUMNS = frozenset({"season", "season_year"})
+_HOME_TEAM_COLUMNS = frozenset({"home_team_id", "team_id_home"})
+_AWAY_TEAM_COLUMNS = frozenset({"visitor_team_id", "away_team_id", "team_id_away"})
+_PLAYER_COLUMN = re.compile(r"(?:player\d?|person)_id$")
+_LINEUP_SIZE = 5
+
+# Staging columns the transforms read that no input or raw schema declares:
+# fields extractors add after the call, and legacy names the SQL still uses.
+# Keyed by staging key, or by endpoint name for every result set it returns.
+_TRANSFORM_COLUMNS: dict[str, dict[str, pl.DataType]] = {
+    "player_dashboard_clutch": {
+        "team_id": pl.Int64(),
+        "off_rating": pl.Float64(),
+        "def_rating": pl.Float64(),
+        "net_rating": pl.Float64(),
+    },
+    "team_dashboard_general_splits": {"team_id": pl.Int64(), "season_year": pl.String()},
+    "stg_box_score_misc": {
+        name: pl.Int64()
+        for name in (
+            "pts_2nd_chance",
+            "pts_fb",
+            "pts_paint",
+            "opp_pts_2nd_chance",
+            "opp_pts_fb",
+            "opp_pts_paint",
+        )
+    },
+    "stg_box_score_player_track_team": {"spd": pl.Float64()},
+    "stg_box_score_scoring": {"pct_pts_paint": pl.Float64()},
+    "stg_league_game_log": {
+        "season_year": pl.String(),
+        "season_type": pl.String(),
+        "home_team_id": pl.Int64(),
+        "visitor_team_id": pl.Int64(),
+        "wl_home": pl.String(),
+        "pts_home": pl.Int64(),
+        "pts_away": pl.Int64(),
+        "plus_minus_home": pl.Int64(),
+        "plus_minus_away": pl.Int64(),
+        "arena_name": pl.String(),
+        "arena_city": pl.String(),
+    },
+    "stg_line_score": {
+        "team_id_home": pl.Int64(),
+        "team_id_away": pl.Int64(),
+        **{
+            f"pts_{period}_{side}": pl.Int64()
+            for period in ("qtr1", "qtr2", "qtr3", "qtr4", "ot1", "ot2")
+            for side in ("home", "away")
+        },
+    },
+    "stg_lineup": {"net_rating": pl.Float64()},
+    "stg_matchup": {"def_fgm": pl.Float64(), "def_fga": pl.Float64(), "def_fg_pct": pl.Float64()},
+    "stg_play_by_play": {
+        "event_num": pl.Int64(),
+        "event_msg_type": pl.Int64(),
+        "event_msg_action_type": pl.Int64(),
+        "wc_time_string": pl.String(),
+        "pc_time_string": pl.String(),
+        "home_description": pl.String(),
+        "neutral_description": pl.String(),
+        "visitor_description": pl.String(),
+        "score": pl.String(),
+        "score_margin": pl.String(),
+        **{
+            f"player{slot}_{suffix}": pl.Int64()
+            for slot in (1, 2, 3)
+            for suffix in ("id", "team_id")
+        },
+    },
+    "stg_player_college": {"college_name": pl.String()},
+    "stg_player_info": {
+        "player_id": pl.Int64(),
+        "full_name": pl.String(),
+        "season": pl.String(),
+        "birth_date": pl.String(),
+        "jersey_number": pl.String(),
+        "college_id": pl.Int64(),
+    },
+    "stg_player_on_details": {
+        "season_year": pl.String(),
+        "season_type": pl.String(),
+        "on_off": pl.String(),
+        "off_rating": pl.Float64(),
+        "def_rating": pl.Float64(),
+        "net_rating": pl.Float64(),
+    },
+    "stg_player_vs_player": {
+        "team_id": pl.Int64(),
+        "season_year": pl.String(),
+        "matchup_min": pl.Float64(),
+        "player_pts": pl.Int64(),
+        "team_pts": pl.Int64(),
+    },
+    "stg_playoff_picture_east": {"team_id": pl.Int64()},
+    "stg_playoff_picture_west": {"team_id": pl.Int64()},
+    "stg_scoreboard_west_conf": {"return_to_play": pl.String()},
+    "stg_standings": {
+        "season_year": pl.String(),
+        "conference_rank": pl.Int64(),
+        "home_record": pl.String(),
+        "road_record": pl.String(),
+        "last_ten": pl.String(),
+        "streak": pl.String(),
+    },
+    "stg_synergy": {
+        "season_year": pl.String(),
+        "entity_type": pl.String(),
+        "ft_poss_pct": pl.Float64(),
+        "tov_poss_pct": pl.Float64(),
+        "sf_poss_pct": pl.Float64(),
+        "score_poss_pct": pl.Float64(),
+    },
+    "stg_team_lineups": {"net_rating": pl.Float64()},
+    "stg_video_events": {"game_id": pl.String()},
+    "stg_video_events_asset": {"game_id": pl.String()},
+    "stg_win_probability": {"pc_time_string": pl.String()},
+}
+# Free-text staging columns whose values star schemas cast or check.
+_TEXT_VALUES: dict[str, tuple[str, ...]] = {
+    "draft_number": tuple(str(pick) for pick in range(1, 61)),
+    "draft_round": ("1", "2"),
+    "draft_year": tuple(str(year) for year in range(2005, 2024)),
+    "type_grouping": ("offensive", "defensive"),
+    "weight": tuple(str(pounds) for pounds in range(180, 285, 5)),
+}
+# Result sets the live API returns without headers; they stage empty.
+_EMPTY_RESULT_SETS = frozenset({"stg_defense_hub_stat10"})
+
+
+def season_label(start_year: int) -> str:
+    """``2023`` -> ``"2023-24"``."""
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticGame:
+    game_id: str
+    season: str
+    game_date: date
+    home_team_id: int
+    visitor_team_id: int
+
+    @property
+    def team_ids(self) -> tuple[int, int]:
+        return (self.home_team_id, self.visitor_team_id)
+
+
+@dataclass(frozen=True, slots=True)
+class _Scope:
+    """The slice of the universe one extractor call asks about."""
+
+    season: str
+    games: tuple[SyntheticGame, ...]
+    team_ids: tuple[int, ...]
+    player_ids: tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Bounds:
+    low: float | None = None
+    high: float | None = None
+    low_exclusive: bool = False
+    high_exclusive: bool = False
+    allowed: tuple[Any, ...] = ()
+
+
+class SyntheticUniverse:
+    """A seeded league of ``teams`` teams playing ``games_per_season`` games a season.
+
+    Rosters are fixed across seasons; games are scheduled round-robin from
+    late October, ``teams // 2`` per day.  Play-by-play style result sets
+    (those with a storage sort key) get ``events_per_game`` rows per game.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int = 0,
+        seasons: int = 1,
+        games_per_season: int = 100,
+        teams: int = 30,
+        players_per_team: int = 13,
+        events_per_game: int = 400,
+        first_season: int = 2023,
+    ) -> None:
+        if seasons < 1 or games_per_season < 1 or teams < 2 or players_per_team < 1:
+            raise ValueError("synthetic universe needs a season, a game, two teams and a player")
+        self.seed = seed
+        self.seasons = tuple(season_label(first_season + i) for i in range(seasons))
+        self.games_per_season = games_per_season
+        self.events_per_game = events_per_game
+        self.team_ids = tuple(_FIRST_TEAM_ID + i for i in range(teams))
+        self.roster: dict[int, tuple[int, ...]] = {
+            team_id: tuple(
+                _FIRST_PLAYER_ID + index * players_per_team + slot
+                for slot in range(players_per_team)
+            )
+            for index, team_id in enumerate(self.team_ids)
+        }
+        self.player_team = {
+            player_id: team_id for team_id, players in self.roster.items() for player_id in players
+        }
+        self.player_ids = tuple(self.player_team)
+        self.games = tuple(self._schedule(first_season + i) for i in range(seasons))
+
+    @property
+    def scale(self) -> dict[str, int]:
+        """The knobs that, with the seed, fully determine the universe."""
+        return {
+            "seed": self.seed,
+            "seasons": len(self.seasons),
+            "games_per_season": self.games_per_season,
+            "teams": len(self.team_ids),
+            "players_per_team": len(self.roster[self.team_ids[0]]),
+            "events_per_game": self.events_per_game,
+        }
+
+    @cached_property
+    def _games_by_id(self) -> dict[str, SyntheticGame]:
+        return {game.game_id: game for season in self.games for game in season}
+
+    def _schedule(self, start_year: int) -> tuple[SyntheticGame, ...]:
+        teams = self.team_ids
+        per_day = max(1, len(teams) // 2)
+        opener = date(start_year, *_SEASON_OPENER)
+        games: list[SyntheticGame] = []
+        for number in range(self.games_per_season):
+            home = number % len(teams)
+            offset = 1 + (number // len(teams)) % (len(teams) - 1)
+            games.append(
+                SyntheticGame(
+                    game_id=f"002{start_year % 100:02d}{number + 1:05d}",
+                    season=season_label(start_year),
+                    game_date=opener + timedelta(days=number // per_day),
+                    home_team_id=teams[home],
+                    visitor_team_id=teams[(home + offset) % len(teams)],
+                )
+            )
+        return tuple(games)
+
+    # ------------------------------------------------------------------
+    # Call parameters
+    # ------------------------------------------------------------------
+
+    def params_for(self, pattern: ParamPattern) -> list[dict[str, Any]]:
+        """Extractor params for every call a sweep of *pattern* would make."""
+        seasons = [{"season": season, "season_type": _REGULAR_SEASON} for season in self.seasons]
+        match pattern:
+            case "static":
+                return [{}]
+            case "season":
+                return seasons
+            case "game" | "live":
+                return [{"game_id": game.game_id} for season in self.games for game in season]
+            case "date":
+                days = sorted({game.game_date for season in self.games for game in season})
+                return [{"game_date": day.isoformat()} for day in days]
+            case "player":
+                return [{"player_id": player_id} for player_id in self.player_ids]
+            case "team":
+                return [{"team_id": team_id} for team_id in self.team_ids]
+            case "player_season":
+                return [
+                    {"player_id": player_id, **season}
+                    for season in seasons
+                    for player_id in self.player_ids
+                ]
+            case "team_season":
+                return [
+                    {"team_id": team_id, **season}
+                    for season in seasons
+                    for team_id in self.team_ids
+                ]
+            case "player_team_season":
+                return [
+                    {"player_id": player_id, "team_id": team_id, **season}
+                    for season in seasons
+                    for team_id, players in self.roster.items()
+                    for player_id in players
+                ]
+        raise ValueError(f"unknown param pattern: {pattern!r}")
+
+    def _scope(self, params: dict[str, Any]) -> _Scope:
+        season = params.get("season") or self.seasons[-1]
+        season_index = self.seasons.index(season) if season in self.seasons else -1
+        games: tuple[SyntheticGame, ...]
+        if game_id := params.get("game_id"):
+            game = self._games_by_id.get(str(game_id))
+            games = (game,) if game is not None else ()
+            season = game.season if game is not None else season
+        elif game_date := params.get("game_date"):
+            games = tuple(
+                game
+                for season_games in self.games
+                for game in season_games
+                if game.game_date.isoformat() == str(game_date)[:10]
+            )
+        elif season_index >= 0 and "season" in params:
+            games = self.games[season_index]
+        else:
+            games = self.games[-1]
+
+        player_ids: tuple[int, ...] = ()
+        if (player_id := params.get("player_id")) is not None:
+            player_ids = (int(player_id),)
+        team_ids: tuple[int, ...]
+        if (team_id := params.get("team_id")) is not None:
+            team_ids = (int(team_id),)
+        elif player_ids:
+            team_ids = tuple({self.player_team[p] for p in player_ids if p in self.player_team})
+        elif params.get("game_id") or params.get("game_date"):
+            team_ids = tuple(dict.fromkeys(t for game in games for t in game.team_ids))
+        else:
+            team_ids = self.team_ids
+        if team_ids != self.team_ids:
+            games = tuple(g for g in games if set(g.team_ids) & set(team_ids))
+        if not player_ids:
+            player_ids = tuple(p for t in team_ids for p in self.roster.get(t, ()))
+        return _Scope(season=season, games=games, team_ids=team_ids, player_ids=player_ids)
+
+    # ------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------
+
+    def frame(self, entry: StagingEntry, params: dict[str, Any]) -> pl.DataFrame:
+        """The result set *entry* would receive for one call with *params*.
+
+        Like ``BaseExtractor._call_nba_api``, a ``season_type`` param is
+        stamped onto result sets that do not carry the column themselves.
+        """
+        frame = self._render(entry.staging_key, _entry_columns(entry), params)
+        if entry.staging_key in _EMPTY_RESULT_SETS:
+            return frame.clear()
+        if (season_type := params.get("season_type")) and "season_type" not in frame.columns:
+            return frame.with_columns(pl.lit(season_type).alias("season_type"))
+        return frame
+
+    def star_frame(self, table: str) -> pl.DataFrame:
+        """Star-schema *table* for the latest season, shaped like its output schema."""
+        columns = _star_columns(table)
+        if columns is None:
+            raise KeyError(f"no output schema for {table!r}")
+        return self._render(table, columns, {})
+
+    def _render(
+        self,
+        table: str,
+        columns: dict[str, tuple[pl.DataType, _Bounds]],
+        params: dict[str, Any],
+    ) -> pl.DataFrame:
+        scope = self._scope(params)
+        rng = random.Random(f"{self.seed}:{table}:{digest_jsonable(params)}")
+        keys = self._key_rows(table, columns, scope, rng)
+        height = len(next(iter(keys.values()))) if keys else _UNKEYED_ROWS
+        data: dict[str, list[Any]] = {}
+        for name, (dtype, bounds) in columns.items():
+            if name in keys:
+                data[name] = keys[name]
+            else:
+                data[name] = self._column(name, dtype, bounds, keys, scope, height, rng)
+        return pl.DataFrame(
+            data,
+            schema={name: dtype for name, (dtype, _bounds) in columns.items()},
+            strict=False,
+        )
+
+    def staging_frames(
+        self, entries: Iterable[StagingEntry] | None = None
+    ) -> dict[str, pl.DataFrame]:
+        """Every call's frame for each entry, concatenated per staging key."""
+        frames: dict[str, pl.DataFrame] = {}
+        for entry in STAGING_MAP if entries is None else entries:
+            parts = [self.frame(entry, params) for params in self.params_for(entry.param_pattern)]
+            frames[entry.staging_key] = pl.concat(parts, how="vertical_relaxed")
+        return frames
+
+    def _key_rows(
+        self,
+        table: str,
+        columns: dict[str, tuple[pl.DataType, _Bounds]],
+        scope: _Scope,
+        rng: random.Random,
+    ) -> dict[str, list[Any]]:
+        player_column = next((c for c in _PLAYER_SUFFIXES if c in columns), None)
+        team_column = "team_id" if "team_id" in columns else None
+        keys: dict[str, list[Any]] = {}
+
+        if sort_key := SORT_KEYS.get(table):
+            # Event streams: events_per_game rows per game, numbered in order.
+            for game in scope.games:
+                players = [p for t in game.team_ids for p in self.roster[t]]
+                for number in range(1, self.events_per_game + 1):
+                    row = {"game_id": game.game_id, sort_key[-1]: number, "event_num": number}
+                    if team_column:
+                        row[team_column] = rng.choice(game.team_ids)
+                    if player_column:
+                        row.update(dict.fromkeys(_PLAYER_SUFFIXES, rng.choice(players)))
+                    _append(keys, row, columns)
+            return keys
+
+        if "game_id" not in columns and not team_column and not player_column:
+            return keys
+        games: Iterable[SyntheticGame | None] = scope.games if "game_id" in columns else (None,)
+        for game in games:
+            team_ids = scope.team_ids
+            if game is not None:
+                team_ids = tuple(t for t in game.team_ids if t in scope.team_ids)
+            if player_column:
+                for team_id in team_ids:
+                    for player_id in self.roster.get(team_id, ()):
+                        if player_id not in scope.player_ids:
+                            continue
+                        row = {**dict.fromkeys(_PLAYER_SUFFIXES, player_id), "team_id": team_id}
+                        if game is not None:
+                            row["game_id"] = game.game_id
+                        _append(keys, row, columns)
+            elif team_column:
+                for team_id in team_ids:
+                    row: dict[str, Any] = {team_column: team_id}
+                    if game is not None:
+                        row["game_id"] = game.game_id
+                    _append(keys, row, columns)
+            elif game is not None:
+                _append(keys, {"game_id": game.game_id}, columns)
+        return keys
+
+    def _column(
+        self,
+        name: str,
+        dtype: pl.DataType,
+        bounds: _Bounds,
+        keys: dict[str, list[Any]],
+        scope: _Scope,
+        height: int,
+        rng: random.Random,
+    ) -> list[Any]:
+        if bounds.allowed:
+            return [rng.choice(bounds.allowed) for _ in range(height)]
+
+        games = [self._games_by_id[g] for g in keys["game_id"]] if "game_id" in keys else None
+        if name in _DATE_COLUMNS or dtype in (pl.Date, pl.Datetime):
+            if games is not None:
+                days = [game.game_date for game in games]
+            else:
+                fallback = scope.games[0].game_date if scope.games else self.games[-1][0].game_date
+                days = [fallback] * height
+            return _temporal(days, dtype)
+        if name in _SEASON_COLUMNS:
+            return [games[i].season if games else scope.season for i in range(height)]
+        if name == "season_id":
+            value = f"2{scope.season[:4]}"
+            return [value if dtype == pl.String else int(value)] * height
+        if name == "season_type":
+            return [_REGULAR_SEASON] * height
+        if name == "is_current":
+            return [True] * height
+        if name == "league_id":
+            return ["00"] * height
+        if name == "game_id":
+            pool = [game.game_id for game in scope.games] or [self.games[-1][0].game_id]
+            return [rng.choice(pool) for _ in range(height)]
+        if name in _HOME_TEAM_COLUMNS or name in _AWAY_TEAM_COLUMNS:
+            side = 0 if name in _HOME_TEAM_COLUMNS else 1
+            if games is not None:
+                return [game.team_ids[side] for game in games]
+        if name.endswith("team_id") and dtype.is_integer():
+            return [rng.choice(self.team_ids) for _ in range(height)]
+        if _PLAYER_COLUMN.search(name) and dtype.is_integer():
+            return [rng.choice(self.player_ids) for _ in range(height)]
+        if name == "team_abbreviation" and "team_id" in keys:
+            return [_abbreviation(self.team_ids.index(t)) for t in keys["team_id"]]
+        if name == "group_id" and "team_id" in keys:
+            return [self._lineup(team_id, rng) for team_id in keys["team_id"]]
+        if name in _TEXT_VALUES and dtype == pl.String:
+            return [rng.choice(_TEXT_VALUES[name]) for _ in range(height)]
+        if name.startswith("wl") and dtype == pl.String:
+            return [rng.choice(("W", "L")) for _ in range(height)]
+        if name.endswith("time_string"):
+            return [f"{rng.randrange(12)}:{rng.randrange(60):02d}" for _ in range(height)]
+        if dtype == pl.Boolean:
+            return [rng.random() < 0.5 for _ in range(height)]
+        if dtype.is_integer():
+            low, high = _integer_range(bounds)
+            return [rng.randint(low, high) for _ in range(height)]
+        if dtype.is_float():
+            low, high = _float_range(bounds)
+            return [round(rng.uniform(low, high), 3) for _ in range(height)]
+        if dtype == pl.String:
+            return [f"{name}_{rng.randrange(8)}" for _ in range(height)]
+        return [None] * height
+
+    def _lineup(self, team_id: int, rng: random.Random) -> str:
+        """A dash-separated lineup ``group_id`` drawn from *team_id*'s roster."""
+        roster = self.roster.get(team_id, ())
+        players = rng.sample(roster, min(_LINEUP_SIZE, len(roster)))
+        return "-".join(str(player_id) for player_id in sorted(players))
+
+
+class SyntheticTransport:
+    """Serves :class:`SyntheticUniverse` frames in place of the nba_api transport.
+
+    Each call returns one result set per staging entry registered for the
+    extractor's endpoint, at that entry's ``result_set_index``, after
+    sleeping ``latency_seconds`` to stand in for the network round trip.
+    """
+
+    def __init__(self, universe: SyntheticUniverse, *, latency_seconds: float = 0.0) -> None:
+        self.universe = universe
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def result_sets(self, endpoint_name: str, params: dict[str, Any]) -> list[pl.DataFrame]:
+        entries = {entry.result_set_index: entry for entry in get_by_endpoint(endpoint_name)}
+        if not entries:
+            return []
+        frames = [pl.DataFrame() for _ in range(max(entries) + 1)]
+        for index, entry in entries.items():
+            frames[index] = self.universe.frame(entry, params)
+        return frames
+
+    def __call__(
+        self, extractor: BaseExtractor, endpoint_cls: type, **kwargs: Any
+    ) -> list[pl.DataFrame]:
+        with self._lock:
+            self.calls += 1
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        params = _normalize_kwargs(kwargs)
+        if season_type := _extract_season_type(kwargs):
+            params["season_type"] = season_type
+        return self.result_sets(extractor.endpoint_name, params)
+
+    @contextmanager
+    def installed(self) -> Generator[SyntheticTransport, None, None]:
+        """Route every ``BaseExtractor._call_nba_api`` call here while active.
+
+        Extractors that build nba_api endpoints themselves never reach the
+        transport; their HTTP requests fail with ``ConnectionError`` instead
+        of going to the network.
+        """
+        original = BaseExtractor._call_nba_api
+        original_send = NBAHTTP.send_api_request
+        transport = self
+
+        def _call_nba_api(
+            self: BaseExtractor, endpoint_cls: type, **kwargs: Any
+        ) -> list[pl.DataFrame]:
+            return transport(self, endpoint_cls, **kwargs)
+
+        def _offline(self: NBAHTTP, endpoint: str, *args: Any, **kwargs: Any) -> Any:
+            raise ConnectionError(f"synthetic transport: no network for {endpoint}")
+
+        BaseExtractor._call_nba_api = _call_nba_api
+        NBAHTTP.send_api_request = _offline
+        try:
+            yield self
+        finally:
+            BaseExtractor._call_nba_api = original
+            NBAHTTP.send_api_request = original_send
+
+
+def _normalize_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Map nba_api endpoint kwargs back onto staging-map params."""
+    params: dict[str, Any] = {}
+    for key, value in kwargs.items():
+        if value in (None, ""):
+            continue
+        name = key.removesuffix("_nullable")
+        if name == "person_id":
+            name = "player_id"
+        if name in {"season", "game_id", "team_id", "player_id", "game_date"}:
+            params[name] = value
+    return params
+
+
+def _append(keys: dict[str, list[Any]], row: dict[str, Any], columns: dict[str, Any]) -> None:
+    for name, value in row.items():
+        if name in columns:
+            keys.setdefault(name, []).append(value)
+
+
+def _abbreviation(index: int) -> str:
+    return f"T{index:02d}"
+
+
+def _temporal(days: list[date], dtype: pl.DataType) -> list[Any]:
+    if dtype == pl.Date:
+        return days
+    if dtype == pl.Datetime:
+        return [datetime(day.year, day.month, day.day, 19, 30) for day in days]
+    return [day.isoformat() for day in days]
+
+
+def _integer_range(bounds: _Bounds) -> tuple[int, int]:
+    low = 0 if bounds.low is None else int(bounds.low) + int(bounds.low_exclusive)
+    if bounds.high is None:
+        return low, low + _DEFAULT_SPAN
+    high = int(bounds.high) - int(bounds.high_exclusive)
+    return (min(low, high) if bounds.low is not None else min(0, high)), high
+
+
+def _float_range(bounds: _Bounds) -> tuple[float, float]:
+    low = 0.0 if bounds.low is None else float(bounds.low)
+    high = low + _DEFAULT_SPAN if bounds.high is None else float(bounds.high)
+    if bounds.low is None:
+        low = min(low, high)
+    # Stay strictly inside exclusive bounds.
+    epsilon = (high - low) / 1000 or 0.001
+    return low + epsilon * bounds.low_exclusive, high - epsilon * bounds.high_exclusive
+
+
+def _bounds(checks: Iterable[Any]) -> _Bounds:
+    low: float | None = None
+    high: float | None = None
+    low_exclusive = high_exclusive = False
+    allowed: tuple[Any, ...] = ()
+    for check in checks:
+        stats = check.statistics or {}
+        match check.name:
+            case "greater_than_or_equal_to":
+                low = stats["min_value"]
+            case "greater_than":
+                low, low_exclusive = stats["min_value"], True
+            case "less_than_or_equal_to":
+                high = stats["max_value"]
+            case "less_than":
+                high, high_exclusive = stats["max_value"], True
+            case "in_range":
+                low, high = stats["min_value"], stats["max_value"]
+                low_exclusive = not stats.get("include_min", True)
+                high_exclusive = not stats.get("include_max", True)
+            case "isin":
+                allowed = tuple(stats["allowed_values"])
+    return _Bounds(low, high, low_exclusive, high_exclusive, allowed)
+
+
+def _entry_columns(entry: StagingEntry) -> dict[str, tuple[pl.DataType, _Bounds]]:
+    """Columns for *entry*: its input schema, plus the endpoint's raw schema for result set 0."""
+    return _schema_columns(entry.staging_key, entry.endpoint_name, entry.result_set_index)
+
+
+@cache
+def _star_columns(table: str) -> dict[str, tuple[pl.DataType, _Bounds]] | None:
+    schema_cls = get_output_schema(table)
+    if schema_cls is None:
+        return None
+    return {
+        name: (column.dtype.type, _bounds(column.checks))
+        for name, column in schema_cls.to_schema().columns.items()
+    }
+
+
+@cache
+def _schema_columns(
+    staging_key: str, endpoint_name: str, result_set_index: int
+) -> dict[str, tuple[pl.DataType, _Bounds]]:
+    schemas = [get_input_schema(staging_key)]
+    if result_set_index == 0:
+        schemas.append(get_raw_schema(endpoint_name))
+    columns: dict[str, tuple[pl.DataType, _Bounds]] = {}
+    for schema_cls in schemas:
+        if schema_cls is None:
+            continue
+        for name, column in schema_cls.to_schema().columns.items():
+            columns.setdefault(name, (column.dtype.type, _bounds(column.checks)))
+    for supplement in (_TRANSFORM_COLUMNS.get(staging_key), _TRANSFORM_COLUMNS.get(endpoint_name)):
+        for name, dtype in (supplement or {}).items():
+            columns.setdefault(name, (dtype, _Bounds()))
+    return columns
@@ -245,12 +245,19 @@ def build_actual_table_year_matrix(
 def build_journal_status_matrix(conn: duckdb.DuckDBPyConnection) -> list[dict[str, Any]]:
     if not _table_exists(conn, "_extraction_journal"):
         return []
+    # Journals migrated by DBManager carry typed season columns; older
+    # read-only snapshots fall back to parsing the params JSON.
+    if {"season", "season_type"} <= _table_columns(conn, "_extraction_journal"):
+        season_expr, season_type_expr = "season", "season_type"
+    else:
+        season_expr = "json_extract_string(params, '$.season')"
+        season_type_expr = "json_extract_string(params, '$.season_type')"
     rows = conn.execute(
-        """
+        f"""
         SELECT
             endpoint,
-            json_extract_string(params, '$.season') AS season,
-            json_extract_string(params, '$.season_type') AS season_type,
+            {season_expr} AS season,
+            {season_type_expr} AS season_type,
             status,
             COUNT(*) AS count,
             COALESCE(SUM(rows_extracted), 0) AS rows_extracted,
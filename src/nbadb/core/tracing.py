@@ -0,0 +1,290 @@
+"""Span-based tracing for pipeline runs.
+
+A :class:`Tracer` records nested, timed spans tagged with a pipeline phase
+(discovery, extraction, staging, materialize, transform, validation, load,
+quality).  A finished run can be written as a Chrome trace-event file
+(open it in ``chrome://tracing`` or Perfetto for a flame graph) and rolled
+up per phase into the ``_pipeline_spans`` table that ``nbadb status``
+reports on.
+
+A disabled tracer hands out one shared no-op context manager, so
+instrumented code costs a single attribute check when tracing is off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+    import duckdb
+
+PHASES = (
+    "run",
+    "discovery",
+    "extraction",
+    "staging",
+    "materialize",
+    "transform",
+    "validation",
+    "load",
+    "quality",
+)
+
+_NOOP_SPAN = contextlib.nullcontext()
+
+# (tracer id, phase) of the innermost open span in the current task/thread.
+_open_span: ContextVar[tuple[int, str] | None] = ContextVar("nbadb_open_span", default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """One finished span; times are ``perf_counter_ns`` values."""
+
+    name: str
+    phase: str
+    start_ns: int
+    end_ns: int
+    track: int
+    nested_in_phase: bool
+    attrs: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseRollup:
+    """Per-phase totals for one run.
+
+    ``busy_seconds`` sums the outermost spans of the phase (concurrent
+    spans each count), while ``wall_seconds`` is the length of the union of
+    their intervals, i.e. how long the phase was active at all.
+    """
+
+    phase: str
+    span_count: int
+    busy_seconds: float
+    wall_seconds: float
+    max_span_seconds: float
+
+
+class Tracer:
+    """Collects spans for one pipeline run."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        run_id: str | None = None,
+        run_mode: str = "unknown",
+    ) -> None:
+        self.enabled = enabled
+        self.run_id = run_id or uuid.uuid4().hex
+        self.run_mode = run_mode
+        self.started_at = datetime.now(UTC)
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: list[Span] = []
+        self._tracks: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> tuple[Span, ...]:
+        with self._lock:
+            return tuple(self._spans)
+
+    def span(
+        self,
+        name: str,
+        *,
+        phase: str | None = None,
+        **attrs: object,
+    ) -> AbstractContextManager[None]:
+        """Time the enclosed block.
+
+        *phase* defaults to the enclosing span's phase, so helpers called
+        under e.g. a ``transform`` span are attributed to it without naming
+        it themselves.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return self._record(name, phase, attrs)
+
+    @contextlib.contextmanager
+    def _record(self, name: str, phase: str | None, attrs: dict[str, object]) -> Iterator[None]:
+        parent = _open_span.get()
+        parent_phase = parent[1] if parent is not None and parent[0] == id(self) else None
+        resolved = phase or parent_phase or name
+        token = _open_span.set((id(self), resolved))
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        except BaseException as exc:
+            attrs["error"] = type(exc).__name__
+            raise
+        finally:
+            end_ns = time.perf_counter_ns()
+            _open_span.reset(token)
+            span = Span(
+                name=name,
+                phase=resolved,
+                start_ns=start_ns,
+                end_ns=end_ns,
+                track=self._track(),
+                nested_in_phase=parent_phase == resolved,
+                attrs=attrs,
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    def _track(self) -> int:
+        """Small stable id for the current asyncio task, or thread outside a loop.
+
+        Trace viewers require the spans on one track to nest, which
+        concurrent tasks sharing the event-loop thread would not.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        with self._lock:
+            return self._tracks.setdefault(key, len(self._tracks) + 1)
+
+    # ── reporting ──────────────────────────────────────────────
+
+    def rollup(self) -> list[PhaseRollup]:
+        """Aggregate spans per phase, in pipeline order."""
+        by_phase: dict[str, list[Span]] = {}
+        for span in self.spans:
+            if not span.nested_in_phase:
+                by_phase.setdefault(span.phase, []).append(span)
+        order = {phase: index for index, phase in enumerate(PHASES)}
+        rollups = []
+        for phase in sorted(by_phase, key=lambda p: (order.get(p, len(order)), p)):
+            spans = by_phase[phase]
+            rollups.append(
+                PhaseRollup(
+                    phase=phase,
+                    span_count=len(spans),
+                    busy_seconds=sum(span.duration_seconds for span in spans),
+                    wall_seconds=_union_seconds(spans),
+                    max_span_seconds=max(span.duration_seconds for span in spans),
+                )
+            )
+        return rollups
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Write the spans as Chrome trace-event JSON and return *path*."""
+        pid = 1
+        events: list[dict[str, object]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": f"nbadb {self.run_mode}"},
+            }
+        ]
+        for span in sorted(self.spans, key=lambda s: (s.start_ns, -s.end_ns)):
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.phase,
+                    "ph": "X",
+                    "ts": (span.start_ns - self._origin_ns) / 1_000,
+                    "dur": (span.end_ns - span.start_ns) / 1_000,
+                    "pid": pid,
+                    "tid": span.track,
+                    "args": span.attrs,
+                }
+            )
+        payload = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "run_id": self.run_id,
+                "run_mode": self.run_mode,
+                "started_at": self.started_at.isoformat(),
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        return path
+
+    def trace_filename(self) -> str:
+        return f"{self.run_mode}-{self.started_at:%Y%m%dT%H%M%SZ}-{self.run_id[:8]}.trace.json"
+
+    def persist(self, conn: duckdb.DuckDBPyConnection) -> int:
+        """Upsert the per-phase rollup into ``_pipeline_spans``."""
+        rows = [
+            [
+                self.run_id,
+                self.run_mode,
+                rollup.phase,
+                self.started_at,
+                rollup.span_count,
+                rollup.busy_seconds,
+                rollup.wall_seconds,
+                rollup.max_span_seconds,
+            ]
+            for rollup in self.rollup()
+        ]
+        if not rows:
+            return 0
+        conn.executemany(
+            """INSERT INTO _pipeline_spans
+               (run_id, run_mode, phase, started_at, span_count,
+                busy_seconds, wall_seconds, max_span_seconds)
+               VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+               ON CONFLICT (run_id, phase) DO UPDATE SET
+                   span_count = EXCLUDED.span_count,
+                   busy_seconds = EXCLUDED.busy_seconds,
+                   wall_seconds = EXCLUDED.wall_seconds,
+                   max_span_seconds = EXCLUDED.max_span_seconds""",
+            rows,
+        )
+        return len(rows)
+
+    def log_summary(self) -> None:
+        for rollup in self.rollup():
+            logger.info(
+                "trace {}: {:.2f}s wall, {:.2f}s busy over {} spans",
+                rollup.phase,
+                rollup.wall_seconds,
+                rollup.busy_seconds,
+                rollup.span_count,
+            )
+
+
+def _union_seconds(spans: list[Span]) -> float:
+    total_ns = 0
+    current_start: int | None = None
+    current_end = 0
+    for span in sorted(spans, key=lambda s: s.start_ns):
+        if current_start is None or span.start_ns > current_end:
+            if current_start is not None:
+                total_ns += current_end - current_start
+            current_start, current_end = span.start_ns, span.end_ns
+        else:
+            current_end = max(current_end, span.end_ns)
+    if current_start is not None:
+        total_ns += current_end - current_start
+    return total_ns / 1e9
+
+
+NOOP_TRACER = Tracer(enabled=False, run_id="disabled")
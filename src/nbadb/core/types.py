@@ -205,6 +205,25 @@ class SeasonPhase(StrEnum):
     ALL_STAR = "All-Star"
 
 
+# Labels of fact_play_by_play.event_type_name, in event_msg_type order.
+EVENT_TYPE_NAMES: tuple[str, ...] = (
+    "made_shot",
+    "missed_shot",
+    "free_throw",
+    "rebound",
+    "turnover",
+    "foul",
+    "violation",
+    "substitution",
+    "timeout",
+    "jump_ball",
+    "ejection",
+    "period_start",
+    "period_end",
+    "unknown",
+)
+
+
 type GameId = str
 type PlayerId = int
 type TeamId = int
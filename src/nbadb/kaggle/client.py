@@ -19,7 +19,7 @@ from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from typing import BinaryIO, Protocol
 
     class _FcntlModule(Protocol):
@@ -44,6 +44,7 @@ from nbadb.core.artifact_identity import (
 )
 from nbadb.core.config import get_settings
 from nbadb.core.types import validate_sql_identifier
+from nbadb.kaggle.package import PACKAGE_MANIFEST_NAME, PackageManifest, resource_schema_hash
 
 PUBLICATION_MARKER_NAME = "nbadb-publication.json"
 PUBLICATION_STATE_NAME = "kaggle-publication-state.json"
@@ -57,6 +58,8 @@ UPLOAD_SERIALIZATION_CONTRACT = {
 _PUBLICATION_RECORD_STATES = frozenset({"failed", "resolved", "unresolved"})
 _REMOTE_FILE_LIST_PAGE_SIZE = 1000
 _DISK_SAFETY_RESERVE_BYTES = 1024 * 1024 * 1024
+# Linux ``FICLONE`` ioctl: share extents with the source on btrfs/XFS/bcachefs.
+_FICLONE = 0x40049409
 
 _PROCESS_UPLOAD_LOCK = threading.Lock()
 _AUTHORIZATION_BEARER_RE = re.compile(
@@ -129,6 +132,7 @@ class KaggleClient:
     def __init__(self) -> None:
         self._settings = get_settings()
         self._dataset = self._settings.kaggle_dataset
+        self._package: PackageManifest | None = None
 
     def download(self, target_dir: Path | None = None) -> Path:
         """Download latest dataset from Kaggle and copy to data dir."""
@@ -315,6 +319,7 @@ class KaggleClient:
             require_assured=require_assured,
             require_terminal_assurance=full_publication,
         )
+        preflight["package_delta"] = self._package_delta(preflight)
         with tempfile.TemporaryDirectory(prefix="nbadb-kaggle-upload-") as temp_dir:
             staged_dir = Path(temp_dir) / "dataset"
             staged_dir.mkdir(parents=True)
@@ -681,6 +686,7 @@ class KaggleClient:
                             },
                             publication=publication,
                         )
+                        self._commit_package(preflight)
                         logger.info("Kaggle already exposes the staged bundle; upload skipped")
                         return manifest_path
                     if prior_unresolved is not None:
@@ -816,6 +822,7 @@ class KaggleClient:
                         },
                         publication=publication,
                     )
+                    self._commit_package(preflight)
                     logger.info("Kaggle bootstrap recheck found the staged bundle; upload skipped")
                     return manifest_path
                 if not bootstrap_recheck["upload_allowed"]:
@@ -902,6 +909,7 @@ class KaggleClient:
                         status="reconciled_existing_remote",
                         resolved_version=resolved_version,
                     )
+                    self._commit_package(preflight)
                     return self._write_upload_manifest(
                         data_dir=upload_dir,
                         staged_dir=staged_dir,
@@ -1100,6 +1108,7 @@ class KaggleClient:
                 remote_readback=remote_readback,
                 publication=publication,
             )
+        self._commit_package(preflight)
         logger.info(f"Uploaded dataset from {upload_dir}")
         logger.info(f"Wrote Kaggle upload manifest to {manifest_path}")
         return manifest_path
@@ -1487,17 +1496,30 @@ class KaggleClient:
                 msg = f"Kaggle metadata declares duplicate resolved resource: {normalized_path}"
                 raise ValueError(msg)
             seen_resolved_paths.add(resolved_resource_path)
+            schema_hash = resource_schema_hash(resource)
             if resolved_resource_path.is_file():
-                database_validation = self._database_validation_for_resource(
+                database_validation = self._cached_validation(
+                    self._database_validation_for_resource,
+                    "database",
                     resolved_resource_path,
                     normalized_path,
+                    schema_hash=schema_hash,
                 )
-                parquet_validation = self._parquet_validation_for_resource(
+                parquet_validation = self._cached_validation(
+                    self._parquet_validation_for_resource,
+                    "parquet",
                     resolved_resource_path,
                     normalized_path,
+                    schema_hash=schema_hash,
                 )
                 csv_validation = (
-                    self._validate_csv_file(resolved_resource_path, normalized_path)
+                    self._cached_validation(
+                        self._validate_csv_file,
+                        "csv",
+                        resolved_resource_path,
+                        normalized_path,
+                        schema_hash=schema_hash,
+                    )
                     if require_terminal_assurance
                     and PurePosixPath(normalized_path).suffix.lower() == ".csv"
                     else None
@@ -1507,7 +1529,8 @@ class KaggleClient:
                     "source_path": str(resolved_resource_path),
                     "kind": "file",
                     "bytes": resolved_resource_path.stat().st_size,
-                    "sha256": self._file_sha256(resolved_resource_path),
+                    "sha256": self._cached_file_sha256(resolved_resource_path),
+                    "schema_hash": schema_hash,
                 }
                 if database_validation is not None:
                     inventory["database_validation"] = database_validation
@@ -1523,6 +1546,7 @@ class KaggleClient:
                     normalized_path,
                     directory_inventory,
                     resolved_resource_path,
+                    schema_hash=schema_hash,
                 )
                 resource_inventory.append(
                     {
@@ -1532,6 +1556,7 @@ class KaggleClient:
                         "bytes": directory_inventory["bytes"],
                         "file_count": directory_inventory["file_count"],
                         "sha256": directory_inventory["fingerprint"],
+                        "schema_hash": schema_hash,
                         "files": directory_inventory["files"],
                     }
                 )
@@ -2017,6 +2042,63 @@ class KaggleClient:
                 digest.update(chunk)
         return digest.hexdigest()
 
+    @property
+    def _package_manifest(self) -> PackageManifest:
+        if self._package is None:
+            self._package = PackageManifest.load(
+                self._settings.log_dir / "kaggle" / PACKAGE_MANIFEST_NAME
+            )
+        return self._package
+
+    def _cached_file_sha256(self, path: Path) -> str:
+        """Hash *path* unless the package manifest already holds its digest."""
+        return self._package_manifest.sha256(path, compute=self._file_sha256)
+
+    def _cached_validation(
+        self,
+        validate: Callable[[Path, str], dict[str, Any] | None],
+        engine: str,
+        path: Path,
+        resource_path: str,
+        *,
+        schema_hash: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Run *validate* unless this file and declared schema passed *engine* before."""
+        return self._package_manifest.validation(
+            path,
+            engine,
+            lambda: validate(path, resource_path),
+            schema_hash=schema_hash,
+        )
+
+    def _package_delta(self, preflight: dict[str, Any]) -> dict[str, Any]:
+        """Diff the preflight inventory against the previously published package."""
+        package = self._package_manifest
+        delta = package.diff(preflight["resources"])
+        logger.info(
+            f"Kaggle package delta: {len(delta.added)} added, {len(delta.changed)} changed, "
+            f"{len(delta.removed)} removed, {len(delta.unchanged)} unchanged; "
+            f"hashed {package.hashed} file(s), reused {package.reused} digest(s)"
+        )
+        return {
+            **delta.to_dict(),
+            "hashed_files": package.hashed,
+            "reused_digests": package.reused,
+        }
+
+    def _commit_package(self, preflight: dict[str, Any]) -> None:
+        """Persist the preflight inventory as the published package.
+
+        Only called once Kaggle holds the bundle, so a failed upload is diffed
+        against the last package that actually went out.
+        """
+        package = self._package_manifest
+        package.record(preflight["resources"])
+        try:
+            package.save()
+        except OSError as exc:
+            logger.warning(f"Could not persist Kaggle package manifest: {exc}")
+
     @staticmethod
     def _normalize_resource_path(raw_path: str) -> str:
         if "\\" in raw_path:
@@ -2035,11 +2117,13 @@ class KaggleClient:
     def _resource_paths_overlap(first_path: str, second_path: str) -> bool:
         return first_path.startswith(f"{second_path}/") or second_path.startswith(f"{first_path}/")
 
-    @staticmethod
     def _validate_directory_resource_inventory(
+        self,
         resource_path: str,
         directory_inventory: dict[str, Any],
         directory_path: Path,
+        *,
+        schema_hash: str | None = None,
     ) -> None:
         if int(directory_inventory.get("file_count", 0)) == 0:
             msg = f"Kaggle directory resource is empty: {resource_path}"
@@ -2059,9 +2143,12 @@ class KaggleClient:
                     f"{resource_path}/{relative_path}"
                 )
                 raise ValueError(msg)
-            file_inventory["parquet_validation"] = KaggleClient._validate_parquet_file(
+            file_inventory["parquet_validation"] = self._cached_validation(
+                self._validate_parquet_file,
+                "parquet_file",
                 directory_path / relative_path,
                 f"{resource_path}/{relative_path}",
+                schema_hash=schema_hash,
             )
 
     def _directory_inventory(self, path: Path) -> dict[str, Any]:
@@ -2080,7 +2167,7 @@ class KaggleClient:
                 {
                     "path": relative_path,
                     "bytes": size,
-                    "sha256": self._file_sha256(child),
+                    "sha256": self._cached_file_sha256(child),
                 }
             )
         fingerprint_source = json.dumps(files, sort_keys=True, separators=(",", ":"))
@@ -2111,12 +2198,13 @@ class KaggleClient:
         except OSError as exc:
             if exc.errno not in {errno.EXDEV, errno.EPERM, errno.EACCES, errno.ENOTSUP}:
                 raise
-            self._require_disk_capacity(
-                destination.parent,
-                required_bytes=int(inventory["bytes"]) + _DISK_SAFETY_RESERVE_BYTES,
-                operation=f"fallback staging copy of {relative_path}",
-            )
-            shutil.copy2(source_path, destination)
+            if not self._reflink_file(source_path, destination):
+                self._require_disk_capacity(
+                    destination.parent,
+                    required_bytes=int(inventory["bytes"]) + _DISK_SAFETY_RESERVE_BYTES,
+                    operation=f"fallback staging copy of {relative_path}",
+                )
+                shutil.copy2(source_path, destination)
         self._assert_file_matches_inventory(
             destination,
             inventory,
@@ -2139,11 +2227,31 @@ class KaggleClient:
             msg = f"Kaggle file inventory path does not exist: {relative_path}"
             raise FileNotFoundError(msg)
         size = path.stat().st_size
-        digest = self._file_sha256(path)
+        digest = self._cached_file_sha256(path)
         if size != inventory["bytes"] or digest != inventory["sha256"]:
             msg = f"{mismatch_message}: {relative_path}"
             raise ValueError(msg)
 
+    @staticmethod
+    def _reflink_file(source_path: Path, destination: Path) -> bool:
+        """Clone *source_path* copy-on-write where the filesystem supports it."""
+        try:
+            import fcntl
+        except ImportError:
+            return False
+        with source_path.open("rb") as source, destination.open("xb") as target:
+            try:
+                fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+            except OSError:
+                cloned = False
+            else:
+                cloned = True
+        if not cloned:
+            destination.unlink()
+            return False
+        shutil.copystat(source_path, destination)
+        return True
+
     @staticmethod
     def _require_disk_capacity(path: Path, *, required_bytes: int, operation: str) -> None:
         available_bytes = shutil.disk_usage(path).free
@@ -2414,7 +2522,7 @@ class KaggleClient:
                 {
                     "path": relative_path,
                     "bytes": size,
-                    "sha256": self._file_sha256(child),
+                    "sha256": self._cached_file_sha256(child),
                 }
             )
         fingerprint_source = json.dumps(files, sort_keys=True, separators=(",", ":"))
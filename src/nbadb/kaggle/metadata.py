@@ -254,6 +254,7 @@ TABLE_DESCRIPTIONS: dict[str, str] = {
     "agg_player_season_advanced": "Per-season advanced stat aggregates for each player including efficiency metrics (TS%, eFG%, USG%), rebounding rates, and pace.",
     "agg_player_season_per36": "Player season stats normalized to per-36-minutes basis.",
     "agg_player_season_per48": "Player season stats normalized to per-48-minutes basis.",
+    "agg_shot_chart_bins": "Shot attempts and makes per court grid cell (1, 2 and 5 ft) per player, team, season and season type; point lookups for shot heatmaps.",
     "agg_shot_location_season": "Season-level shooting aggregates by court location for each player.",
     "agg_shot_zones": "Shooting efficiency by zone per player per season: attempts, makes, FG%, average distance.",
     "agg_team_defense": "Team defensive efficiency per season combining defensive rating, opponent shooting, and hustle metrics.",
@@ -500,6 +501,7 @@ _CURATED_TABLE_CATEGORIES: dict[str, list[str]] = {
         "agg_player_season_advanced",
         "agg_player_season_per36",
         "agg_player_season_per48",
+        "agg_shot_chart_bins",
         "agg_shot_location_season",
         "agg_shot_zones",
         "agg_team_defense",
@@ -1215,8 +1217,14 @@ def generate_metadata(
             include_assurance_resources=include_assurance_resources,
         ),
     }
+    rendered = json.dumps(metadata, indent=2) + "\n"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(metadata, indent=2) + "\n", encoding="utf-8")
+    # Leaving an unchanged file untouched keeps its identity stable, so the
+    # Kaggle package manifest can reuse its digest instead of rehashing it.
+    if output_path.is_file() and output_path.read_text(encoding="utf-8") == rendered:
+        logger.info(f"Metadata at {output_path} is already current")
+        return
+    output_path.write_text(rendered, encoding="utf-8")
     logger.info(f"Generated metadata at {output_path}")
 
 
@@ -0,0 +1,202 @@
+"""Delta bookkeeping for Kaggle publication packages.
+
+Preparing an upload hashes and validates every declared resource several
+times: the preflight inventory, staging (source and hardlinked copy), the
+staged-tree snapshots and the pre-upload recheck.  :class:`PackageManifest`
+remembers each file's SHA-256 and validation results under its stat identity
+(device, inode, size, mtime), so unchanged files -- and their hardlinked
+staged copies, which share the identity -- are looked up instead of reread.
+It also keeps the previous package's per-resource inventory, including a hash
+of each resource's declared schema, so a run can report what changed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from nbadb.transform.schema_version import schema_hash_for_columns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+PACKAGE_MANIFEST_NAME = "kaggle-package-manifest.json"
+_PACKAGE_MANIFEST_VERSION = 1
+# Files modified this recently may be rewritten within the same mtime tick
+# without their identity changing, so their digests are not remembered.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_identity(path: Path) -> str:
+    """Return the stat identity a cached digest is valid for."""
+    stat = path.stat()
+    return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def resource_schema_hash(resource: dict[str, Any]) -> str | None:
+    """Hash the field names and types a metadata resource declares, if any."""
+    schema = resource.get("schema")
+    if not isinstance(schema, dict) or not isinstance(schema.get("fields"), list):
+        return None
+    fields = [item for item in schema["fields"] if isinstance(item, dict)]
+    return schema_hash_for_columns(
+        [str(item.get("name")) for item in fields],
+        [str(item.get("type")) for item in fields],
+    )
+
+
+@dataclass(slots=True)
+class PackageDelta:
+    """Resources added, changed, removed or unchanged since the previous package."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, list[str]]:
+        return asdict(self)
+
+
+class PackageManifest:
+    """Stat-keyed digest/validation cache plus the previous package's inventory."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.hashed = 0
+        self.reused = 0
+        self._files: dict[str, dict[str, Any]] = {}
+        self._resources: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+
+    @classmethod
+    def load(cls, path: Path) -> PackageManifest:
+        manifest = cls(path)
+        if not path.is_file():
+            return manifest
+        try:
+            payload = json.loads(path.read_bytes())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            logger.warning(f"Ignoring unreadable Kaggle package manifest {path}: {exc}")
+            return manifest
+        if (
+            not isinstance(payload, dict)
+            or payload.get("schema_version") != _PACKAGE_MANIFEST_VERSION
+            or not isinstance(payload.get("files"), dict)
+            or not isinstance(payload.get("resources"), dict)
+        ):
+            logger.warning(f"Ignoring Kaggle package manifest with unknown layout: {path}")
+            return manifest
+        manifest._files = payload["files"]
+        manifest._resources = payload["resources"]
+        return manifest
+
+    def _entry(self, path: Path) -> tuple[str, dict[str, Any]]:
+        identity = file_identity(path)
+        self._seen.add(identity)
+        return identity, self._files.get(identity, {})
+
+    @staticmethod
+    def _racy(identity: str) -> bool:
+        mtime_ns = int(identity.rsplit(":", 1)[1])
+        return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+    def sha256(self, path: Path, *, compute: Callable[[Path], str]) -> str:
+        """Return *path*'s digest, computing it only when its identity is new."""
+        identity, entry = self._entry(path)
+        cached = entry.get("sha256")
+        if isinstance(cached, str):
+            self.reused += 1
+            return cached
+        digest = compute(path)
+        self.hashed += 1
+        if not self._racy(identity):
+            self._files.setdefault(identity, {})["sha256"] = digest
+        return digest
+
+    def validation(
+        self,
+        path: Path,
+        engine: str,
+        validate: Callable[[], dict[str, Any] | None],
+        *,
+        schema_hash: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return a cached validation result for an unchanged file and schema."""
+        identity, entry = self._entry(path)
+        key = f"{engine}:{schema_hash or ''}"
+        validations = entry.get("validations", {})
+        if key in validations:
+            return validations[key]
+        result = validate()
+        if not self._racy(identity):
+            self._files.setdefault(identity, {}).setdefault("validations", {})[key] = result
+        return result
+
+    def diff(self, resources: Iterable[dict[str, Any]]) -> PackageDelta:
+        """Compare a resource inventory against the previous package."""
+        delta = PackageDelta()
+        current: set[str] = set()
+        for resource in resources:
+            path = str(resource["path"])
+            current.add(path)
+            previous = self._resources.get(path)
+            if previous is None:
+                delta.added.append(path)
+            elif (
+                previous.get("sha256") != resource["sha256"]
+                or previous.get("schema_hash") != resource.get("schema_hash")
+                or previous.get("kind") != resource["kind"]
+            ):
+                delta.changed.append(path)
+            else:
+                delta.unchanged.append(path)
+        delta.removed = sorted(set(self._resources) - current)
+        return delta
+
+    def record(self, resources: Iterable[dict[str, Any]]) -> None:
+        """Remember *resources* as the previous package for the next run."""
+        self._resources = {
+            str(resource["path"]): {
+                "kind": resource["kind"],
+                "bytes": resource["bytes"],
+                "sha256": resource["sha256"],
+                "schema_hash": resource.get("schema_hash"),
+            }
+            for resource in resources
+        }
+
+    def save(self) -> Path | None:
+        """Persist entries seen this run; files no longer present are dropped."""
+        if self.path is None:
+            return None
+        payload = {
+            "schema_version": _PACKAGE_MANIFEST_VERSION,
+            "files": {
+                identity: entry
+                for identity, entry in sorted(self._files.items())
+                if identity in self._seen
+            },
+            "resources": dict(sorted(self._resources.items())),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_name = tempfile.mkstemp(
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, sort_keys=True, separators=(",", ":"))
+            os.replace(temporary_name, self.path)
+        except Exception:
+            Path(temporary_name).unlink(missing_ok=True)
+            raise
+        return self.path
@@ -6,20 +6,59 @@ from loguru import logger
 
 from nbadb.core.types import validate_sql_identifier
 from nbadb.load.base import BaseLoader
+from nbadb.load.layout import sort_keys_for
 
 if TYPE_CHECKING:
     import duckdb
     import polars as pl
     import pyarrow as pa
 
+    from nbadb.transform.base import Passthrough
+
 
 # Threshold above which Arrow zero-copy is preferred over register+SELECT.
 _ARROW_THRESHOLD_ROWS = 100_000
 
 
+def _enum_cast(column: str, dtype: pl.DataType, values: pl.Series) -> str | None:
+    """``CAST`` a polars Enum/Categorical column to a DuckDB ENUM.
+
+    Registered frames surface both as VARCHAR, which stores the label per row.
+    """
+    import polars as pl
+
+    if isinstance(dtype, pl.Enum):
+        labels = dtype.categories.to_list()
+    elif isinstance(dtype, pl.Categorical):
+        labels = sorted(values.drop_nulls().unique().cast(pl.String).to_list())
+    else:
+        return None
+    if not labels:
+        return None
+    members = ", ".join("'" + label.replace("'", "''") + "'" for label in labels)
+    return f'CAST("{column}" AS ENUM({members})) AS "{column}"'
+
+
+def _layout_select(source: str, table: str, df: pl.DataFrame) -> str:
+    """``SELECT`` from *source* with dictionary-coded columns and storage order applied."""
+    casts = [
+        cast
+        for name, dtype in df.schema.items()
+        if (cast := _enum_cast(name, dtype, df.get_column(name))) is not None
+    ]
+    replace = f" REPLACE ({', '.join(casts)})" if casts else ""
+    select = f"SELECT *{replace} FROM {source}"
+    keys = sort_keys_for(table, df.columns)
+    if keys:
+        select += " ORDER BY " + ", ".join(f'"{key}"' for key in keys)
+    return select
+
+
 class DuckDBLoader(BaseLoader):
     def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
         self._conn = conn
+        # Passthrough views in the database file, read on first replace load
+        self._views: set[str] | None = None
 
     def load(
         self,
@@ -28,12 +67,87 @@ class DuckDBLoader(BaseLoader):
         mode: Literal["replace", "append"] = "replace",
     ) -> None:
         validate_sql_identifier(table)
+        if mode == "replace" and table in self._view_names():
+            self._conn.execute(f"DROP VIEW {self._qualified(table)}")
+            self._view_names().discard(table)
         # For large frames, use Arrow zero-copy path to avoid materialisation
         if df.shape[0] >= _ARROW_THRESHOLD_ROWS:
             self._load_via_arrow(table, df, mode)
         else:
             self._load_via_register(table, df, mode)
 
+    def load_passthrough_view(
+        self,
+        table: str,
+        df: pl.DataFrame,
+        passthrough: Passthrough,
+    ) -> bool:
+        """Define *table* as a view over its persisted source tables.
+
+        The sources are read from the database file itself (not from frames
+        registered on the connection), and the view is only created when they
+        produce exactly *df*'s schema and row count.  Returns ``False``
+        without writing anything otherwise, so the caller can fall back to
+        :meth:`load`.
+        """
+        import duckdb
+
+        validate_sql_identifier(table)
+        for source in passthrough.sources:
+            validate_sql_identifier(source)
+        persisted = passthrough.sql(catalog=self._catalog())
+        try:
+            schema = self._conn.execute(f"SELECT * FROM ({persisted}) LIMIT 0").pl().schema
+            row = self._conn.execute(f"SELECT COUNT(*) FROM ({persisted})").fetchone()
+        except duckdb.Error:
+            return False
+        if schema != df.schema or row is None or row[0] != df.shape[0]:
+            return False
+        self._drop_table(table)
+        self._conn.execute(
+            f"CREATE OR REPLACE VIEW {self._qualified(table)} AS {passthrough.sql()}"
+        )
+        self._view_names().add(table)
+        logger.debug(f"DuckDB: defined {table} as a view over {', '.join(passthrough.sources)}")
+        return True
+
+    def _view_names(self) -> set[str]:
+        """Views in the database file, listed once and then kept in step.
+
+        ``CREATE OR REPLACE TABLE`` cannot replace a view, so replace loads
+        check this set rather than querying the catalog for every table.
+        """
+        if self._views is None:
+            rows = self._conn.execute(
+                "SELECT view_name FROM duckdb_views() "
+                "WHERE database_name = current_database() AND schema_name = 'main' "
+                "AND NOT temporary"
+            ).fetchall()
+            self._views = {str(row[0]) for row in rows}
+        return self._views
+
+    def _catalog(self) -> str:
+        row = self._conn.execute("SELECT current_database()").fetchone()
+        return str(row[0]) if row is not None else "memory"
+
+    def _qualified(self, table: str) -> str:
+        catalog = self._catalog().replace('"', '""')
+        return f'"{catalog}".main.{table}'
+
+    def _drop_table(self, table: str) -> None:
+        """Drop *table* if it exists in the database file as a base table.
+
+        ``CREATE OR REPLACE VIEW`` cannot replace a table.
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM duckdb_tables() "
+            "WHERE database_name = current_database() AND schema_name = 'main' "
+            "AND NOT temporary AND table_name = ?",
+            [table],
+        ).fetchone()
+        if row is not None:
+            self._conn.execute(f"DROP TABLE {self._qualified(table)}")
+
     def _load_via_register(
         self,
         table: str,
@@ -43,7 +157,8 @@ class DuckDBLoader(BaseLoader):
         """Standard load path: register DataFrame then SELECT."""
         self._conn.register("_load_df", df)
         if mode == "replace":
-            self._conn.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM _load_df")
+            select = _layout_select("_load_df", table, df)
+            self._conn.execute(f"CREATE OR REPLACE TABLE {table} AS {select}")
         else:
             self._conn.execute(f"INSERT INTO {table} SELECT * FROM _load_df")
         self._conn.unregister("_load_df")
@@ -60,7 +175,8 @@ class DuckDBLoader(BaseLoader):
         arrow_table = df.to_arrow()
         self._conn.register("_load_arrow", arrow_table)
         if mode == "replace":
-            self._conn.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM _load_arrow")
+            select = _layout_select("_load_arrow", table, df)
+            self._conn.execute(f"CREATE OR REPLACE TABLE {table} AS {select}")
         else:
             self._conn.execute(f"INSERT INTO {table} SELECT * FROM _load_arrow")
         self._conn.unregister("_load_arrow")
@@ -0,0 +1,36 @@
+"""Physical row order for large tables read a slice at a time.
+
+Play-by-play tables hold millions of rows per season and are almost always
+read one game at a time; shot-chart bins are read one player-season at a
+time.  Writing them sorted by that key keeps each slice in a handful of
+contiguous DuckDB row groups and Parquet row groups, so zonemaps and
+row-group min/max statistics skip everything else.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+SORT_KEYS: dict[str, tuple[str, ...]] = {
+    "stg_play_by_play": ("game_id", "action_number"),
+    "stg_play_by_play_v2": ("game_id", "eventnum"),
+    "stg_win_prob_pbp": ("game_id", "event_num"),
+    "fact_play_by_play": ("game_id", "event_num"),
+    "fact_play_by_play_v2": ("game_id", "eventnum"),
+    "fact_win_prob_pbp": ("game_id", "event_num"),
+    "bridge_play_player": ("game_id", "event_num", "slot"),
+    "agg_shot_chart_bins": ("player_id", "season_year", "resolution_ft"),
+}
+
+# Small enough that a row group spans a few hundred games at most.
+SORTED_ROW_GROUP_SIZE = 65_536
+
+
+def sort_keys_for(table: str, columns: Iterable[str]) -> tuple[str, ...]:
+    """The storage sort key for *table*, or ``()`` if it has none or lacks a key column."""
+    keys = SORT_KEYS.get(table, ())
+    available = set(columns)
+    return keys if all(key in available for key in keys) else ()
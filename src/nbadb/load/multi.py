@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 
     from nbadb.core.config import NbaDbSettings
     from nbadb.load.base import BaseLoader
+    from nbadb.transform.base import Passthrough
 
 
 SUPPORTED_FORMATS = frozenset({"sqlite", "duckdb", "csv", "parquet"})
@@ -26,7 +27,18 @@ class MultiLoader:
         table: str,
         df: pl.DataFrame,
         mode: Literal["replace", "append"] = "replace",
+        *,
+        passthrough: Passthrough | None = None,
+        persisted: bool = False,
     ) -> None:
+        """Write *df* to every format.
+
+        With *passthrough* in replace mode, the DuckDB loader defines the
+        table as a view over its persisted sources when it can rather than
+        copying them; the file-based loaders still write *df*.  With
+        *persisted*, the DuckDB table already holds *df* (it was reused from
+        the transform cache), so only the file-based loaders write it.
+        """
         from nbadb.load.duckdb_loader import DuckDBLoader
 
         if self._strict and mode == "append":
@@ -41,7 +53,16 @@ class MultiLoader:
 
         secondary_errors: list[tuple[str, Exception]] = []
         for loader in self._loaders:
+            if persisted and isinstance(loader, DuckDBLoader):
+                continue
             try:
+                if (
+                    passthrough is not None
+                    and mode == "replace"
+                    and isinstance(loader, DuckDBLoader)
+                    and loader.load_passthrough_view(table, df, passthrough)
+                ):
+                    continue
                 loader.load(table, df, mode)
             except Exception as e:
                 if isinstance(loader, DuckDBLoader):
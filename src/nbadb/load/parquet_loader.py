@@ -9,6 +9,7 @@ from loguru import logger
 
 from nbadb.core.types import validate_sql_identifier
 from nbadb.load.base import BaseLoader
+from nbadb.load.layout import SORTED_ROW_GROUP_SIZE, sort_keys_for
 
 if TYPE_CHECKING:
     import polars as pl
@@ -73,6 +74,12 @@ class ParquetLoader(BaseLoader):
         logger.debug(f"Parquet: wrote {df.shape[0]} rows to {table}/")
 
     def _write_table(self, out_dir: Path, table: str, df: pl.DataFrame) -> None:
+        # Sorted tables get smaller row groups so per-game statistics stay selective.
+        row_group_size: int | None = None
+        keys = sort_keys_for(table, df.columns)
+        if keys:
+            df = df.sort(keys, maintain_order=True)
+            row_group_size = SORTED_ROW_GROUP_SIZE
         if table in PARTITIONED_TABLES and "season_year" in df.columns:
             if df.is_empty():
                 out_dir.mkdir(parents=True, exist_ok=True)
@@ -81,9 +88,10 @@ class ParquetLoader(BaseLoader):
                     compression="zstd",
                     compression_level=self.compression_level,
                     statistics=True,
+                    row_group_size=row_group_size,
                 )
                 return
-            for (season,), part in df.group_by("season_year"):
+            for (season,), part in df.group_by("season_year", maintain_order=True):
                 part_dir = out_dir / f"season_year={season}"
                 part_dir.mkdir(parents=True, exist_ok=True)
                 part.drop("season_year").write_parquet(
@@ -91,6 +99,7 @@ class ParquetLoader(BaseLoader):
                     compression="zstd",
                     compression_level=self.compression_level,
                     statistics=True,
+                    row_group_size=row_group_size,
                 )
         else:
             out_dir.mkdir(parents=True, exist_ok=True)
@@ -99,4 +108,5 @@ class ParquetLoader(BaseLoader):
                 compression="zstd",
                 compression_level=self.compression_level,
                 statistics=True,
+                row_group_size=row_group_size,
             )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, cast
 
@@ -7,13 +8,15 @@ import duckdb
 
 from nbadb.core.types import SeasonType, validate_sql_identifier
 from nbadb.orchestrate.planning import (
+    _CURRENT_TEAM_ONLY_ENDPOINTS,
     PATTERN_PRIORITY,
     PLAYER_TEAM_SEASON_WORKLOAD_ENDPOINTS,
     ExtractionPlanItem,
+    PlanParams,
 )
 from nbadb.orchestrate.staging_map import (
-    STAGING_MAP,
     StagingEntry,
+    staging_registry,
 )
 from nbadb.orchestrate.workload_contract import (
     PlayerTeamSeasonWorkloadCoverage,
@@ -26,6 +29,29 @@ if TYPE_CHECKING:
 _UNSET_SEASON_COLUMN = object()
 
 
+@dataclass(frozen=True, slots=True)
+class _EntityKeySource:
+    """Where the expected keys for an entity pattern come from."""
+
+    table: str
+    column: str
+    param: str  # plan param name, also the typed journal column
+    sql_type: str
+    season_scoped: bool = False
+
+
+_ENTITY_KEY_SOURCES: dict[str, _EntityKeySource] = {
+    "game": _EntityKeySource(
+        "stg_league_game_log", "game_id", "game_id", "VARCHAR", season_scoped=True
+    ),
+    "player": _EntityKeySource("stg_common_all_players", "person_id", "player_id", "BIGINT"),
+    "team": _EntityKeySource("stg_common_team_years", "team_id", "team_id", "BIGINT"),
+    "date": _EntityKeySource(
+        "stg_league_game_log", "game_date", "game_date", "VARCHAR", season_scoped=True
+    ),
+}
+
+
 # ── data classes ─────────────────────────────────────────────────
 
 
@@ -40,6 +66,7 @@ class GapReport:
     actual: int
     missing: int | None  # None when expected is unknown
     min_season: int | None
+    missing_keys: tuple[str | int, ...] = ()  # exact holes for entity patterns
 
 
 @dataclass(frozen=True, slots=True)
@@ -173,14 +200,8 @@ class BackfillPlanner:
             return self._gaps_static(entry, done_total_by_ep)
         if pattern == "season":
             return self._gaps_season(entry, done_map, seasons, season_types)
-        if pattern == "game":
-            return self._gaps_game(entry, done_total_by_ep, seasons)
-        if pattern == "player":
-            return self._gaps_entity(entry, done_total_by_ep, "person_id", "stg_common_all_players")
-        if pattern == "team":
-            return self._gaps_entity(entry, done_total_by_ep, "team_id", "stg_common_team_years")
-        if pattern == "date":
-            return self._gaps_date(entry, done_total_by_ep, seasons)
+        if pattern in _ENTITY_KEY_SOURCES:
+            return self._gaps_for_entity_keys(entry, done_total_by_ep, seasons)
         if pattern in ("player_season", "team_season", "player_team_season"):
             return self._gaps_cross_product(
                 entry,
@@ -261,43 +282,41 @@ class BackfillPlanner:
 
         return gaps
 
-    def _gaps_game(
+    def _gaps_for_entity_keys(
         self,
         entry: StagingEntry,
         done_total_by_ep: dict[str, int],
         seasons: list[str] | None,
     ) -> list[GapReport]:
-        expected = self._count_from_table("stg_league_game_log", "game_id", seasons=seasons)
-        actual = done_total_by_ep.get(entry.endpoint_name, 0)
-
-        if expected is not None and actual >= expected:
-            return []
+        """Report the exact expected-but-not-done keys for an entity pattern.
 
-        return [
-            GapReport(
-                endpoint=entry.endpoint_name,
-                season=None,
-                pattern="game",
-                expected=expected,
-                actual=actual,
-                missing=(expected - actual) if expected is not None else None,
-                min_season=entry.min_season,
-            )
-        ]
+        Falls back to comparing aggregate counts when the journal predates
+        the typed key columns.
+        """
+        source = _ENTITY_KEY_SOURCES[entry.param_pattern]
+        scope = seasons if source.season_scoped else None
+        expected = self._count_from_table(source.table, source.column, seasons=scope)
+        missing_keys = self.missing_keys(entry.endpoint_name, entry.param_pattern, seasons=scope)
+
+        if expected is not None and missing_keys is not None:
+            if not missing_keys:
+                return []
+            return [
+                GapReport(
+                    endpoint=entry.endpoint_name,
+                    season=None,
+                    pattern=entry.param_pattern,
+                    expected=expected,
+                    actual=expected - len(missing_keys),
+                    missing=len(missing_keys),
+                    min_season=entry.min_season,
+                    missing_keys=tuple(missing_keys),
+                )
+            ]
 
-    def _gaps_entity(
-        self,
-        entry: StagingEntry,
-        done_total_by_ep: dict[str, int],
-        id_col: str,
-        ref_table: str,
-    ) -> list[GapReport]:
-        expected = self._count_from_table(ref_table, id_col)
         actual = done_total_by_ep.get(entry.endpoint_name, 0)
-
         if expected is not None and actual >= expected:
             return []
-
         return [
             GapReport(
                 endpoint=entry.endpoint_name,
@@ -310,29 +329,54 @@ class BackfillPlanner:
             )
         ]
 
-    def _gaps_date(
+    def missing_keys(
         self,
-        entry: StagingEntry,
-        done_total_by_ep: dict[str, int],
-        seasons: list[str] | None,
-    ) -> list[GapReport]:
-        expected = self._count_from_table("stg_league_game_log", "game_date", seasons=seasons)
-        actual = done_total_by_ep.get(entry.endpoint_name, 0)
-
-        if expected is not None and actual >= expected:
-            return []
-
-        return [
-            GapReport(
-                endpoint=entry.endpoint_name,
-                season=None,
-                pattern="date",
-                expected=expected,
-                actual=actual,
-                missing=(expected - actual) if expected is not None else None,
-                min_season=entry.min_season,
+        endpoint: str,
+        pattern: str,
+        *,
+        seasons: list[str] | None = None,
+        include_done: bool = False,
+    ) -> list[str | int] | None:
+        """Return entity keys expected for *endpoint* but not yet done.
+
+        Computed in DuckDB as an anti-join of the distinct reference keys
+        (``stg_league_game_log``, ``stg_common_all_players``, ...) against
+        done journal rows on the typed key column, so the cost follows the
+        reference table rather than the journal history.  Returns ``None``
+        when the reference table or the typed journal columns are missing.
+        ``include_done`` returns every reference key (for forced replays).
+        """
+        source = _ENTITY_KEY_SOURCES.get(pattern)
+        if source is None or not self._table_exists(source.table):
+            return None
+        if not include_done and not self._journal.has_key_columns():
+            return None
+        table = validate_sql_identifier(source.table)
+        column = validate_sql_identifier(source.column)
+        key_expr = f"TRY_CAST(e.{column} AS {source.sql_type})"
+        clauses = [f"{key_expr} IS NOT NULL"]
+        params: list[str] = []
+        if seasons and "season_id" in self._get_columns(source.table):
+            placeholders = ", ".join(f"${i + 1}" for i in range(len(seasons)))
+            clauses.append(f"e.season_id IN ({placeholders})")
+            params.extend(seasons)
+        if not include_done:
+            params.append(endpoint)
+            clauses.append(
+                "NOT EXISTS ("
+                "SELECT 1 FROM _extraction_journal j "
+                f"WHERE j.endpoint = ${len(params)} AND j.status = 'done' "
+                f"AND j.{source.param} = {key_expr})"
             )
-        ]
+        try:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT {key_expr} AS entity_key FROM {table} e "
+                f"WHERE {' AND '.join(clauses)} ORDER BY entity_key",
+                params,
+            ).fetchall()
+        except duckdb.Error:
+            return None
+        return [row[0] for row in rows]
 
     def _gaps_cross_product(
         self,
@@ -798,6 +842,18 @@ class BackfillPlanner:
                     plan_items.append(item)
                 continue
 
+            if pattern in _ENTITY_KEY_SOURCES:
+                plan_items.extend(
+                    self._build_entity_plan_items(
+                        pattern,
+                        entries,
+                        seasons=seasons,
+                        include_done=force,
+                        priority=priority,
+                    )
+                )
+                continue
+
             params = self._build_params_for_pattern(
                 pattern,
                 entries,
@@ -890,6 +946,48 @@ class BackfillPlanner:
             )
         return plan_items
 
+    def _build_entity_plan_items(
+        self,
+        pattern: str,
+        entries: list[StagingEntry],
+        *,
+        seasons: list[str] | None,
+        include_done: bool,
+        priority: int,
+    ) -> list[ExtractionPlanItem]:
+        """One plan item per group of endpoints that share the same missing keys."""
+        source = _ENTITY_KEY_SOURCES[pattern]
+        scope = seasons if source.season_scoped else None
+        keys_by_endpoint: dict[str, tuple[str | int, ...]] = {}
+        entries_by_keys: dict[tuple[str | int, ...], list[StagingEntry]] = {}
+        for entry in entries:
+            if pattern == "team" and entry.endpoint_name in _CURRENT_TEAM_ONLY_ENDPOINTS:
+                continue
+            keys = keys_by_endpoint.get(entry.endpoint_name)
+            if keys is None:
+                keys = tuple(
+                    self.missing_keys(
+                        entry.endpoint_name,
+                        pattern,
+                        seasons=scope,
+                        include_done=include_done,
+                    )
+                    or ()
+                )
+                keys_by_endpoint[entry.endpoint_name] = keys
+            if keys:
+                entries_by_keys.setdefault(keys, []).append(entry)
+        return [
+            ExtractionPlanItem(
+                label=f"backfill:{pattern}",
+                pattern=pattern,
+                entries=grouped_entries,
+                params=[{source.param: key} for key in keys],
+                priority=priority,
+            )
+            for keys, grouped_entries in entries_by_keys.items()
+        ]
+
     def force_reset(
         self,
         *,
@@ -926,14 +1024,7 @@ class BackfillPlanner:
         patterns: list[str] | None = None,
     ) -> list[StagingEntry]:
         """Filter STAGING_MAP by endpoint and/or pattern."""
-        result: list[StagingEntry] = []
-        for entry in STAGING_MAP:
-            if endpoints and entry.endpoint_name not in endpoints:
-                continue
-            if patterns and entry.param_pattern not in patterns:
-                continue
-            result.append(entry)
-        return result
+        return staging_registry().select(endpoints=endpoints, patterns=patterns)
 
     @classmethod
     def _build_params_for_pattern(
@@ -963,3 +1054,51 @@ class BackfillPlanner:
         # Entity-dependent patterns need runtime discovery — return
         # a sentinel so the caller knows params must be resolved later
         return []
+
+
+def restrict_plan_to_missing(
+    plan: list[ExtractionPlanItem],
+    journal: PipelineJournal,
+) -> list[ExtractionPlanItem]:
+    """Drop param sets that every endpoint of an entity-pattern item already finished.
+
+    Uses the journal's in-memory done index, so planning cost follows the
+    plan size.  Endpoints whose pending params differ are split into
+    separate items; items for other patterns are returned unchanged.
+    """
+    restricted: list[ExtractionPlanItem] = []
+    for item in plan:
+        if item.pattern not in _ENTITY_KEY_SOURCES or not item.params:
+            restricted.append(item)
+            continue
+        keyed = [(params, json.dumps(params, sort_keys=True)) for params in item.params]
+        entries_by_pending: dict[tuple[str, ...], list[StagingEntry]] = {}
+        pending_params: dict[tuple[str, ...], list[PlanParams]] = {}
+        signature_by_endpoint: dict[str, tuple[str, ...]] = {}
+        for entry in item.entries:
+            signature = signature_by_endpoint.get(entry.endpoint_name)
+            if signature is None:
+                done = journal.was_extracted_batch(
+                    [(entry.endpoint_name, params_json) for _, params_json in keyed]
+                )
+                pending = [
+                    (params, params_json)
+                    for params, params_json in keyed
+                    if (entry.endpoint_name, params_json) not in done
+                ]
+                signature = tuple(params_json for _, params_json in pending)
+                signature_by_endpoint[entry.endpoint_name] = signature
+                pending_params[signature] = [params for params, _ in pending]
+            if signature:
+                entries_by_pending.setdefault(signature, []).append(entry)
+        for signature, grouped_entries in entries_by_pending.items():
+            restricted.append(
+                ExtractionPlanItem(
+                    label=item.label,
+                    pattern=item.pattern,
+                    entries=grouped_entries,
+                    params=pending_params[signature],
+                    priority=item.priority,
+                )
+            )
+    return restricted
@@ -6,7 +6,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal, Protocol, cast
 
 import polars as pl
-from aiolimiter import AsyncLimiter
 from loguru import logger
 
 from nbadb.core.config import get_settings
@@ -19,11 +18,13 @@ from nbadb.core.errors import (
 from nbadb.core.extraction_failures import classify_exception
 from nbadb.core.types import season_type_upstream_unavailable_reason
 from nbadb.orchestrate.extractor_runner import _sync_extract
+from nbadb.orchestrate.rate_governor import RateGovernor
 from nbadb.orchestrate.seasons import season_range
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from concurrent.futures import ThreadPoolExecutor
+    from contextlib import AbstractAsyncContextManager
 
     from nbadb.core.config import NbaDbSettings
     from nbadb.extract.registry import EndpointRegistry
@@ -161,7 +162,7 @@ async def _extract_with_retry(
     thread_pool: ThreadPoolExecutor | None = None,
     attempts: int | None = None,
     base_delay: float | None = None,
-    rate_limiter: AsyncLimiter | None = None,
+    rate_limiter: AbstractAsyncContextManager[object] | None = None,
     **kwargs: object,
 ) -> pl.DataFrame:
     """Extract with retries and inter-call delay for rate limiting.
@@ -268,11 +269,12 @@ class EntityDiscovery:
         registry: EndpointRegistry,
         thread_pool: ThreadPoolExecutor | None = None,
         settings: NbaDbSettings | None = None,
+        rate_governor: RateGovernor | None = None,
     ) -> None:
         self._registry = registry
         self._thread_pool = thread_pool
         self._settings = settings or get_settings()
-        self._rate_limiter = AsyncLimiter(max_rate=self._settings.rate_limit, time_period=1.0)
+        self._governor = rate_governor or RateGovernor.from_settings(self._settings)
         self._discovery_concurrency = max(1, int(self._settings.discovery_concurrency))
         self._retry_attempts = max(1, int(self._settings.extract_max_retries) + 1)
         self._concurrent_retry_attempts = min(
@@ -281,6 +283,15 @@ class EntityDiscovery:
         )
         self._retry_delay = float(self._settings.extract_retry_base_delay)
 
+    def _rate_slot(self, extractor: object) -> AbstractAsyncContextManager[object]:
+        """Governor slot for one discovery call, fair-shared as the ``discovery`` family.
+
+        The slot reports each call's outcome back to the governor, so failing
+        discovery calls back off the shared rate like extraction failures do.
+        """
+        endpoint = str(getattr(extractor, "endpoint_name", "") or "discovery")
+        return self._governor.slot(endpoint, "discovery", adaptive=True)
+
     async def discover_game_ids_result(
         self,
         seasons: list[str],
@@ -391,7 +402,7 @@ class EntityDiscovery:
                         thread_pool=self._thread_pool,
                         attempts=attempts,
                         base_delay=self._retry_delay,
-                        rate_limiter=self._rate_limiter,
+                        rate_limiter=self._rate_slot(extractor),
                         **request_params,
                     )
                 except _DiscoveryResponseError:
@@ -659,7 +670,7 @@ class EntityDiscovery:
                 thread_pool=self._thread_pool,
                 attempts=self._retry_attempts,
                 base_delay=self._retry_delay,
-                rate_limiter=self._rate_limiter,
+                rate_limiter=self._rate_slot(extractor),
                 **params,
             )
         except NbaDbError as exc:
@@ -698,7 +709,7 @@ class EntityDiscovery:
                 thread_pool=self._thread_pool,
                 attempts=self._retry_attempts,
                 base_delay=self._retry_delay,
-                rate_limiter=self._rate_limiter,
+                rate_limiter=self._rate_slot(extractor),
                 **params,
             )
         except _DiscoveryResponseError:
@@ -865,7 +876,7 @@ class EntityDiscovery:
                 thread_pool=self._thread_pool,
                 attempts=self._retry_attempts,
                 base_delay=self._retry_delay,
-                rate_limiter=self._rate_limiter,
+                rate_limiter=self._rate_slot(extractor),
                 allow_static_fallback=False,
                 timeout=_CONCURRENT_DISCOVERY_TIMEOUT,
             )
@@ -1010,7 +1021,7 @@ class EntityDiscovery:
                         thread_pool=self._thread_pool,
                         attempts=attempts,
                         base_delay=self._retry_delay,
-                        rate_limiter=self._rate_limiter,
+                        rate_limiter=self._rate_slot(extractor),
                         **request_params,
                     )
                 except _DiscoveryResponseError:
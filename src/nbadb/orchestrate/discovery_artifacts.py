@@ -2,19 +2,32 @@ from __future__ import annotations
 
 import hashlib
 import json
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import polars as pl
 from loguru import logger
 
 from nbadb.orchestrate.persistence import atomic_write_path, atomic_write_text
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 _ARTIFACT_VERSION = 2
 _ARTIFACT_FORMAT = "parquet"
+_SEASON_INDEX_VERSION = 1
+_SEASON_INDEX_NAME = "season-ids"
+_SEASON_INDEX_SCHEMA = {
+    "kind": pl.String,
+    "variant": pl.String,
+    "season": pl.String,
+    "value": pl.Int64,
+}
 
 ArtifactKind = Literal[
     "league_game_log",
@@ -37,6 +50,15 @@ class DiscoveryArtifactScope:
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 
+@dataclass(frozen=True, slots=True)
+class _SeasonIndex:
+    """Per-season IDs for every ID kind, sorted by (kind, variant, season)."""
+
+    frame: pl.DataFrame
+    scopes: frozenset[tuple[str, str, str]]
+    content_sha256: str
+
+
 @dataclass(frozen=True, slots=True)
 class _ArtifactIntegrity:
     generation_path: Path
@@ -48,6 +70,8 @@ class _ArtifactIntegrity:
 class DiscoveryArtifactStore:
     def __init__(self, root_dir: Path | None) -> None:
         self._root_dir = root_dir
+        # (kind, variant) -> season -> IDs awaiting one season-index rewrite.
+        self._pending_index: dict[tuple[str, str], dict[str, list[int]]] | None = None
 
     @classmethod
     def from_duckdb_path(cls, duckdb_path: Path | None) -> DiscoveryArtifactStore:
@@ -198,12 +222,20 @@ class DiscoveryArtifactStore:
         variant: str = "default",
         column: str = "value",
     ) -> list[int] | None:
-        """Load a union of per-season ID artifacts when every season is cached."""
+        """Load a union of per-season ID artifacts when every season is cached.
+
+        Seasons are answered from the season-ID index in one read; only
+        seasons missing from it fall back to their per-season artifacts,
+        which are then folded into the index for the next lookup.
+        """
         if not seasons:
             return []
 
-        values: list[int] = []
+        ids_by_season = self.load_ids_by_season(kind=kind, seasons=seasons, variant=variant)
+        promoted: dict[str, list[int]] = {}
         for season in seasons:
+            if season in ids_by_season:
+                continue
             frame = self.load_frame(
                 DiscoveryArtifactScope(
                     kind=kind,
@@ -213,8 +245,17 @@ class DiscoveryArtifactStore:
                 )
             )
             if frame is None:
+                break
+            promoted[season] = self._ids_from_frame(frame, column=column)
+        if promoted:
+            self._index_season_ids(kind, variant, promoted)
+            ids_by_season.update(promoted)
+
+        values: list[int] = []
+        for season in seasons:
+            season_values = ids_by_season.get(season)
+            if season_values is None:
                 return None
-            season_values = self._ids_from_frame(frame, column=column)
             if kind in {"player_ids_active", "player_ids_all"} and not season_values:
                 logger.warning(
                     "ignoring empty player-ID discovery artifact for required season {}",
@@ -225,6 +266,58 @@ class DiscoveryArtifactStore:
 
         return sorted({int(value) for value in values})
 
+    def load_ids_by_season(
+        self,
+        *,
+        kind: ArtifactKind,
+        seasons: tuple[str, ...],
+        variant: str = "default",
+    ) -> dict[str, list[int]]:
+        """Return indexed IDs for each of *seasons* the season-ID index covers.
+
+        Updates still buffered by :meth:`deferred_season_index` are included.
+        """
+        pending = (self._pending_index or {}).get((kind, variant), {})
+        ids_by_season = {season: list(pending[season]) for season in seasons if season in pending}
+        index = self._load_season_index()
+        if index is None:
+            return ids_by_season
+        covered = [
+            season
+            for season in seasons
+            if (kind, variant, season) in index.scopes and season not in ids_by_season
+        ]
+        if not covered:
+            return ids_by_season
+        rows = index.frame.filter(
+            (pl.col("kind") == kind)
+            & (pl.col("variant") == variant)
+            & pl.col("season").is_in(covered)
+        )
+        ids_by_season.update({season: [] for season in covered})
+        for season, value in rows.select("season", "value").iter_rows():
+            ids_by_season[season].append(int(value))
+        return ids_by_season
+
+    @contextmanager
+    def deferred_season_index(self) -> Iterator[None]:
+        """Buffer season-ID index updates made in the block into one rewrite at exit.
+
+        Per-season artifacts are still written immediately; the index is
+        derived from them, so updates lost to a crash are re-promoted by the
+        next lookup.  Nested blocks share the outermost buffer.
+        """
+        if self._pending_index is not None:
+            yield
+            return
+        self._pending_index = {}
+        try:
+            yield
+        finally:
+            pending, self._pending_index = self._pending_index, None
+            if pending:
+                self._write_season_index(pending)
+
     def upsert_ids(
         self,
         scope: DiscoveryArtifactScope,
@@ -237,7 +330,10 @@ class DiscoveryArtifactStore:
             {column: pl.Series(column, sorted({int(value) for value in values}), dtype=pl.Int64)}
         )
         self.upsert_frame(scope, frame, provenance=provenance)
-        return frame.get_column(column).cast(pl.Int64, strict=False).to_list()
+        stored = frame.get_column(column).cast(pl.Int64, strict=False).to_list()
+        if self.is_available() and len(scope.seasons) == 1 and not scope.season_types:
+            self._index_season_ids(scope.kind, scope.variant, {scope.seasons[0]: stored})
+        return stored
 
     def upsert_game_log_combo_frames(
         self,
@@ -256,6 +352,138 @@ class DiscoveryArtifactStore:
                 provenance=provenance,
             )
 
+    def _season_index_manifest_path(self) -> Path:
+        root_dir = self._root_dir
+        assert root_dir is not None
+        return root_dir / f"{_SEASON_INDEX_NAME}.json"
+
+    def _load_season_index(self) -> _SeasonIndex | None:
+        if not self.is_available():
+            return None
+        manifest_path = self._season_index_manifest_path()
+        if not manifest_path.exists():
+            return None
+        payload = self._load_manifest(manifest_path)
+        if payload is None:
+            return None
+        content = payload.get("content")
+        content_sha256 = content.get("sha256") if isinstance(content, dict) else None
+        row_count = content.get("row_count") if isinstance(content, dict) else None
+        scopes = _parse_index_scopes(payload.get("scopes"))
+        valid = (
+            payload.get("artifact_version") == _SEASON_INDEX_VERSION
+            and isinstance(content, dict)
+            and content.get("format") == _ARTIFACT_FORMAT
+            and _is_sha256(content_sha256)
+            and content.get("path") == f"{_SEASON_INDEX_NAME}.{content_sha256}.parquet"
+            and type(row_count) is int
+            and scopes is not None
+        )
+        if not valid:
+            logger.warning("ignoring invalid season-ID index manifest {}", manifest_path)
+            return None
+        assert isinstance(content_sha256, str)
+        assert isinstance(row_count, int)
+        assert scopes is not None
+        frame = _read_season_index(
+            str(manifest_path.with_name(f"{_SEASON_INDEX_NAME}.{content_sha256}.parquet")),
+            content_sha256,
+            row_count,
+        )
+        if frame is None:
+            return None
+        return _SeasonIndex(frame=frame, scopes=scopes, content_sha256=content_sha256)
+
+    def _index_season_ids(
+        self,
+        kind: str,
+        variant: str,
+        ids_by_season: dict[str, list[int]],
+    ) -> None:
+        """Replace the indexed IDs for each season in *ids_by_season*."""
+        if not self.is_available() or kind == "league_game_log" or not ids_by_season:
+            return
+        if self._pending_index is not None:
+            self._pending_index.setdefault((kind, variant), {}).update(ids_by_season)
+            return
+        self._write_season_index({(kind, variant): ids_by_season})
+
+    def _write_season_index(
+        self,
+        updates: dict[tuple[str, str], dict[str, list[int]]],
+    ) -> None:
+        """Rewrite the season-ID index once with every scope in *updates* replaced."""
+        current = self._load_season_index()
+        replaced = {
+            (kind, variant, season)
+            for (kind, variant), ids_by_season in updates.items()
+            for season in ids_by_season
+        }
+        additions = pl.DataFrame(
+            [
+                (kind, variant, season, int(value))
+                for (kind, variant), ids_by_season in updates.items()
+                for season, values in ids_by_season.items()
+                for value in sorted({int(value) for value in values})
+            ],
+            schema=_SEASON_INDEX_SCHEMA,
+            orient="row",
+        )
+        if current is None:
+            frame = additions
+            scopes: set[tuple[str, str, str]] = set()
+        else:
+            replaced_keys = pl.DataFrame(
+                sorted(replaced),
+                schema=["kind", "variant", "season"],
+                orient="row",
+            )
+            frame = pl.concat(
+                [
+                    current.frame.join(replaced_keys, on=["kind", "variant", "season"], how="anti"),
+                    additions,
+                ]
+            )
+            scopes = set(current.scopes)
+        scopes.update(replaced)
+        frame = frame.sort("kind", "variant", "season", "value")
+
+        buffer = BytesIO()
+        frame.write_parquet(buffer)
+        artifact_bytes = buffer.getvalue()
+        content_sha256 = hashlib.sha256(artifact_bytes).hexdigest()
+        manifest_path = self._season_index_manifest_path()
+        generation_path = manifest_path.with_name(f"{_SEASON_INDEX_NAME}.{content_sha256}.parquet")
+
+        def _write_index(path: Path) -> None:
+            path.write_bytes(artifact_bytes)
+
+        if _sha256_path(generation_path) != content_sha256:
+            atomic_write_path(generation_path, _write_index)
+        atomic_write_text(
+            manifest_path,
+            json.dumps(
+                {
+                    "artifact_version": _SEASON_INDEX_VERSION,
+                    "content": {
+                        "format": _ARTIFACT_FORMAT,
+                        "path": generation_path.name,
+                        "row_count": frame.height,
+                        "sha256": content_sha256,
+                    },
+                    "scopes": [list(scope) for scope in sorted(scopes)],
+                    "updated_at": datetime.now(UTC).isoformat(),
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+        )
+        if current is not None and current.content_sha256 != content_sha256:
+            manifest_path.with_name(
+                f"{_SEASON_INDEX_NAME}.{current.content_sha256}.parquet"
+            ).unlink(missing_ok=True)
+
     def _artifact_path(self, scope: DiscoveryArtifactScope) -> Path:
         """Return the fixed legacy-v1 artifact path for exact-scope promotion."""
         root_dir = self._root_dir
@@ -456,6 +684,43 @@ class DiscoveryArtifactStore:
         ]
 
 
+@lru_cache(maxsize=4)
+def _read_season_index(path: str, content_sha256: str, row_count: int) -> pl.DataFrame | None:
+    """Read and verify one season-ID index generation; cached by content digest."""
+    try:
+        artifact_bytes = Path(path).read_bytes()
+    except OSError as exc:
+        logger.warning("ignoring unreadable season-ID index {}: {}", path, type(exc).__name__)
+        return None
+    if hashlib.sha256(artifact_bytes).hexdigest() != content_sha256:
+        logger.warning("ignoring season-ID index with content digest mismatch: {}", path)
+        return None
+    try:
+        frame = pl.read_parquet(BytesIO(artifact_bytes))
+    except (OSError, pl.exceptions.PolarsError) as exc:
+        logger.warning("ignoring unreadable season-ID index {}: {}", path, type(exc).__name__)
+        return None
+    if frame.height != row_count or dict(frame.schema) != _SEASON_INDEX_SCHEMA:
+        logger.warning("ignoring season-ID index with row-count or schema mismatch: {}", path)
+        return None
+    return frame
+
+
+def _parse_index_scopes(value: object) -> frozenset[tuple[str, str, str]] | None:
+    if not isinstance(value, list):
+        return None
+    scopes: set[tuple[str, str, str]] = set()
+    for item in value:
+        if (
+            not isinstance(item, list)
+            or len(item) != 3
+            or not all(isinstance(part, str) and part for part in item)
+        ):
+            return None
+        scopes.add((item[0], item[1], item[2]))
+    return frozenset(scopes)
+
+
 def _scope_payload(scope: DiscoveryArtifactScope) -> dict[str, object]:
     return {
         "kind": scope.kind,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import itertools
 import json
 import os
 import time
@@ -11,7 +12,6 @@ from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, Protocol, cast
 
-from aiolimiter import AsyncLimiter
 from loguru import logger
 
 from nbadb.core.errors import ExtractionError, NbaDbError, TransientError
@@ -22,7 +22,9 @@ from nbadb.core.extraction_failures import (
 )
 from nbadb.extract.base import BaseExtractor, is_retryable_error
 from nbadb.orchestrate.execution_policy import endpoint_family
-from nbadb.orchestrate.resilience import _AdaptiveThrottle, _CircuitBreaker, _LatencyTracker
+from nbadb.orchestrate.frame_spool import FrameSpool
+from nbadb.orchestrate.rate_governor import RateGovernor
+from nbadb.orchestrate.resilience import _CircuitBreaker, _LatencyTracker
 from nbadb.orchestrate.staging_map import StagingEntry, get_multi_entries
 
 if TYPE_CHECKING:
@@ -35,6 +37,12 @@ if TYPE_CHECKING:
     from nbadb.orchestrate.journal import PipelineJournal
 
 
+# Cost assumed for an endpoint with no recorded latency yet.
+_DEFAULT_CALL_SECONDS = 1.0
+# Live samples required before chunk sizing trusts an endpoint's latency.
+_MIN_LATENCY_SAMPLES = 5
+
+
 class _ExtractorLike(Protocol):
     def extract(self, **kwargs: object) -> Coroutine[Any, Any, pl.DataFrame]: ...
 
@@ -202,6 +210,8 @@ class PatternExtractionResult:
     failure_count: int = 0
     deferred_failure_count: int = 0
     row_count: int = 0
+    queue_wait_seconds: float = 0.0  # time this pattern's calls spent in the rate governor
+    staging_keys: tuple[str, ...] = ()  # keys that produced rows, retained or not
     errors: list[str] = field(default_factory=list)
 
     @property
@@ -234,21 +244,14 @@ class ExtractorRunner:
         journal: PipelineJournal,
         rate_limit: float = 10.0,
         progress: _ProgressReporter | None = None,
+        rate_governor: RateGovernor | None = None,
     ) -> None:
         self._registry = registry
         self._settings = settings
         self._journal = journal
         self._progress = progress
         self._semaphores: dict[str, asyncio.Semaphore] = {}
-        self._rate_limiter = AsyncLimiter(max_rate=rate_limit, time_period=1.0)
-        self._endpoint_rate_limiters: dict[str, AsyncLimiter] = {}
-        self._family_rate_limiters: dict[str, AsyncLimiter] = {}
-        self._adaptive = _AdaptiveThrottle(
-            base_rate=rate_limit,
-            min_rate=getattr(settings, "adaptive_rate_min", 1.0),
-            recovery_threshold=getattr(settings, "adaptive_rate_recovery", 50),
-        )
-        self._family_adaptive: dict[str, _AdaptiveThrottle] = {}
+        self._governor = rate_governor or RateGovernor.from_settings(settings, rate_limit)
         try:
             self._thread_pool = ThreadPoolExecutor(max_workers=settings.thread_pool_size)
         except (AttributeError, ValueError, TypeError) as exc:
@@ -261,8 +264,8 @@ class ExtractorRunner:
         self._latency = _LatencyTracker(
             window_size=getattr(settings, "latency_window_size", 200),
         )
-        # Cache for multi-endpoint results: (endpoint, params_json) -> DFs
-        self._multi_cache: dict[tuple[str, str], list[pl.DataFrame]] = {}
+        # p95 call durations from earlier runs, loaded on first use
+        self._latency_priors: dict[str, float] | None = None
         # Count of extractions skipped because already done in journal
         self.skipped: int = 0
         # Count only journal-driven skips for the current run.
@@ -272,12 +275,18 @@ class ExtractorRunner:
         # Count of extraction calls that failed in the current run after retries.
         self.failed_current_run: int = 0
 
+    @property
+    def rate_governor(self) -> RateGovernor:
+        """Rate governor shared with discovery so both draw from one budget."""
+        return self._governor
+
     def shutdown(self) -> None:
         """Shut down the thread pool to release worker threads."""
         self._thread_pool.shutdown(wait=False)
 
     def log_latency_summary(self) -> None:
-        """Log the top 5 slowest endpoints by p95 latency."""
+        """Log the top 5 slowest endpoints by p95 latency, then rate-governor queueing."""
+        self._log_rate_summary()
         sums = self._latency.all_summaries()
         if not sums:
             return
@@ -293,6 +302,23 @@ class ExtractorRunner:
                 int(s["count"]),
             )
 
+    def _log_rate_summary(self) -> None:
+        stats = [s for s in self._governor.snapshot() if s.granted]
+        if not stats:
+            return
+        logger.info("Rate governor (rate / base, granted, mean wait, max wait):")
+        for s in stats:
+            logger.info(
+                "  {:<8} {:<25} | {:5.2f}/{:5.2f} req/s | {:>7} | {:6.2f}s | {:6.2f}s",
+                s.scope,
+                s.name,
+                s.rate,
+                s.base_rate,
+                s.granted,
+                s.mean_wait_seconds,
+                s.max_wait_seconds,
+            )
+
     async def __aenter__(self) -> ExtractorRunner:
         return self
 
@@ -339,21 +365,35 @@ class ExtractorRunner:
         *,
         skip_items: set[tuple[str, str]] | None = None,
         persist_chunk_results: Callable[..., None] | None = None,
+        retain_frames: bool = True,
     ) -> PatternExtractionResult:
-        """Extract a pattern and return frames plus call-local accounting."""
+        """Extract a pattern and return frames plus call-local accounting.
+
+        Chunk outputs are spooled to Arrow IPC files as they complete and
+        only unioned into ``frames`` once the pattern finishes.  Callers
+        that already persist every chunk through *persist_chunk_results*
+        can pass ``retain_frames=False`` to skip the spool entirely; the
+        result then carries ``staging_keys`` but no frames.
+        """
 
         multi_entries, single_entries, multi_by_ep = self._classify_entries(entries)
-        accum: dict[str, list[pl.DataFrame]] = {e.staging_key: [] for e in entries}
+        spool = FrameSpool()
+        produced_keys: dict[str, None] = {}
         single_by_key = {
             (entry.endpoint_name, entry.staging_key): entry for entry in single_entries
         }
         pattern_result = PatternExtractionResult(frames={})
+        endpoint_names = {entry.endpoint_name for entry in entries}
+        queue_wait_before = self._governor.wait_seconds(endpoint_names)
 
-        chunk_size = self._chunk_size_for_entries(pattern, entries)
-        for chunk_index, chunk_start in enumerate(range(0, max(len(param_sets), 1), chunk_size)):
+        chunk_start = 0
+        for chunk_index in itertools.count():
+            # Re-sized every chunk so live latency can steer it mid-pattern.
+            chunk_size = self._chunk_size_for_entries(pattern, entries)
             chunk = param_sets[chunk_start : chunk_start + chunk_size]
             if not chunk:
                 break
+            chunk_start += len(chunk)
             chunk_accum: dict[str, list[pl.DataFrame]] = {e.staging_key: [] for e in entries}
             pending_successes: list[_PendingJournalSuccess] = []
             source_results: list[dict[str, object]] = []
@@ -449,12 +489,12 @@ class ExtractorRunner:
                     success.rows,
                 )
             for key, df in chunk_output.items():
-                if not df.is_empty():
-                    accum[key].append(df)
+                if df.is_empty():
+                    continue
+                produced_keys[key] = None
+                if retain_frames:
+                    spool.append(key, df)
 
-            # HR-A-007: free multi-endpoint cache between chunks to
-            # prevent unbounded memory growth on large historical runs.
-            self._multi_cache.clear()
             _record_chunk_completion_heartbeat()
 
             chunk_successes = pattern_result.success_count - success_count_before
@@ -486,7 +526,12 @@ class ExtractorRunner:
                 )
                 break
 
-        pattern_result.frames = self._concat_accum(accum)
+        pattern_result.frames = self._collect_spool(spool)
+        pattern_result.staging_keys = tuple(produced_keys)
+        spool.close()
+        pattern_result.queue_wait_seconds = (
+            self._governor.wait_seconds(endpoint_names) - queue_wait_before
+        )
         return pattern_result
 
     # ── run_pattern decomposition ──────────────────────────────
@@ -564,15 +609,25 @@ class ExtractorRunner:
         skip_items: set[tuple[str, str]] | None = None,
         defer_journal_success: bool = False,
     ) -> _ChunkTaskBatch:
-        """Create asyncio tasks for all entries in a chunk."""
-        tasks: list[
-            asyncio.Task[
-                dict[str, pl.DataFrame]
-                | _ExtractionTaskResult
-                | _DeferredExtraction
-                | _SkippedTaskResult
-                | _FailedExtraction
-                | None
+        """Create asyncio tasks for all entries in a chunk.
+
+        Tasks are created longest-expected-first (see
+        ``_order_by_expected_cost``); semaphores wake waiters in FIFO order,
+        so that is also the order in which each lane starts them.
+        """
+        scheduled: list[
+            tuple[
+                str,
+                Coroutine[
+                    Any,
+                    Any,
+                    dict[str, pl.DataFrame]
+                    | _ExtractionTaskResult
+                    | _DeferredExtraction
+                    | _SkippedTaskResult
+                    | _FailedExtraction
+                    | None,
+                ],
             ]
         ] = []
         support_skip_count = 0
@@ -601,8 +656,9 @@ class ExtractorRunner:
                     continue
                 self.planned_calls += 1
                 eligible_calls += 1
-                tasks.append(
-                    asyncio.create_task(
+                scheduled.append(
+                    (
+                        entry.endpoint_name,
                         self._extract_single_result(
                             entry,
                             params,
@@ -611,7 +667,7 @@ class ExtractorRunner:
                             on_progress=on_progress,
                             allow_late_recovery=True,
                             defer_journal_success=defer_journal_success,
-                        )
+                        ),
                     )
                 )
 
@@ -639,8 +695,9 @@ class ExtractorRunner:
                     continue
                 self.planned_calls += 1
                 eligible_calls += 1
-                tasks.append(
-                    asyncio.create_task(
+                scheduled.append(
+                    (
+                        ep_name,
                         self._extract_multi_result(
                             ep_name,
                             eligible,
@@ -650,16 +707,35 @@ class ExtractorRunner:
                             on_progress=on_progress,
                             allow_late_recovery=True,
                             defer_journal_success=defer_journal_success,
-                        )
+                        ),
                     )
                 )
 
+        tasks = [asyncio.create_task(coro) for coro in self._order_by_expected_cost(scheduled)]
         return _ChunkTaskBatch(
             tasks=tasks,
             eligible_calls=eligible_calls,
             support_skip_count=support_skip_count,
         )
 
+    def _order_by_expected_cost[T](self, scheduled: list[tuple[str, T]]) -> list[T]:
+        """Order calls longest-expected-first, round-robin across endpoints on ties.
+
+        Starting the slowest endpoints first keeps them from running alone
+        at the tail of a chunk; interleaving equal-cost endpoints stops one
+        endpoint's calls from queueing ahead of every other endpoint in a
+        shared lane.
+        """
+        costs = {endpoint: self._expected_cost(endpoint) for endpoint, _ in scheduled}
+        seen: dict[str, int] = {}
+        keyed: list[tuple[float, int, T]] = []
+        for endpoint, call in scheduled:
+            position = seen.get(endpoint, 0)
+            seen[endpoint] = position + 1
+            keyed.append((-costs[endpoint], position, call))
+        keyed.sort(key=lambda item: (item[0], item[1]))
+        return [call for _, _, call in keyed]
+
     async def _replay_deferred_chunk(
         self,
         deferred: list[_DeferredExtraction],
@@ -933,6 +1009,22 @@ class ExtractorRunner:
                     accum[key].append(df)
         return pending_successes
 
+    @staticmethod
+    def _collect_spool(spool: FrameSpool) -> dict[str, pl.DataFrame]:
+        """Materialize each spooled staging key, unifying drifted schemas."""
+        output: dict[str, pl.DataFrame] = {}
+        for key in spool:
+            drift = spool.drifted_columns(key)
+            if drift:
+                logger.warning(
+                    "{}: schema drift detected across spooled chunks — divergent columns: {}",
+                    key,
+                    ", ".join(sorted(drift)),
+                )
+            output[key] = spool.scan(key).collect()
+            logger.info("{}: {} rows total", key, output[key].shape[0])
+        return output
+
     @staticmethod
     def _concat_accum(accum: dict[str, list[pl.DataFrame]]) -> dict[str, pl.DataFrame]:
         """Concatenate per-staging_key frames into final output."""
@@ -961,70 +1053,73 @@ class ExtractorRunner:
 
     # ── private helpers ────────────────────────────────────────
 
-    def _get_endpoint_rate_limiter(self, endpoint_name: str) -> AsyncLimiter | None:
-        endpoint_limits = getattr(self._settings, "endpoint_rate_limits", {})
-        if endpoint_name not in endpoint_limits:
-            return None
-        if endpoint_name not in self._endpoint_rate_limiters:
-            self._endpoint_rate_limiters[endpoint_name] = AsyncLimiter(
-                max_rate=endpoint_limits[endpoint_name],
-                time_period=1.0,
-            )
-        return self._endpoint_rate_limiters[endpoint_name]
-
     def _endpoint_family(self, endpoint_name: str, category: str) -> str:
         family_overrides = getattr(self._settings, "endpoint_family_overrides", {})
         if endpoint_name in family_overrides:
             return str(family_overrides[endpoint_name])
         return endpoint_family(endpoint_name, category)
 
-    def _get_family_rate_limiter(self, family: str) -> AsyncLimiter | None:
-        family_limits = getattr(self._settings, "family_rate_limits", {})
-        if family not in family_limits:
-            return None
-        if family not in self._family_rate_limiters:
-            self._family_rate_limiters[family] = AsyncLimiter(
-                max_rate=family_limits[family],
-                time_period=1.0,
-            )
-        return self._family_rate_limiters[family]
-
-    def _get_family_adaptive(self, family: str) -> _AdaptiveThrottle | None:
-        family_limits = getattr(self._settings, "family_rate_limits", {})
-        if family not in family_limits:
-            return None
-        if family not in self._family_adaptive:
-            self._family_adaptive[family] = _AdaptiveThrottle(
-                base_rate=float(family_limits[family]),
-                min_rate=getattr(self._settings, "adaptive_rate_min", 1.0),
-                recovery_threshold=getattr(self._settings, "adaptive_rate_recovery", 50),
-            )
-        return self._family_adaptive[family]
-
-    def _get_semaphore(self, endpoint_name: str, category: str) -> asyncio.Semaphore:
-        """Lazily create a semaphore for the given endpoint/category lane."""
+    def _lane(self, endpoint_name: str, category: str) -> tuple[str, int]:
+        """Return the semaphore key and concurrency limit for an endpoint."""
         endpoint_limits = getattr(self._settings, "endpoint_semaphore_limits", {})
         family_limits = getattr(self._settings, "family_semaphore_limits", {})
         family = self._endpoint_family(endpoint_name, category)
         if endpoint_name in endpoint_limits:
-            key = endpoint_name
-        elif family in family_limits:
-            key = f"family:{family}"
-        else:
-            key = category
+            return endpoint_name, endpoint_limits[endpoint_name]
+        if family in family_limits:
+            return f"family:{family}", family_limits[family]
+        return category, self._settings.semaphore_tiers.get(
+            category,
+            self._settings.semaphore_tiers.get("default", 10),
+        )
+
+    def _get_semaphore(self, endpoint_name: str, category: str) -> asyncio.Semaphore:
+        """Lazily create a semaphore for the given endpoint/category lane."""
+        key, limit = self._lane(endpoint_name, category)
         if key not in self._semaphores:
-            if endpoint_name in endpoint_limits:
-                limit = endpoint_limits[endpoint_name]
-            elif family in family_limits:
-                limit = family_limits[family]
-            else:
-                limit = self._settings.semaphore_tiers.get(
-                    category,
-                    self._settings.semaphore_tiers.get("default", 10),
-                )
             self._semaphores[key] = asyncio.Semaphore(limit)
         return self._semaphores[key]
 
+    # ── cost model ─────────────────────────────────────────────
+
+    def _expected_cost(self, endpoint_name: str) -> float:
+        """Expected seconds per call: live p95, else the recorded p95, else a default."""
+        live = self._latency.percentile(endpoint_name, 95)
+        if live is not None:
+            return live
+        if self._latency_priors is None:
+            priors = self._journal.endpoint_latency_p95()
+            self._latency_priors = priors if isinstance(priors, dict) else {}
+        return self._latency_priors.get(endpoint_name, _DEFAULT_CALL_SECONDS)
+
+    def _seconds_per_call(self, endpoint_name: str) -> float:
+        """Wall time one more call adds to its lane under current concurrency and rate."""
+        try:
+            category = getattr(self._registry.get(endpoint_name), "category", "default")
+        except KeyError:
+            category = "default"
+        _, limit = self._lane(endpoint_name, category)
+        family = self._endpoint_family(endpoint_name, category)
+        rate = self._governor.rate_for(endpoint_name, family)
+        interval = 1.0 / rate if rate > 0 else 0.0
+        return max(self._expected_cost(endpoint_name) / max(int(limit), 1), interval)
+
+    def _live_chunk_size(self, entries: list[StagingEntry]) -> int | None:
+        """Param sets per chunk that fit ``adaptive_chunk_target_seconds``.
+
+        ``None`` until every endpoint in *entries* has enough live samples.
+        """
+        target = float(getattr(self._settings, "adaptive_chunk_target_seconds", 0.0))
+        endpoints = {entry.endpoint_name for entry in entries}
+        if target <= 0 or not endpoints:
+            return None
+        if any(self._latency.samples(ep) < _MIN_LATENCY_SAMPLES for ep in endpoints):
+            return None
+        per_param = sum(self._seconds_per_call(ep) for ep in endpoints)
+        if per_param <= 0:
+            return None
+        return max(1, int(target / per_param))
+
     def _chunk_size_for_entries(self, pattern: str, entries: list[StagingEntry]) -> int:
         base_chunk_size = (
             self._settings.pbp_chunk_size
@@ -1044,6 +1139,10 @@ class ExtractorRunner:
             min_chunk_size,
             min(max_chunk_size, max(1, int(base_chunk_size * multiplier))),
         )
+        # Once latency is measured it replaces the static family multiplier.
+        live_chunk_size = self._live_chunk_size(entries)
+        if live_chunk_size is not None:
+            chunk_size = max(min_chunk_size, min(max_chunk_size, live_chunk_size))
         endpoint_limits = getattr(self._settings, "endpoint_chunk_size_limits", {})
         configured_limits = [
             max(1, int(endpoint_limits[entry.endpoint_name]))
@@ -1142,8 +1241,6 @@ class ExtractorRunner:
         endpoint_name: str,
         family: str,
         duration: float,
-        *,
-        isolated_scope: str,
     ) -> None:
         self._journal.record_metric(endpoint_name, duration, 0, errors=1)
         self._circuit_breaker.record_failure(endpoint_name)
@@ -1151,27 +1248,33 @@ class ExtractorRunner:
         if tripped and self._progress is not None:
             self._progress.update_circuit_breakers(tripped)
         self._latency.record(endpoint_name, duration)
-        if isolated_scope == "global":
-            new_rate = self._adaptive.record_failure()
-            if new_rate is not None:
-                self._rate_limiter = AsyncLimiter(max_rate=new_rate, time_period=1.0)
-                logger.warning("adaptive rate: backing off to {:.1f} req/s", new_rate)
-                if self._progress is not None:
-                    self._progress.update_rate_info(
-                        self._adaptive.current_rate,
-                        self._adaptive._base_rate,
-                    )
-        elif isolated_scope == "family":
-            adaptive = self._get_family_adaptive(family)
-            if adaptive is not None:
-                new_rate = adaptive.record_failure()
-                if new_rate is not None:
-                    self._family_rate_limiters[family] = AsyncLimiter(
-                        max_rate=new_rate, time_period=1.0
-                    )
-                    logger.warning(
-                        "family adaptive rate [{}]: backing off to {:.1f} req/s", family, new_rate
-                    )
+        new_rate = self._governor.record_failure(endpoint_name, family)
+        if new_rate is not None:
+            self._log_rate_change(endpoint_name, family, new_rate, "backing off")
+
+    def _log_rate_change(self, endpoint_name: str, family: str, new_rate: float, verb: str) -> None:
+        scope = self._governor.scope(endpoint_name, family)
+        if scope == "global":
+            logger.log(
+                "WARNING" if verb == "backing off" else "INFO",
+                "adaptive rate: {} to {:.1f} req/s",
+                verb,
+                new_rate,
+            )
+            if self._progress is not None:
+                self._progress.update_rate_info(
+                    self._governor.current_rate,
+                    self._governor.base_rate,
+                )
+            return
+        logger.log(
+            "WARNING" if verb == "backing off" else "INFO",
+            "{} adaptive rate [{}]: {} to {:.1f} req/s",
+            scope,
+            endpoint_name if scope == "endpoint" else family,
+            verb,
+            new_rate,
+        )
 
     async def _run_with_journal(
         self,
@@ -1224,28 +1327,16 @@ class ExtractorRunner:
 
         self._journal.record_start(endpoint_name, params_json)
         t0 = time.perf_counter()
-        isolated_scope = "global"
 
         for attempt in range(max_retries + 1):
             extractor = extractor_cls()
             self._prepare_extractor(extractor)
             family = self._endpoint_family(endpoint_name, extractor.category)
             sem = self._get_semaphore(endpoint_name, extractor.category)
-            endpoint_limiter = self._get_endpoint_rate_limiter(endpoint_name)
-            family_limiter = self._get_family_rate_limiter(family)
-            if endpoint_limiter is not None:
-                rate_limiter = endpoint_limiter
-                isolated_scope = "endpoint"
-            elif family_limiter is not None:
-                rate_limiter = family_limiter
-                isolated_scope = "family"
-            else:
-                rate_limiter = self._rate_limiter
-                isolated_scope = "global"
 
             try:
                 await self._wait_for_circuit_breaker(endpoint_name, params_json)
-                async with sem, rate_limiter:
+                async with sem, self._governor.slot(endpoint_name, family):
                     result = await fn(extractor)
             except Exception as exc:
                 last_exc = exc
@@ -1277,30 +1368,9 @@ class ExtractorRunner:
                 self._journal.record_metric(endpoint_name, duration, rows)
                 self._circuit_breaker.record_success(endpoint_name)
                 self._latency.record(endpoint_name, duration)
-                if isolated_scope == "global":
-                    new_rate = self._adaptive.record_success()
-                    if new_rate is not None:
-                        self._rate_limiter = AsyncLimiter(max_rate=new_rate, time_period=1.0)
-                        logger.info("adaptive rate: recovering to {:.1f} req/s", new_rate)
-                        if self._progress is not None:
-                            self._progress.update_rate_info(
-                                self._adaptive.current_rate,
-                                self._adaptive._base_rate,
-                            )
-                elif isolated_scope == "family":
-                    adaptive = self._get_family_adaptive(family)
-                    if adaptive is not None:
-                        new_rate = adaptive.record_success()
-                        if new_rate is not None:
-                            self._family_rate_limiters[family] = AsyncLimiter(
-                                max_rate=new_rate,
-                                time_period=1.0,
-                            )
-                            logger.info(
-                                "family adaptive rate [{}]: recovering to {:.1f} req/s",
-                                family,
-                                new_rate,
-                            )
+                new_rate = self._governor.record_success(endpoint_name, family)
+                if new_rate is not None:
+                    self._log_rate_change(endpoint_name, family, new_rate, "recovering")
                 if attempt > 0:
                     logger.info(
                         "extract succeeded on retry {}: {} [{}]",
@@ -1325,7 +1395,6 @@ class ExtractorRunner:
                 endpoint_name,
                 family,
                 duration,
-                isolated_scope=isolated_scope,
             )
             wait_seconds = self._late_recovery_wait_seconds(endpoint_name)
             logger.warning(
@@ -1348,7 +1417,6 @@ class ExtractorRunner:
                 endpoint_name,
                 family,
                 duration,
-                isolated_scope=isolated_scope,
             )
         logger.error(
             "extract failed after {} attempts: {} [{}] -> {}",
@@ -1550,13 +1618,13 @@ class ExtractorRunner:
         """Extract a multi-result endpoint once and fan out by
         ``result_set_index``.
 
-        Uses a cache so the same (endpoint, params) is only called
-        once even if multiple staging entries reference it.
+        Every staging entry sharing the call is fanned out from the one
+        response (HR-A-007), so nothing is cached past this call and memory
+        stays flat regardless of chunk size.
         """
         import polars as pl
 
         params_json = json.dumps(params, sort_keys=True)
-        cache_key = (endpoint_name, params_json)
 
         # Single check: all entries share the same endpoint call
         # (use pre-fetched set when available)
@@ -1584,68 +1652,85 @@ class ExtractorRunner:
                 params_json,
             )
 
-        # Check cache first
-        if cache_key not in self._multi_cache:
-            pool = self._thread_pool
+        pool = self._thread_pool
 
-            async def _do(ext: object) -> list[pl.DataFrame]:
-                loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(pool, lambda: _sync_extract_all(ext, **params))
+        async def _do(ext: object) -> list[pl.DataFrame]:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, lambda: _sync_extract_all(ext, **params))
 
-            all_dfs = await self._run_with_journal(
+        all_dfs = await self._run_with_journal(
+            endpoint_name,
+            params_json,
+            params=params,
+            fn=_do,
+            allow_late_recovery=allow_late_recovery,
+            late_recovery_replay=late_recovery_replay,
+            defer_journal_success=defer_journal_success,
+            return_failures=True,
+        )
+        if all_dfs is None:
+            return _FailedExtraction(endpoint_name, params_json, "UnknownFailure")
+        if isinstance(all_dfs, _FailedExtraction):
+            return all_dfs
+        if isinstance(all_dfs, _DeferredExtraction):
+            return _DeferredExtraction(
+                endpoint_name=all_dfs.endpoint_name,
+                params=all_dfs.params,
+                wait_seconds=all_dfs.wait_seconds,
+                eligible_staging_keys=tuple(entry.staging_key for entry in entries),
+            )
+        pending_success: _PendingJournalSuccess | None = None
+        if isinstance(all_dfs, _JournaledExtraction):
+            pending_success = all_dfs.success
+            all_dfs = all_dfs.data
+        if not isinstance(all_dfs, list):
+            logger.error("unexpected non-list result for multi extraction: {}", endpoint_name)
+            return _FailedExtraction(
                 endpoint_name,
                 params_json,
-                params=params,
-                fn=_do,
-                allow_late_recovery=allow_late_recovery,
-                late_recovery_replay=late_recovery_replay,
-                defer_journal_success=defer_journal_success,
-                return_failures=True,
+                "UnexpectedNonListResult",
+                status="unexpected",
             )
-            if all_dfs is None:
-                return _FailedExtraction(endpoint_name, params_json, "UnknownFailure")
-            if isinstance(all_dfs, _FailedExtraction):
-                return all_dfs
-            if isinstance(all_dfs, _DeferredExtraction):
-                return _DeferredExtraction(
-                    endpoint_name=all_dfs.endpoint_name,
-                    params=all_dfs.params,
-                    wait_seconds=all_dfs.wait_seconds,
-                    eligible_staging_keys=tuple(entry.staging_key for entry in entries),
+        validated_dfs: list[pl.DataFrame] = []
+        for df in all_dfs:
+            if not isinstance(df, pl.DataFrame):
+                logger.error(
+                    "unexpected element type for multi extraction {}: {}",
+                    endpoint_name,
+                    type(df).__name__,
                 )
-            pending_success: _PendingJournalSuccess | None = None
-            if isinstance(all_dfs, _JournaledExtraction):
-                pending_success = all_dfs.success
-                all_dfs = all_dfs.data
-            if not isinstance(all_dfs, list):
-                logger.error("unexpected non-list result for multi extraction: {}", endpoint_name)
                 return _FailedExtraction(
                     endpoint_name,
                     params_json,
-                    "UnexpectedNonListResult",
+                    f"UnexpectedElementType:{type(df).__name__}",
                     status="unexpected",
                 )
-            validated_dfs: list[pl.DataFrame] = []
-            for df in all_dfs:
-                if not isinstance(df, pl.DataFrame):
-                    logger.error(
-                        "unexpected element type for multi extraction {}: {}",
-                        endpoint_name,
-                        type(df).__name__,
-                    )
-                    return _FailedExtraction(
-                        endpoint_name,
-                        params_json,
-                        f"UnexpectedElementType:{type(df).__name__}",
-                        status="unexpected",
-                    )
-                validated_dfs.append(df)
-            self._multi_cache[cache_key] = validated_dfs
-        else:
-            pending_success = None
+            validated_dfs.append(df)
 
         # Fan out results by result_set_index
-        all_dfs = self._multi_cache[cache_key]
+        output = self._fan_out_multi(endpoint_name, params_json, entries, validated_dfs)
+        if isinstance(output, _FailedExtraction):
+            return output
+        if pending_success is not None:
+            return _ExtractionTaskResult(
+                frames=output,
+                pending_success=pending_success,
+                source_endpoint_name=endpoint_name,
+                source_params_json=params_json,
+                expected_staging_keys=tuple(output),
+            )
+        return output
+
+    def _fan_out_multi(
+        self,
+        endpoint_name: str,
+        params_json: str,
+        entries: list[StagingEntry],
+        all_dfs: list[pl.DataFrame],
+    ) -> dict[str, pl.DataFrame] | _FailedExtraction:
+        """Map each entry to its result set, failing on a missing required set."""
+        import polars as pl
+
         output: dict[str, pl.DataFrame] = {}
         for entry in entries:
             idx = entry.result_set_index
@@ -1674,13 +1759,4 @@ class ExtractorRunner:
                     error,
                     status="unexpected",
                 )
-
-        if pending_success is not None:
-            return _ExtractionTaskResult(
-                frames=output,
-                pending_success=pending_success,
-                source_endpoint_name=endpoint_name,
-                source_params_json=params_json,
-                expected_staging_keys=tuple(output),
-            )
         return output
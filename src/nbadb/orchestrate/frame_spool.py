@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import polars as pl
+
+
+class FrameSpool:
+    """Per-staging-key frame accumulator backed by Arrow IPC files.
+
+    Each appended frame is written straight to its own IPC file so the
+    extracted data for a whole pattern never has to stay resident; only
+    row counts and column sets are kept in memory. ``scan`` returns a lazy
+    ``diagonal_relaxed`` union over a key's files, so schema differences
+    between chunks are reconciled when the data is read, not when it is
+    appended.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self._root = root
+        self._tmp: tempfile.TemporaryDirectory[str] | None = None
+        self._seq = 0
+        self._files: dict[str, list[Path]] = {}
+        self._rows: dict[str, int] = {}
+        self._columns: dict[str, list[frozenset[str]]] = {}
+
+    def __enter__(self) -> FrameSpool:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        """Staging keys that received at least one non-empty frame, in arrival order."""
+        return iter(list(self._files))
+
+    def rows(self, key: str) -> int:
+        return self._rows.get(key, 0)
+
+    def append(self, key: str, df: pl.DataFrame) -> None:
+        """Spill *df* for *key*; empty frames are ignored."""
+        if df.is_empty():
+            return
+        files = self._files.setdefault(key, [])
+        self._seq += 1
+        path = self._dir() / f"{self._seq:08d}.arrow"
+        df.write_ipc(path)
+        files.append(path)
+        self._rows[key] = self._rows.get(key, 0) + df.shape[0]
+        column_sets = self._columns.setdefault(key, [])
+        columns = frozenset(df.columns)
+        if columns not in column_sets:
+            column_sets.append(columns)
+
+    def scan(self, key: str) -> pl.LazyFrame:
+        """Lazily union every frame spilled for *key*."""
+        import polars as pl
+
+        files = self._files.get(key)
+        if not files:
+            return pl.LazyFrame()
+        scans = [pl.scan_ipc(path, memory_map=False) for path in files]
+        if len(scans) == 1:
+            return scans[0]
+        return pl.concat(scans, how="diagonal_relaxed")
+
+    def drifted_columns(self, key: str) -> set[str]:
+        """Columns present in some but not all of *key*'s frames."""
+        column_sets = self._columns.get(key, [])
+        if len(column_sets) <= 1:
+            return set()
+        return set(frozenset().union(*column_sets) - frozenset.intersection(*column_sets))
+
+    def close(self) -> None:
+        """Delete every spill file."""
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+        self._files.clear()
+        self._rows.clear()
+        self._columns.clear()
+
+    def _dir(self) -> Path:
+        if self._tmp is None:
+            if self._root is not None:
+                self._root.mkdir(parents=True, exist_ok=True)
+            # TemporaryDirectory also cleans up on garbage collection, so an
+            # extraction that raises part-way does not leak its spill files.
+            self._tmp = tempfile.TemporaryDirectory(prefix="nbadb-spool-", dir=self._root)
+            logger.debug("spooling extracted frames to {}", self._tmp.name)
+        return Path(self._tmp.name)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -10,15 +12,102 @@ if TYPE_CHECKING:
     import duckdb
 
 
+def params_digest(params: str) -> str:
+    """Return the digest stored in ``_extraction_journal.params_digest``.
+
+    Matches DuckDB's ``md5(params)`` so the migration and Python writers agree.
+    """
+    return hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()
+
+
+def _digest_key(digest: str) -> int:
+    return int(digest[:16], 16)
+
+
+def _json_text(value: object) -> str | None:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _json_int(value: object) -> int | None:
+    text = _json_text(value)
+    if text is None:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def journal_key_values(params: str | None) -> tuple[str | int | None, ...]:
+    """Return ``(season, season_type, game_id, player_id, team_id, game_date)`` for *params*.
+
+    Mirrors the SQL backfill in ``DBManager._create_pipeline_tables()``:
+    non-JSON params yield all ``None``.
+    """
+    try:
+        payload = json.loads(params) if params else None
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        return (None, None, None, None, None, None)
+    return (
+        _json_text(payload.get("season")),
+        _json_text(payload.get("season_type")),
+        _json_text(payload.get("game_id")),
+        _json_int(payload.get("player_id", payload.get("person_id"))),
+        _json_int(payload.get("team_id")),
+        _json_text(payload.get("game_date")),
+    )
+
+
 class PipelineJournal:
     """Thin wrapper around the DuckDB pipeline tables.
 
     Tables are created by ``DBManager._create_pipeline_tables()``.
     This class only reads/writes; it never creates schema.
+
+    Journal rows carry typed key columns (season, season_type, game_id,
+    player_id, team_id, game_date) and a ``params_digest`` next to the raw
+    JSON ``params``, so filters and aggregates never parse JSON.
+
+    Resume checks use an in-memory index of completed ``(endpoint, params)``
+    pairs, loaded from the journal on first use and kept current as this
+    instance records outcomes.  Keys are stored as 64-bit params digests
+    grouped by endpoint, so memory stays proportional to the done history
+    while each lookup costs O(batch).
     """
 
     def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
         self._conn = conn
+        self._done_index: dict[str, set[int]] | None = None
+        self._done_lock = threading.Lock()
+        self._key_columns: bool | None = None
+
+    def has_key_columns(self) -> bool:
+        """Return True when the journal has the typed key columns.
+
+        Databases opened read-only without ``DBManager.init()`` may predate
+        them; queries then fall back to parsing ``params``.
+        """
+        if self._key_columns is None:
+            row = self._conn.execute(
+                """
+                SELECT COUNT(*)
+                FROM information_schema.columns
+                WHERE table_schema = 'main'
+                  AND table_name = '_extraction_journal'
+                  AND column_name = 'params_digest'
+                """
+            ).fetchone()
+            self._key_columns = bool(row and row[0])
+        return self._key_columns
+
+    def _key_expr(self, column: str) -> str:
+        if self.has_key_columns():
+            return column
+        return f"json_extract_string(params, '$.{column}')"
 
     # ── watermarks ────────────────────────────────────────────────
 
@@ -70,11 +159,21 @@ class PipelineJournal:
     def record_start(self, endpoint: str, params: str) -> None:
         """Mark an extraction as started (in-progress)."""
         now = datetime.now(UTC).isoformat()
+        if self.has_key_columns():
+            columns = (
+                "endpoint, params, status, started_at, params_digest, "
+                "season, season_type, game_id, player_id, team_id, game_date"
+            )
+            values = "$1, $2, 'running', $3, $4, $5, $6, $7, $8, $9, $10"
+            args = [endpoint, params, now, params_digest(params), *journal_key_values(params)]
+        else:
+            columns = "endpoint, params, status, started_at"
+            values = "$1, $2, 'running', $3"
+            args = [endpoint, params, now]
         self._conn.execute(
-            """
-            INSERT INTO _extraction_journal
-                (endpoint, params, status, started_at)
-            VALUES ($1, $2, 'running', $3)
+            f"""
+            INSERT INTO _extraction_journal ({columns})
+            VALUES ({values})
             ON CONFLICT (endpoint, params)
             DO UPDATE SET
                 status = 'running',
@@ -84,7 +183,7 @@ class PipelineJournal:
                 error_message = NULL
             WHERE _extraction_journal.status != 'done'
             """,
-            [endpoint, params, now],
+            args,
         )
 
     def record_success(self, endpoint: str, params: str, rows: int) -> None:
@@ -101,6 +200,9 @@ class PipelineJournal:
             """,
             [now, rows, endpoint, params],
         )
+        with self._done_lock:
+            if self._done_index is not None:
+                self._done_index.setdefault(endpoint, set()).add(_digest_key(params_digest(params)))
         logger.info(
             "journal OK: {} [{}] -> {} rows",
             endpoint,
@@ -122,6 +224,9 @@ class PipelineJournal:
             """,
             [now, error, endpoint, params],
         )
+        with self._done_lock:
+            if self._done_index is not None:
+                self._done_index.get(endpoint, set()).discard(_digest_key(params_digest(params)))
         logger.warning(
             "journal FAIL: {} [{}] -> {}",
             endpoint,
@@ -161,21 +266,44 @@ class PipelineJournal:
     def was_extracted_batch(self, items: list[tuple[str, str]]) -> set[tuple[str, str]]:
         """Return the subset of (endpoint, params) pairs already done.
 
-        Fetches all completed items from the journal in a single scan, then
-        intersects with the requested set in Python.
+        The done history is read once per journal instance; afterwards each
+        call only hashes the requested items.
         """
         if not items:
             return set()
 
-        rows = self._conn.execute(
-            """
-            SELECT endpoint, params
-            FROM _extraction_journal
-            WHERE status = 'done'
-            """,
-        ).fetchall()
-        all_done = {(r[0], r[1]) for r in rows}
-        return all_done & set(items)
+        index = self._load_done_index()
+        done: set[tuple[str, str]] = set()
+        for endpoint, params in items:
+            digests = index.get(endpoint)
+            if digests and _digest_key(params_digest(params)) in digests:
+                done.add((endpoint, params))
+        return done
+
+    def _load_done_index(self) -> dict[str, set[int]]:
+        with self._done_lock:
+            if self._done_index is None:
+                index: dict[str, set[int]] = {}
+                digest = "md5(COALESCE(params, ''))"
+                if self.has_key_columns():
+                    digest = f"COALESCE(params_digest, {digest})"
+                result = self._conn.execute(
+                    f"""
+                    SELECT endpoint, {digest}
+                    FROM _extraction_journal
+                    WHERE status = 'done'
+                    """,
+                )
+                while rows := result.fetchmany(100_000):
+                    for endpoint, digest in rows:
+                        index.setdefault(endpoint, set()).add(_digest_key(digest))
+                self._done_index = index
+            return self._done_index
+
+    def invalidate_done_index(self) -> None:
+        """Drop the cached done index; the next resume check reloads it."""
+        with self._done_lock:
+            self._done_index = None
 
     MAX_RETRIES = 5
 
@@ -333,6 +461,7 @@ class PipelineJournal:
     def clear_journal(self) -> None:
         """Delete all journal entries (for fresh runs)."""
         self._conn.execute("DELETE FROM _extraction_journal")
+        self.invalidate_done_index()
         logger.info("extraction journal cleared")
 
     # ── selective journal operations (backfill) ────────────────────
@@ -343,6 +472,7 @@ class PipelineJournal:
         endpoint: str | list[str] | None = None,
         status_filter: str | None = None,
         season_like: str | None = None,
+        season_expr: str = "season",
     ) -> tuple[str, list[str | int]]:
         """Build a WHERE clause from AND-combined filters.
 
@@ -372,9 +502,8 @@ class PipelineJournal:
             idx += 1
 
         if season_like is not None:
-            escaped = season_like.replace("%", "\\%").replace("_", "\\_")
-            clauses.append(f"params LIKE ${idx} ESCAPE '\\'")
-            params.append(f'%"season": "{escaped}"%')
+            clauses.append(f"{season_expr} = ${idx}")
+            params.append(season_like)
             idx += 1
 
         if not clauses:
@@ -399,6 +528,7 @@ class PipelineJournal:
             endpoint=endpoint,
             status_filter=status_filter,
             season_like=season_like,
+            season_expr=self._key_expr("season"),
         )
         result = self._conn.execute(
             f"""
@@ -408,6 +538,7 @@ class PipelineJournal:
             """,
             params,
         )
+        self.invalidate_done_index()
         row = result.fetchone()
         count = row[0] if row else 0
         logger.info(
@@ -435,6 +566,7 @@ class PipelineJournal:
             endpoint=endpoint,
             status_filter=status_filter,
             season_like=season_like,
+            season_expr=self._key_expr("season"),
         )
         result = self._conn.execute(
             f"""
@@ -443,6 +575,7 @@ class PipelineJournal:
             """,
             params,
         )
+        self.invalidate_done_index()
         row = result.fetchone()
         count = row[0] if row else 0
         logger.info(
@@ -481,20 +614,15 @@ class PipelineJournal:
     def count_done_by_endpoint_season_type(
         self,
     ) -> list[tuple[str, str | None, str | None, int]]:
-        """Return ``(endpoint, season, season_type, done_count)`` using JSON extraction."""
+        """Return ``(endpoint, season, season_type, done_count)`` from the typed key columns."""
+        season = self._key_expr("season")
+        season_type = self._key_expr("season_type")
         rows = self._conn.execute(
-            """
-            SELECT
-                endpoint,
-                json_extract_string(params, '$.season')      AS season,
-                json_extract_string(params, '$.season_type') AS season_type,
-                COUNT(*) AS done_count
+            f"""
+            SELECT endpoint, {season} AS season, {season_type} AS season_type, COUNT(*)
             FROM _extraction_journal
             WHERE status = 'done'
-            GROUP BY
-                endpoint,
-                json_extract_string(params, '$.season'),
-                json_extract_string(params, '$.season_type')
+            GROUP BY ALL
             ORDER BY endpoint, season, season_type
             """
         ).fetchall()
@@ -528,13 +656,10 @@ class PipelineJournal:
             idx += 1
 
         if seasons:
-            season_clauses = []
-            for season in seasons:
-                escaped = season.replace("%", "\\%").replace("_", "\\_")
-                season_clauses.append(f"params LIKE ${idx} ESCAPE '\\'")
-                params.append(f'%"season": "{escaped}"%')
-                idx += 1
-            clauses.append(f"({' OR '.join(season_clauses)})")
+            placeholders = ", ".join(f"${idx + i}" for i in range(len(seasons)))
+            clauses.append(f"{self._key_expr('season')} IN ({placeholders})")
+            params.extend(seasons)
+            idx += len(seasons)
 
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         params.append(limit)
@@ -623,6 +748,18 @@ class PipelineJournal:
             [endpoint, now, duration, rows, errors],
         )
 
+    def endpoint_latency_p95(self) -> dict[str, float]:
+        """Return the recorded p95 call duration per endpoint, in seconds."""
+        rows = self._conn.execute(
+            """
+            SELECT endpoint, quantile_cont(duration_seconds, 0.95)
+            FROM _pipeline_metrics
+            WHERE error_count = 0 AND duration_seconds IS NOT NULL
+            GROUP BY endpoint
+            """
+        ).fetchall()
+        return {str(endpoint): float(p95) for endpoint, p95 in rows if p95 is not None}
+
     def record_lane_metric(
         self,
         *,
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import contextlib
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import duckdb
 import polars as pl
@@ -13,6 +14,7 @@ from nbadb.core.config import NbaDbSettings, get_settings
 from nbadb.core.db import DBManager
 from nbadb.core.types import validate_sql_identifier
 from nbadb.extract.live.endpoints import (
+    LIVE_PACKET_CONTRACTS,
     LiveBoxScoreExtractor,
     LiveOddsExtractor,
     LivePlayByPlayExtractor,
@@ -24,6 +26,10 @@ from nbadb.orchestrate.extractor_runner import _sync_extract, _sync_extract_all
 from nbadb.orchestrate.transformers import discover_live_transformers
 from nbadb.schemas.registry import get_input_schema
 from nbadb.transform.pipeline import TransformPipeline
+from nbadb.transform.result_cache import frame_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
 
 _LIVE_BOX_SCORE_STAGING_KEYS = [
     "stg_live_box_score_game_details",
@@ -48,6 +54,64 @@ _LIVE_RAW_SCHEMA_BY_STAGING_KEY = {
     "stg_live_box_score_player_stats_away": "raw_live_box_score_player_stats",
 }
 
+_STAR_TABLE_BY_STAGING_KEY = {
+    contract.staging_key: contract.star_tables[0] for contract in LIVE_PACKET_CONTRACTS
+}
+_NATURAL_KEYS_BY_STAR_TABLE = {
+    star_table: contract.natural_keys
+    for contract in LIVE_PACKET_CONTRACTS
+    for star_table in contract.star_tables
+}
+# Stamped on every row of every poll, so they never count as a change.
+_SNAPSHOT_COLUMNS = frozenset({"snapshot_at", "snapshot_date"})
+_FINAL_GAME_STATUS = 3
+_WATERMARK_TABLE = "_live_game_watermarks"
+
+
+@dataclass(frozen=True, slots=True)
+class LiveGameWatermark:
+    """How far a game's live feed had progressed when it was last processed.
+
+    Play-by-play progress is tracked field by field; the scoreboard, odds and
+    box-score rows of the game are folded into ``content_digest``, so a score
+    correction or a line move counts as a change even when no action was
+    added.
+    """
+
+    last_action_number: int | None
+    period: int | None
+    clock: str | None
+    game_status: int | None
+    content_digest: str | None = None
+
+    @classmethod
+    def from_play_by_play(
+        cls,
+        play_by_play: pl.DataFrame,
+        *,
+        game_status: int | None,
+        content_digest: str | None = None,
+    ) -> LiveGameWatermark:
+        if play_by_play.is_empty() or "action_number" not in play_by_play.columns:
+            return cls(None, None, None, game_status, content_digest)
+        last = play_by_play.sort("action_number", nulls_last=False).row(-1, named=True)
+        return cls(
+            last["action_number"],
+            last.get("period"),
+            last.get("clock"),
+            game_status,
+            content_digest,
+        )
+
+
+def _content_digest(frames: Iterable[pl.DataFrame]) -> str:
+    """Digest live frames, ignoring the columns stamped on every poll."""
+    digest = hashlib.sha256()
+    for frame in frames:
+        unstamped = frame.drop(*_SNAPSHOT_COLUMNS, strict=False)
+        digest.update(frame_fingerprint(unstamped).encode("ascii"))
+    return digest.hexdigest()[:32]
+
 
 @dataclass(frozen=True, slots=True)
 class LiveSnapshotResult:
@@ -57,14 +121,22 @@ class LiveSnapshotResult:
     star_tables_loaded: int
     staging_rows_persisted: int
     star_rows_loaded: int
+    skipped_game_ids: list[str] = field(default_factory=list)
 
 
 class LiveSnapshotWarehouse:
-    """Dedicated append-only live snapshot warehouse path.
+    """Dedicated incremental live snapshot warehouse path.
 
     This path deliberately avoids the historical journal and replace-style
-    transform/load flow so repeated live snapshots for the same game can be
-    persisted side-by-side.
+    transform/load flow. Each game carries a high-water mark (last action
+    number, period, clock, game status and a digest of the game's scoreboard,
+    odds and box-score rows) in ``_live_game_watermarks``; games whose mark has
+    not moved since the previous poll are skipped before anything is
+    validated, transformed or merged. For the games that did move, only rows
+    that differ from the current star rows are appended to staging,
+    transformed, and merged into the live star tables on their natural keys,
+    so poll cost tracks what changed rather than how many games the slate has
+    seen.
     """
 
     def __init__(self, settings: NbaDbSettings | None = None) -> None:
@@ -89,7 +161,7 @@ class LiveSnapshotWarehouse:
 
     @staticmethod
     def _ordered_game_ids(frame: pl.DataFrame) -> list[str]:
-        if frame.is_empty or "game_id" not in frame.columns:
+        if frame.is_empty() or "game_id" not in frame.columns:
             return []
         seen: set[str] = set()
         ordered: list[str] = []
@@ -103,16 +175,26 @@ class LiveSnapshotWarehouse:
 
     @classmethod
     def _active_game_ids(cls, score_board: pl.DataFrame) -> list[str]:
-        if score_board.is_empty:
+        if score_board.is_empty():
             return []
         active_rows = score_board
         if "game_status" in score_board.columns:
             active_rows = score_board.filter(pl.col("game_status") == 2)
         return cls._ordered_game_ids(active_rows)
 
+    @staticmethod
+    def _game_statuses(score_board: pl.DataFrame) -> dict[str, int | None]:
+        if score_board.is_empty() or not {"game_id", "game_status"} <= set(score_board.columns):
+            return {}
+        return {
+            str(game_id): status
+            for game_id, status in score_board.select("game_id", "game_status").iter_rows()
+            if game_id is not None
+        }
+
     @staticmethod
     def _filter_game_ids(frame: pl.DataFrame, game_ids: list[str]) -> pl.DataFrame:
-        if frame.is_empty or not game_ids or "game_id" not in frame.columns:
+        if frame.is_empty() or not game_ids or "game_id" not in frame.columns:
             return frame
         return frame.filter(pl.col("game_id").cast(pl.Utf8).is_in(game_ids))
 
@@ -143,46 +225,77 @@ class LiveSnapshotWarehouse:
         *,
         snapshot_at: datetime,
         game_ids: list[str] | None,
-    ) -> tuple[dict[str, pl.DataFrame], list[str]]:
+        read_watermarks: Callable[[list[str]], Mapping[str, LiveGameWatermark]] | None = None,
+    ) -> tuple[dict[str, pl.DataFrame], list[str], dict[str, LiveGameWatermark]]:
+        """Extract live frames for games whose high-water mark moved.
+
+        Every feed of a candidate game is fetched so its content digest can be
+        compared, but only games whose watermark moved are returned. Returns
+        the frames, every candidate game id, and the new watermark of each game
+        that moved; candidates missing from the last are unchanged.
+        """
         score_board = _sync_extract(LiveScoreBoardExtractor(), snapshot_at=snapshot_at)
         effective_game_ids = list(game_ids or self._active_game_ids(score_board))
-        if not effective_game_ids and not game_ids:
-            return {}, []
+        if not effective_game_ids:
+            return {}, [], {}
 
-        score_board = self._filter_game_ids(score_board, effective_game_ids)
-        odds = self._filter_game_ids(
-            _sync_extract(LiveOddsExtractor(), snapshot_at=snapshot_at),
-            effective_game_ids,
-        )
+        watermarks = read_watermarks(effective_game_ids) if read_watermarks is not None else {}
 
+        statuses = self._game_statuses(score_board)
+        odds: pl.DataFrame | None = None
+        score_board_frames: list[pl.DataFrame] = []
+        odds_frames: list[pl.DataFrame] = []
         play_by_play_frames: list[pl.DataFrame] = []
         box_score_frames: dict[str, list[pl.DataFrame]] = {
             staging_key: [] for staging_key in _LIVE_BOX_SCORE_STAGING_KEYS
         }
-
+        advanced: dict[str, LiveGameWatermark] = {}
         for game_id in effective_game_ids:
-            play_by_play_frames.append(
-                _sync_extract(
-                    LivePlayByPlayExtractor(),
-                    game_id=game_id,
-                    snapshot_at=snapshot_at,
-                )
+            previous = watermarks.get(game_id)
+            status = statuses.get(game_id)
+            if (
+                previous is not None
+                and previous.game_status == _FINAL_GAME_STATUS
+                and status in (None, _FINAL_GAME_STATUS)
+            ):
+                continue
+            if odds is None:
+                odds = _sync_extract(LiveOddsExtractor(), snapshot_at=snapshot_at)
+            play_by_play = _sync_extract(
+                LivePlayByPlayExtractor(),
+                game_id=game_id,
+                snapshot_at=snapshot_at,
             )
-            live_box_score_packets = _sync_extract_all(
+            box_score_packets = _sync_extract_all(
                 LiveBoxScoreExtractor(),
                 game_id=game_id,
                 snapshot_at=snapshot_at,
             )
+            game_score_board = self._filter_game_ids(score_board, [game_id])
+            game_odds = self._filter_game_ids(odds, [game_id])
+            watermark = LiveGameWatermark.from_play_by_play(
+                play_by_play,
+                game_status=status,
+                content_digest=_content_digest([game_score_board, game_odds, *box_score_packets]),
+            )
+            if watermark == previous:
+                continue
+            advanced[game_id] = watermark
+            score_board_frames.append(game_score_board)
+            odds_frames.append(game_odds)
+            play_by_play_frames.append(play_by_play)
             for staging_key, frame in zip(
                 _LIVE_BOX_SCORE_STAGING_KEYS,
-                live_box_score_packets,
+                box_score_packets,
                 strict=True,
             ):
                 box_score_frames[staging_key].append(frame)
+        if not advanced:
+            return {}, effective_game_ids, {}
 
         raw_frames = {
-            "stg_live_score_board": score_board,
-            "stg_live_odds": odds,
+            "stg_live_score_board": self._concat_frames(score_board_frames),
+            "stg_live_odds": self._concat_frames(odds_frames),
             "stg_live_play_by_play": self._concat_frames(play_by_play_frames),
         }
         raw_frames.update(
@@ -191,7 +304,7 @@ class LiveSnapshotWarehouse:
                 for staging_key, frames in box_score_frames.items()
             }
         )
-        return raw_frames, effective_game_ids
+        return raw_frames, effective_game_ids, advanced
 
     def _validate_live_contracts(
         self,
@@ -232,6 +345,128 @@ class LiveSnapshotWarehouse:
             persisted_rows += frame.height
         return persisted_tables, persisted_rows
 
+    @staticmethod
+    def _base_table_exists(db: DBManager, table_name: str) -> bool:
+        return (
+            db.duckdb.execute(
+                (
+                    "SELECT 1 FROM information_schema.tables "
+                    "WHERE table_schema = 'main' "
+                    "AND table_name = ? "
+                    "AND table_type = 'BASE TABLE'"
+                ),
+                [table_name],
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _read_watermarks(db: DBManager, game_ids: list[str]) -> dict[str, LiveGameWatermark]:
+        db.duckdb.execute(
+            f"CREATE TABLE IF NOT EXISTS {_WATERMARK_TABLE} ("
+            "game_id VARCHAR PRIMARY KEY, last_action_number BIGINT, period BIGINT, "
+            "clock VARCHAR, game_status BIGINT, snapshot_at TIMESTAMP)"
+        )
+        db.duckdb.execute(
+            f"ALTER TABLE {_WATERMARK_TABLE} ADD COLUMN IF NOT EXISTS content_digest VARCHAR"
+        )
+        if not game_ids:
+            return {}
+        rows = db.duckdb.execute(
+            f"SELECT game_id, last_action_number, period, clock, game_status, content_digest "
+            f"FROM {_WATERMARK_TABLE} WHERE game_id IN (SELECT unnest($1::VARCHAR[]))",
+            [game_ids],
+        ).fetchall()
+        return {row[0]: LiveGameWatermark(*row[1:]) for row in rows}
+
+    @staticmethod
+    def _write_watermarks(
+        db: DBManager,
+        watermarks: Mapping[str, LiveGameWatermark],
+        snapshot_at: datetime,
+    ) -> None:
+        db.duckdb.executemany(
+            f"INSERT OR REPLACE INTO {_WATERMARK_TABLE} (game_id, last_action_number, period, "
+            "clock, game_status, content_digest, snapshot_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                [
+                    game_id,
+                    watermark.last_action_number,
+                    watermark.period,
+                    watermark.clock,
+                    watermark.game_status,
+                    watermark.content_digest,
+                    snapshot_at.replace(tzinfo=None),
+                ]
+                for game_id, watermark in watermarks.items()
+            ],
+        )
+
+    @classmethod
+    def _changed_rows(
+        cls,
+        db: DBManager,
+        staging_key: str,
+        frame: pl.DataFrame,
+    ) -> pl.DataFrame:
+        """Drop rows whose star row already holds the same values."""
+        star_table = _STAR_TABLE_BY_STAGING_KEY[staging_key]
+        if frame.is_empty() or not cls._base_table_exists(db, star_table):
+            return frame
+        star_columns = {
+            row[0]
+            for row in db.duckdb.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = 'main' AND table_name = ?",
+                [star_table],
+            ).fetchall()
+        }
+        compared = [
+            column
+            for column in frame.columns
+            if column in star_columns and column not in _SNAPSHOT_COLUMNS
+        ]
+        if "game_id" not in compared:
+            return frame
+        matches = " AND ".join(
+            f't."{column}" IS NOT DISTINCT FROM s."{column}"' for column in compared
+        )
+        db.duckdb.register("_live_snapshot_tmp", frame)
+        try:
+            return db.duckdb.execute(
+                f"WITH t AS (SELECT * FROM {validate_sql_identifier(star_table)} "
+                "WHERE game_id IN (SELECT game_id FROM _live_snapshot_tmp)) "
+                f"SELECT s.* FROM _live_snapshot_tmp s WHERE NOT EXISTS "
+                f"(SELECT 1 FROM t WHERE {matches})"
+            ).pl()
+        finally:
+            db.duckdb.unregister("_live_snapshot_tmp")
+
+    @staticmethod
+    def _merge_into_duckdb(
+        db: DBManager,
+        table_name: str,
+        frame: pl.DataFrame,
+        natural_keys: tuple[str, ...],
+    ) -> None:
+        safe_table = validate_sql_identifier(table_name)
+        frame = frame.unique(subset=list(natural_keys), keep="last", maintain_order=True)
+        on = " AND ".join(f't."{key}" = s."{key}"' for key in natural_keys)
+        updates = ", ".join(
+            f'"{column}" = s."{column}"' for column in frame.columns if column not in natural_keys
+        )
+        columns = ", ".join(f'"{column}"' for column in frame.columns)
+        values = ", ".join(f's."{column}"' for column in frame.columns)
+        db.duckdb.register("_live_snapshot_tmp", frame)
+        try:
+            db.duckdb.execute(
+                f"MERGE INTO {safe_table} AS t USING _live_snapshot_tmp AS s ON {on} "
+                f"WHEN MATCHED THEN UPDATE SET {updates} "
+                f"WHEN NOT MATCHED THEN INSERT ({columns}) VALUES ({values})"
+            )
+        finally:
+            db.duckdb.unregister("_live_snapshot_tmp")
+
     def run(
         self,
         *,
@@ -247,12 +482,21 @@ class LiveSnapshotWarehouse:
             sqlite_path=self._settings.sqlite_path,
             duckdb_path=self._settings.duckdb_path,
         ) as db:
-            raw_frames, effective_game_ids = self._extract_live_frames(
+            raw_frames, candidate_game_ids, advanced = self._extract_live_frames(
                 snapshot_at=snapshot_ts,
                 game_ids=game_ids,
+                read_watermarks=lambda ids: self._read_watermarks(db, ids),
             )
-            if not effective_game_ids and game_ids is None:
-                logger.info("live snapshot skipped: no active live games")
+            skipped_game_ids = [
+                game_id for game_id in candidate_game_ids if game_id not in advanced
+            ]
+            if not advanced:
+                if candidate_game_ids:
+                    logger.info(
+                        "live snapshot skipped: {} live games unchanged", len(skipped_game_ids)
+                    )
+                else:
+                    logger.info("live snapshot skipped: no active live games")
                 return LiveSnapshotResult(
                     snapshot_at=snapshot_ts,
                     game_ids=[],
@@ -260,8 +504,12 @@ class LiveSnapshotWarehouse:
                     star_tables_loaded=0,
                     staging_rows_persisted=0,
                     star_rows_loaded=0,
+                    skipped_game_ids=skipped_game_ids,
                 )
-            staging_frames = self._validate_live_contracts(raw_frames)
+            staging_frames = {
+                staging_key: self._changed_rows(db, staging_key, frame)
+                for staging_key, frame in self._validate_live_contracts(raw_frames).items()
+            }
             staging_tables_persisted, staging_rows_persisted = self._persist_staging_to_duckdb(
                 db,
                 staging_frames,
@@ -287,32 +535,24 @@ class LiveSnapshotWarehouse:
                     continue
                 with contextlib.suppress(Exception):
                     db.duckdb.unregister(table_name)
-                load_mode_for_table = (
-                    "append"
-                    if db.duckdb.execute(
-                        (
-                            "SELECT 1 FROM information_schema.tables "
-                            "WHERE table_schema = 'main' "
-                            "AND table_name = ? "
-                            "AND table_type = 'BASE TABLE'"
-                        ),
-                        [table_name],
-                    ).fetchone()
-                    else "replace"
-                )
-                if load_mode_for_table == "append":
-                    duckdb_loader.load(table_name, frame, mode="append")
-                else:
+                natural_keys = _NATURAL_KEYS_BY_STAR_TABLE.get(table_name)
+                if not self._base_table_exists(db, table_name):
                     loader.load(table_name, frame, mode="replace")
+                elif natural_keys:
+                    self._merge_into_duckdb(db, table_name, frame, natural_keys)
+                else:
+                    duckdb_loader.load(table_name, frame, mode="append")
                 star_tables_loaded += 1
                 star_rows_loaded += frame.height
                 logger.info("loaded live snapshot table {}: {} rows", table_name, frame.height)
+            self._write_watermarks(db, advanced, snapshot_ts)
 
         return LiveSnapshotResult(
             snapshot_at=snapshot_ts,
-            game_ids=effective_game_ids,
+            game_ids=list(advanced),
             staging_tables_persisted=staging_tables_persisted,
             star_tables_loaded=star_tables_loaded,
             staging_rows_persisted=staging_rows_persisted,
             star_rows_loaded=star_rows_loaded,
+            skipped_game_ids=skipped_game_ids,
         )
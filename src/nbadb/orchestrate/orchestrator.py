@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import json
 import os
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Protocol, cast
+from typing import TYPE_CHECKING, Any, Concatenate, Literal, Protocol, cast
 
 import duckdb
 from loguru import logger
@@ -15,6 +17,7 @@ from loguru import logger
 from nbadb.core.config import NbaDbSettings, get_settings
 from nbadb.core.db import DBManager
 from nbadb.core.errors import ExtractionError
+from nbadb.core.tracing import NOOP_TRACER, Tracer
 from nbadb.core.types import SeasonType, season_type_upstream_unavailable_reason
 from nbadb.extract.registry import registry as _global_registry
 from nbadb.load.multi import create_multi_loader
@@ -52,7 +55,7 @@ from nbadb.orchestrate.staging_batches import (
     digest_jsonable,
     frame_content_hash,
 )
-from nbadb.orchestrate.staging_map import STAGING_MAP
+from nbadb.orchestrate.staging_map import get_by_endpoint, staging_registry
 from nbadb.orchestrate.transformers import (
     discover_all_transformers,
     require_complete_transformer_universe,
@@ -60,14 +63,17 @@ from nbadb.orchestrate.transformers import (
 from nbadb.orchestrate.workload_contract import PlayerTeamSeasonWorkloadStore
 from nbadb.transform.pipeline import TransformPipeline
 from nbadb.transform.quality import DataQualityMonitor
+from nbadb.transform.result_cache import TransformResultCache
 from nbadb.transform.schema_version import schema_hash_for_frame
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Coroutine, Sequence
     from concurrent.futures import ThreadPoolExecutor
 
     import polars as pl
 
+    from nbadb.orchestrate.rate_governor import RateGovernor
+
 
 DEFAULT_SEASON_TYPES = tuple(season_type.value for season_type in SeasonType)
 type LoadMode = Literal["replace", "append"]
@@ -165,6 +171,91 @@ def _group_exact_pairs(
     )
 
 
+async def _gather_or_cancel(*tasks: asyncio.Task[Any]) -> None:
+    """Await independent discovery *tasks*, cancelling the rest on the first failure.
+
+    Unlike ``asyncio.gather``, siblings of a failed lookup stop issuing requests
+    instead of running to completion; unlike ``asyncio.TaskGroup``, the first
+    error propagates unwrapped so callers' typed ``except`` clauses still match.
+    """
+    if not tasks:
+        return
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    for task in tasks:
+        if task in done and not task.cancelled() and task.exception() is not None:
+            task.result()
+
+
+type _OrchestratorMethod[**P, R] = Callable[Concatenate[Orchestrator, P], R]
+
+
+def _phase_span[**P, R](
+    name: str, *, phase: str
+) -> Callable[[_OrchestratorMethod[P, R]], _OrchestratorMethod[P, R]]:
+    """Record each call of an ``Orchestrator`` method as a *phase* span."""
+
+    def decorate(method: _OrchestratorMethod[P, R]) -> _OrchestratorMethod[P, R]:
+        if inspect.iscoroutinefunction(method):
+            coroutine = cast("_OrchestratorMethod[P, Awaitable[Any]]", method)
+
+            @functools.wraps(method)
+            async def async_wrapper(self: Orchestrator, *args: P.args, **kwargs: P.kwargs) -> Any:
+                with self._tracer.span(name, phase=phase):
+                    return await coroutine(self, *args, **kwargs)
+
+            return cast("_OrchestratorMethod[P, R]", async_wrapper)
+
+        @functools.wraps(method)
+        def wrapper(self: Orchestrator, *args: P.args, **kwargs: P.kwargs) -> R:
+            with self._tracer.span(name, phase=phase):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _traced_run[**P, R](
+    run_mode: str,
+) -> Callable[
+    [_OrchestratorMethod[P, Awaitable[R]]], _OrchestratorMethod[P, Coroutine[Any, Any, R]]
+]:
+    """Trace a run-mode entry point from start to finish.
+
+    The outermost traced run owns the tracer: it writes the trace file and
+    the ``_pipeline_spans`` rollup once the run returns or raises.
+    """
+
+    def decorate(
+        method: _OrchestratorMethod[P, Awaitable[R]],
+    ) -> _OrchestratorMethod[P, Coroutine[Any, Any, R]]:
+        @functools.wraps(method)
+        async def wrapper(self: Orchestrator, *args: P.args, **kwargs: P.kwargs) -> R:
+            owns_trace = not self._tracer.enabled
+            if owns_trace:
+                self._tracer = self._new_tracer(run_mode)
+            try:
+                with self._tracer.span(run_mode, phase="run"):
+                    return await method(self, *args, **kwargs)
+            finally:
+                if owns_trace:
+                    self._finish_trace()
+
+        return wrapper
+
+    return decorate
+
+
 @dataclass
 class PipelineResult:
     """Outcome of a pipeline run."""
@@ -267,6 +358,7 @@ class Orchestrator:
         self._db: DBManager | None = None
         self._journal: PipelineJournal | None = None
         self._progress: _ProgressReporter | None = progress
+        self._tracer: Tracer = NOOP_TRACER
 
     # ── lifecycle helpers ──────────────────────────────────────
 
@@ -292,6 +384,29 @@ class Orchestrator:
         self._journal = journal
         return db, journal
 
+    def _new_tracer(self, run_mode: str) -> Tracer:
+        if self._settings.trace_enabled is not True:
+            return NOOP_TRACER
+        return Tracer(run_mode=run_mode)
+
+    def _finish_trace(self) -> None:
+        """Write the current run's trace file and span rollup, then disarm."""
+        tracer, self._tracer = self._tracer, NOOP_TRACER
+        if not tracer.enabled:
+            return
+        trace_dir = self._settings.trace_dir or self._settings.data_dir / "traces"
+        try:
+            path = tracer.write_chrome_trace(trace_dir / tracer.trace_filename())
+            logger.info("trace written to {}", path)
+        except OSError as exc:
+            logger.warning("trace file write failed: {}", type(exc).__name__)
+        if self._db is not None:
+            try:
+                tracer.persist(self._db.duckdb)
+            except duckdb.Error as exc:
+                logger.warning("span rollup write failed: {}", type(exc).__name__)
+        tracer.log_summary()
+
     def _build_runner(self, journal: PipelineJournal) -> ExtractorRunner:
         _global_registry.discover()
         return ExtractorRunner(
@@ -302,12 +417,17 @@ class Orchestrator:
             progress=self._progress,
         )
 
-    def _build_discovery(self, thread_pool: ThreadPoolExecutor | None = None) -> EntityDiscovery:
+    def _build_discovery(
+        self,
+        thread_pool: ThreadPoolExecutor | None = None,
+        rate_governor: RateGovernor | None = None,
+    ) -> EntityDiscovery:
         """Create an EntityDiscovery wired to the global registry."""
         return EntityDiscovery(
             _global_registry,
             thread_pool=thread_pool,
             settings=self._settings,
+            rate_governor=rate_governor,
         )
 
     def _build_result(
@@ -401,6 +521,7 @@ class Orchestrator:
             return list(DEFAULT_SEASON_TYPES)
         return list(season_types)
 
+    @_phase_span("discover current teams", phase="discovery")
     async def _discover_current_team_ids(
         self,
         discovery: _DiscoveryService,
@@ -417,6 +538,7 @@ class Orchestrator:
         artifacts.upsert_ids(scope, discovered, provenance="discovery")
         return discovered
 
+    @_phase_span("discover player-team seasons", phase="discovery")
     async def _discover_player_team_season_result(
         self,
         discovery: _DiscoveryService,
@@ -637,17 +759,24 @@ class Orchestrator:
         # Transform
         transformers = discover_all_transformers(include_live=False)
         require_complete_transformer_universe(transformers, include_live=False)
-        pipeline = TransformPipeline(db.duckdb)
+        cache = TransformResultCache(db.duckdb) if self._settings.transform_cache_enabled else None
+        pipeline = TransformPipeline(
+            db.duckdb,
+            cache=cache,
+            tracer=self._tracer,
+            validation_chunk_rows=self._settings.validation_chunk_rows,
+        )
         pipeline.register_all(transformers)
         n_transformers = len(transformers)
         if pp is not None:
             pp.start_pattern(f"Transform ({n_transformers})", total=n_transformers)
         try:
-            outputs = pipeline.run(
-                staging,
-                validate_input_schemas=True,
-                on_progress=pp,
-            )
+            with self._tracer.span("transform pipeline", phase="transform"):
+                outputs = pipeline.run(
+                    staging,
+                    validate_input_schemas=True,
+                    on_progress=pp,
+                )
         finally:
             # TransformPipeline.run() resets _conn in its own finally,
             # but we guard here as well for safety.
@@ -659,6 +788,13 @@ class Orchestrator:
         rows_total = 0
         failed_loads = 0
         non_empty = {t: df for t, df in outputs.items() if not df.is_empty()}
+        passthroughs = pipeline.passthroughs if self._settings.passthrough_views is True else {}
+        cache_keys = pipeline.cache_keys if mode == "replace" else {}
+        # Star tables reused from the cache or maintained in place by their
+        # transformer are already what the DuckDB file holds
+        last_result = pipeline.last_result
+        reused = set(last_result.cached) if last_result is not None and mode == "replace" else set()
+        reused.update(pipeline.persisted_tables)
         if pp is not None:
             pp.start_pattern(f"Load ({len(non_empty)})", total=len(non_empty))
 
@@ -666,9 +802,20 @@ class Orchestrator:
             if df.is_empty():
                 logger.debug("skip load (empty): {}", table)
                 continue
+            if cache is not None and table not in reused:
+                cache.forget(table)
             try:
-                loader.load(table, df, mode=mode)
+                with self._tracer.span(table, phase="load", rows=df.shape[0]):
+                    loader.load(
+                        table,
+                        df,
+                        mode=mode,
+                        passthrough=passthroughs.get(table),
+                        persisted=table in reused,
+                    )
                 rows = df.shape[0]
+                if cache is not None and table in cache_keys and table not in reused:
+                    cache.record(table, cache_keys[table], rows)
                 tables_updated += 1
                 rows_total += rows
                 if pp is not None:
@@ -692,11 +839,12 @@ class Orchestrator:
             try:
                 quality_score: float | None = None
                 try:
-                    monitor = DataQualityMonitor(db.duckdb)
-                    quality_score = monitor.record_table_quality_checks(
-                        table,
-                        row_count=rows,
-                    )
+                    with self._tracer.span(table, phase="quality"):
+                        monitor = DataQualityMonitor(db.duckdb)
+                        quality_score = monitor.record_table_quality_checks(
+                            table,
+                            row_count=rows,
+                        )
                 except Exception as dq_exc:
                     logger.debug(
                         "quality score skipped for {}: {}",
@@ -725,6 +873,7 @@ class Orchestrator:
 
         return tables_updated, rows_total, failed_loads
 
+    @_phase_span("persist staging chunk", phase="staging")
     def _persist_staging_to_duckdb(
         self,
         db: DBManager,
@@ -735,7 +884,7 @@ class Orchestrator:
         pattern: str = "unknown",
         chunk_index: int = 0,
         chunk_params: list[dict] | None = None,
-        entries: list[object] | None = None,
+        entries: Sequence[object] | None = None,
         expected_staging_keys: list[str] | None = None,
         source_results: list[dict[str, object]] | None = None,
         dedupe_materialized: bool | None = None,
@@ -847,6 +996,7 @@ class Orchestrator:
             materialize=materialize,
         )
 
+    @_phase_span("materialize staging", phase="materialize")
     def _materialize_staging_batches(
         self,
         db: DBManager,
@@ -856,13 +1006,9 @@ class Orchestrator:
     ) -> int:
         keys: list[str] | None = None
         if endpoints is not None or patterns is not None:
-            ep_set = set(endpoints) if endpoints else None
-            pat_set = set(patterns) if patterns else None
             keys = [
                 entry.staging_key
-                for entry in STAGING_MAP
-                if (ep_set is None or entry.endpoint_name in ep_set)
-                and (pat_set is None or entry.param_pattern in pat_set)
+                for entry in staging_registry().select(endpoints=endpoints, patterns=patterns)
             ]
         return StagingBatchStore(db.duckdb).materialize(keys)
 
@@ -903,6 +1049,7 @@ class Orchestrator:
 
     # ── shared discovery (QUAL-006) ───────────────────────────
 
+    @_phase_span("discover entities", phase="discovery")
     async def _discover_entities(
         self,
         discovery: _DiscoveryService,
@@ -936,271 +1083,280 @@ class Orchestrator:
 
         pp = self._progress
         artifacts = self._discovery_artifacts()
-        resolved_season_types = tuple(season_types or ["Regular Season"])
-        requested_game_combos = frozenset(
-            (season, season_type) for season in seasons for season_type in resolved_season_types
-        )
-        refresh_current_scope = refresh_mutable_entities and current_season() in seasons
-
-        discovery_tasks: list[Awaitable[object]] = []
-        game_index: int | None = None
-        player_index: int | None = None
-        team_index: int | None = None
-
-        if include_games:
-            game_scope = DiscoveryArtifactScope(
-                kind="league_game_log",
-                seasons=tuple(seasons),
-                season_types=resolved_season_types,
-            )
-            cached_game_log = (
-                None if refresh_current_scope else artifacts.load_game_log_frame(game_scope)
+        with artifacts.deferred_season_index():
+            resolved_season_types = tuple(season_types or ["Regular Season"])
+            requested_game_combos = frozenset(
+                (season, season_type) for season in seasons for season_type in resolved_season_types
             )
-            if cached_game_log is not None:
-                game_ids = (
-                    cached_game_log.get_column("game_id").unique().sort().to_list()
-                    if not cached_game_log.is_empty() and "game_id" in cached_game_log.columns
-                    else []
+            refresh_current_scope = refresh_mutable_entities and current_season() in seasons
+
+            discovery_tasks: list[Awaitable[object]] = []
+            game_index: int | None = None
+            player_index: int | None = None
+            team_index: int | None = None
+
+            if include_games:
+                game_scope = DiscoveryArtifactScope(
+                    kind="league_game_log",
+                    seasons=tuple(seasons),
+                    season_types=resolved_season_types,
                 )
-                game_log_df = cached_game_log
-                if pp is not None:
-                    pp.log_discovery("games", len(game_ids))
-                if include_dates:
-                    game_dates = (
-                        game_log_df.get_column("game_date").cast(pl.Utf8).unique().sort().to_list()
-                        if "game_date" in game_log_df.columns
+                cached_game_log = (
+                    None if refresh_current_scope else artifacts.load_game_log_frame(game_scope)
+                )
+                if cached_game_log is not None:
+                    game_ids = (
+                        cached_game_log.get_column("game_id").unique().sort().to_list()
+                        if not cached_game_log.is_empty() and "game_id" in cached_game_log.columns
                         else []
                     )
+                    game_log_df = cached_game_log
                     if pp is not None:
-                        pp.log_discovery("dates", len(game_dates))
+                        pp.log_discovery("games", len(game_ids))
+                    if include_dates:
+                        game_dates = (
+                            game_log_df.get_column("game_date")
+                            .cast(pl.Utf8)
+                            .unique()
+                            .sort()
+                            .to_list()
+                            if "game_date" in game_log_df.columns
+                            else []
+                        )
+                        if pp is not None:
+                            pp.log_discovery("dates", len(game_dates))
+                    else:
+                        game_dates = []
                 else:
+                    game_index = len(discovery_tasks)
+                    discovery_tasks.append(
+                        discovery.discover_game_ids_result(
+                            seasons,
+                            on_progress=pp,
+                            season_types=season_types,
+                        )
+                    )
+                    game_ids = []
+                    game_log_df = pl.DataFrame()
                     game_dates = []
             else:
-                game_index = len(discovery_tasks)
-                discovery_tasks.append(
-                    discovery.discover_game_ids_result(
-                        seasons,
-                        on_progress=pp,
-                        season_types=season_types,
-                    )
-                )
                 game_ids = []
                 game_log_df = pl.DataFrame()
                 game_dates = []
-        else:
-            game_ids = []
-            game_log_df = pl.DataFrame()
-            game_dates = []
-
-        if include_players:
-            player_scope = DiscoveryArtifactScope(
-                kind="player_ids_all" if include_historical_players else "player_ids_active",
-                seasons=tuple(seasons),
-                season_types=(),
-                variant="historical" if include_historical_players else "active",
-            )
-            cached_player_ids = [] if refresh_current_scope else artifacts.load_ids(player_scope)
-            if not cached_player_ids and include_historical_players and len(seasons) > 1:
-                season_cached_player_ids = artifacts.load_ids_for_seasons(
-                    kind="player_ids_all",
+
+            if include_players:
+                player_scope = DiscoveryArtifactScope(
+                    kind="player_ids_all" if include_historical_players else "player_ids_active",
                     seasons=tuple(seasons),
-                    variant="historical",
+                    season_types=(),
+                    variant="historical" if include_historical_players else "active",
+                )
+                cached_player_ids = (
+                    [] if refresh_current_scope else artifacts.load_ids(player_scope)
                 )
-                if season_cached_player_ids is not None:
-                    cached_player_ids = season_cached_player_ids
-                    artifacts.upsert_ids(
-                        player_scope,
-                        cached_player_ids,
-                        provenance="per-season-discovery-cache",
+                if not cached_player_ids and include_historical_players and len(seasons) > 1:
+                    season_cached_player_ids = artifacts.load_ids_for_seasons(
+                        kind="player_ids_all",
+                        seasons=tuple(seasons),
+                        variant="historical",
                     )
-            if cached_player_ids:
-                player_ids = _apply_player_shard(cached_player_ids)
-                if pp is not None:
-                    pp.log_discovery("players", len(player_ids))
+                    if season_cached_player_ids is not None:
+                        cached_player_ids = season_cached_player_ids
+                        artifacts.upsert_ids(
+                            player_scope,
+                            cached_player_ids,
+                            provenance="per-season-discovery-cache",
+                        )
+                if cached_player_ids:
+                    player_ids = _apply_player_shard(cached_player_ids)
+                    if pp is not None:
+                        pp.log_discovery("players", len(player_ids))
+                else:
+                    player_index = len(discovery_tasks)
+                    single_season = (
+                        seasons[0] if include_historical_players and len(seasons) == 1 else None
+                    )
+                    discovery_tasks.append(
+                        discovery.discover_all_player_ids(season=single_season)
+                        if include_historical_players
+                        else discovery.discover_player_ids()
+                    )
+                    player_ids = []
             else:
-                player_index = len(discovery_tasks)
-                single_season = (
-                    seasons[0] if include_historical_players and len(seasons) == 1 else None
-                )
-                discovery_tasks.append(
-                    discovery.discover_all_player_ids(season=single_season)
-                    if include_historical_players
-                    else discovery.discover_player_ids()
-                )
                 player_ids = []
-        else:
-            player_ids = []
 
-        if include_teams:
-            team_scope = DiscoveryArtifactScope(kind="team_ids", seasons=tuple(seasons))
-            cached_team_ids = artifacts.load_ids(team_scope)
-            if cached_team_ids:
-                team_ids = cached_team_ids
-                if pp is not None:
-                    pp.log_discovery("teams", len(team_ids))
+            if include_teams:
+                team_scope = DiscoveryArtifactScope(kind="team_ids", seasons=tuple(seasons))
+                cached_team_ids = artifacts.load_ids(team_scope)
+                if cached_team_ids:
+                    team_ids = cached_team_ids
+                    if pp is not None:
+                        pp.log_discovery("teams", len(team_ids))
+                else:
+                    team_index = len(discovery_tasks)
+                    discovery_tasks.append(discovery.discover_team_ids())
+                    team_ids = []
             else:
-                team_index = len(discovery_tasks)
-                discovery_tasks.append(discovery.discover_team_ids())
                 team_ids = []
-        else:
-            team_ids = []
 
-        results = (
-            await asyncio.gather(*discovery_tasks, return_exceptions=True)
-            if discovery_tasks
-            else []
-        )
+            results = (
+                await asyncio.gather(*discovery_tasks, return_exceptions=True)
+                if discovery_tasks
+                else []
+            )
 
-        _game_result = results[game_index] if game_index is not None else None
-        _player_result = results[player_index] if player_index is not None else None
-        _team_result = results[team_index] if team_index is not None else None
+            _game_result = results[game_index] if game_index is not None else None
+            _player_result = results[player_index] if player_index is not None else None
+            _team_result = results[team_index] if team_index is not None else None
 
-        if isinstance(_game_result, Exception):
-            bound_log.warning("discover_game_ids failed: {}", type(_game_result).__name__)
-            if (require_complete or require_complete_games) and include_games:
-                raise InitDiscoveryCoverageError(
-                    [f"discover_game_ids failed: {type(_game_result).__name__}"]
-                )
-            game_ids = []
-            game_log_df = pl.DataFrame()
-        elif _game_result is None:
-            if not include_games:
+            if isinstance(_game_result, Exception):
+                bound_log.warning("discover_game_ids failed: {}", type(_game_result).__name__)
+                if (require_complete or require_complete_games) and include_games:
+                    raise InitDiscoveryCoverageError(
+                        [f"discover_game_ids failed: {type(_game_result).__name__}"]
+                    )
                 game_ids = []
                 game_log_df = pl.DataFrame()
-        else:
-            game_discovery_result = _game_result
-            assert isinstance(game_discovery_result, GameDiscoveryResult)
-            if require_complete or require_complete_games:
-                self._require_complete_game_discovery(
-                    game_discovery_result,
-                    requested_combos=requested_game_combos,
+            elif _game_result is None:
+                if not include_games:
+                    game_ids = []
+                    game_log_df = pl.DataFrame()
+            else:
+                game_discovery_result = _game_result
+                assert isinstance(game_discovery_result, GameDiscoveryResult)
+                if require_complete or require_complete_games:
+                    self._require_complete_game_discovery(
+                        game_discovery_result,
+                        requested_combos=requested_game_combos,
+                    )
+                game_ids = game_discovery_result.game_ids
+                game_log_df = game_discovery_result.raw
+                persistable_combos = (
+                    requested_game_combos
+                    & game_discovery_result.requested_combos
+                    & game_discovery_result.covered_combos
                 )
-            game_ids = game_discovery_result.game_ids
-            game_log_df = game_discovery_result.raw
-            persistable_combos = (
-                requested_game_combos
-                & game_discovery_result.requested_combos
-                & game_discovery_result.covered_combos
-            )
-            persistable_frames = {
-                combo: frame
-                for combo, frame in game_discovery_result.frames_by_combo.items()
-                if combo in persistable_combos
-            }
-            runtime_frames = [persistable_frames[combo] for combo in sorted(persistable_frames)]
-            if runtime_frames:
-                game_log_df = (
-                    runtime_frames[0].clone()
-                    if len(runtime_frames) == 1
-                    else pl.concat(runtime_frames, how="diagonal_relaxed")
+                persistable_frames = {
+                    combo: frame
+                    for combo, frame in game_discovery_result.frames_by_combo.items()
+                    if combo in persistable_combos
+                }
+                runtime_frames = [persistable_frames[combo] for combo in sorted(persistable_frames)]
+                if runtime_frames:
+                    game_log_df = (
+                        runtime_frames[0].clone()
+                        if len(runtime_frames) == 1
+                        else pl.concat(runtime_frames, how="diagonal_relaxed")
+                    )
+                    game_ids = sorted(
+                        {
+                            str(value)
+                            for value in game_log_df.get_column("game_id").drop_nulls().to_list()
+                        }
+                    )
+                else:
+                    game_ids = []
+                    game_log_df = pl.DataFrame()
+                aggregate_complete = (
+                    bool(requested_game_combos)
+                    and game_discovery_result.requested_combos == requested_game_combos
+                    and requested_game_combos <= game_discovery_result.covered_combos
+                    and requested_game_combos == frozenset(persistable_frames)
                 )
-                game_ids = sorted(
-                    {
-                        str(value)
-                        for value in game_log_df.get_column("game_id").drop_nulls().to_list()
-                    }
+                artifacts.upsert_game_log_combo_frames(
+                    persistable_frames,
+                    provenance="discovery" if aggregate_complete else "partial-discovery",
                 )
+                if aggregate_complete:
+                    aggregate_frames = [
+                        persistable_frames[combo] for combo in sorted(requested_game_combos)
+                    ]
+                    aggregate_game_log = (
+                        aggregate_frames[0].clone()
+                        if len(aggregate_frames) == 1
+                        else pl.concat(aggregate_frames, how="diagonal_relaxed")
+                    )
+                    artifacts.upsert_frame(
+                        DiscoveryArtifactScope(
+                            kind="league_game_log",
+                            seasons=tuple(seasons),
+                            season_types=resolved_season_types,
+                        ),
+                        aggregate_game_log,
+                        provenance="discovery",
+                    )
+                else:
+                    logger.warning(
+                        (
+                            "persisting {} covered game discovery combos individually "
+                            "and skipping aggregate cache for requested scope {}"
+                        ),
+                        len(persistable_frames),
+                        sorted(game_discovery_result.requested_combos),
+                    )
+                if pp is not None:
+                    pp.log_discovery("games", len(game_ids))
+
+            if isinstance(_player_result, Exception):
+                bound_log.warning("discover_player_ids failed: {}", type(_player_result).__name__)
+                if require_complete and include_players:
+                    raise InitDiscoveryCoverageError(
+                        [f"discover_player_ids failed: {type(_player_result).__name__}"]
+                    )
+                player_ids = []
+            elif _player_result is None:
+                if not include_players:
+                    player_ids = []
             else:
-                game_ids = []
-                game_log_df = pl.DataFrame()
-            aggregate_complete = (
-                bool(requested_game_combos)
-                and game_discovery_result.requested_combos == requested_game_combos
-                and requested_game_combos <= game_discovery_result.covered_combos
-                and requested_game_combos == frozenset(persistable_frames)
-            )
-            artifacts.upsert_game_log_combo_frames(
-                persistable_frames,
-                provenance="discovery" if aggregate_complete else "partial-discovery",
-            )
-            if aggregate_complete:
-                aggregate_frames = [
-                    persistable_frames[combo] for combo in sorted(requested_game_combos)
-                ]
-                aggregate_game_log = (
-                    aggregate_frames[0].clone()
-                    if len(aggregate_frames) == 1
-                    else pl.concat(aggregate_frames, how="diagonal_relaxed")
-                )
-                artifacts.upsert_frame(
+                player_ids = cast("list[int]", _player_result)
+                artifacts.upsert_ids(
                     DiscoveryArtifactScope(
-                        kind="league_game_log",
+                        kind="player_ids_all"
+                        if include_historical_players
+                        else "player_ids_active",
                         seasons=tuple(seasons),
-                        season_types=resolved_season_types,
+                        season_types=(),
+                        variant="historical" if include_historical_players else "active",
                     ),
-                    aggregate_game_log,
+                    player_ids,
                     provenance="discovery",
                 )
-            else:
-                logger.warning(
-                    (
-                        "persisting {} covered game discovery combos individually "
-                        "and skipping aggregate cache for requested scope {}"
-                    ),
-                    len(persistable_frames),
-                    sorted(game_discovery_result.requested_combos),
-                )
-            if pp is not None:
-                pp.log_discovery("games", len(game_ids))
-
-        if isinstance(_player_result, Exception):
-            bound_log.warning("discover_player_ids failed: {}", type(_player_result).__name__)
-            if require_complete and include_players:
-                raise InitDiscoveryCoverageError(
-                    [f"discover_player_ids failed: {type(_player_result).__name__}"]
-                )
-            player_ids = []
-        elif _player_result is None:
-            if not include_players:
-                player_ids = []
-        else:
-            player_ids = cast("list[int]", _player_result)
-            artifacts.upsert_ids(
-                DiscoveryArtifactScope(
-                    kind="player_ids_all" if include_historical_players else "player_ids_active",
-                    seasons=tuple(seasons),
-                    season_types=(),
-                    variant="historical" if include_historical_players else "active",
-                ),
-                player_ids,
-                provenance="discovery",
-            )
-            player_ids = _apply_player_shard(player_ids)
-            if require_complete and include_players and not player_ids:
-                raise InitDiscoveryCoverageError(["player discovery returned no ids"])
-            if pp is not None:
-                pp.log_discovery("players", len(player_ids))
+                player_ids = _apply_player_shard(player_ids)
+                if require_complete and include_players and not player_ids:
+                    raise InitDiscoveryCoverageError(["player discovery returned no ids"])
+                if pp is not None:
+                    pp.log_discovery("players", len(player_ids))
 
-        if isinstance(_team_result, Exception):
-            bound_log.warning("discover_team_ids failed: {}", type(_team_result).__name__)
-            if require_complete and include_teams:
-                raise InitDiscoveryCoverageError(
-                    [f"discover_team_ids failed: {type(_team_result).__name__}"]
-                )
-            team_ids = []
-        elif _team_result is None:
-            if not include_teams:
+            if isinstance(_team_result, Exception):
+                bound_log.warning("discover_team_ids failed: {}", type(_team_result).__name__)
+                if require_complete and include_teams:
+                    raise InitDiscoveryCoverageError(
+                        [f"discover_team_ids failed: {type(_team_result).__name__}"]
+                    )
                 team_ids = []
-        else:
-            team_ids = cast("list[int]", _team_result)
-            artifacts.upsert_ids(
-                DiscoveryArtifactScope(kind="team_ids", seasons=tuple(seasons)),
-                team_ids,
-                provenance="discovery",
-            )
-            if require_complete and include_teams and not team_ids:
-                raise InitDiscoveryCoverageError(["team discovery returned no ids"])
-            if pp is not None:
-                pp.log_discovery("teams", len(team_ids))
+            elif _team_result is None:
+                if not include_teams:
+                    team_ids = []
+            else:
+                team_ids = cast("list[int]", _team_result)
+                artifacts.upsert_ids(
+                    DiscoveryArtifactScope(kind="team_ids", seasons=tuple(seasons)),
+                    team_ids,
+                    provenance="discovery",
+                )
+                if require_complete and include_teams and not team_ids:
+                    raise InitDiscoveryCoverageError(["team discovery returned no ids"])
+                if pp is not None:
+                    pp.log_discovery("teams", len(team_ids))
 
-        if include_dates and not game_log_df.is_empty() and not game_dates:
-            game_dates = await discovery.discover_game_dates(game_log_df)
-            if pp is not None:
-                pp.log_discovery("dates", len(game_dates))
-        elif not include_dates:
-            game_dates = []
+            if include_dates and not game_log_df.is_empty() and not game_dates:
+                game_dates = await discovery.discover_game_dates(game_log_df)
+                if pp is not None:
+                    pp.log_discovery("dates", len(game_dates))
+            elif not include_dates:
+                game_dates = []
 
-        return game_ids, player_ids, team_ids, game_dates, game_log_df
+            return game_ids, player_ids, team_ids, game_dates, game_log_df
 
     async def _extract_all_patterns(
         self,
@@ -1361,38 +1517,17 @@ class Orchestrator:
                     persist_metadata["source_results"] = source_results
                 chunk_persist_results(frames, **persist_metadata)
 
-            if skip_items and chunk_persist_results is not None:
-                result = await runner.run_pattern_result(
-                    pattern,
-                    params,
-                    entries,
-                    on_progress=pp,
-                    skip_items=skip_items,
-                    persist_chunk_results=_persist_with_lane_metadata,
-                )
-            elif skip_items:
-                result = await runner.run_pattern_result(
-                    pattern,
-                    params,
-                    entries,
-                    on_progress=pp,
-                    skip_items=skip_items,
-                )
-            elif chunk_persist_results is not None:
-                result = await runner.run_pattern_result(
-                    pattern,
-                    params,
-                    entries,
-                    on_progress=pp,
-                    persist_chunk_results=_persist_with_lane_metadata,
-                )
-            else:
-                result = await runner.run_pattern_result(
-                    pattern,
-                    params,
-                    entries,
-                    on_progress=pp,
-                )
+            pattern_kwargs: dict[str, Any] = {"on_progress": pp}
+            if skip_items:
+                pattern_kwargs["skip_items"] = skip_items
+            if chunk_persist_results is not None:
+                pattern_kwargs["persist_chunk_results"] = _persist_with_lane_metadata
+                if not retain_in_memory:
+                    # Every chunk is already durable in the staging chunk
+                    # tables, so there is nothing to spool for this run.
+                    pattern_kwargs["retain_frames"] = False
+            with self._tracer.span(label, phase="extraction", pattern=pattern, tasks=n_tasks):
+                result = await runner.run_pattern_result(pattern, params, entries, **pattern_kwargs)
             result_raw = result.frames
 
             completed_at = datetime.now(UTC)
@@ -1417,7 +1552,7 @@ class Orchestrator:
                         deferred_failure_count=result.deferred_failure_count,
                         row_count=row_count,
                         wall_time_seconds=(completed_at - started_at).total_seconds(),
-                        staging_keys=sorted(result_raw),
+                        staging_keys=sorted({*result_raw, *result.staging_keys}),
                         endpoint_families=endpoint_families,
                     )
                 else:
@@ -1446,6 +1581,7 @@ class Orchestrator:
                     row_count=row_count,
                     success_count=result.success_count + result.journal_skip_count,
                     failure_count=result.failure_count + result.deferred_failure_count,
+                    queue_wait_seconds=result.queue_wait_seconds,
                 )
             return result
 
@@ -1462,10 +1598,11 @@ class Orchestrator:
             tier_labels = ", ".join(item.label for _, item in tier_items)
             logger.info("priority tier {}: {}", tier_key, tier_labels)
 
-            tier_results = await asyncio.gather(
-                *[_run_one(idx, item) for idx, item in tier_items],
-                return_exceptions=True,
-            )
+            with self._tracer.span(f"priority tier {tier_key}", phase="extraction"):
+                tier_results = await asyncio.gather(
+                    *[_run_one(idx, item) for idx, item in tier_items],
+                    return_exceptions=True,
+                )
 
             for j, result in enumerate(tier_results):
                 if isinstance(result, BaseException):
@@ -1538,6 +1675,7 @@ class Orchestrator:
 
     # ── run modes ──────────────────────────────────────────────
 
+    @_traced_run("init")
     async def run_init(
         self,
         start_season: int = 1946,
@@ -1576,7 +1714,9 @@ class Orchestrator:
 
             # -- 1. Entity discovery (parallel) --------------------
             seasons = season_range(start_season, end_season)
-            discovery = self._build_discovery(thread_pool=runner._thread_pool)
+            discovery = self._build_discovery(
+                thread_pool=runner._thread_pool, rate_governor=runner.rate_governor
+            )
 
             bound_log.info(
                 "init: discovering entities for {} seasons × {} season_types",
@@ -1608,11 +1748,10 @@ class Orchestrator:
                     run_mode="init",
                 )
             )
-            (
-                (game_ids, player_ids, team_ids, game_dates, game_log_df),
-                current_team_ids,
-                player_team_result,
-            ) = await asyncio.gather(entity_task, current_team_task, player_team_task)
+            await _gather_or_cancel(entity_task, current_team_task, player_team_task)
+            game_ids, player_ids, team_ids, game_dates, game_log_df = entity_task.result()
+            current_team_ids = current_team_task.result()
+            player_team_result = player_team_task.result()
             if not current_team_ids:
                 raise InitDiscoveryCoverageError(["current-team discovery returned no ids"])
             self._require_complete_player_team_discovery(player_team_result)
@@ -1731,6 +1870,7 @@ class Orchestrator:
         journal.log_summary()
         return result
 
+    @_traced_run("daily")
     async def run_daily(self) -> PipelineResult:
         """Incremental update focused on recent games.
 
@@ -1748,17 +1888,20 @@ class Orchestrator:
 
         db, journal = self._init_db()
         async with self._build_runner(journal) as runner:
-            discovery = self._build_discovery(thread_pool=runner._thread_pool)
+            discovery = self._build_discovery(
+                thread_pool=runner._thread_pool, rate_governor=runner.rate_governor
+            )
 
             season = current_season()
             bound_log.info("daily: season={}", season)
 
             # -- 1. Discover recent game_ids across the full declared contract -----
             daily_season_types = list(DEFAULT_SEASON_TYPES)
-            game_result = await discovery.discover_game_ids_result(
-                [season],
-                season_types=daily_season_types,
-            )
+            with self._tracer.span("discover games", phase="discovery"):
+                game_result = await discovery.discover_game_ids_result(
+                    [season],
+                    season_types=daily_season_types,
+                )
             self._require_complete_game_discovery(
                 game_result,
                 requested_combos=frozenset(
@@ -1790,20 +1933,31 @@ class Orchestrator:
                 len(game_dates),
             )
 
-            # -- 2. Discover active players + teams for lightweight refresh
-            player_ids = await discovery.discover_player_ids()
-            team_ids = await discovery.discover_team_ids()
-            current_team_ids = await self._discover_current_team_ids(
-                discovery,
-                seasons=[season],
-                refresh=True,
-            )
-            player_team_result = await self._discover_player_team_season_result(
-                discovery,
-                seasons=[season],
-                season_types=daily_season_types,
-                run_mode="daily",
-            )
+            # -- 2. Discover active players + teams for lightweight refresh; the
+            # lookups are independent of each other, so they run together.
+            with self._tracer.span("discover active entities", phase="discovery"):
+                player_task = asyncio.create_task(discovery.discover_player_ids())
+                team_task = asyncio.create_task(discovery.discover_team_ids())
+                current_team_task = asyncio.create_task(
+                    self._discover_current_team_ids(
+                        discovery,
+                        seasons=[season],
+                        refresh=True,
+                    )
+                )
+                player_team_task = asyncio.create_task(
+                    self._discover_player_team_season_result(
+                        discovery,
+                        seasons=[season],
+                        season_types=daily_season_types,
+                        run_mode="daily",
+                    )
+                )
+                await _gather_or_cancel(player_task, team_task, current_team_task, player_team_task)
+                player_ids = player_task.result()
+                team_ids = team_task.result()
+                current_team_ids = current_team_task.result()
+                player_team_result = player_team_task.result()
             self._require_complete_player_team_discovery(player_team_result)
             player_team_season_params = self._persist_player_team_season_workloads(
                 player_team_result.params,
@@ -1902,6 +2056,7 @@ class Orchestrator:
         )
         return result
 
+    @_traced_run("monthly")
     async def run_monthly(self) -> PipelineResult:
         """Monthly refresh of the last 3 seasons.
 
@@ -1914,7 +2069,9 @@ class Orchestrator:
 
         db, journal = self._init_db()
         async with self._build_runner(journal) as runner:
-            discovery = self._build_discovery(thread_pool=runner._thread_pool)
+            discovery = self._build_discovery(
+                thread_pool=runner._thread_pool, rate_governor=runner.rate_governor
+            )
 
             seasons = recent_seasons(3)
             bound_log.info("monthly: seasons={}", seasons)
@@ -1929,17 +2086,21 @@ class Orchestrator:
                 require_complete_games=True,
                 refresh_mutable_entities=True,
             )
-            current_team_ids = await self._discover_current_team_ids(
-                discovery,
-                seasons=seasons,
-                refresh=True,
+            # Past the game-coverage gate; the remaining lookups are independent.
+            current_team_task = asyncio.create_task(
+                self._discover_current_team_ids(discovery, seasons=seasons, refresh=True)
             )
-            player_team_result = await self._discover_player_team_season_result(
-                discovery,
-                seasons=seasons,
-                season_types=monthly_season_types,
-                run_mode="monthly",
+            player_team_task = asyncio.create_task(
+                self._discover_player_team_season_result(
+                    discovery,
+                    seasons=seasons,
+                    season_types=monthly_season_types,
+                    run_mode="monthly",
+                )
             )
+            await _gather_or_cancel(current_team_task, player_team_task)
+            current_team_ids = current_team_task.result()
+            player_team_result = player_team_task.result()
             self._require_complete_player_team_discovery(player_team_result)
             player_team_season_params = self._persist_player_team_season_workloads(
                 player_team_result.params,
@@ -2030,6 +2191,7 @@ class Orchestrator:
         )
         return result
 
+    @_traced_run("retry")
     async def run_retry(self) -> PipelineResult:
         """Retries previously failed extractions.
 
@@ -2046,7 +2208,9 @@ class Orchestrator:
 
         db, journal = self._init_db()
         async with self._build_runner(journal) as runner:
-            discovery = self._build_discovery(thread_pool=runner._thread_pool)
+            discovery = self._build_discovery(
+                thread_pool=runner._thread_pool, rate_governor=runner.rate_governor
+            )
 
             # -- 1. Retry failed extractions ------------------------
             failed = journal.get_failed(include_exhausted=True, include_abandoned=True)
@@ -2083,15 +2247,10 @@ class Orchestrator:
                     continue
                 failed_by_entry.setdefault(endpoint, []).append(params)
 
-            # Build a lookup from endpoint_name -> StagingEntry(s)
-            entries_by_ep: dict[str, list] = {}
-            for entry in STAGING_MAP:
-                entries_by_ep.setdefault(entry.endpoint_name, []).append(entry)
-
             raw: dict[str, pl.DataFrame] = {}
 
             for endpoint, param_list in failed_by_entry.items():
-                ep_entries = entries_by_ep.get(endpoint, [])
+                ep_entries = get_by_endpoint(endpoint)
                 if not ep_entries:
                     bound_log.warning(
                         "no staging entry for failed endpoint: {}",
@@ -2168,13 +2327,20 @@ class Orchestrator:
             game_ids, player_ids, team_ids, game_dates, game_log_df = await self._discover_entities(
                 discovery, seasons, bound_log, season_types=_full_st
             )
-            current_team_ids = await self._discover_current_team_ids(discovery, seasons=seasons)
-            player_team_result = await self._discover_player_team_season_result(
-                discovery,
-                seasons=seasons,
-                season_types=_full_st,
-                run_mode="retry",
+            current_team_task = asyncio.create_task(
+                self._discover_current_team_ids(discovery, seasons=seasons)
             )
+            player_team_task = asyncio.create_task(
+                self._discover_player_team_season_result(
+                    discovery,
+                    seasons=seasons,
+                    season_types=_full_st,
+                    run_mode="retry",
+                )
+            )
+            await _gather_or_cancel(current_team_task, player_team_task)
+            current_team_ids = current_team_task.result()
+            player_team_result = player_team_task.result()
             self._require_complete_player_team_discovery(player_team_result)
             player_team_season_params = self._persist_player_team_season_workloads(
                 player_team_result.params,
@@ -2244,6 +2410,7 @@ class Orchestrator:
         journal.log_summary()
         return result
 
+    @_traced_run("backfill")
     async def run_backfill(
         self,
         *,
@@ -2317,7 +2484,9 @@ class Orchestrator:
 
         # ── extraction path ──
         async with self._build_runner(journal) as runner:
-            discovery = self._build_discovery(thread_pool=runner._thread_pool)
+            discovery = self._build_discovery(
+                thread_pool=runner._thread_pool, rate_governor=runner.rate_governor
+            )
             effective_seasons = seasons if seasons is not None else season_range()
 
             bound_log.info(
@@ -2334,8 +2503,7 @@ class Orchestrator:
                 endpoint_set = set(endpoints)
                 requested_patterns = {
                     entry.param_pattern
-                    for entry in STAGING_MAP
-                    if entry.endpoint_name in endpoint_set
+                    for entry in staging_registry().select(endpoints=endpoint_set)
                 }
                 if "league_game_log" in endpoint_set:
                     requested_patterns.add("game")
@@ -2381,18 +2549,31 @@ class Orchestrator:
                 include_dates=needs_dates,
                 require_complete=needs_games or needs_players or needs_teams,
             )
-            current_team_ids = (
-                await self._discover_current_team_ids(discovery, seasons=effective_seasons)
+            current_team_task = (
+                asyncio.create_task(
+                    self._discover_current_team_ids(discovery, seasons=effective_seasons)
+                )
                 if needs_teams
-                else []
+                else None
             )
-            if needs_player_team_season:
-                player_team_result = await self._discover_player_team_season_result(
-                    discovery,
-                    seasons=effective_seasons,
-                    season_types=season_types,
-                    run_mode="backfill",
+            player_team_task = (
+                asyncio.create_task(
+                    self._discover_player_team_season_result(
+                        discovery,
+                        seasons=effective_seasons,
+                        season_types=season_types,
+                        run_mode="backfill",
+                    )
                 )
+                if needs_player_team_season
+                else None
+            )
+            await _gather_or_cancel(
+                *(task for task in (current_team_task, player_team_task) if task is not None)
+            )
+            current_team_ids = current_team_task.result() if current_team_task is not None else []
+            if player_team_task is not None:
+                player_team_result = player_team_task.result()
                 self._require_complete_player_team_discovery(player_team_result)
                 player_team_season_params = self._persist_player_team_season_workloads(
                     player_team_result.params,
@@ -2445,6 +2626,12 @@ class Orchestrator:
                         filtered.append(item)
                 plan = filtered
 
+            # Schedule only the entity keys each endpoint has not finished yet
+            if not force:
+                from nbadb.orchestrate.backfill import restrict_plan_to_missing
+
+                plan = restrict_plan_to_missing(plan, journal)
+
             # -- 3. Extract ──────────────────────────────────────────────
             raw: dict[str, pl.DataFrame] = {}
             if not game_log_df.is_empty():
@@ -2521,6 +2708,7 @@ class Orchestrator:
         journal.log_summary()
         return result
 
+    @_phase_span("read staging tables", phase="materialize")
     def _load_staging_from_duckdb(
         self,
         db: DBManager,
@@ -2537,13 +2725,9 @@ class Orchestrator:
         from nbadb.orchestrate.staging_map import get_all_staging_keys
 
         if endpoints is not None or patterns is not None:
-            ep_set = set(endpoints) if endpoints else None
-            pat_set = set(patterns) if patterns else None
             keys = [
                 e.staging_key
-                for e in STAGING_MAP
-                if (ep_set is None or e.endpoint_name in ep_set)
-                and (pat_set is None or e.param_pattern in pat_set)
+                for e in staging_registry().select(endpoints=endpoints, patterns=patterns)
             ]
         else:
             keys = get_all_staging_keys()
@@ -1,5211 +1,75 @@
-"""CommonAllPlayers year-window snapshot for discovery seed fallback."""
+"""CommonAllPlayers year-window snapshot for discovery seed fallback.
+
+The windows live in ``player_directory_snapshot.parquet`` next to this
+module as ``(person_id, from_year, to_year)`` rows and are only read the
+first time a lookup needs them, so importing the module stays free.
+
+Regenerate the file with ``.github/scripts/refresh_player_directory_snapshot.py``,
+which fetches the unscoped directory and writes it via
+:func:`write_player_year_windows`; bump the ``SNAPSHOT_*`` constants below to
+match the summary it prints.
+"""
 
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
 SNAPSHOT_SOURCE = "nba_api CommonAllPlayers"
 SNAPSHOT_NBA_API_VERSION = "1.11.4"
 SNAPSHOT_COMPLETE_THROUGH_SEASON = "2025-26"
 SNAPSHOT_COMPLETE_THROUGH_YEAR = 2025
 
-PLAYER_YEAR_WINDOWS: tuple[tuple[int, int, int], ...] = (
-    (2, 1983, 1996),
-    (3, 1988, 2002),
-    (7, 1981, 1998),
-    (9, 1983, 1996),
-    (12, 1993, 1998),
-    (15, 1994, 2007),
-    (17, 1983, 1997),
-    (21, 1991, 2001),
-    (22, 1988, 1999),
-    (23, 1986, 1999),
-    (24, 1992, 1994),
-    (26, 1991, 2000),
-    (28, 1989, 2000),
-    (29, 1994, 2000),
-    (30, 1992, 1995),
-    (31, 1992, 1999),
-    (32, 1994, 1997),
-    (35, 1993, 1998),
-    (36, 1989, 1996),
-    (37, 1993, 1997),
-    (38, 1987, 1997),
-    (41, 1990, 2002),
-    (42, 1994, 2002),
-    (43, 1993, 2003),
-    (45, 1989, 2002),
-    (46, 1993, 1995),
-    (47, 1985, 1996),
-    (49, 1993, 1999),
-    (51, 1990, 2000),
-    (52, 1988, 1998),
-    (53, 1990, 2000),
-    (54, 1994, 2001),
-    (55, 1991, 1999),
-    (56, 1990, 2006),
-    (57, 1992, 2006),
-    (61, 1991, 1998),
-    (63, 1994, 2000),
-    (64, 1984, 2000),
-    (65, 1994, 1998),
-    (66, 1995, 1995),
-    (67, 1989, 2000),
-    (70, 1988, 2002),
-    (71, 1989, 1998),
-    (72, 1991, 2004),
-    (73, 1986, 1998),
-    (74, 1994, 1994),
-    (76, 1990, 2000),
-    (77, 1992, 2003),
-    (78, 1982, 1996),
-    (80, 1987, 1996),
-    (81, 1988, 1997),
-    (82, 1985, 1999),
-    (84, 1992, 2004),
-    (85, 1992, 2002),
-    (87, 1991, 2008),
-    (88, 1990, 1996),
-    (89, 1993, 2005),
-    (93, 1992, 2003),
-    (95, 1988, 2002),
-    (96, 1985, 2000),
-    (97, 1988, 1995),
-    (98, 1989, 2002),
-    (100, 1989, 1999),
-    (101, 1986, 1995),
-    (103, 1992, 2000),
-    (104, 1985, 1999),
-    (105, 1988, 2001),
-    (107, 1983, 1999),
-    (109, 1992, 2007),
-    (111, 1992, 2002),
-    (112, 1994, 1997),
-    (114, 1992, 1995),
-    (116, 1988, 1996),
-    (117, 1983, 1995),
-    (120, 1991, 2004),
-    (121, 1985, 2001),
-    (122, 1983, 1996),
-    (123, 1991, 2003),
-    (124, 1989, 2004),
-    (128, 1991, 2000),
-    (129, 1993, 1996),
-    (132, 1994, 1994),
-    (133, 1993, 2006),
-    (134, 1987, 1999),
-    (136, 1993, 2007),
-    (137, 1988, 2000),
-    (138, 1992, 1999),
-    (140, 1989, 1997),
-    (141, 1994, 1994),
-    (143, 1993, 1998),
-    (145, 1992, 2003),
-    (146, 1990, 2001),
-    (147, 1994, 2006),
-    (149, 1985, 1995),
-    (154, 1989, 1997),
-    (156, 1984, 1999),
-    (157, 1983, 1998),
-    (160, 1994, 1997),
-    (164, 1994, 2002),
-    (165, 1984, 2002),
-    (166, 1986, 2000),
-    (168, 1993, 2002),
-    (170, 1985, 1999),
-    (173, 1990, 1998),
-    (174, 1985, 1994),
-    (175, 1981, 1997),
-    (176, 1993, 2002),
-    (177, 1987, 2000),
-    (178, 1987, 2003),
-    (179, 1992, 2002),
-    (180, 1992, 2002),
-    (181, 1987, 1996),
-    (182, 1991, 2002),
-    (183, 1991, 1998),
-    (184, 1991, 1999),
-    (185, 1993, 2007),
-    (187, 1982, 1999),
-    (189, 1994, 1994),
-    (190, 1990, 2002),
-    (192, 1990, 1999),
-    (193, 1989, 2002),
-    (194, 1988, 1997),
-    (195, 1992, 1998),
-    (197, 1993, 2000),
-    (198, 1990, 2002),
-    (199, 1987, 1996),
-    (201, 1987, 2002),
-    (202, 1988, 2000),
-    (203, 1986, 1997),
-    (204, 1986, 1999),
-    (208, 1993, 2007),
-    (209, 1986, 2001),
-    (210, 1991, 2002),
-    (211, 1994, 1996),
-    (212, 1994, 1997),
-    (213, 1993, 2005),
-    (216, 1988, 2002),
-    (219, 1988, 2001),
-    (221, 1992, 2004),
-    (223, 1994, 2000),
-    (224, 1994, 2007),
-    (226, 1994, 1999),
-    (228, 1992, 2000),
-    (229, 1977, 1995),
-    (234, 1994, 1999),
-    (236, 1988, 2000),
-    (238, 1990, 2003),
-    (239, 1994, 2007),
-    (240, 1994, 1997),
-    (241, 1994, 1996),
-    (243, 1994, 2006),
-    (244, 1990, 2001),
-    (246, 1987, 1997),
-    (247, 1985, 1998),
-    (248, 1993, 2004),
-    (251, 1989, 2000),
-    (252, 1985, 2003),
-    (255, 1994, 2012),
-    (258, 1994, 2005),
-    (262, 1984, 1999),
-    (265, 1988, 1998),
-    (270, 1987, 2003),
-    (271, 1986, 2001),
-    (273, 1988, 1998),
-    (275, 1993, 2004),
-    (278, 1991, 2005),
-    (279, 1983, 1997),
-    (280, 1990, 2001),
-    (281, 1990, 2004),
-    (283, 1993, 2009),
-    (285, 1989, 1995),
-    (287, 1988, 1996),
-    (288, 1987, 1999),
-    (289, 1988, 1997),
-    (291, 1985, 1996),
-    (292, 1994, 2004),
-    (293, 1988, 1996),
-    (296, 1991, 2003),
-    (297, 1992, 2007),
-    (299, 1994, 2004),
-    (302, 1989, 2001),
-    (304, 1984, 2002),
-    (305, 1976, 1996),
-    (306, 1984, 1994),
-    (308, 1994, 1996),
-    (310, 1993, 1997),
-    (313, 1984, 1995),
-    (316, 1995, 1996),
-    (317, 1988, 2001),
-    (320, 1994, 1998),
-    (321, 1993, 1993),
-    (323, 1990, 2002),
-    (324, 1992, 2004),
-    (328, 1980, 1998),
-    (330, 1988, 2002),
-    (333, 1987, 1996),
-    (335, 1988, 1996),
-    (339, 1992, 2004),
-    (340, 1990, 1995),
-    (341, 1987, 1998),
-    (342, 1990, 1995),
-    (344, 1989, 2003),
-    (345, 1985, 2001),
-    (346, 1993, 1995),
-    (348, 1993, 2003),
-    (349, 1987, 2003),
-    (351, 1989, 1996),
-    (353, 1994, 2007),
-    (355, 1987, 1997),
-    (356, 1988, 1998),
-    (357, 1991, 1995),
-    (358, 1993, 2007),
-    (359, 1989, 2001),
-    (361, 1989, 2006),
-    (363, 1992, 2004),
-    (364, 1988, 1999),
-    (365, 1987, 2001),
-    (368, 1990, 1998),
-    (369, 1994, 2004),
-    (371, 1990, 2000),
-    (375, 1993, 2001),
-    (376, 1994, 2002),
-    (378, 1983, 1996),
-    (380, 1990, 2000),
-    (381, 1993, 2000),
-    (383, 1990, 2004),
-    (384, 1993, 2005),
-    (386, 1991, 2001),
-    (389, 1993, 2005),
-    (390, 1995, 1996),
-    (393, 1988, 2004),
-    (397, 1987, 2004),
-    (399, 1992, 2003),
-    (400, 1991, 2000),
-    (402, 1985, 1995),
-    (404, 1986, 1996),
-    (406, 1992, 2010),
-    (412, 1994, 1997),
-    (416, 1990, 1998),
-    (417, 1989, 2001),
-    (418, 1988, 1997),
-    (420, 1990, 1998),
-    (422, 1988, 2003),
-    (423, 1991, 2001),
-    (426, 1989, 2000),
-    (428, 1989, 2000),
-    (431, 1989, 2002),
-    (432, 1991, 1999),
-    (433, 1981, 1997),
-    (434, 1994, 1997),
-    (435, 1994, 2001),
-    (436, 1994, 2012),
-    (438, 1992, 1996),
-    (440, 1994, 2000),
-    (441, 1994, 2005),
-    (442, 1989, 2000),
-    (445, 1994, 2004),
-    (446, 1993, 2004),
-    (448, 1993, 2007),
-    (452, 1993, 2005),
-    (456, 1986, 1999),
-    (457, 1988, 1999),
-    (458, 1994, 2005),
-    (460, 1994, 1995),
-    (461, 1993, 2003),
-    (462, 1989, 2000),
-    (467, 1994, 2012),
-    (468, 1992, 2005),
-    (469, 1993, 2003),
-    (470, 1983, 1995),
-    (474, 1995, 1995),
-    (475, 1991, 1995),
-    (511, 1995, 1996),
-    (671, 1995, 1996),
-    (672, 1990, 2002),
-    (673, 1995, 2006),
-    (674, 1993, 1999),
-    (675, 1995, 1995),
-    (676, 1995, 2002),
-    (677, 1995, 2006),
-    (678, 1995, 1997),
-    (679, 1995, 2002),
-    (680, 1995, 2002),
-    (681, 1995, 2002),
-    (682, 1995, 2006),
-    (683, 1995, 1995),
-    (684, 1995, 1998),
-    (685, 1995, 2003),
-    (686, 1995, 2010),
-    (687, 1995, 1995),
-    (688, 1993, 2004),
-    (689, 1995, 2010),
-    (690, 1995, 2002),
-    (691, 1995, 1996),
-    (692, 1995, 2004),
-    (693, 1995, 2010),
-    (694, 1992, 2001),
-    (695, 1994, 2001),
-    (696, 1995, 2004),
-    (697, 1995, 2004),
-    (698, 1981, 1998),
-    (699, 1995, 2008),
-    (700, 1993, 1996),
-    (701, 1995, 1996),
-    (702, 1995, 2005),
-    (703, 1995, 2012),
-    (704, 1995, 1998),
-    (705, 1988, 1995),
-    (706, 1995, 1996),
-    (707, 1995, 1999),
-    (708, 1995, 2015),
-    (709, 1995, 1996),
-    (710, 1995, 1998),
-    (711, 1995, 2012),
-    (712, 1995, 2002),
-    (713, 1995, 2000),
-    (714, 1995, 2009),
-    (715, 1995, 2000),
-    (716, 1990, 1996),
-    (717, 1995, 2002),
-    (718, 1995, 2003),
-    (719, 1995, 1996),
-    (720, 1995, 1995),
-    (721, 1995, 2000),
-    (722, 1995, 2006),
-    (723, 1995, 1995),
-    (724, 1995, 2004),
-    (725, 1993, 1996),
-    (726, 1995, 1995),
-    (727, 1995, 2007),
-    (728, 1995, 1996),
-    (729, 1995, 1996),
-    (730, 1995, 1995),
-    (731, 1995, 2005),
-    (732, 1995, 1996),
-    (733, 1995, 1996),
-    (734, 1995, 1997),
-    (735, 1995, 2000),
-    (736, 1995, 1995),
-    (737, 1989, 1997),
-    (738, 1985, 1995),
-    (739, 1995, 2012),
-    (753, 1991, 2002),
-    (754, 1992, 2005),
-    (757, 1995, 2007),
-    (760, 1984, 2000),
-    (761, 1992, 2001),
-    (762, 1993, 2004),
-    (763, 1990, 2004),
-    (764, 1989, 2002),
-    (765, 1988, 2000),
-    (766, 1986, 2000),
-    (767, 1985, 1992),
-    (768, 1993, 1996),
-    (769, 1989, 1999),
-    (770, 1983, 1999),
-    (771, 1992, 1996),
-    (777, 1993, 1999),
-    (779, 1989, 2003),
-    (780, 1992, 1995),
-    (781, 1988, 2000),
-    (782, 1988, 2001),
-    (783, 1984, 1996),
-    (785, 1991, 1999),
-    (786, 1985, 1998),
-    (787, 1984, 1999),
-    (788, 1984, 2006),
-    (891, 1985, 2003),
-    (892, 1985, 1997),
-    (893, 1984, 2002),
-    (894, 1982, 1997),
-    (895, 1985, 2000),
-    (896, 1989, 2002),
-    (897, 1988, 1995),
-    (898, 1989, 1998),
-    (899, 1986, 1997),
-    (900, 1994, 1996),
-    (901, 1984, 2000),
-    (902, 1990, 2003),
-    (903, 1993, 1995),
-    (904, 1985, 2000),
-    (905, 1991, 2006),
-    (906, 1989, 1999),
-    (907, 1992, 1999),
-    (911, 1993, 2005),
-    (912, 1986, 1996),
-    (913, 1991, 2000),
-    (914, 1991, 1999),
-    (915, 1993, 2004),
-    (916, 1993, 2003),
-    (917, 1988, 1997),
-    (919, 1990, 2000),
-    (920, 1985, 2000),
-    (921, 1986, 1993),
-    (922, 1990, 2004),
-    (923, 1994, 2008),
-    (924, 1995, 2005),
-    (925, 1990, 1997),
-    (926, 1984, 1995),
-    (927, 1986, 1999),
-    (928, 1995, 1995),
-    (929, 1991, 1996),
-    (930, 1986, 1995),
-    (931, 1992, 2000),
-    (932, 1992, 2003),
-    (934, 1990, 2004),
-    (935, 1993, 2005),
-    (937, 1987, 2003),
-    (938, 1988, 1998),
-    (939, 1986, 1997),
-    (940, 1980, 1996),
-    (941, 1983, 1996),
-    (942, 1995, 1995),
-    (943, 1994, 1994),
-    (944, 1992, 1993),
-    (947, 1996, 2009),
-    (948, 1996, 2012),
-    (949, 1996, 2007),
-    (950, 1996, 2008),
-    (951, 1996, 2013),
-    (952, 1996, 2007),
-    (953, 1996, 2008),
-    (954, 1996, 2004),
-    (955, 1996, 2005),
-    (956, 1996, 2011),
-    (957, 1996, 2000),
-    (958, 1996, 2006),
-    (959, 1996, 2013),
-    (960, 1996, 2005),
-    (961, 1996, 2003),
-    (962, 1996, 2005),
-    (963, 1997, 1997),
-    (964, 1996, 1999),
-    (965, 1996, 2013),
-    (966, 1996, 2004),
-    (967, 1996, 1998),
-    (968, 1996, 1997),
-    (969, 1996, 2002),
-    (970, 1996, 2007),
-    (971, 1996, 1999),
-    (976, 1996, 2007),
-    (977, 1996, 2015),
-    (978, 1998, 2010),
-    (979, 1996, 2013),
-    (980, 1997, 2010),
-    (981, 2002, 2002),
-    (982, 1996, 1997),
-    (983, 1996, 2005),
-    (984, 1996, 1996),
-    (986, 1996, 1997),
-    (987, 1996, 2002),
-    (988, 1996, 2006),
-    (989, 1996, 1999),
-    (990, 1996, 2008),
-    (992, 1996, 1999),
-    (994, 1996, 2002),
-    (997, 1996, 1997),
-    (998, 1997, 2004),
-    (999, 1997, 1997),
-    (1000, 1996, 2005),
-    (1002, 1996, 1997),
-    (1003, 1997, 1999),
-    (1005, 1992, 2002),
-    (1006, 1981, 1998),
-    (1007, 1993, 1993),
-    (1008, 1986, 1994),
-    (1010, 1992, 1995),
-    (1022, 1994, 1994),
-    (1023, 1996, 2002),
-    (1024, 1996, 2002),
-    (1026, 1996, 1996),
-    (1027, 1990, 1995),
-    (1030, 1992, 1993),
-    (1032, 1996, 2004),
-    (1034, 1991, 1995),
-    (1035, 1996, 2001),
-    (1036, 1992, 1998),
-    (1037, 1990, 1998),
-    (1038, 2002, 2002),
-    (1041, 1996, 1996),
-    (1043, 1996, 2003),
-    (1049, 1996, 2003),
-    (1051, 1996, 2001),
-    (1052, 2003, 2004),
-    (1054, 1990, 1993),
-    (1055, 1997, 1997),
-    (1059, 1996, 1996),
-    (1061, 1997, 1998),
-    (1063, 1991, 1997),
-    (1064, 1996, 1996),
-    (1065, 1996, 2004),
-    (1067, 1995, 1995),
-    (1068, 1986, 1996),
-    (1070, 1996, 1999),
-    (1073, 1994, 2002),
-    (1074, 1996, 2002),
-    (1075, 1997, 1997),
-    (1077, 1996, 1996),
-    (1080, 1990, 1997),
-    (1085, 1999, 2001),
-    (1086, 1996, 1999),
-    (1088, 1999, 2009),
-    (1089, 1996, 1997),
-    (1090, 1992, 1994),
-    (1091, 1985, 1991),
-    (1093, 1996, 1996),
-    (1096, 1994, 1997),
-    (1097, 1989, 1989),
-    (1099, 1996, 1996),
-    (1100, 1990, 1990),
-    (1101, 1991, 1994),
-    (1106, 1991, 1995),
-    (1108, 1997, 1999),
-    (1109, 1996, 1996),
-    (1110, 1994, 2002),
-    (1112, 1996, 2011),
-    (1114, 1989, 2001),
-    (1116, 1992, 1992),
-    (1117, 1988, 1990),
-    (1118, 1986, 1997),
-    (1120, 1994, 1996),
-    (1121, 1996, 1996),
-    (1122, 1982, 1998),
-    (1123, 1983, 1994),
-    (1125, 1991, 1996),
-    (1126, 1996, 1997),
-    (1127, 1995, 1995),
-    (1128, 1992, 1997),
-    (1129, 1996, 1996),
-    (1131, 1996, 1996),
-    (1132, 1995, 1995),
-    (1133, 1995, 1998),
-    (1134, 1991, 2001),
-    (1136, 1996, 1996),
-    (1137, 1993, 1996),
-    (1138, 1996, 2000),
-    (1361, 1996, 1996),
-    (1365, 1985, 1997),
-    (1380, 1992, 1997),
-    (1381, 1978, 1996),
-    (1425, 1993, 2007),
-    (1429, 1991, 1998),
-    (1432, 1992, 1996),
-    (1434, 2000, 2000),
-    (1442, 2001, 2005),
-    (1444, 1997, 2004),
-    (1449, 1979, 1991),
-    (1450, 1980, 1992),
-    (1453, 1977, 1991),
-    (1456, 1983, 1991),
-    (1460, 1982, 1993),
-    (1472, 1981, 1997),
-    (1474, 1986, 1996),
-    (1477, 1996, 2008),
-    (1478, 1996, 1996),
-    (1479, 1986, 1997),
-    (1489, 1990, 1996),
-    (1495, 1997, 2015),
-    (1496, 1997, 2005),
-    (1497, 1997, 2013),
-    (1498, 1997, 2010),
-    (1499, 1997, 2011),
-    (1500, 1997, 2004),
-    (1501, 1997, 2009),
-    (1502, 1997, 2009),
-    (1503, 1997, 2012),
-    (1504, 1997, 2006),
-    (1505, 1997, 2003),
-    (1506, 1997, 2008),
-    (1507, 1997, 2007),
-    (1508, 1997, 2006),
-    (1509, 1997, 2006),
-    (1510, 1997, 2008),
-    (1511, 1997, 1999),
-    (1512, 1997, 1999),
-    (1513, 1997, 2007),
-    (1514, 1998, 2003),
-    (1515, 1997, 2011),
-    (1516, 1997, 1998),
-    (1517, 1997, 2008),
-    (1518, 1997, 1999),
-    (1519, 1997, 2005),
-    (1520, 1997, 2005),
-    (1521, 1997, 2008),
-    (1522, 1997, 1998),
-    (1525, 1997, 1998),
-    (1526, 1997, 1998),
-    (1527, 1997, 1998),
-    (1528, 1997, 1997),
-    (1529, 1997, 1997),
-    (1530, 1997, 1997),
-    (1531, 2000, 2006),
-    (1532, 1997, 1998),
-    (1533, 1997, 2009),
-    (1535, 1997, 2002),
-    (1536, 2000, 2013),
-    (1538, 1997, 2002),
-    (1539, 1997, 1997),
-    (1540, 1997, 1998),
-    (1541, 1997, 2006),
-    (1542, 2001, 2004),
-    (1544, 1997, 2003),
-    (1545, 1997, 1998),
-    (1548, 2000, 2008),
-    (1554, 2000, 2000),
-    (1559, 1999, 2007),
-    (1562, 1998, 2000),
-    (1563, 1997, 2009),
-    (1564, 1997, 2000),
-    (1565, 1997, 2004),
-    (1569, 1997, 2000),
-    (1572, 2002, 2002),
-    (1575, 1997, 1997),
-    (1576, 1997, 1998),
-    (1577, 1993, 1994),
-    (1578, 1997, 1997),
-    (1585, 1997, 2002),
-    (1591, 1998, 1998),
-    (1593, 1988, 1998),
-    (1594, 1997, 2005),
-    (1600, 1998, 2000),
-    (1601, 1997, 2003),
-    (1603, 1992, 1994),
-    (1607, 1997, 2007),
-    (1609, 2000, 2002),
-    (1612, 1997, 2000),
-    (1619, 1997, 2002),
-    (1622, 1983, 1992),
-    (1628, 1990, 1992),
-    (1630, 1998, 2011),
-    (1631, 1986, 1991),
-    (1635, 1993, 1993),
-    (1666, 1993, 1997),
-    (1667, 1990, 1998),
-    (1677, 1993, 1997),
-    (1680, 1990, 1997),
-    (1682, 1997, 1997),
-    (1683, 1990, 2001),
-    (1709, 1998, 2006),
-    (1710, 1998, 2011),
-    (1711, 1998, 2008),
-    (1712, 1998, 2013),
-    (1713, 1998, 2019),
-    (1714, 1998, 2004),
-    (1715, 1998, 2010),
-    (1716, 1998, 2011),
-    (1717, 1998, 2018),
-    (1718, 1998, 2016),
-    (1719, 1998, 2007),
-    (1720, 1998, 2007),
-    (1721, 1998, 2003),
-    (1722, 1998, 2002),
-    (1723, 1998, 2008),
-    (1724, 1998, 2003),
-    (1725, 1998, 2009),
-    (1726, 1999, 1999),
-    (1727, 1998, 2007),
-    (1728, 1998, 2000),
-    (1729, 1998, 2009),
-    (1730, 1998, 2011),
-    (1731, 1998, 2008),
-    (1732, 1998, 2002),
-    (1733, 1998, 2013),
-    (1734, 1998, 2000),
-    (1735, 1998, 2003),
-    (1736, 1998, 2002),
-    (1737, 1998, 2015),
-    (1738, 2001, 2004),
-    (1739, 1998, 2007),
-    (1740, 1998, 2013),
-    (1741, 1998, 2007),
-    (1742, 1998, 2006),
-    (1743, 1998, 2004),
-    (1744, 1998, 2008),
-    (1745, 1998, 2002),
-    (1746, 1999, 1999),
-    (1747, 1999, 2009),
-    (1748, 1998, 1998),
-    (1749, 1998, 2008),
-    (1750, 1998, 2002),
-    (1751, 1998, 2004),
-    (1752, 1998, 2010),
-    (1753, 1998, 2002),
-    (1754, 1998, 1999),
-    (1755, 1998, 1998),
-    (1756, 1998, 1999),
-    (1757, 1998, 1998),
-    (1760, 1999, 2003),
-    (1761, 1999, 2008),
-    (1762, 2001, 2004),
-    (1763, 1999, 2009),
-    (1764, 1998, 1998),
-    (1765, 2003, 2004),
-    (1766, 2002, 2008),
-    (1800, 1998, 2008),
-    (1801, 1998, 2002),
-    (1802, 1998, 2011),
-    (1806, 1994, 1994),
-    (1814, 1992, 1994),
-    (1817, 1993, 1998),
-    (1819, 1991, 1991),
-    (1820, 1998, 1998),
-    (1821, 1991, 1994),
-    (1823, 1998, 1998),
-    (1824, 1998, 1998),
-    (1829, 2001, 2001),
-    (1831, 1998, 1998),
-    (1838, 1998, 2001),
-    (1839, 1989, 1993),
-    (1844, 1994, 1999),
-    (1845, 1993, 1998),
-    (1846, 1987, 1989),
-    (1847, 1983, 1998),
-    (1848, 1989, 1990),
-    (1852, 1998, 1998),
-    (1853, 1999, 2011),
-    (1855, 1991, 1998),
-    (1858, 1998, 1998),
-    (1861, 1990, 1998),
-    (1863, 1998, 2011),
-    (1864, 2000, 2002),
-    (1868, 1998, 1998),
-    (1869, 1998, 1999),
-    (1871, 1998, 1998),
-    (1872, 1998, 1999),
-    (1874, 1989, 1992),
-    (1882, 1999, 2015),
-    (1883, 1999, 2007),
-    (1884, 1999, 2011),
-    (1885, 1999, 2013),
-    (1886, 1999, 2009),
-    (1887, 1999, 2008),
-    (1888, 1999, 2012),
-    (1889, 1999, 2015),
-    (1890, 1999, 2014),
-    (1891, 1999, 2017),
-    (1892, 1999, 2001),
-    (1893, 1999, 2004),
-    (1894, 1999, 2012),
-    (1895, 1999, 2002),
-    (1897, 1999, 2016),
-    (1898, 1999, 2001),
-    (1899, 1999, 2010),
-    (1900, 1999, 2003),
-    (1901, 1999, 2004),
-    (1902, 1999, 2011),
-    (1903, 1999, 2009),
-    (1904, 1999, 2009),
-    (1905, 2001, 2014),
-    (1906, 1999, 2002),
-    (1907, 1999, 2002),
-    (1908, 1999, 2006),
-    (1909, 1999, 2006),
-    (1910, 2001, 2003),
-    (1911, 1999, 2002),
-    (1913, 1999, 2008),
-    (1914, 1999, 2000),
-    (1915, 1999, 2003),
-    (1916, 1999, 2008),
-    (1917, 2000, 2004),
-    (1918, 1999, 2004),
-    (1919, 1999, 2005),
-    (1920, 1999, 1999),
-    (1921, 2002, 2007),
-    (1922, 2003, 2011),
-    (1924, 2000, 2005),
-    (1926, 1999, 1999),
-    (1928, 1999, 2003),
-    (1930, 1999, 2000),
-    (1934, 1999, 2004),
-    (1937, 1999, 1999),
-    (1938, 2002, 2017),
-    (1942, 1999, 2002),
-    (1943, 1999, 1999),
-    (1944, 1999, 2003),
-    (1950, 2000, 2000),
-    (1952, 2000, 2011),
-    (1953, 1999, 1999),
-    (1954, 1999, 1999),
-    (1956, 2000, 2007),
-    (1960, 1999, 2005),
-    (1965, 1999, 1999),
-    (1967, 1999, 2002),
-    (1972, 1989, 1991),
-    (1975, 1999, 2000),
-    (1983, 1999, 2005),
-    (1984, 1987, 1987),
-    (1985, 2000, 2005),
-    (2000, 1999, 1999),
-    (2030, 2000, 2014),
-    (2031, 2000, 2008),
-    (2032, 2000, 2008),
-    (2033, 2000, 2005),
-    (2034, 2000, 2016),
-    (2035, 2000, 2007),
-    (2036, 2000, 2008),
-    (2037, 2000, 2019),
-    (2038, 2000, 2012),
-    (2039, 2000, 2012),
-    (2040, 2000, 2004),
-    (2041, 2001, 2010),
-    (2042, 2000, 2003),
-    (2043, 2000, 2005),
-    (2044, 2000, 2004),
-    (2045, 2000, 2014),
-    (2046, 2000, 2009),
-    (2047, 2000, 2012),
-    (2048, 2000, 2011),
-    (2049, 2001, 2008),
-    (2050, 2000, 2010),
-    (2051, 2000, 2004),
-    (2052, 2000, 2012),
-    (2053, 2000, 2002),
-    (2054, 2000, 2006),
-    (2055, 2000, 2004),
-    (2056, 2001, 2009),
-    (2057, 2000, 2002),
-    (2058, 2000, 2008),
-    (2059, 2000, 2011),
-    (2060, 2002, 2008),
-    (2061, 2000, 2003),
-    (2062, 2000, 2002),
-    (2063, 2000, 2008),
-    (2064, 2000, 2002),
-    (2065, 2000, 2000),
-    (2066, 2000, 2002),
-    (2067, 2000, 2010),
-    (2068, 2000, 2002),
-    (2069, 2000, 2001),
-    (2071, 2000, 2002),
-    (2072, 2000, 2011),
-    (2073, 2000, 2011),
-    (2074, 2000, 2004),
-    (2078, 2000, 2009),
-    (2079, 2003, 2007),
-    (2080, 2002, 2002),
-    (2081, 2001, 2003),
-    (2082, 2000, 2000),
-    (2084, 2000, 2000),
-    (2091, 2000, 2004),
-    (2092, 2000, 2000),
-    (2098, 2000, 2006),
-    (2101, 2000, 2000),
-    (2106, 2000, 2002),
-    (2109, 2000, 2008),
-    (2121, 2000, 2000),
-    (2123, 2000, 2000),
-    (2124, 2001, 2010),
-    (2128, 2000, 2000),
-    (2130, 2000, 2001),
-    (2137, 2003, 2010),
-    (2143, 2000, 2002),
-    (2173, 2000, 2002),
-    (2198, 2001, 2012),
-    (2199, 2001, 2019),
-    (2200, 2001, 2018),
-    (2201, 2001, 2012),
-    (2202, 2001, 2014),
-    (2203, 2001, 2013),
-    (2204, 2001, 2006),
-    (2205, 2001, 2012),
-    (2206, 2001, 2004),
-    (2207, 2001, 2021),
-    (2208, 2001, 2004),
-    (2209, 2001, 2012),
-    (2210, 2001, 2017),
-    (2211, 2001, 2012),
-    (2212, 2001, 2009),
-    (2213, 2001, 2002),
-    (2214, 2001, 2005),
-    (2215, 2001, 2013),
-    (2216, 2001, 2017),
-    (2217, 2001, 2014),
-    (2218, 2001, 2002),
-    (2219, 2001, 2002),
-    (2220, 2001, 2003),
-    (2221, 2002, 2004),
-    (2222, 2001, 2014),
-    (2223, 2001, 2014),
-    (2224, 2001, 2013),
-    (2225, 2001, 2018),
-    (2226, 2001, 2008),
-    (2228, 2001, 2003),
-    (2229, 2001, 2013),
-    (2230, 2001, 2011),
-    (2237, 2001, 2002),
-    (2238, 2001, 2001),
-    (2239, 2001, 2009),
-    (2240, 2001, 2011),
-    (2241, 2001, 2004),
-    (2242, 2001, 2005),
-    (2243, 2001, 2011),
-    (2244, 2001, 2003),
-    (2245, 2001, 2004),
-    (2246, 2002, 2011),
-    (2248, 2001, 2013),
-    (2249, 2001, 2004),
-    (2250, 2001, 2011),
-    (2253, 2002, 2003),
-    (2254, 2001, 2007),
-    (2256, 2002, 2002),
-    (2257, 2001, 2003),
-    (2260, 2001, 2010),
-    (2261, 2001, 2002),
-    (2264, 2001, 2002),
-    (2294, 2001, 2010),
-    (2306, 2001, 2010),
-    (2321, 2002, 2004),
-    (2343, 2001, 2001),
-    (2347, 2001, 2002),
-    (2349, 1991, 2001),
-    (2351, 2001, 2002),
-    (2352, 2001, 2002),
-    (2357, 2001, 2004),
-    (2365, 2001, 2016),
-    (2366, 2002, 2009),
-    (2367, 2004, 2004),
-    (2369, 2001, 2001),
-    (2370, 2001, 2003),
-    (2397, 2002, 2010),
-    (2398, 2002, 2002),
-    (2399, 2002, 2016),
-    (2400, 2002, 2015),
-    (2401, 2002, 2005),
-    (2402, 2002, 2006),
-    (2403, 2002, 2018),
-    (2404, 2002, 2012),
-    (2405, 2002, 2015),
-    (2406, 2002, 2015),
-    (2407, 2002, 2012),
-    (2408, 2002, 2013),
-    (2409, 2002, 2009),
-    (2410, 2002, 2008),
-    (2411, 2002, 2007),
-    (2412, 2002, 2005),
-    (2413, 2002, 2008),
-    (2414, 2002, 2004),
-    (2415, 2002, 2004),
-    (2416, 2002, 2009),
-    (2417, 2002, 2005),
-    (2418, 2002, 2007),
-    (2419, 2002, 2015),
-    (2420, 2004, 2010),
-    (2421, 2002, 2004),
-    (2422, 2002, 2014),
-    (2423, 2002, 2003),
-    (2424, 2002, 2007),
-    (2425, 2002, 2003),
-    (2427, 2002, 2013),
-    (2428, 2002, 2002),
-    (2429, 2002, 2011),
-    (2430, 2002, 2014),
-    (2431, 2009, 2010),
-    (2432, 2002, 2002),
-    (2434, 2007, 2007),
-    (2435, 2004, 2005),
-    (2436, 2002, 2009),
-    (2437, 2002, 2005),
-    (2440, 2002, 2016),
-    (2441, 2002, 2006),
-    (2442, 2002, 2002),
-    (2443, 2003, 2010),
-    (2446, 2002, 2015),
-    (2447, 2002, 2004),
-    (2449, 2007, 2016),
-    (2450, 2002, 2005),
-    (2451, 2002, 2004),
-    (2452, 2002, 2003),
-    (2453, 2002, 2002),
-    (2454, 2002, 2006),
-    (2456, 2002, 2003),
-    (2457, 2002, 2014),
-    (2462, 2002, 2002),
-    (2466, 2002, 2003),
-    (2469, 2002, 2006),
-    (2470, 2002, 2007),
-    (2471, 2002, 2002),
-    (2484, 2002, 2009),
-    (2486, 2002, 2004),
-    (2492, 2002, 2002),
-    (2499, 2002, 2007),
-    (2501, 2002, 2014),
-    (2541, 2002, 2002),
-    (2544, 2003, 2026),
-    (2545, 2003, 2012),
-    (2546, 2003, 2021),
-    (2547, 2003, 2016),
-    (2548, 2003, 2018),
-    (2549, 2003, 2015),
-    (2550, 2003, 2015),
-    (2551, 2003, 2011),
-    (2552, 2003, 2006),
-    (2553, 2003, 2009),
-    (2554, 2003, 2012),
-    (2555, 2003, 2017),
-    (2556, 2003, 2010),
-    (2557, 2003, 2014),
-    (2558, 2003, 2005),
-    (2559, 2003, 2003),
-    (2560, 2003, 2006),
-    (2561, 2003, 2017),
-    (2562, 2003, 2012),
-    (2563, 2003, 2016),
-    (2564, 2003, 2016),
-    (2565, 2003, 2005),
-    (2566, 2003, 2013),
-    (2567, 2003, 2011),
-    (2568, 2004, 2013),
-    (2569, 2003, 2004),
-    (2570, 2003, 2017),
-    (2571, 2003, 2016),
-    (2572, 2003, 2012),
-    (2573, 2003, 2005),
-    (2574, 2003, 2011),
-    (2575, 2003, 2012),
-    (2580, 2003, 2003),
-    (2581, 2003, 2015),
-    (2582, 2003, 2003),
-    (2583, 2005, 2005),
-    (2584, 2003, 2014),
-    (2585, 2003, 2018),
-    (2586, 2003, 2013),
-    (2588, 2004, 2015),
-    (2590, 2003, 2015),
-    (2591, 2006, 2006),
-    (2592, 2003, 2016),
-    (2594, 2003, 2019),
-    (2599, 2003, 2004),
-    (2601, 2006, 2006),
-    (2602, 2003, 2003),
-    (2604, 2003, 2004),
-    (2605, 2003, 2012),
-    (2617, 2003, 2022),
-    (2624, 2004, 2010),
-    (2632, 2003, 2004),
-    (2637, 2005, 2005),
-    (2639, 2003, 2004),
-    (2648, 2003, 2010),
-    (2652, 1988, 1988),
-    (2657, 2004, 2004),
-    (2667, 2003, 2003),
-    (2668, 2003, 2011),
-    (2669, 2003, 2008),
-    (2673, 2003, 2003),
-    (2679, 2003, 2012),
-    (2682, 2003, 2004),
-    (2684, 2005, 2005),
-    (2688, 2004, 2004),
-    (2693, 2003, 2006),
-    (2694, 2005, 2013),
-    (2696, 2006, 2006),
-    (2724, 2003, 2003),
-    (2730, 2004, 2021),
-    (2731, 2004, 2017),
-    (2732, 2004, 2014),
-    (2733, 2004, 2018),
-    (2734, 2004, 2018),
-    (2735, 2004, 2013),
-    (2736, 2004, 2018),
-    (2737, 2004, 2006),
-    (2738, 2004, 2022),
-    (2739, 2004, 2007),
-    (2740, 2004, 2013),
-    (2741, 2004, 2008),
-    (2742, 2004, 2014),
-    (2743, 2004, 2016),
-    (2744, 2004, 2017),
-    (2745, 2004, 2007),
-    (2746, 2004, 2017),
-    (2747, 2004, 2019),
-    (2748, 2004, 2015),
-    (2749, 2004, 2017),
-    (2750, 2004, 2005),
-    (2751, 2004, 2007),
-    (2752, 2005, 2005),
-    (2753, 2004, 2011),
-    (2754, 2004, 2017),
-    (2755, 2004, 2015),
-    (2756, 2004, 2016),
-    (2757, 2004, 2016),
-    (2758, 2004, 2007),
-    (2760, 2004, 2020),
-    (2761, 2004, 2005),
-    (2762, 2004, 2004),
-    (2763, 2004, 2004),
-    (2764, 2004, 2005),
-    (2765, 2004, 2011),
-    (2766, 2004, 2005),
-    (2767, 2004, 2013),
-    (2768, 2004, 2012),
-    (2770, 2004, 2006),
-    (2772, 2004, 2021),
-    (2774, 2004, 2006),
-    (2775, 2004, 2005),
-    (2776, 2004, 2006),
-    (2779, 2006, 2006),
-    (2782, 2004, 2006),
-    (2784, 2004, 2004),
-    (2788, 2004, 2010),
-    (2798, 2004, 2004),
-    (2800, 2004, 2004),
-    (2804, 2004, 2011),
-    (2809, 2005, 2005),
-    (2810, 2006, 2008),
-    (2823, 2004, 2005),
-    (2824, 2006, 2008),
-    (2825, 2004, 2004),
-    (2839, 2004, 2005),
-    (2845, 2004, 2004),
-    (2852, 2004, 2007),
-    (2853, 2005, 2014),
-    (2857, 2004, 2007),
-    (2863, 2004, 2017),
-    (2866, 2004, 2006),
-    (2867, 2007, 2007),
-    (2873, 2004, 2007),
-    (2876, 2004, 2006),
-    (2891, 1983, 2004),
-    (76001, 1990, 1994),
-    (76002, 1968, 1977),
-    (76003, 1969, 1988),
-    (76005, 1976, 1980),
-    (76006, 1956, 1956),
-    (76007, 1946, 1947),
-    (76008, 1953, 1953),
-    (76009, 1987, 1992),
-    (76010, 1967, 1967),
-    (76011, 1975, 1987),
-    (76012, 1970, 1976),
-    (76015, 1968, 1974),
-    (76016, 1981, 1993),
-    (76017, 1981, 1994),
-    (76018, 1966, 1967),
-    (76019, 1986, 1990),
-    (76020, 1959, 1960),
-    (76021, 1984, 1984),
-    (76022, 1993, 1993),
-    (76024, 1987, 1990),
-    (76025, 1988, 1989),
-    (76027, 1969, 1978),
-    (76028, 1968, 1968),
-    (76029, 1971, 1971),
-    (76030, 1980, 1980),
-    (76034, 1959, 1959),
-    (76035, 1967, 1970),
-    (76036, 1974, 1975),
-    (76037, 1982, 1982),
-    (76040, 1975, 1976),
-    (76041, 1978, 1978),
-    (76042, 1988, 1988),
-    (76043, 1982, 1984),
-    (76045, 1982, 1989),
-    (76046, 1984, 1993),
-    (76048, 1969, 1969),
-    (76049, 1954, 1954),
-    (76050, 1989, 1991),
-    (76053, 1961, 1961),
-    (76054, 1970, 1983),
-    (76055, 1974, 1977),
-    (76056, 1950, 1961),
-    (76057, 1987, 1987),
-    (76059, 1977, 1978),
-    (76060, 1948, 1950),
-    (76061, 1956, 1956),
-    (76062, 1955, 1955),
-    (76063, 1963, 1965),
-    (76064, 1970, 1970),
-    (76065, 1969, 1969),
-    (76068, 1953, 1953),
-    (76069, 1955, 1957),
-    (76070, 1960, 1970),
-    (76071, 1946, 1946),
-    (76073, 1966, 1966),
-    (76074, 1983, 1983),
-    (76076, 1976, 1977),
-    (76078, 1970, 1981),
-    (76079, 1990, 1991),
-    (76080, 1948, 1948),
-    (76081, 1952, 1956),
-    (76082, 1982, 1993),
-    (76083, 1974, 1979),
-    (76084, 1981, 1981),
-    (76085, 1979, 1987),
-    (76089, 1946, 1946),
-    (76090, 1990, 1990),
-    (76091, 1977, 1988),
-    (76092, 1946, 1946),
-    (76093, 1981, 1986),
-    (76094, 1984, 1990),
-    (76095, 1973, 1981),
-    (76096, 1956, 1956),
-    (76097, 1991, 1995),
-    (76098, 1949, 1951),
-    (76099, 1976, 1978),
-    (76102, 1951, 1954),
-    (76103, 1968, 1968),
-    (76104, 1976, 1979),
-    (76105, 1964, 1970),
-    (76106, 1966, 1976),
-    (76107, 1959, 1973),
-    (76108, 1962, 1968),
-    (76109, 1976, 1976),
-    (76110, 1949, 1953),
-    (76111, 1946, 1946),
-    (76112, 1976, 1976),
-    (76113, 1970, 1970),
-    (76114, 1953, 1955),
-    (76117, 1949, 1950),
-    (76118, 1971, 1971),
-    (76119, 1975, 1975),
-    (76120, 1976, 1979),
-    (76121, 1979, 1982),
-    (76123, 1989, 1992),
-    (76124, 1982, 1983),
-    (76125, 1969, 1970),
-    (76126, 1946, 1946),
-    (76127, 1958, 1971),
-    (76128, 1994, 1994),
-    (76129, 1950, 1950),
-    (76130, 1969, 1978),
-    (76131, 1949, 1950),
-    (76133, 1962, 1974),
-    (76134, 1976, 1976),
-    (76136, 1953, 1960),
-    (76137, 1946, 1946),
-    (76138, 1986, 1992),
-    (76139, 1946, 1948),
-    (76140, 1973, 1979),
-    (76141, 1951, 1951),
-    (76142, 1973, 1975),
-    (76143, 1959, 1960),
-    (76144, 1961, 1974),
-    (76145, 1953, 1956),
-    (76146, 1974, 1975),
-    (76148, 1992, 1994),
-    (76151, 1976, 1981),
-    (76152, 1989, 1991),
-    (76154, 1977, 1987),
-    (76155, 1949, 1949),
-    (76156, 1956, 1956),
-    (76157, 1988, 1988),
-    (76158, 1986, 1988),
-    (76159, 1978, 1979),
-    (76160, 1956, 1965),
-    (76161, 1946, 1946),
-    (76162, 1972, 1980),
-    (76163, 1968, 1968),
-    (76164, 1955, 1955),
-    (76165, 1975, 1978),
-    (76166, 1966, 1977),
-    (76167, 1986, 1986),
-    (76168, 1958, 1958),
-    (76170, 1977, 1988),
-    (76171, 1948, 1948),
-    (76172, 1985, 1989),
-    (76173, 1948, 1951),
-    (76174, 1980, 1980),
-    (76175, 1970, 1970),
-    (76176, 1981, 1993),
-    (76177, 1984, 1984),
-    (76179, 1987, 1987),
-    (76180, 1992, 1992),
-    (76182, 1961, 1961),
-    (76183, 1990, 1992),
-    (76184, 1992, 1992),
-    (76186, 1950, 1950),
-    (76187, 1966, 1975),
-    (76188, 1947, 1948),
-    (76189, 1981, 1981),
-    (76190, 1949, 1952),
-    (76191, 1958, 1964),
-    (76192, 1968, 1977),
-    (76195, 1985, 1994),
-    (76196, 1953, 1953),
-    (76197, 1957, 1957),
-    (76198, 1977, 1977),
-    (76201, 1964, 1965),
-    (76203, 1961, 1961),
-    (76204, 1976, 1980),
-    (76206, 1960, 1970),
-    (76207, 1948, 1949),
-    (76209, 1950, 1950),
-    (76210, 1949, 1953),
-    (76211, 1977, 1977),
-    (76212, 1979, 1979),
-    (76213, 1975, 1983),
-    (76214, 1949, 1952),
-    (76217, 1984, 1994),
-    (76219, 1966, 1970),
-    (76221, 1978, 1978),
-    (76222, 1972, 1977),
-    (76223, 1974, 1974),
-    (76224, 1949, 1950),
-    (76225, 1978, 1980),
-    (76226, 1972, 1974),
-    (76227, 1964, 1965),
-    (76228, 1981, 1981),
-    (76229, 1977, 1979),
-    (76230, 1981, 1983),
-    (76231, 1979, 1988),
-    (76232, 1949, 1949),
-    (76233, 1967, 1976),
-    (76237, 1986, 1989),
-    (76238, 1949, 1954),
-    (76239, 1981, 1982),
-    (76240, 1965, 1965),
-    (76241, 1952, 1952),
-    (76242, 1977, 1985),
-    (76243, 1947, 1961),
-    (76245, 1958, 1958),
-    (76246, 1954, 1954),
-    (76247, 1983, 1993),
-    (76248, 1973, 1981),
-    (76249, 1978, 1985),
-    (76250, 1949, 1955),
-    (76252, 1975, 1986),
-    (76253, 1962, 1974),
-    (76254, 1946, 1946),
-    (76255, 1946, 1946),
-    (76256, 1972, 1974),
-    (76257, 1973, 1982),
-    (76258, 1967, 1967),
-    (76259, 1977, 1977),
-    (76260, 1985, 1986),
-    (76261, 1980, 1980),
-    (76262, 1981, 1982),
-    (76263, 1974, 1977),
-    (76264, 1948, 1949),
-    (76265, 1991, 1993),
-    (76266, 1980, 1987),
-    (76268, 1984, 1991),
-    (76270, 1948, 1948),
-    (76272, 1971, 1983),
-    (76273, 1957, 1957),
-    (76275, 1946, 1946),
-    (76276, 1973, 1979),
-    (76277, 1991, 1991),
-    (76278, 1946, 1946),
-    (76279, 1980, 1980),
-    (76282, 1989, 1989),
-    (76283, 1980, 1984),
-    (76284, 1948, 1949),
-    (76285, 1947, 1951),
-    (76286, 1972, 1979),
-    (76287, 1948, 1949),
-    (76288, 1989, 1989),
-    (76289, 1964, 1971),
-    (76290, 1975, 1982),
-    (76291, 1983, 1985),
-    (76292, 1989, 1989),
-    (76293, 1961, 1962),
-    (76294, 1989, 1989),
-    (76295, 1961, 1962),
-    (76296, 1976, 1985),
-    (76297, 1960, 1964),
-    (76298, 1948, 1951),
-    (76300, 1978, 1978),
-    (76301, 1952, 1952),
-    (76302, 1965, 1965),
-    (76303, 1976, 1977),
-    (76304, 1981, 1981),
-    (76305, 1974, 1980),
-    (76306, 1949, 1949),
-    (76307, 1981, 1981),
-    (76308, 1993, 1993),
-    (76309, 1967, 1967),
-    (76311, 1950, 1951),
-    (76313, 1956, 1957),
-    (76314, 1961, 1964),
-    (76316, 1984, 1992),
-    (76317, 1976, 1984),
-    (76318, 1961, 1965),
-    (76319, 1961, 1964),
-    (76320, 1988, 1990),
-    (76321, 1978, 1982),
-    (76322, 1946, 1950),
-    (76323, 1946, 1946),
-    (76324, 1958, 1963),
-    (76326, 1950, 1951),
-    (76328, 1967, 1967),
-    (76329, 1964, 1969),
-    (76330, 1972, 1979),
-    (76331, 1948, 1954),
-    (76332, 1991, 1991),
-    (76333, 1946, 1946),
-    (76334, 1990, 1990),
-    (76335, 1946, 1948),
-    (76336, 1976, 1980),
-    (76337, 1992, 1992),
-    (76338, 1984, 1994),
-    (76339, 1973, 1973),
-    (76340, 1961, 1961),
-    (76341, 1946, 1946),
-    (76342, 1984, 1989),
-    (76343, 1975, 1975),
-    (76344, 1946, 1950),
-    (76345, 1954, 1954),
-    (76346, 1949, 1950),
-    (76348, 1971, 1980),
-    (76350, 1977, 1986),
-    (76351, 1976, 1984),
-    (76352, 1977, 1979),
-    (76353, 1980, 1990),
-    (76355, 1980, 1985),
-    (76356, 1969, 1976),
-    (76357, 1967, 1967),
-    (76358, 1983, 1984),
-    (76359, 1949, 1949),
-    (76360, 1980, 1981),
-    (76361, 1978, 1979),
-    (76362, 1979, 1994),
-    (76363, 1968, 1968),
-    (76364, 1976, 1976),
-    (76365, 1974, 1984),
-    (76367, 1971, 1971),
-    (76368, 1981, 1985),
-    (76370, 1984, 1988),
-    (76373, 1949, 1952),
-    (76374, 1973, 1973),
-    (76375, 1959, 1972),
-    (76376, 1966, 1971),
-    (76378, 1988, 1988),
-    (76379, 1968, 1979),
-    (76380, 1949, 1949),
-    (76382, 1962, 1970),
-    (76383, 1973, 1977),
-    (76384, 1985, 1985),
-    (76385, 1978, 1992),
-    (76386, 1971, 1980),
-    (76387, 1988, 1990),
-    (76391, 1949, 1950),
-    (76392, 1974, 1981),
-    (76393, 1954, 1954),
-    (76394, 1950, 1954),
-    (76395, 1970, 1973),
-    (76397, 1966, 1975),
-    (76398, 1983, 1984),
-    (76402, 1971, 1979),
-    (76403, 1965, 1975),
-    (76404, 1950, 1957),
-    (76406, 1949, 1951),
-    (76407, 1949, 1949),
-    (76408, 1946, 1946),
-    (76409, 1974, 1974),
-    (76410, 1990, 1990),
-    (76411, 1985, 1986),
-    (76412, 1986, 1993),
-    (76413, 1973, 1978),
-    (76414, 1949, 1957),
-    (76415, 1987, 1987),
-    (76416, 1980, 1980),
-    (76418, 1980, 1986),
-    (76419, 1970, 1971),
-    (76421, 1973, 1980),
-    (76422, 1948, 1948),
-    (76425, 1983, 1983),
-    (76426, 1987, 1988),
-    (76427, 1963, 1963),
-    (76428, 1952, 1963),
-    (76429, 1955, 1961),
-    (76431, 1982, 1994),
-    (76432, 1946, 1947),
-    (76433, 1990, 1995),
-    (76434, 1954, 1954),
-    (76435, 1980, 1988),
-    (76436, 1979, 1987),
-    (76437, 1976, 1977),
-    (76438, 1949, 1949),
-    (76439, 1985, 1985),
-    (76440, 1970, 1970),
-    (76441, 1978, 1991),
-    (76442, 1950, 1955),
-    (76443, 1981, 1984),
-    (76444, 1978, 1989),
-    (76446, 1991, 1991),
-    (76447, 1979, 1981),
-    (76448, 1989, 1991),
-    (76450, 1991, 1993),
-    (76451, 1946, 1946),
-    (76452, 1949, 1952),
-    (76453, 1978, 1990),
-    (76454, 1954, 1967),
-    (76456, 1949, 1949),
-    (76457, 1979, 1979),
-    (76458, 1964, 1975),
-    (76459, 1964, 1964),
-    (76462, 1970, 1982),
-    (76463, 1982, 1982),
-    (76464, 1962, 1962),
-    (76465, 1977, 1978),
-    (76466, 1966, 1970),
-    (76468, 1975, 1975),
-    (76469, 1985, 1985),
-    (76470, 1946, 1946),
-    (76471, 1977, 1984),
-    (76472, 1987, 1988),
-    (76473, 1948, 1952),
-    (76474, 1978, 1983),
-    (76475, 1979, 1979),
-    (76476, 1985, 1985),
-    (76477, 1970, 1972),
-    (76478, 1983, 1983),
-    (76479, 1947, 1949),
-    (76481, 1977, 1977),
-    (76482, 1991, 1994),
-    (76483, 1979, 1990),
-    (76485, 1968, 1974),
-    (76487, 1965, 1975),
-    (76488, 1992, 1992),
-    (76489, 1946, 1946),
-    (76492, 1948, 1949),
-    (76496, 1951, 1951),
-    (76497, 1982, 1991),
-    (76498, 1946, 1948),
-    (76499, 1976, 1978),
-    (76500, 1969, 1981),
-    (76502, 1976, 1976),
-    (76504, 1976, 1990),
-    (76505, 1973, 1976),
-    (76506, 1952, 1952),
-    (76507, 1949, 1949),
-    (76509, 1974, 1974),
-    (76511, 1961, 1961),
-    (76514, 1948, 1954),
-    (76515, 1946, 1946),
-    (76516, 1977, 1991),
-    (76517, 1993, 1993),
-    (76518, 1981, 1989),
-    (76519, 1971, 1973),
-    (76520, 1980, 1980),
-    (76521, 1972, 1976),
-    (76522, 1972, 1976),
-    (76523, 1978, 1979),
-    (76524, 1955, 1955),
-    (76525, 1967, 1974),
-    (76526, 1976, 1985),
-    (76528, 1988, 1988),
-    (76529, 1973, 1976),
-    (76530, 1982, 1982),
-    (76531, 1969, 1972),
-    (76532, 1960, 1961),
-    (76533, 1972, 1972),
-    (76534, 1976, 1981),
-    (76536, 1953, 1957),
-    (76538, 1946, 1946),
-    (76539, 1975, 1988),
-    (76541, 1979, 1979),
-    (76542, 1990, 1994),
-    (76543, 1983, 1987),
-    (76544, 1979, 1979),
-    (76545, 1962, 1973),
-    (76546, 1958, 1961),
-    (76548, 1946, 1946),
-    (76551, 1951, 1951),
-    (76552, 1988, 1988),
-    (76553, 1979, 1981),
-    (76555, 1954, 1958),
-    (76556, 1981, 1983),
-    (76557, 1952, 1952),
-    (76558, 1976, 1976),
-    (76559, 1974, 1975),
-    (76560, 1966, 1966),
-    (76561, 1955, 1957),
-    (76562, 1950, 1950),
-    (76563, 1975, 1976),
-    (76564, 1973, 1977),
-    (76565, 1951, 1951),
-    (76566, 1958, 1970),
-    (76567, 1976, 1982),
-    (76568, 1973, 1977),
-    (76569, 1981, 1981),
-    (76570, 1946, 1946),
-    (76571, 1949, 1949),
-    (76574, 1989, 1990),
-    (76575, 1971, 1971),
-    (76576, 1967, 1971),
-    (76577, 1962, 1972),
-    (76578, 1954, 1954),
-    (76580, 1949, 1949),
-    (76581, 1949, 1950),
-    (76582, 1946, 1949),
-    (76583, 1980, 1994),
-    (76584, 1950, 1953),
-    (76585, 1949, 1949),
-    (76586, 1987, 1987),
-    (76587, 1977, 1980),
-    (76588, 1986, 1986),
-    (76589, 1981, 1982),
-    (76590, 1976, 1982),
-    (76592, 1967, 1968),
-    (76593, 1947, 1947),
-    (76594, 1973, 1974),
-    (76595, 1962, 1962),
-    (76596, 1989, 1989),
-    (76598, 1974, 1984),
-    (76599, 1980, 1990),
-    (76603, 1970, 1974),
-    (76604, 1980, 1980),
-    (76605, 1957, 1957),
-    (76607, 1972, 1978),
-    (76608, 1979, 1982),
-    (76609, 1946, 1946),
-    (76610, 1962, 1964),
-    (76611, 1955, 1962),
-    (76615, 1948, 1950),
-    (76616, 1976, 1989),
-    (76617, 1957, 1957),
-    (76618, 1977, 1990),
-    (76619, 1980, 1982),
-    (76621, 1984, 1985),
-    (76622, 1971, 1974),
-    (76623, 1974, 1975),
-    (76624, 1948, 1948),
-    (76625, 1981, 1981),
-    (76626, 1953, 1953),
-    (76628, 1976, 1977),
-    (76630, 1953, 1953),
-    (76631, 1982, 1992),
-    (76632, 1982, 1986),
-    (76633, 1957, 1957),
-    (76634, 1974, 1977),
-    (76635, 1991, 1991),
-    (76636, 1949, 1952),
-    (76637, 1984, 1984),
-    (76638, 1982, 1983),
-    (76641, 1981, 1987),
-    (76643, 1989, 1989),
-    (76646, 1993, 1993),
-    (76647, 1961, 1971),
-    (76648, 1948, 1948),
-    (76649, 1947, 1948),
-    (76651, 1961, 1961),
-    (76653, 1946, 1946),
-    (76655, 1948, 1950),
-    (76656, 1978, 1980),
-    (76658, 1958, 1959),
-    (76661, 1966, 1973),
-    (76663, 1962, 1975),
-    (76664, 1977, 1979),
-    (76667, 1976, 1976),
-    (76668, 1958, 1968),
-    (76669, 1946, 1946),
-    (76670, 1982, 1987),
-    (76671, 1988, 1988),
-    (76672, 1990, 1991),
-    (76673, 1976, 1990),
-    (76674, 1970, 1970),
-    (76675, 1972, 1972),
-    (76676, 1992, 1994),
-    (76677, 1949, 1949),
-    (76678, 1978, 1978),
-    (76679, 1957, 1957),
-    (76680, 1965, 1976),
-    (76681, 1976, 1986),
-    (76682, 1948, 1948),
-    (76683, 1995, 1995),
-    (76685, 1979, 1979),
-    (76686, 1979, 1987),
-    (76687, 1949, 1949),
-    (76689, 1947, 1949),
-    (76690, 1946, 1946),
-    (76691, 1965, 1965),
-    (76692, 1948, 1948),
-    (76693, 1954, 1958),
-    (76694, 1958, 1965),
-    (76695, 1987, 1993),
-    (76696, 1946, 1946),
-    (76697, 1962, 1962),
-    (76698, 1946, 1949),
-    (76699, 1976, 1976),
-    (76701, 1955, 1955),
-    (76702, 1949, 1952),
-    (76703, 1986, 1991),
-    (76704, 1953, 1961),
-    (76705, 1951, 1952),
-    (76706, 1946, 1946),
-    (76707, 1975, 1983),
-    (76708, 1955, 1962),
-    (76709, 1988, 1988),
-    (76711, 1948, 1950),
-    (76712, 1959, 1968),
-    (76713, 1984, 1987),
-    (76714, 1967, 1967),
-    (76715, 1970, 1971),
-    (76716, 1966, 1974),
-    (76717, 1952, 1954),
-    (76719, 1946, 1947),
-    (76720, 1946, 1948),
-    (76721, 1946, 1952),
-    (76722, 1977, 1977),
-    (76723, 1955, 1959),
-    (76725, 1982, 1982),
-    (76726, 1982, 1994),
-    (76727, 1976, 1977),
-    (76728, 1975, 1975),
-    (76729, 1962, 1962),
-    (76731, 1970, 1970),
-    (76732, 1993, 1994),
-    (76733, 1972, 1981),
-    (76734, 1975, 1981),
-    (76735, 1970, 1971),
-    (76736, 1978, 1984),
-    (76738, 1948, 1948),
-    (76739, 1977, 1978),
-    (76740, 1968, 1976),
-    (76742, 1983, 1985),
-    (76744, 1950, 1961),
-    (76745, 1951, 1951),
-    (76746, 1972, 1972),
-    (76747, 1967, 1976),
-    (76748, 1987, 1993),
-    (76749, 1946, 1946),
-    (76750, 1967, 1979),
-    (76751, 1965, 1965),
-    (76752, 1988, 1991),
-    (76753, 1975, 1987),
-    (76754, 1975, 1975),
-    (76755, 1970, 1970),
-    (76756, 1973, 1973),
-    (76757, 1946, 1946),
-    (76758, 1957, 1957),
-    (76759, 1968, 1968),
-    (76760, 1953, 1954),
-    (76761, 1973, 1974),
-    (76762, 1946, 1946),
-    (76763, 1947, 1947),
-    (76764, 1946, 1953),
-    (76765, 1980, 1980),
-    (76767, 1976, 1979),
-    (76768, 1949, 1954),
-    (76769, 1947, 1949),
-    (76770, 1988, 1994),
-    (76771, 1976, 1981),
-    (76772, 1993, 1993),
-    (76773, 1948, 1957),
-    (76774, 1958, 1969),
-    (76776, 1946, 1946),
-    (76778, 1948, 1948),
-    (76779, 1949, 1951),
-    (76780, 1946, 1948),
-    (76781, 1979, 1979),
-    (76782, 1987, 1994),
-    (76783, 1955, 1960),
-    (76785, 1982, 1985),
-    (76786, 1980, 1983),
-    (76788, 1969, 1973),
-    (76789, 1972, 1976),
-    (76790, 1988, 1991),
-    (76791, 1983, 1983),
-    (76793, 1973, 1973),
-    (76794, 1949, 1949),
-    (76797, 1950, 1950),
-    (76800, 1953, 1960),
-    (76801, 1990, 1994),
-    (76802, 1976, 1980),
-    (76803, 1989, 1990),
-    (76804, 1976, 1985),
-    (76805, 1946, 1946),
-    (76806, 1972, 1979),
-    (76807, 1971, 1975),
-    (76808, 1949, 1949),
-    (76809, 1963, 1963),
-    (76810, 1983, 1985),
-    (76811, 1949, 1949),
-    (76812, 1988, 1988),
-    (76813, 1946, 1946),
-    (76815, 1969, 1976),
-    (76817, 1970, 1970),
-    (76818, 1946, 1950),
-    (76819, 1978, 1979),
-    (76820, 1948, 1948),
-    (76821, 1990, 1995),
-    (76822, 1977, 1986),
-    (76823, 1949, 1949),
-    (76824, 1985, 1985),
-    (76825, 1971, 1971),
-    (76826, 1980, 1993),
-    (76827, 1990, 1991),
-    (76828, 1955, 1965),
-    (76829, 1946, 1946),
-    (76830, 1977, 1982),
-    (76831, 1986, 1988),
-    (76832, 1965, 1978),
-    (76833, 1946, 1947),
-    (76834, 1984, 1987),
-    (76835, 1949, 1949),
-    (76836, 1946, 1947),
-    (76837, 1953, 1953),
-    (76838, 1948, 1961),
-    (76839, 1993, 1993),
-    (76841, 1988, 1988),
-    (76842, 1991, 1993),
-    (76843, 1967, 1968),
-    (76844, 1990, 1990),
-    (76847, 1983, 1986),
-    (76850, 1949, 1950),
-    (76852, 1993, 1993),
-    (76853, 1972, 1973),
-    (76854, 1949, 1949),
-    (76855, 1984, 1984),
-    (76859, 1967, 1967),
-    (76860, 1974, 1976),
-    (76861, 1984, 1990),
-    (76862, 1988, 1988),
-    (76863, 1946, 1947),
-    (76865, 1969, 1970),
-    (76867, 1959, 1972),
-    (76868, 1985, 1985),
-    (76869, 1985, 1986),
-    (76872, 1972, 1972),
-    (76873, 1976, 1979),
-    (76874, 1977, 1991),
-    (76875, 1991, 1993),
-    (76876, 1983, 1992),
-    (76877, 1956, 1965),
-    (76878, 1976, 1978),
-    (76879, 1978, 1978),
-    (76880, 1963, 1964),
-    (76881, 1979, 1990),
-    (76882, 1958, 1972),
-    (76883, 1968, 1972),
-    (76884, 1985, 1987),
-    (76885, 1982, 1982),
-    (76886, 1953, 1953),
-    (76887, 1975, 1984),
-    (76888, 1977, 1977),
-    (76889, 1976, 1982),
-    (76890, 1980, 1990),
-    (76891, 1954, 1954),
-    (76893, 1946, 1946),
-    (76894, 1952, 1952),
-    (76895, 1975, 1982),
-    (76896, 1964, 1964),
-    (76897, 1949, 1950),
-    (76899, 1977, 1985),
-    (76900, 1959, 1962),
-    (76901, 1981, 1988),
-    (76902, 1956, 1969),
-    (76903, 1993, 1994),
-    (76904, 1992, 1993),
-    (76905, 1946, 1948),
-    (76906, 1962, 1962),
-    (76907, 1949, 1949),
-    (76908, 1966, 1975),
-    (76909, 1946, 1946),
-    (76910, 1976, 1976),
-    (76911, 1989, 1990),
-    (76912, 1956, 1965),
-    (76913, 1981, 1981),
-    (76914, 1949, 1949),
-    (76915, 1968, 1969),
-    (76916, 1964, 1974),
-    (76917, 1975, 1975),
-    (76918, 1946, 1950),
-    (76919, 1960, 1961),
-    (76920, 1948, 1950),
-    (76922, 1968, 1971),
-    (76923, 1971, 1972),
-    (76925, 1949, 1949),
-    (76926, 1967, 1968),
-    (76927, 1948, 1948),
-    (76928, 1979, 1980),
-    (76929, 1958, 1959),
-    (76935, 1946, 1947),
-    (76936, 1973, 1974),
-    (76937, 1949, 1956),
-    (76938, 1952, 1952),
-    (76939, 1953, 1954),
-    (76940, 1975, 1977),
-    (76941, 1978, 1978),
-    (76942, 1983, 1991),
-    (76944, 1980, 1989),
-    (76945, 1963, 1967),
-    (76946, 1962, 1964),
-    (76947, 1980, 1981),
-    (76948, 1978, 1981),
-    (76949, 1949, 1950),
-    (76950, 1963, 1963),
-    (76951, 1968, 1968),
-    (76952, 1994, 1994),
-    (76954, 1980, 1981),
-    (76956, 1968, 1971),
-    (76957, 1974, 1974),
-    (76958, 1955, 1955),
-    (76959, 1949, 1953),
-    (76960, 1985, 1989),
-    (76961, 1990, 1994),
-    (76962, 1949, 1957),
-    (76965, 1967, 1975),
-    (76966, 1977, 1982),
-    (76967, 1949, 1950),
-    (76968, 1982, 1992),
-    (76969, 1958, 1961),
-    (76970, 1962, 1977),
-    (76971, 1974, 1983),
-    (76972, 1969, 1975),
-    (76974, 1949, 1949),
-    (76975, 1975, 1978),
-    (76977, 1959, 1968),
-    (76978, 1973, 1975),
-    (76979, 1968, 1983),
-    (76980, 1981, 1985),
-    (76981, 1970, 1982),
-    (76982, 1948, 1948),
-    (76983, 1964, 1973),
-    (76984, 1969, 1969),
-    (76985, 1970, 1980),
-    (76986, 1954, 1954),
-    (76987, 1995, 1995),
-    (76988, 1956, 1964),
-    (76989, 1955, 1956),
-    (76990, 1986, 1986),
-    (76991, 1987, 1987),
-    (76992, 1985, 1986),
-    (76993, 1979, 1991),
-    (76994, 1986, 1987),
-    (76996, 1974, 1982),
-    (76998, 1955, 1955),
-    (76999, 1952, 1954),
-    (77000, 1970, 1971),
-    (77001, 1985, 1985),
-    (77002, 1986, 1987),
-    (77003, 1993, 1993),
-    (77004, 1948, 1949),
-    (77006, 1949, 1949),
-    (77007, 1946, 1952),
-    (77010, 1978, 1981),
-    (77011, 1946, 1950),
-    (77012, 1965, 1970),
-    (77013, 1968, 1974),
-    (77014, 1947, 1947),
-    (77015, 1963, 1965),
-    (77016, 1947, 1947),
-    (77017, 1976, 1978),
-    (77019, 1982, 1994),
-    (77021, 1978, 1981),
-    (77022, 1979, 1983),
-    (77023, 1962, 1966),
-    (77024, 1976, 1983),
-    (77025, 1961, 1961),
-    (77026, 1963, 1964),
-    (77027, 1946, 1947),
-    (77028, 1976, 1979),
-    (77029, 1971, 1972),
-    (77030, 1983, 1990),
-    (77031, 1946, 1946),
-    (77032, 1951, 1956),
-    (77034, 1982, 1991),
-    (77035, 1946, 1947),
-    (77036, 1947, 1954),
-    (77037, 1966, 1966),
-    (77038, 1962, 1963),
-    (77039, 1948, 1948),
-    (77040, 1979, 1981),
-    (77041, 1949, 1951),
-    (77042, 1975, 1978),
-    (77043, 1975, 1984),
-    (77044, 1978, 1978),
-    (77045, 1952, 1955),
-    (77046, 1970, 1970),
-    (77047, 1984, 1989),
-    (77048, 1947, 1947),
-    (77049, 1956, 1958),
-    (77050, 1948, 1953),
-    (77051, 1963, 1966),
-    (77052, 1956, 1959),
-    (77053, 1987, 1992),
-    (77054, 1987, 1991),
-    (77055, 1955, 1955),
-    (77056, 1980, 1981),
-    (77057, 1988, 1993),
-    (77058, 1961, 1962),
-    (77060, 1989, 1989),
-    (77061, 1968, 1971),
-    (77062, 1953, 1957),
-    (77064, 1994, 1994),
-    (77065, 1991, 1992),
-    (77066, 1970, 1971),
-    (77067, 1976, 1976),
-    (77069, 1978, 1978),
-    (77070, 1959, 1970),
-    (77071, 1979, 1988),
-    (77072, 1947, 1948),
-    (77074, 1966, 1978),
-    (77076, 1985, 1985),
-    (77077, 1987, 1989),
-    (77078, 1976, 1980),
-    (77080, 1970, 1975),
-    (77081, 1984, 1994),
-    (77082, 1957, 1962),
-    (77083, 1991, 1991),
-    (77084, 1964, 1964),
-    (77086, 1946, 1946),
-    (77087, 1979, 1986),
-    (77088, 1947, 1947),
-    (77089, 1951, 1957),
-    (77090, 1950, 1951),
-    (77091, 1970, 1970),
-    (77092, 1982, 1988),
-    (77093, 1960, 1971),
-    (77094, 1973, 1973),
-    (77095, 1957, 1957),
-    (77096, 1989, 1992),
-    (77097, 1976, 1984),
-    (77098, 1991, 1992),
-    (77099, 1967, 1967),
-    (77100, 1980, 1980),
-    (77101, 1974, 1974),
-    (77103, 1964, 1971),
-    (77104, 1987, 1989),
-    (77105, 1986, 1986),
-    (77106, 1967, 1979),
-    (77107, 1984, 1984),
-    (77109, 1993, 1993),
-    (77110, 1981, 1983),
-    (77111, 1974, 1974),
-    (77112, 1946, 1946),
-    (77114, 1990, 1993),
-    (77115, 1974, 1978),
-    (77116, 1948, 1950),
-    (77120, 1946, 1947),
-    (77122, 1949, 1949),
-    (77123, 1946, 1950),
-    (77125, 1947, 1949),
-    (77126, 1979, 1980),
-    (77129, 1990, 1991),
-    (77130, 1986, 1992),
-    (77131, 1958, 1961),
-    (77132, 1948, 1952),
-    (77133, 1972, 1978),
-    (77134, 1981, 1990),
-    (77135, 1981, 1983),
-    (77136, 1978, 1987),
-    (77138, 1992, 1993),
-    (77139, 1949, 1952),
-    (77141, 1976, 1989),
-    (77142, 1979, 1995),
-    (77144, 1977, 1986),
-    (77145, 1989, 1989),
-    (77146, 1981, 1993),
-    (77147, 1970, 1973),
-    (77148, 1978, 1985),
-    (77149, 1972, 1985),
-    (77150, 1963, 1972),
-    (77151, 1946, 1946),
-    (77152, 1970, 1981),
-    (77153, 1987, 1987),
-    (77154, 1985, 1985),
-    (77156, 1977, 1977),
-    (77158, 1980, 1980),
-    (77159, 1979, 1979),
-    (77160, 1977, 1989),
-    (77161, 1966, 1969),
-    (77162, 1972, 1981),
-    (77163, 1980, 1983),
-    (77164, 1968, 1970),
-    (77165, 1960, 1960),
-    (77166, 1986, 1986),
-    (77167, 1979, 1991),
-    (77168, 1974, 1985),
-    (77169, 1951, 1958),
-    (77170, 1989, 1989),
-    (77171, 1982, 1982),
-    (77172, 1960, 1962),
-    (77173, 1986, 1989),
-    (77174, 1994, 1994),
-    (77175, 1976, 1989),
-    (77178, 1984, 1988),
-    (77180, 1988, 1988),
-    (77182, 1973, 1982),
-    (77183, 1984, 1985),
-    (77184, 1980, 1985),
-    (77185, 1971, 1971),
-    (77186, 1974, 1976),
-    (77187, 1967, 1967),
-    (77188, 1958, 1966),
-    (77189, 1979, 1984),
-    (77191, 1984, 1985),
-    (77192, 1976, 1976),
-    (77193, 1976, 1985),
-    (77194, 1976, 1977),
-    (77195, 1967, 1971),
-    (77196, 1957, 1968),
-    (77197, 1975, 1975),
-    (77198, 1964, 1975),
-    (77199, 1949, 1951),
-    (77200, 1964, 1973),
-    (77201, 1976, 1977),
-    (77202, 1960, 1964),
-    (77203, 1982, 1983),
-    (77205, 1977, 1983),
-    (77208, 1992, 1992),
-    (77209, 1980, 1980),
-    (77210, 1956, 1962),
-    (77211, 1947, 1948),
-    (77212, 1946, 1952),
-    (77213, 1946, 1946),
-    (77214, 1985, 1985),
-    (77215, 1978, 1982),
-    (77217, 1948, 1948),
-    (77218, 1948, 1952),
-    (77219, 1954, 1956),
-    (77221, 1946, 1947),
-    (77222, 1946, 1946),
-    (77223, 1976, 1977),
-    (77225, 1946, 1946),
-    (77226, 1948, 1949),
-    (77227, 1968, 1974),
-    (77228, 1946, 1946),
-    (77229, 1980, 1981),
-    (77230, 1954, 1954),
-    (77231, 1958, 1958),
-    (77233, 1985, 1985),
-    (77234, 1946, 1946),
-    (77235, 1975, 1985),
-    (77236, 1982, 1986),
-    (77237, 1946, 1947),
-    (77238, 1948, 1948),
-    (77239, 1979, 1984),
-    (77240, 1973, 1973),
-    (77242, 1974, 1974),
-    (77243, 1976, 1976),
-    (77244, 1968, 1969),
-    (77245, 1960, 1960),
-    (77246, 1976, 1982),
-    (77247, 1953, 1959),
-    (77248, 1954, 1965),
-    (77249, 1949, 1952),
-    (77251, 1990, 1993),
-    (77254, 1993, 1993),
-    (77255, 1979, 1979),
-    (77256, 1951, 1952),
-    (77257, 1970, 1970),
-    (77258, 1979, 1979),
-    (77259, 1966, 1974),
-    (77260, 1990, 1992),
-    (77261, 1989, 1992),
-    (77262, 1980, 1980),
-    (77263, 1981, 1991),
-    (77264, 1977, 1992),
-    (77266, 1954, 1954),
-    (77268, 1951, 1957),
-    (77270, 1963, 1972),
-    (77272, 1959, 1962),
-    (77273, 1979, 1984),
-    (77276, 1946, 1946),
-    (77277, 1948, 1949),
-    (77278, 1948, 1951),
-    (77279, 1961, 1961),
-    (77280, 1986, 1986),
-    (77283, 1948, 1949),
-    (77284, 1947, 1947),
-    (77285, 1949, 1950),
-    (77287, 1954, 1954),
-    (77288, 1970, 1971),
-    (77289, 1977, 1981),
-    (77290, 1976, 1984),
-    (77291, 1946, 1949),
-    (77292, 1953, 1953),
-    (77293, 1968, 1968),
-    (77294, 1987, 1992),
-    (77295, 1963, 1974),
-    (77296, 1949, 1949),
-    (77297, 1964, 1973),
-    (77299, 1964, 1964),
-    (77300, 1982, 1984),
-    (77301, 1989, 1990),
-    (77302, 1974, 1975),
-    (77303, 1948, 1948),
-    (77304, 1946, 1946),
-    (77305, 1973, 1975),
-    (77306, 1979, 1979),
-    (77307, 1964, 1964),
-    (77308, 1978, 1982),
-    (77309, 1948, 1948),
-    (77310, 1948, 1948),
-    (77311, 1957, 1963),
-    (77312, 1980, 1980),
-    (77313, 1966, 1968),
-    (77314, 1975, 1976),
-    (77316, 1969, 1977),
-    (77317, 1949, 1949),
-    (77318, 1983, 1983),
-    (77319, 1949, 1952),
-    (77320, 1977, 1979),
-    (77322, 1947, 1948),
-    (77323, 1973, 1981),
-    (77324, 1976, 1985),
-    (77325, 1975, 1977),
-    (77326, 1970, 1982),
-    (77327, 1960, 1962),
-    (77328, 1977, 1984),
-    (77329, 1946, 1946),
-    (77330, 1976, 1976),
-    (77331, 1975, 1981),
-    (77332, 1981, 1988),
-    (77333, 1986, 1986),
-    (77334, 1977, 1983),
-    (77335, 1988, 1992),
-    (77338, 1968, 1975),
-    (77339, 1961, 1961),
-    (77340, 1959, 1968),
-    (77341, 1975, 1976),
-    (77342, 1967, 1968),
-    (77344, 1977, 1977),
-    (77345, 1949, 1949),
-    (77346, 1949, 1950),
-    (77347, 1950, 1953),
-    (77348, 1980, 1980),
-    (77350, 1971, 1977),
-    (77351, 1972, 1973),
-    (77352, 1956, 1956),
-    (77353, 1979, 1988),
-    (77354, 1989, 1989),
-    (77356, 1978, 1979),
-    (77357, 1966, 1975),
-    (77358, 1991, 1994),
-    (77359, 1960, 1967),
-    (77360, 1975, 1975),
-    (77361, 1985, 1988),
-    (77362, 1990, 1990),
-    (77363, 1981, 1981),
-    (77364, 1976, 1981),
-    (77365, 1972, 1974),
-    (77366, 1949, 1950),
-    (77367, 1946, 1946),
-    (77369, 1967, 1968),
-    (77370, 1989, 1991),
-    (77371, 1956, 1962),
-    (77372, 1988, 1994),
-    (77373, 1980, 1985),
-    (77374, 1989, 1990),
-    (77375, 1948, 1952),
-    (77376, 1982, 1993),
-    (77377, 1982, 1994),
-    (77379, 1948, 1949),
-    (77380, 1966, 1976),
-    (77381, 1946, 1948),
-    (77383, 1987, 1989),
-    (77384, 1987, 1992),
-    (77385, 1967, 1970),
-    (77386, 1990, 1993),
-    (77387, 1989, 1993),
-    (77388, 1974, 1974),
-    (77389, 1982, 1983),
-    (77392, 1949, 1950),
-    (77394, 1950, 1959),
-    (77395, 1981, 1989),
-    (77396, 1976, 1982),
-    (77397, 1952, 1952),
-    (77398, 1988, 1988),
-    (77399, 1983, 1983),
-    (77401, 1981, 1983),
-    (77402, 1950, 1953),
-    (77403, 1946, 1950),
-    (77406, 1967, 1970),
-    (77409, 1955, 1963),
-    (77410, 1967, 1968),
-    (77411, 1962, 1972),
-    (77412, 1966, 1976),
-    (77413, 1971, 1974),
-    (77414, 1953, 1963),
-    (77415, 1983, 1989),
-    (77416, 1971, 1971),
-    (77417, 1948, 1948),
-    (77418, 1963, 1973),
-    (77419, 1976, 1989),
-    (77420, 1976, 1987),
-    (77421, 1961, 1962),
-    (77422, 1953, 1953),
-    (77423, 1946, 1946),
-    (77424, 1974, 1975),
-    (77425, 1948, 1952),
-    (77426, 1991, 1992),
-    (77427, 1969, 1970),
-    (77428, 1973, 1973),
-    (77429, 1949, 1958),
-    (77430, 1954, 1954),
-    (77432, 1979, 1981),
-    (77435, 1981, 1983),
-    (77436, 1949, 1950),
-    (77438, 1980, 1986),
-    (77439, 1948, 1948),
-    (77441, 1950, 1950),
-    (77442, 1982, 1982),
-    (77443, 1946, 1952),
-    (77444, 1952, 1953),
-    (77447, 1948, 1948),
-    (77449, 1976, 1994),
-    (77450, 1979, 1979),
-    (77451, 1973, 1973),
-    (77452, 1948, 1949),
-    (77453, 1946, 1946),
-    (77454, 1967, 1970),
-    (77456, 1983, 1988),
-    (77457, 1959, 1962),
-    (77458, 1946, 1946),
-    (77459, 1970, 1979),
-    (77460, 1989, 1993),
-    (77462, 1947, 1947),
-    (77463, 1966, 1976),
-    (77464, 1970, 1972),
-    (77465, 1977, 1977),
-    (77466, 1971, 1971),
-    (77467, 1954, 1958),
-    (77468, 1973, 1973),
-    (77469, 1985, 1985),
-    (77471, 1946, 1947),
-    (77472, 1986, 1986),
-    (77473, 1946, 1948),
-    (77474, 1989, 1990),
-    (77475, 1972, 1975),
-    (77476, 1986, 1987),
-    (77477, 1954, 1954),
-    (77478, 1993, 1994),
-    (77479, 1961, 1961),
-    (77480, 1949, 1959),
-    (77481, 1985, 1987),
-    (77482, 1952, 1953),
-    (77483, 1970, 1972),
-    (77484, 1980, 1989),
-    (77485, 1946, 1950),
-    (77486, 1992, 1993),
-    (77487, 1977, 1987),
-    (77489, 1968, 1974),
-    (77490, 1976, 1982),
-    (77492, 1975, 1976),
-    (77493, 1991, 1991),
-    (77494, 1975, 1975),
-    (77495, 1980, 1980),
-    (77496, 1990, 1992),
-    (77497, 1949, 1949),
-    (77498, 1972, 1985),
-    (77499, 1954, 1954),
-    (77500, 1957, 1959),
-    (77502, 1989, 1989),
-    (77503, 1946, 1949),
-    (77504, 1976, 1980),
-    (77505, 1969, 1971),
-    (77506, 1956, 1963),
-    (77507, 1946, 1946),
-    (77509, 1985, 1985),
-    (77510, 1976, 1978),
-    (77512, 1952, 1952),
-    (77513, 1951, 1951),
-    (77514, 1952, 1952),
-    (77515, 1980, 1980),
-    (77516, 1984, 1991),
-    (77517, 1972, 1976),
-    (77518, 1983, 1986),
-    (77520, 1981, 1981),
-    (77523, 1971, 1977),
-    (77524, 1985, 1988),
-    (77525, 1974, 1976),
-    (77527, 1981, 1986),
-    (77528, 1975, 1981),
-    (77529, 1948, 1948),
-    (77530, 1981, 1989),
-    (77531, 1962, 1964),
-    (77532, 1975, 1981),
-    (77533, 1965, 1975),
-    (77534, 1971, 1971),
-    (77535, 1973, 1973),
-    (77536, 1951, 1954),
-    (77537, 1949, 1959),
-    (77540, 1971, 1974),
-    (77541, 1981, 1987),
-    (77542, 1986, 1986),
-    (77543, 1967, 1973),
-    (77545, 1989, 1991),
-    (77546, 1946, 1951),
-    (77547, 1978, 1985),
-    (77548, 1964, 1971),
-    (77549, 1952, 1952),
-    (77551, 1952, 1959),
-    (77553, 1975, 1985),
-    (77554, 1970, 1978),
-    (77555, 1958, 1961),
-    (77556, 1949, 1950),
-    (77557, 1947, 1947),
-    (77558, 1982, 1990),
-    (77559, 1950, 1951),
-    (77560, 1985, 1987),
-    (77561, 1973, 1978),
-    (77562, 1960, 1961),
-    (77563, 1954, 1954),
-    (77565, 1986, 1986),
-    (77566, 1965, 1965),
-    (77567, 1972, 1972),
-    (77568, 1946, 1947),
-    (77570, 1971, 1975),
-    (77571, 1989, 1990),
-    (77572, 1949, 1951),
-    (77573, 1952, 1957),
-    (77574, 1947, 1948),
-    (77575, 1973, 1974),
-    (77576, 1966, 1967),
-    (77577, 1946, 1946),
-    (77578, 1971, 1976),
-    (77579, 1955, 1956),
-    (77580, 1971, 1980),
-    (77581, 1949, 1949),
-    (77582, 1975, 1984),
-    (77583, 1962, 1962),
-    (77584, 1961, 1970),
-    (77586, 1975, 1979),
-    (77587, 1946, 1952),
-    (77588, 1983, 1984),
-    (77589, 1946, 1946),
-    (77590, 1948, 1953),
-    (77591, 1970, 1970),
-    (77593, 1949, 1958),
-    (77594, 1949, 1949),
-    (77596, 1963, 1971),
-    (77598, 1946, 1946),
-    (77599, 1952, 1953),
-    (77600, 1946, 1946),
-    (77601, 1967, 1968),
-    (77602, 1980, 1980),
-    (77603, 1983, 1983),
-    (77604, 1946, 1946),
-    (77605, 1948, 1948),
-    (77606, 1946, 1946),
-    (77609, 1985, 1987),
-    (77610, 1951, 1952),
-    (77612, 1972, 1972),
-    (77613, 1947, 1947),
-    (77614, 1988, 1988),
-    (77615, 1978, 1987),
-    (77616, 1949, 1949),
-    (77618, 1969, 1982),
-    (77619, 1952, 1952),
-    (77621, 1977, 1977),
-    (77622, 1946, 1950),
-    (77623, 1979, 1990),
-    (77624, 1953, 1953),
-    (77625, 1966, 1966),
-    (77626, 1979, 1990),
-    (77627, 1974, 1979),
-    (77628, 1991, 1991),
-    (77630, 1962, 1962),
-    (77631, 1952, 1952),
-    (77632, 1987, 1987),
-    (77633, 1980, 1989),
-    (77634, 1954, 1956),
-    (77635, 1980, 1982),
-    (77636, 1968, 1976),
-    (77637, 1987, 1987),
-    (77639, 1960, 1964),
-    (77640, 1982, 1982),
-    (77641, 1970, 1971),
-    (77642, 1946, 1948),
-    (77644, 1993, 1993),
-    (77646, 1949, 1949),
-    (77647, 1992, 1992),
-    (77648, 1954, 1957),
-    (77649, 1989, 1989),
-    (77652, 1988, 1988),
-    (77653, 1977, 1978),
-    (77654, 1985, 1986),
-    (77657, 1950, 1950),
-    (77658, 1966, 1972),
-    (77659, 1949, 1949),
-    (77660, 1946, 1946),
-    (77662, 1964, 1975),
-    (77664, 1990, 1990),
-    (77665, 1946, 1947),
-    (77668, 1976, 1976),
-    (77669, 1970, 1982),
-    (77670, 1984, 1987),
-    (77671, 1946, 1946),
-    (77672, 1946, 1946),
-    (77673, 1987, 1987),
-    (77674, 1987, 1993),
-    (77675, 1950, 1954),
-    (77676, 1966, 1971),
-    (77677, 1946, 1948),
-    (77681, 1952, 1952),
-    (77682, 1954, 1954),
-    (77683, 1949, 1949),
-    (77684, 1948, 1948),
-    (77685, 1981, 1993),
-    (77686, 1948, 1948),
-    (77687, 1964, 1964),
-    (77688, 1972, 1978),
-    (77689, 1976, 1983),
-    (77690, 1995, 1995),
-    (77691, 1979, 1989),
-    (77692, 1980, 1984),
-    (77693, 1956, 1965),
-    (77694, 1988, 1990),
-    (77695, 1953, 1954),
-    (77696, 1972, 1978),
-    (77697, 1982, 1992),
-    (77698, 1946, 1946),
-    (77699, 1971, 1971),
-    (77700, 1962, 1975),
-    (77701, 1973, 1977),
-    (77704, 1987, 1987),
-    (77705, 1976, 1977),
-    (77706, 1961, 1966),
-    (77707, 1982, 1993),
-    (77710, 1971, 1981),
-    (77712, 1968, 1969),
-    (77713, 1948, 1957),
-    (77715, 1980, 1982),
-    (77716, 1968, 1969),
-    (77717, 1948, 1949),
-    (77718, 1980, 1980),
-    (77719, 1981, 1989),
-    (77720, 1989, 1989),
-    (77721, 1977, 1988),
-    (77722, 1955, 1961),
-    (77723, 1947, 1951),
-    (77724, 1949, 1949),
-    (77725, 1953, 1953),
-    (77727, 1961, 1964),
-    (77728, 1946, 1950),
-    (77729, 1974, 1978),
-    (77731, 1982, 1984),
-    (77732, 1979, 1979),
-    (77733, 1971, 1977),
-    (77734, 1946, 1949),
-    (77735, 1946, 1948),
-    (77736, 1948, 1953),
-    (77737, 1962, 1962),
-    (77738, 1986, 1986),
-    (77742, 1952, 1952),
-    (77743, 1951, 1952),
-    (77744, 1947, 1948),
-    (77745, 1948, 1949),
-    (77746, 1949, 1949),
-    (77747, 1969, 1970),
-    (77748, 1970, 1970),
-    (77750, 1946, 1948),
-    (77751, 1960, 1969),
-    (77752, 1947, 1950),
-    (77753, 1950, 1950),
-    (77754, 1980, 1987),
-    (77756, 1976, 1986),
-    (77757, 1980, 1990),
-    (77758, 1949, 1950),
-    (77759, 1975, 1976),
-    (77760, 1978, 1979),
-    (77764, 1949, 1949),
-    (77765, 1962, 1968),
-    (77766, 1969, 1969),
-    (77767, 1952, 1952),
-    (77768, 1968, 1968),
-    (77769, 1949, 1949),
-    (77770, 1980, 1987),
-    (77771, 1988, 1989),
-    (77772, 1961, 1961),
-    (77773, 1950, 1952),
-    (77774, 1946, 1946),
-    (77775, 1951, 1954),
-    (77776, 1990, 1995),
-    (77777, 1992, 1992),
-    (77778, 1949, 1952),
-    (77779, 1949, 1949),
-    (77780, 1952, 1952),
-    (77782, 1977, 1977),
-    (77783, 1949, 1951),
-    (77784, 1973, 1974),
-    (77785, 1991, 1991),
-    (77786, 1976, 1982),
-    (77788, 1976, 1977),
-    (77789, 1990, 1993),
-    (77790, 1948, 1948),
-    (77791, 1954, 1959),
-    (77792, 1958, 1960),
-    (77793, 1946, 1948),
-    (77794, 1990, 1992),
-    (77797, 1948, 1950),
-    (77799, 1955, 1959),
-    (77800, 1976, 1981),
-    (77801, 1949, 1949),
-    (77802, 1958, 1958),
-    (77803, 1946, 1946),
-    (77804, 1949, 1949),
-    (77806, 1946, 1948),
-    (77807, 1946, 1946),
-    (77808, 1980, 1980),
-    (77809, 1949, 1949),
-    (77811, 1967, 1967),
-    (77812, 1971, 1975),
-    (77813, 1972, 1973),
-    (77814, 1957, 1957),
-    (77815, 1968, 1971),
-    (77816, 1957, 1957),
-    (77817, 1976, 1984),
-    (77818, 1956, 1957),
-    (77819, 1979, 1989),
-    (77820, 1983, 1993),
-    (77821, 1949, 1952),
-    (77822, 1989, 1992),
-    (77823, 1971, 1971),
-    (77824, 1951, 1952),
-    (77825, 1946, 1946),
-    (77826, 1946, 1946),
-    (77827, 1979, 1979),
-    (77828, 1948, 1948),
-    (77829, 1979, 1982),
-    (77834, 1949, 1950),
-    (77835, 1970, 1977),
-    (77839, 1984, 1991),
-    (77840, 1968, 1969),
-    (77841, 1949, 1950),
-    (77842, 1963, 1963),
-    (77843, 1953, 1955),
-    (77844, 1970, 1975),
-    (77845, 1989, 1992),
-    (77846, 1993, 1993),
-    (77847, 1954, 1964),
-    (77848, 1978, 1983),
-    (77849, 1953, 1953),
-    (77850, 1949, 1949),
-    (77852, 1985, 1987),
-    (77853, 1947, 1957),
-    (77854, 1982, 1982),
-    (77855, 1961, 1965),
-    (77858, 1978, 1980),
-    (77859, 1951, 1951),
-    (77861, 1983, 1983),
-    (77862, 1956, 1962),
-    (77863, 1983, 1983),
-    (77864, 1982, 1985),
-    (77865, 1984, 1992),
-    (77866, 1986, 1986),
-    (77867, 1948, 1954),
-    (77868, 1952, 1952),
-    (77869, 1975, 1977),
-    (77870, 1984, 1985),
-    (77872, 1988, 1991),
-    (77873, 1977, 1986),
-    (77875, 1971, 1977),
-    (77876, 1972, 1982),
-    (77878, 1969, 1972),
-    (77879, 1982, 1992),
-    (77880, 1988, 1988),
-    (77881, 1986, 1989),
-    (77882, 1980, 1980),
-    (77883, 1972, 1978),
-    (77884, 1970, 1972),
-    (77886, 1952, 1952),
-    (77887, 1949, 1949),
-    (77888, 1948, 1949),
-    (77889, 1948, 1948),
-    (77890, 1992, 1992),
-    (77891, 1946, 1949),
-    (77892, 1968, 1971),
-    (77893, 1989, 1991),
-    (77894, 1969, 1973),
-    (77895, 1948, 1948),
-    (77896, 1981, 1982),
-    (77897, 1978, 1978),
-    (77899, 1961, 1961),
-    (77900, 1952, 1952),
-    (77901, 1957, 1957),
-    (77902, 1951, 1951),
-    (77903, 1952, 1952),
-    (77904, 1981, 1982),
-    (77905, 1981, 1994),
-    (77906, 1959, 1960),
-    (77907, 1954, 1963),
-    (77908, 1948, 1948),
-    (77910, 1980, 1980),
-    (77911, 1980, 1985),
-    (77912, 1951, 1951),
-    (77913, 1949, 1954),
-    (77914, 1973, 1977),
-    (77915, 1972, 1973),
-    (77916, 1983, 1984),
-    (77917, 1971, 1980),
-    (77918, 1949, 1949),
-    (77919, 1956, 1959),
-    (77920, 1980, 1982),
-    (77921, 1968, 1968),
-    (77922, 1953, 1953),
-    (77923, 1973, 1973),
-    (77925, 1953, 1953),
-    (77926, 1978, 1979),
-    (77927, 1958, 1964),
-    (77928, 1965, 1966),
-    (77929, 1964, 1973),
-    (77932, 1955, 1957),
-    (77933, 1950, 1951),
-    (77935, 1967, 1967),
-    (77936, 1977, 1990),
-    (77937, 1980, 1980),
-    (77938, 1947, 1949),
-    (77939, 1987, 1987),
-    (77941, 1951, 1951),
-    (77942, 1946, 1946),
-    (77944, 1974, 1981),
-    (77945, 1969, 1969),
-    (77946, 1985, 1995),
-    (77947, 1952, 1952),
-    (77950, 1979, 1986),
-    (77952, 1978, 1985),
-    (77954, 1959, 1959),
-    (77955, 1955, 1957),
-    (77957, 1971, 1971),
-    (77958, 1946, 1948),
-    (77959, 1950, 1950),
-    (77960, 1972, 1974),
-    (77962, 1967, 1975),
-    (77963, 1970, 1970),
-    (77964, 1972, 1975),
-    (77965, 1971, 1973),
-    (77966, 1968, 1976),
-    (77967, 1948, 1957),
-    (77968, 1948, 1950),
-    (77969, 1988, 1988),
-    (77970, 1988, 1991),
-    (77972, 1947, 1948),
-    (77973, 1969, 1975),
-    (77975, 1977, 1983),
-    (77977, 1960, 1962),
-    (77978, 1976, 1976),
-    (77979, 1948, 1949),
-    (77983, 1977, 1978),
-    (77984, 1978, 1985),
-    (77986, 1979, 1991),
-    (77988, 1966, 1972),
-    (77989, 1978, 1981),
-    (77993, 1974, 1984),
-    (77994, 1982, 1982),
-    (77996, 1980, 1980),
-    (77997, 1975, 1981),
-    (77998, 1976, 1983),
-    (77999, 1947, 1956),
-    (78000, 1975, 1981),
-    (78001, 1947, 1947),
-    (78002, 1947, 1947),
-    (78003, 1958, 1969),
-    (78007, 1986, 1987),
-    (78008, 1976, 1976),
-    (78010, 1953, 1954),
-    (78011, 1963, 1963),
-    (78012, 1948, 1952),
-    (78013, 1958, 1960),
-    (78014, 1977, 1994),
-    (78015, 1980, 1984),
-    (78016, 1988, 1988),
-    (78017, 1946, 1946),
-    (78018, 1957, 1958),
-    (78019, 1946, 1946),
-    (78020, 1954, 1956),
-    (78021, 1989, 1989),
-    (78022, 1987, 1989),
-    (78023, 1946, 1948),
-    (78024, 1946, 1947),
-    (78025, 1976, 1986),
-    (78026, 1946, 1948),
-    (78027, 1986, 1986),
-    (78028, 1971, 1978),
-    (78029, 1988, 1989),
-    (78030, 1985, 1985),
-    (78031, 1987, 1989),
-    (78033, 1949, 1949),
-    (78035, 1989, 1992),
-    (78036, 1978, 1978),
-    (78037, 1962, 1964),
-    (78039, 1970, 1974),
-    (78040, 1959, 1961),
-    (78041, 1981, 1992),
-    (78042, 1967, 1974),
-    (78043, 1946, 1949),
-    (78045, 1966, 1977),
-    (78046, 1972, 1972),
-    (78047, 1974, 1984),
-    (78048, 1982, 1987),
-    (78049, 1956, 1968),
-    (78050, 1946, 1949),
-    (78051, 1946, 1950),
-    (78055, 1983, 1991),
-    (78057, 1978, 1980),
-    (78059, 1982, 1992),
-    (78060, 1960, 1972),
-    (78061, 1955, 1955),
-    (78062, 1984, 1984),
-    (78063, 1949, 1954),
-    (78064, 1957, 1965),
-    (78065, 1974, 1977),
-    (78066, 1951, 1956),
-    (78067, 1950, 1950),
-    (78068, 1980, 1983),
-    (78069, 1972, 1972),
-    (78070, 1947, 1947),
-    (78071, 1948, 1949),
-    (78072, 1955, 1955),
-    (78073, 1946, 1948),
-    (78074, 1949, 1949),
-    (78075, 1949, 1953),
-    (78076, 1949, 1963),
-    (78078, 1946, 1946),
-    (78080, 1984, 1984),
-    (78081, 1966, 1967),
-    (78082, 1950, 1951),
-    (78084, 1968, 1977),
-    (78085, 1948, 1948),
-    (78086, 1950, 1957),
-    (78087, 1982, 1988),
-    (78088, 1969, 1969),
-    (78089, 1946, 1949),
-    (78091, 1949, 1952),
-    (78092, 1946, 1949),
-    (78093, 1984, 1986),
-    (78094, 1946, 1954),
-    (78095, 1977, 1984),
-    (78097, 1971, 1979),
-    (78100, 1961, 1969),
-    (78102, 1985, 1987),
-    (78103, 1975, 1977),
-    (78105, 1975, 1975),
-    (78106, 1955, 1963),
-    (78107, 1949, 1949),
-    (78109, 1949, 1949),
-    (78110, 1986, 1992),
-    (78111, 1976, 1976),
-    (78112, 1949, 1949),
-    (78113, 1954, 1963),
-    (78114, 1946, 1949),
-    (78115, 1946, 1953),
-    (78116, 1984, 1984),
-    (78117, 1947, 1959),
-    (78118, 1946, 1946),
-    (78120, 1949, 1950),
-    (78121, 1961, 1963),
-    (78123, 1946, 1948),
-    (78124, 1948, 1949),
-    (78125, 1951, 1959),
-    (78126, 1950, 1960),
-    (78128, 1956, 1957),
-    (78130, 1946, 1946),
-    (78131, 1946, 1946),
-    (78132, 1980, 1981),
-    (78133, 1976, 1985),
-    (78135, 1977, 1978),
-    (78136, 1982, 1982),
-    (78138, 1975, 1975),
-    (78139, 1978, 1989),
-    (78140, 1989, 1989),
-    (78141, 1948, 1948),
-    (78142, 1954, 1963),
-    (78143, 1975, 1980),
-    (78144, 1972, 1972),
-    (78145, 1973, 1973),
-    (78146, 1980, 1989),
-    (78147, 1963, 1971),
-    (78148, 1946, 1946),
-    (78149, 1977, 1990),
-    (78150, 1976, 1981),
-    (78151, 1964, 1979),
-    (78152, 1970, 1970),
-    (78153, 1946, 1955),
-    (78154, 1946, 1946),
-    (78157, 1976, 1979),
-    (78159, 1968, 1968),
-    (78160, 1961, 1961),
-    (78161, 1977, 1977),
-    (78162, 1986, 1986),
-    (78163, 1951, 1953),
-    (78164, 1984, 1984),
-    (78167, 1976, 1979),
-    (78168, 1974, 1975),
-    (78169, 1951, 1956),
-    (78170, 1962, 1962),
-    (78171, 1951, 1951),
-    (78172, 1982, 1982),
-    (78173, 1965, 1975),
-    (78174, 1984, 1984),
-    (78175, 1988, 1988),
-    (78176, 1946, 1951),
-    (78177, 1948, 1949),
-    (78178, 1961, 1970),
-    (78179, 1989, 1995),
-    (78181, 1986, 1990),
-    (78182, 1946, 1946),
-    (78183, 1982, 1990),
-    (78184, 1974, 1974),
-    (78185, 1948, 1948),
-    (78187, 1953, 1953),
-    (78188, 1971, 1978),
-    (78189, 1970, 1971),
-    (78190, 1968, 1975),
-    (78191, 1981, 1982),
-    (78192, 1986, 1986),
-    (78194, 1991, 1993),
-    (78195, 1980, 1992),
-    (78197, 1989, 1994),
-    (78198, 1986, 1991),
-    (78199, 1974, 1982),
-    (78200, 1971, 1982),
-    (78201, 1992, 1993),
-    (78202, 1969, 1979),
-    (78203, 1959, 1961),
-    (78204, 1977, 1984),
-    (78205, 1978, 1979),
-    (78207, 1971, 1972),
-    (78208, 1976, 1979),
-    (78209, 1961, 1961),
-    (78212, 1953, 1953),
-    (78213, 1966, 1978),
-    (78214, 1949, 1949),
-    (78215, 1975, 1985),
-    (78216, 1956, 1959),
-    (78217, 1974, 1976),
-    (78219, 1965, 1965),
-    (78220, 1970, 1972),
-    (78221, 1946, 1946),
-    (78222, 1979, 1983),
-    (78223, 1957, 1959),
-    (78225, 1948, 1956),
-    (78226, 1946, 1949),
-    (78227, 1992, 1993),
-    (78230, 1946, 1946),
-    (78231, 1967, 1967),
-    (78232, 1954, 1957),
-    (78233, 1981, 1985),
-    (78234, 1948, 1948),
-    (78235, 1948, 1948),
-    (78237, 1974, 1981),
-    (78238, 1965, 1974),
-    (78239, 1972, 1976),
-    (78240, 1949, 1950),
-    (78241, 1984, 1986),
-    (78243, 1976, 1976),
-    (78244, 1958, 1963),
-    (78245, 1971, 1979),
-    (78247, 1988, 1990),
-    (78249, 1955, 1955),
-    (78250, 1982, 1988),
-    (78251, 1992, 1992),
-    (78252, 1959, 1959),
-    (78253, 1970, 1970),
-    (78256, 1956, 1956),
-    (78257, 1983, 1987),
-    (78259, 1961, 1961),
-    (78260, 1962, 1962),
-    (78261, 1985, 1992),
-    (78264, 1985, 1989),
-    (78266, 1946, 1946),
-    (78267, 1972, 1972),
-    (78268, 1965, 1967),
-    (78269, 1970, 1970),
-    (78270, 1963, 1963),
-    (78271, 1987, 1988),
-    (78273, 1991, 1992),
-    (78274, 1980, 1980),
-    (78275, 1947, 1949),
-    (78276, 1946, 1948),
-    (78277, 1970, 1970),
-    (78278, 1953, 1954),
-    (78279, 1983, 1991),
-    (78280, 1952, 1953),
-    (78281, 1983, 1984),
-    (78283, 1958, 1958),
-    (78284, 1953, 1953),
-    (78285, 1962, 1962),
-    (78286, 1994, 1994),
-    (78287, 1946, 1946),
-    (78291, 1947, 1948),
-    (78293, 1986, 1994),
-    (78294, 1976, 1979),
-    (78295, 1988, 1988),
-    (78296, 1976, 1981),
-    (78297, 1989, 1989),
-    (78298, 1970, 1971),
-    (78299, 1982, 1986),
-    (78301, 1989, 1989),
-    (78302, 1976, 1976),
-    (78303, 1982, 1982),
-    (78304, 1982, 1992),
-    (78305, 1976, 1978),
-    (78306, 1972, 1976),
-    (78307, 1980, 1982),
-    (78308, 1976, 1977),
-    (78309, 1963, 1967),
-    (78310, 1978, 1990),
-    (78311, 1984, 1985),
-    (78312, 1956, 1957),
-    (78313, 1972, 1973),
-    (78314, 1982, 1986),
-    (78316, 1991, 1991),
-    (78317, 1990, 1990),
-    (78318, 1981, 1993),
-    (78320, 1983, 1990),
-    (78321, 1970, 1970),
-    (78322, 1975, 1975),
-    (78323, 1984, 1988),
-    (78325, 1982, 1982),
-    (78326, 1976, 1983),
-    (78327, 1974, 1974),
-    (78328, 1964, 1965),
-    (78329, 1993, 1993),
-    (78331, 1978, 1990),
-    (78332, 1983, 1985),
-    (78333, 1991, 1991),
-    (78335, 1963, 1970),
-    (78340, 1947, 1947),
-    (78341, 1948, 1948),
-    (78342, 1962, 1962),
-    (78343, 1982, 1983),
-    (78344, 1947, 1948),
-    (78346, 1949, 1950),
-    (78347, 1988, 1994),
-    (78348, 1981, 1988),
-    (78349, 1974, 1977),
-    (78350, 1970, 1980),
-    (78351, 1980, 1987),
-    (78352, 1985, 1993),
-    (78353, 1948, 1948),
-    (78355, 1947, 1949),
-    (78356, 1979, 1979),
-    (78357, 1946, 1948),
-    (78358, 1962, 1969),
-    (78359, 1951, 1953),
-    (78360, 1948, 1949),
-    (78361, 1976, 1976),
-    (78363, 1948, 1949),
-    (78364, 1982, 1984),
-    (78365, 1978, 1981),
-    (78366, 1971, 1976),
-    (78367, 1968, 1972),
-    (78368, 1948, 1949),
-    (78369, 1981, 1990),
-    (78370, 1972, 1974),
-    (78371, 1956, 1958),
-    (78372, 1967, 1970),
-    (78374, 1954, 1956),
-    (78375, 1982, 1992),
-    (78377, 1986, 1991),
-    (78378, 1981, 1988),
-    (78379, 1989, 1994),
-    (78380, 1954, 1954),
-    (78381, 1984, 1995),
-    (78382, 1961, 1961),
-    (78385, 1967, 1972),
-    (78386, 1984, 1989),
-    (78387, 1976, 1979),
-    (78388, 1955, 1965),
-    (78390, 1978, 1988),
-    (78391, 1957, 1961),
-    (78392, 1968, 1980),
-    (78393, 1953, 1953),
-    (78394, 1988, 1990),
-    (78395, 1981, 1990),
-    (78396, 1980, 1980),
-    (78397, 1970, 1971),
-    (78398, 1965, 1976),
-    (78399, 1965, 1976),
-    (78400, 1976, 1982),
-    (78401, 1946, 1949),
-    (78402, 1947, 1951),
-    (78403, 1995, 1995),
-    (78404, 1980, 1992),
-    (78405, 1949, 1955),
-    (78406, 1969, 1978),
-    (78407, 1985, 1986),
-    (78409, 1962, 1966),
-    (78411, 1946, 1946),
-    (78413, 1973, 1973),
-    (78414, 1981, 1986),
-    (78415, 1992, 1992),
-    (78416, 1991, 1991),
-    (78417, 1985, 1991),
-    (78418, 1981, 1989),
-    (78419, 1989, 1989),
-    (78420, 1949, 1949),
-    (78421, 1989, 1991),
-    (78422, 1949, 1949),
-    (78423, 1981, 1987),
-    (78425, 1980, 1980),
-    (78426, 1987, 1989),
-    (78427, 1949, 1949),
-    (78428, 1949, 1949),
-    (78429, 1987, 1990),
-    (78430, 1983, 1987),
-    (78431, 1978, 1979),
-    (78432, 1969, 1976),
-    (78433, 1976, 1976),
-    (78434, 1948, 1951),
-    (78435, 1962, 1974),
-    (78436, 1974, 1983),
-    (78437, 1983, 1992),
-    (78438, 1961, 1961),
-    (78439, 1967, 1975),
-    (78440, 1986, 1994),
-    (78441, 1977, 1977),
-    (78442, 1976, 1983),
-    (78443, 1946, 1946),
-    (78444, 1968, 1968),
-    (78445, 1987, 1987),
-    (78446, 1957, 1957),
-    (78447, 1949, 1954),
-    (78448, 1953, 1953),
-    (78449, 1976, 1980),
-    (78450, 1974, 1986),
-    (78453, 1948, 1956),
-    (78454, 1974, 1974),
-    (78455, 1963, 1966),
-    (78456, 1976, 1976),
-    (78457, 1966, 1967),
-    (78458, 1962, 1966),
-    (78459, 1965, 1968),
-    (78460, 1970, 1976),
-    (78461, 1969, 1973),
-    (78462, 1982, 1985),
-    (78463, 1986, 1987),
-    (78464, 1987, 1992),
-    (78465, 1986, 1988),
-    (78466, 1965, 1975),
-    (78467, 1973, 1987),
-    (78468, 1976, 1981),
-    (78469, 1970, 1971),
-    (78470, 1974, 1974),
-    (78471, 1977, 1978),
-    (78473, 1973, 1978),
-    (78474, 1965, 1966),
-    (78475, 1973, 1979),
-    (78477, 1970, 1971),
-    (78478, 1992, 1992),
-    (78479, 1946, 1946),
-    (78481, 1976, 1986),
-    (78482, 1974, 1986),
-    (78483, 1948, 1948),
-    (78484, 1983, 1983),
-    (78485, 1965, 1976),
-    (78486, 1967, 1967),
-    (78488, 1974, 1974),
-    (78489, 1962, 1962),
-    (78492, 1993, 1993),
-    (78494, 1946, 1947),
-    (78495, 1966, 1975),
-    (78497, 1960, 1973),
-    (78499, 1967, 1967),
-    (78500, 1972, 1983),
-    (78501, 1967, 1975),
-    (78504, 1987, 1988),
-    (78506, 1954, 1954),
-    (78507, 1987, 1988),
-    (78508, 1970, 1970),
-    (78509, 1962, 1963),
-    (78510, 1969, 1980),
-    (78512, 1982, 1986),
-    (78513, 1975, 1980),
-    (78514, 1987, 1987),
-    (78515, 1984, 1985),
-    (78516, 1978, 1988),
-    (78519, 1980, 1981),
-    (78520, 1971, 1980),
-    (78521, 1949, 1949),
-    (78522, 1961, 1961),
-    (78523, 1983, 1991),
-    (78524, 1967, 1968),
-    (78525, 1948, 1949),
-    (78526, 1962, 1965),
-    (78527, 1980, 1981),
-    (78528, 1988, 1994),
-    (78529, 1957, 1960),
-    (78530, 1960, 1974),
-    (78531, 1976, 1982),
-    (78532, 1974, 1985),
-    (78533, 1980, 1982),
-    (78534, 1984, 1992),
-    (78537, 1980, 1985),
-    (78538, 1984, 1984),
-    (78539, 1967, 1973),
-    (78540, 1969, 1970),
-    (78541, 1976, 1976),
-    (78543, 1968, 1968),
-    (78545, 1979, 1979),
-    (78546, 1974, 1978),
-    (78547, 1976, 1977),
-    (78548, 1978, 1985),
-    (78549, 1975, 1986),
-    (78550, 1984, 1985),
-    (78554, 1986, 1994),
-    (78555, 1990, 1993),
-    (78556, 1983, 1988),
-    (78558, 1989, 1989),
-    (78560, 1970, 1973),
-    (78561, 1971, 1978),
-    (78563, 1982, 1982),
-    (78564, 1955, 1956),
-    (78565, 1982, 1983),
-    (78566, 1985, 1986),
-    (78567, 1968, 1975),
-    (78568, 1968, 1969),
-    (78569, 1981, 1984),
-    (78570, 1979, 1985),
-    (78571, 1977, 1986),
-    (78573, 1948, 1948),
-    (78574, 1970, 1970),
-    (78575, 1976, 1980),
-    (78577, 1975, 1983),
-    (78578, 1984, 1986),
-    (78579, 1964, 1970),
-    (78580, 1971, 1971),
-    (78581, 1983, 1986),
-    (78582, 1987, 1987),
-    (78583, 1978, 1979),
-    (78584, 1987, 1987),
-    (78585, 1974, 1977),
-    (78586, 1951, 1951),
-    (78587, 1979, 1979),
-    (78589, 1990, 1992),
-    (78590, 1959, 1959),
-    (78591, 1963, 1963),
-    (78592, 1969, 1975),
-    (78596, 1972, 1975),
-    (78597, 1970, 1970),
-    (78600, 1974, 1982),
-    (78601, 1985, 1985),
-    (78602, 1976, 1977),
-    (78603, 1973, 1975),
-    (78605, 1981, 1981),
-    (78606, 1971, 1977),
-    (78609, 1981, 1981),
-    (78610, 1981, 1986),
-    (78611, 1984, 1990),
-    (78612, 1949, 1949),
-    (78614, 1980, 1990),
-    (78615, 1981, 1993),
-    (78616, 1952, 1953),
-    (78617, 1967, 1969),
-    (78618, 1980, 1981),
-    (78620, 1986, 1987),
-    (78621, 1990, 1992),
-    (78622, 1972, 1972),
-    (78623, 1976, 1981),
-    (78627, 1990, 1990),
-    (78628, 1953, 1959),
-    (78629, 1971, 1971),
-    (78630, 1961, 1961),
-    (78631, 1971, 1971),
-    (78632, 1981, 1981),
-    (78633, 1984, 1994),
-    (78634, 1984, 1989),
-    (78635, 1986, 1986),
-    (78638, 1946, 1955),
-    (78639, 1952, 1954),
-    (78640, 1961, 1961),
-    (78641, 1970, 1971),
-    (78642, 1946, 1946),
-    (78643, 1979, 1979),
-    (78644, 1987, 1987),
-    (78647, 1982, 1982),
-    (78648, 1970, 1970),
-    (78650, 1948, 1948),
-    (78651, 1964, 1972),
-    (78653, 1949, 1949),
-    (78654, 1988, 1988),
-    (78656, 1985, 1992),
-    (90000, 1983, 1983),
-    (100263, 1980, 1993),
-    (101106, 2005, 2018),
-    (101107, 2005, 2019),
-    (101108, 2005, 2025),
-    (101109, 2005, 2018),
-    (101110, 2005, 2014),
-    (101111, 2005, 2015),
-    (101112, 2005, 2018),
-    (101113, 2005, 2011),
-    (101114, 2005, 2016),
-    (101115, 2005, 2013),
-    (101117, 2005, 2006),
-    (101118, 2005, 2009),
-    (101119, 2005, 2008),
-    (101120, 2005, 2010),
-    (101121, 2005, 2010),
-    (101122, 2005, 2014),
-    (101123, 2005, 2018),
-    (101124, 2005, 2012),
-    (101125, 2005, 2006),
-    (101126, 2005, 2015),
-    (101127, 2005, 2017),
-    (101128, 2005, 2014),
-    (101129, 2005, 2010),
-    (101130, 2005, 2012),
-    (101131, 2005, 2014),
-    (101132, 2005, 2012),
-    (101133, 2007, 2019),
-    (101134, 2005, 2006),
-    (101135, 2005, 2016),
-    (101136, 2005, 2008),
-    (101137, 2005, 2006),
-    (101138, 2005, 2016),
-    (101139, 2005, 2021),
-    (101141, 2006, 2020),
-    (101142, 2005, 2014),
-    (101143, 2005, 2009),
-    (101144, 2005, 2011),
-    (101145, 2005, 2016),
-    (101146, 2008, 2009),
-    (101147, 2005, 2005),
-    (101148, 2006, 2006),
-    (101149, 2005, 2006),
-    (101150, 2005, 2021),
-    (101152, 2005, 2006),
-    (101153, 2006, 2012),
-    (101154, 2005, 2013),
-    (101155, 2005, 2013),
-    (101156, 2005, 2005),
-    (101158, 2005, 2010),
-    (101159, 2005, 2006),
-    (101160, 2005, 2006),
-    (101161, 2005, 2018),
-    (101162, 2007, 2018),
-    (101165, 2005, 2008),
-    (101166, 2006, 2006),
-    (101177, 2005, 2010),
-    (101178, 2005, 2005),
-    (101179, 2005, 2016),
-    (101180, 2005, 2006),
-    (101181, 2005, 2018),
-    (101182, 2005, 2006),
-    (101183, 2005, 2014),
-    (101184, 2005, 2005),
-    (101185, 2005, 2006),
-    (101187, 2005, 2016),
-    (101188, 2005, 2005),
-    (101189, 2005, 2011),
-    (101190, 2005, 2005),
-    (101194, 2005, 2008),
-    (101195, 2005, 2006),
-    (101198, 2005, 2014),
-    (101204, 2005, 2012),
-    (101207, 2005, 2005),
-    (101209, 2005, 2005),
-    (101211, 2005, 2010),
-    (101212, 2005, 2006),
-    (101213, 2005, 2005),
-    (101214, 2008, 2010),
-    (101215, 2006, 2012),
-    (101219, 2005, 2005),
-    (101223, 2005, 2005),
-    (101230, 2005, 2005),
-    (101232, 2006, 2006),
-    (101235, 2006, 2011),
-    (101236, 2005, 2015),
-    (101238, 2005, 2005),
-    (101247, 2007, 2007),
-    (101249, 2005, 2016),
-    (101261, 2005, 2007),
-    (200081, 2007, 2011),
-    (200603, 1992, 1993),
-    (200745, 2006, 2015),
-    (200746, 2006, 2021),
-    (200747, 2006, 2009),
-    (200748, 2006, 2014),
-    (200749, 2006, 2011),
-    (200750, 2006, 2012),
-    (200751, 2006, 2016),
-    (200752, 2006, 2022),
-    (200753, 2006, 2009),
-    (200754, 2006, 2008),
-    (200755, 2006, 2020),
-    (200756, 2006, 2013),
-    (200757, 2006, 2019),
-    (200758, 2006, 2013),
-    (200759, 2006, 2008),
-    (200760, 2006, 2010),
-    (200761, 2006, 2014),
-    (200762, 2007, 2009),
-    (200763, 2006, 2008),
-    (200764, 2006, 2011),
-    (200765, 2006, 2021),
-    (200766, 2006, 2009),
-    (200767, 2006, 2009),
-    (200768, 2006, 2026),
-    (200769, 2006, 2014),
-    (200770, 2006, 2016),
-    (200771, 2006, 2016),
-    (200772, 2006, 2010),
-    (200776, 2006, 2009),
-    (200777, 2012, 2014),
-    (200778, 2006, 2012),
-    (200779, 2006, 2016),
-    (200780, 2006, 2013),
-    (200781, 2006, 2009),
-    (200782, 2006, 2024),
-    (200783, 2006, 2011),
-    (200784, 2006, 2007),
-    (200785, 2007, 2007),
-    (200786, 2006, 2006),
-    (200788, 2006, 2007),
-    (200789, 2006, 2012),
-    (200790, 2006, 2007),
-    (200792, 2006, 2009),
-    (200793, 2006, 2008),
-    (200794, 2006, 2021),
-    (200796, 2006, 2010),
-    (200797, 2006, 2015),
-    (200798, 2007, 2008),
-    (200799, 2007, 2007),
-    (200801, 2006, 2008),
-    (200806, 2006, 2006),
-    (200807, 2006, 2006),
-    (200809, 2006, 2012),
-    (200810, 2006, 2006),
-    (200811, 2006, 2015),
-    (200814, 2006, 2008),
-    (200816, 2006, 2007),
-    (200817, 2010, 2010),
-    (200818, 2006, 2007),
-    (200821, 2006, 2009),
-    (200822, 2006, 2010),
-    (200823, 2006, 2006),
-    (200826, 2006, 2019),
-    (200827, 2007, 2007),
-    (200829, 2006, 2006),
-    (200835, 2006, 2008),
-    (200837, 2006, 2006),
-    (200838, 2006, 2006),
-    (200839, 2007, 2013),
-    (200840, 2006, 2006),
-    (200841, 2006, 2006),
-    (200848, 2006, 2006),
-    (200970, 2006, 2006),
-    (200971, 2008, 2008),
-    (200978, 2006, 2008),
-    (200984, 2007, 2007),
-    (201041, 2011, 2011),
-    (201043, 2006, 2009),
-    (201141, 2007, 2013),
-    (201142, 2007, 2026),
-    (201143, 2007, 2026),
-    (201144, 2007, 2026),
-    (201145, 2007, 2026),
-    (201146, 2007, 2011),
-    (201147, 2007, 2019),
-    (201148, 2007, 2017),
-    (201149, 2007, 2019),
-    (201150, 2007, 2016),
-    (201151, 2007, 2010),
-    (201152, 2007, 2023),
-    (201153, 2007, 2010),
-    (201154, 2007, 2010),
-    (201155, 2007, 2016),
-    (201156, 2007, 2018),
-    (201157, 2007, 2011),
-    (201158, 2007, 2019),
-    (201159, 2007, 2009),
-    (201160, 2007, 2018),
-    (201161, 2007, 2012),
-    (201162, 2007, 2020),
-    (201163, 2007, 2019),
-    (201164, 2008, 2011),
-    (201165, 2007, 2011),
-    (201166, 2007, 2017),
-    (201167, 2007, 2017),
-    (201168, 2010, 2016),
-    (201169, 2007, 2009),
-    (201171, 2007, 2015),
-    (201172, 2007, 2008),
-    (201173, 2007, 2008),
-    (201174, 2007, 2007),
-    (201175, 2007, 2014),
-    (201176, 2007, 2008),
-    (201177, 2007, 2017),
-    (201178, 2007, 2011),
-    (201180, 2008, 2008),
-    (201181, 2007, 2009),
-    (201182, 2011, 2011),
-    (201186, 2007, 2007),
-    (201187, 2007, 2012),
-    (201188, 2008, 2020),
-    (201189, 2007, 2013),
-    (201191, 2007, 2009),
-    (201192, 2007, 2007),
-    (201193, 2007, 2008),
-    (201195, 2007, 2007),
-    (201196, 2007, 2017),
-    (201199, 2007, 2007),
-    (201202, 2007, 2016),
-    (201203, 2009, 2013),
-    (201207, 2007, 2009),
-    (201208, 2007, 2011),
-    (201228, 2007, 2016),
-    (201229, 2008, 2020),
-    (201234, 2008, 2011),
-    (201235, 2007, 2008),
-    (201238, 2007, 2010),
-    (201242, 2007, 2008),
-    (201274, 2011, 2012),
-    (201281, 2017, 2018),
-    (201286, 2011, 2011),
-    (201291, 2011, 2011),
-    (201336, 2007, 2011),
-    (201446, 2008, 2008),
-    (201563, 2008, 2018),
-    (201564, 2008, 2015),
-    (201565, 2008, 2023),
-    (201566, 2008, 2026),
-    (201567, 2008, 2026),
-    (201568, 2008, 2023),
-    (201569, 2008, 2025),
-    (201570, 2008, 2009),
-    (201571, 2008, 2022),
-    (201572, 2008, 2026),
-    (201573, 2008, 2018),
-    (201574, 2008, 2015),
-    (201575, 2008, 2016),
-    (201576, 2008, 2013),
-    (201577, 2008, 2023),
-    (201578, 2008, 2017),
-    (201579, 2008, 2016),
-    (201580, 2008, 2023),
-    (201581, 2008, 2015),
-    (201582, 2008, 2017),
-    (201583, 2008, 2019),
-    (201584, 2008, 2019),
-    (201585, 2008, 2018),
-    (201586, 2009, 2022),
-    (201587, 2008, 2026),
-    (201588, 2008, 2022),
-    (201589, 2008, 2017),
-    (201590, 2008, 2012),
-    (201591, 2008, 2013),
-    (201592, 2008, 2009),
-    (201593, 2010, 2016),
-    (201594, 2008, 2008),
-    (201595, 2008, 2014),
-    (201596, 2008, 2017),
-    (201599, 2008, 2026),
-    (201600, 2010, 2017),
-    (201601, 2008, 2019),
-    (201602, 2008, 2010),
-    (201603, 2008, 2015),
-    (201604, 2008, 2014),
-    (201605, 2008, 2009),
-    (201606, 2008, 2008),
-    (201607, 2010, 2010),
-    (201609, 2008, 2022),
-    (201611, 2008, 2014),
-    (201612, 2008, 2009),
-    (201616, 2008, 2010),
-    (201619, 2015, 2015),
-    (201621, 2008, 2008),
-    (201623, 2010, 2011),
-    (201627, 2008, 2016),
-    (201628, 2008, 2017),
-    (201629, 2008, 2009),
-    (201631, 2008, 2008),
-    (201632, 2008, 2012),
-    (201633, 2008, 2009),
-    (201634, 2008, 2008),
-    (201785, 2009, 2013),
-    (201802, 2009, 2009),
-    (201805, 2008, 2009),
-    (201814, 2010, 2011),
-    (201821, 2009, 2009),
-    (201858, 2008, 2014),
-    (201880, 2009, 2014),
-    (201933, 2009, 2022),
-    (201934, 2009, 2013),
-    (201935, 2009, 2026),
-    (201936, 2009, 2018),
-    (201937, 2011, 2022),
-    (201938, 2009, 2011),
-    (201939, 2009, 2026),
-    (201941, 2009, 2016),
-    (201942, 2009, 2025),
-    (201943, 2009, 2017),
-    (201944, 2009, 2012),
-    (201945, 2009, 2016),
-    (201946, 2009, 2015),
-    (201947, 2009, 2014),
-    (201948, 2009, 2014),
-    (201949, 2009, 2024),
-    (201950, 2009, 2026),
-    (201951, 2009, 2017),
-    (201952, 2009, 2020),
-    (201953, 2009, 2013),
-    (201954, 2009, 2021),
-    (201956, 2009, 2018),
-    (201957, 2009, 2013),
-    (201958, 2009, 2012),
-    (201959, 2009, 2026),
-    (201960, 2009, 2019),
-    (201961, 2009, 2021),
-    (201962, 2009, 2016),
-    (201963, 2010, 2011),
-    (201964, 2012, 2014),
-    (201965, 2009, 2015),
-    (201966, 2009, 2010),
-    (201967, 2009, 2018),
-    (201969, 2009, 2012),
-    (201970, 2009, 2012),
-    (201971, 2009, 2015),
-    (201972, 2009, 2011),
-    (201973, 2009, 2018),
-    (201974, 2009, 2011),
-    (201975, 2009, 2018),
-    (201976, 2012, 2023),
-    (201977, 2009, 2016),
-    (201978, 2009, 2015),
-    (201979, 2013, 2014),
-    (201980, 2009, 2023),
-    (201981, 2009, 2009),
-    (201985, 2009, 2014),
-    (201986, 2012, 2013),
-    (201987, 2010, 2010),
-    (201988, 2009, 2024),
-    (201991, 2009, 2014),
-    (201998, 2009, 2009),
-    (202066, 2009, 2026),
-    (202067, 2011, 2011),
-    (202068, 2009, 2009),
-    (202070, 2009, 2009),
-    (202077, 2012, 2014),
-    (202079, 2009, 2009),
-    (202081, 2010, 2010),
-    (202082, 2010, 2011),
-    (202083, 2009, 2023),
-    (202087, 2009, 2016),
-    (202091, 2013, 2013),
-    (202130, 2009, 2016),
-    (202132, 2009, 2009),
-    (202148, 2011, 2011),
-    (202178, 2009, 2011),
-    (202197, 2013, 2013),
-    (202220, 2010, 2010),
-    (202221, 2009, 2009),
-    (202227, 2011, 2012),
-    (202238, 2009, 2009),
-    (202322, 2010, 2022),
-    (202323, 2010, 2019),
-    (202324, 2010, 2021),
-    (202325, 2010, 2018),
-    (202326, 2010, 2021),
-    (202327, 2010, 2018),
-    (202328, 2010, 2021),
-    (202329, 2010, 2020),
-    (202330, 2010, 2023),
-    (202331, 2010, 2026),
-    (202332, 2010, 2017),
-    (202333, 2010, 2014),
-    (202334, 2010, 2021),
-    (202335, 2010, 2020),
-    (202336, 2010, 2016),
-    (202337, 2010, 2017),
-    (202338, 2010, 2016),
-    (202339, 2010, 2021),
-    (202340, 2010, 2021),
-    (202341, 2010, 2015),
-    (202342, 2010, 2011),
-    (202343, 2010, 2015),
-    (202344, 2010, 2017),
-    (202345, 2010, 2013),
-    (202346, 2010, 2012),
-    (202347, 2010, 2018),
-    (202348, 2010, 2017),
-    (202349, 2010, 2016),
-    (202350, 2010, 2013),
-    (202351, 2010, 2012),
-    (202353, 2015, 2015),
-    (202354, 2010, 2013),
-    (202355, 2010, 2021),
-    (202356, 2010, 2011),
-    (202357, 2015, 2021),
-    (202358, 2010, 2010),
-    (202359, 2011, 2011),
-    (202360, 2010, 2010),
-    (202361, 2010, 2014),
-    (202362, 2010, 2021),
-    (202363, 2012, 2013),
-    (202364, 2010, 2010),
-    (202365, 2010, 2012),
-    (202366, 2011, 2014),
-    (202371, 2010, 2010),
-    (202374, 2010, 2011),
-    (202375, 2010, 2010),
-    (202376, 2010, 2011),
-    (202377, 2010, 2010),
-    (202378, 2010, 2010),
-    (202379, 2010, 2017),
-    (202380, 2010, 2013),
-    (202382, 2010, 2010),
-    (202385, 2011, 2011),
-    (202386, 2010, 2011),
-    (202388, 2011, 2015),
-    (202389, 2010, 2018),
-    (202390, 2010, 2016),
-    (202391, 2010, 2018),
-    (202392, 2010, 2010),
-    (202395, 2010, 2010),
-    (202396, 2010, 2012),
-    (202397, 2010, 2023),
-    (202399, 2010, 2014),
-    (202406, 2011, 2011),
-    (202407, 2014, 2016),
-    (202408, 2010, 2010),
-    (202412, 2010, 2016),
-    (202419, 2010, 2012),
-    (202458, 2011, 2012),
-    (202498, 2011, 2019),
-    (202536, 2011, 2011),
-    (202545, 2012, 2012),
-    (202620, 2013, 2016),
-    (202622, 2011, 2011),
-    (202681, 2011, 2026),
-    (202682, 2011, 2017),
-    (202683, 2011, 2021),
-    (202684, 2011, 2024),
-    (202685, 2012, 2026),
-    (202686, 2011, 2013),
-    (202687, 2011, 2026),
-    (202688, 2011, 2021),
-    (202689, 2011, 2022),
-    (202690, 2011, 2018),
-    (202691, 2011, 2026),
-    (202692, 2011, 2024),
-    (202693, 2011, 2024),
-    (202694, 2011, 2023),
-    (202695, 2011, 2026),
-    (202696, 2011, 2026),
-    (202697, 2011, 2020),
-    (202698, 2011, 2013),
-    (202699, 2011, 2026),
-    (202700, 2012, 2018),
-    (202701, 2011, 2012),
-    (202702, 2011, 2018),
-    (202703, 2014, 2018),
-    (202704, 2011, 2024),
-    (202705, 2011, 2018),
-    (202706, 2011, 2015),
-    (202707, 2011, 2011),
-    (202708, 2011, 2016),
-    (202709, 2011, 2024),
-    (202710, 2011, 2026),
-    (202711, 2014, 2023),
-    (202712, 2011, 2016),
-    (202713, 2012, 2017),
-    (202714, 2011, 2018),
-    (202715, 2011, 2012),
-    (202716, 2011, 2011),
-    (202717, 2011, 2011),
-    (202718, 2011, 2019),
-    (202719, 2011, 2013),
-    (202720, 2011, 2018),
-    (202721, 2011, 2014),
-    (202722, 2016, 2023),
-    (202723, 2011, 2014),
-    (202724, 2011, 2012),
-    (202725, 2011, 2013),
-    (202726, 2011, 2015),
-    (202727, 2011, 2011),
-    (202728, 2011, 2011),
-    (202729, 2011, 2012),
-    (202730, 2011, 2016),
-    (202731, 2011, 2011),
-    (202732, 2011, 2017),
-    (202734, 2011, 2020),
-    (202738, 2011, 2023),
-    (202775, 2011, 2011),
-    (202779, 2013, 2017),
-    (202809, 2011, 2012),
-    (202810, 2011, 2011),
-    (202814, 2011, 2011),
-    (202862, 2011, 2011),
-    (202874, 2011, 2013),
-    (202880, 2011, 2011),
-    (202918, 2011, 2017),
-    (202933, 2011, 2017),
-    (202951, 2011, 2019),
-    (202952, 2011, 2014),
-    (202954, 2018, 2021),
-    (202962, 2011, 2015),
-    (202970, 2011, 2013),
-    (203006, 2012, 2012),
-    (203076, 2012, 2026),
-    (203077, 2012, 2019),
-    (203078, 2012, 2026),
-    (203079, 2012, 2019),
-    (203080, 2012, 2016),
-    (203081, 2012, 2026),
-    (203082, 2012, 2022),
-    (203083, 2012, 2026),
-    (203084, 2012, 2026),
-    (203085, 2012, 2022),
-    (203086, 2012, 2022),
-    (203087, 2012, 2021),
-    (203088, 2012, 2015),
-    (203089, 2012, 2019),
-    (203090, 2012, 2021),
-    (203091, 2012, 2013),
-    (203092, 2012, 2019),
-    (203093, 2012, 2018),
-    (203094, 2012, 2016),
-    (203095, 2012, 2023),
-    (203096, 2012, 2016),
-    (203097, 2012, 2012),
-    (203098, 2012, 2018),
-    (203099, 2012, 2015),
-    (203100, 2012, 2015),
-    (203101, 2012, 2018),
-    (203102, 2012, 2013),
-    (203103, 2012, 2014),
-    (203104, 2012, 2017),
-    (203105, 2012, 2016),
-    (203106, 2012, 2014),
-    (203107, 2016, 2021),
-    (203108, 2012, 2014),
-    (203109, 2012, 2024),
-    (203110, 2012, 2026),
-    (203111, 2012, 2015),
-    (203112, 2012, 2018),
-    (203113, 2012, 2014),
-    (203114, 2012, 2026),
-    (203115, 2012, 2022),
-    (203116, 2012, 2013),
-    (203117, 2012, 2013),
-    (203118, 2012, 2020),
-    (203119, 2012, 2012),
-    (203120, 2013, 2016),
-    (203121, 2012, 2020),
-    (203122, 2012, 2012),
-    (203123, 2014, 2015),
-    (203124, 2012, 2019),
-    (203126, 2012, 2012),
-    (203128, 2014, 2014),
-    (203129, 2012, 2013),
-    (203130, 2012, 2013),
-    (203133, 2013, 2014),
-    (203135, 2012, 2015),
-    (203136, 2013, 2014),
-    (203138, 2013, 2016),
-    (203139, 2012, 2013),
-    (203141, 2012, 2017),
-    (203142, 2012, 2015),
-    (203143, 2012, 2015),
-    (203144, 2012, 2014),
-    (203145, 2012, 2021),
-    (203146, 2012, 2013),
-    (203147, 2013, 2013),
-    (203148, 2012, 2016),
-    (203156, 2012, 2015),
-    (203158, 2012, 2012),
-    (203159, 2012, 2018),
-    (203162, 2012, 2012),
-    (203183, 2013, 2013),
-    (203186, 2012, 2017),
-    (203187, 2012, 2015),
-    (203197, 2012, 2013),
-    (203199, 2012, 2012),
-    (203200, 2012, 2023),
-    (203203, 2012, 2012),
-    (203210, 2014, 2022),
-    (203263, 2013, 2020),
-    (203268, 2013, 2015),
-    (203315, 2013, 2014),
-    (203317, 2012, 2012),
-    (203318, 2013, 2014),
-    (203382, 2012, 2020),
-    (203457, 2013, 2022),
-    (203458, 2013, 2024),
-    (203459, 2013, 2019),
-    (203460, 2013, 2020),
-    (203461, 2013, 2016),
-    (203462, 2013, 2016),
-    (203463, 2013, 2021),
-    (203464, 2017, 2017),
-    (203467, 2013, 2013),
-    (203468, 2013, 2026),
-    (203469, 2013, 2023),
-    (203471, 2013, 2026),
-    (203473, 2013, 2022),
-    (203474, 2013, 2018),
-    (203475, 2014, 2015),
-    (203476, 2013, 2022),
-    (203477, 2013, 2018),
-    (203479, 2013, 2014),
-    (203480, 2013, 2013),
-    (203481, 2013, 2017),
-    (203482, 2013, 2026),
-    (203484, 2013, 2026),
-    (203485, 2013, 2018),
-    (203486, 2013, 2026),
-    (203487, 2013, 2022),
-    (203488, 2013, 2023),
-    (203489, 2013, 2017),
-    (203490, 2013, 2023),
-    (203491, 2013, 2013),
-    (203492, 2013, 2015),
-    (203493, 2013, 2023),
-    (203495, 2013, 2014),
-    (203496, 2013, 2023),
-    (203497, 2013, 2026),
-    (203498, 2013, 2017),
-    (203499, 2013, 2017),
-    (203500, 2013, 2026),
-    (203501, 2013, 2026),
-    (203502, 2013, 2013),
-    (203503, 2013, 2021),
-    (203504, 2013, 2021),
-    (203505, 2013, 2017),
-    (203506, 2013, 2022),
-    (203507, 2013, 2026),
-    (203508, 2013, 2015),
-    (203510, 2016, 2016),
-    (203511, 2013, 2014),
-    (203512, 2014, 2017),
-    (203513, 2013, 2013),
-    (203515, 2013, 2015),
-    (203516, 2014, 2021),
-    (203517, 2013, 2013),
-    (203518, 2016, 2018),
-    (203519, 2013, 2013),
-    (203521, 2013, 2022),
-    (203524, 2013, 2021),
-    (203526, 2015, 2022),
-    (203527, 2013, 2016),
-    (203530, 2014, 2017),
-    (203539, 2013, 2014),
-    (203540, 2013, 2014),
-    (203543, 2013, 2013),
-    (203544, 2013, 2014),
-    (203545, 2013, 2014),
-    (203546, 2013, 2018),
-    (203548, 2013, 2013),
-    (203552, 2013, 2026),
-    (203561, 2013, 2014),
-    (203564, 2014, 2018),
-    (203565, 2014, 2014),
-    (203569, 2013, 2014),
-    (203580, 2014, 2017),
-    (203584, 2013, 2019),
-    (203585, 2016, 2022),
-    (203590, 2017, 2017),
-    (203613, 2015, 2018),
-    (203648, 2015, 2026),
-    (203658, 2019, 2021),
-    (203687, 2017, 2017),
-    (203705, 2017, 2019),
-    (203710, 2017, 2018),
-    (203798, 2014, 2015),
-    (203805, 2014, 2014),
-    (203810, 2013, 2013),
-    (203816, 2013, 2021),
-    (203893, 2014, 2015),
-    (203894, 2014, 2019),
-    (203895, 2015, 2019),
-    (203897, 2014, 2026),
-    (203898, 2014, 2017),
-    (203900, 2014, 2017),
-    (203901, 2014, 2024),
-    (203902, 2016, 2016),
-    (203903, 2014, 2026),
-    (203906, 2014, 2015),
-    (203909, 2014, 2016),
-    (203910, 2014, 2014),
-    (203912, 2014, 2017),
-    (203913, 2014, 2014),
-    (203914, 2014, 2026),
-    (203915, 2014, 2024),
-    (203917, 2014, 2021),
-    (203918, 2014, 2021),
-    (203919, 2014, 2015),
-    (203920, 2017, 2022),
-    (203921, 2014, 2015),
-    (203922, 2014, 2020),
-    (203923, 2014, 2017),
-    (203924, 2014, 2026),
-    (203925, 2014, 2023),
-    (203926, 2014, 2026),
-    (203928, 2014, 2015),
-    (203930, 2014, 2017),
-    (203932, 2014, 2026),
-    (203933, 2014, 2023),
-    (203934, 2015, 2016),
-    (203935, 2014, 2026),
-    (203937, 2014, 2026),
-    (203939, 2014, 2026),
-    (203940, 2014, 2017),
-    (203943, 2014, 2022),
-    (203944, 2014, 2026),
-    (203945, 2014, 2014),
-    (203946, 2014, 2015),
-    (203948, 2014, 2017),
-    (203949, 2014, 2017),
-    (203950, 2014, 2016),
-    (203951, 2015, 2015),
-    (203952, 2014, 2026),
-    (203953, 2014, 2021),
-    (203954, 2014, 2026),
-    (203955, 2014, 2015),
-    (203956, 2014, 2015),
-    (203957, 2014, 2024),
-    (203958, 2014, 2014),
-    (203960, 2014, 2020),
-    (203961, 2014, 2018),
-    (203962, 2015, 2017),
-    (203963, 2014, 2015),
-    (203966, 2017, 2017),
-    (203967, 2016, 2025),
-    (203968, 2014, 2014),
-    (203991, 2014, 2026),
-    (203992, 2017, 2026),
-    (203994, 2014, 2026),
-    (203995, 2023, 2024),
-    (203996, 2014, 2015),
-    (203998, 2014, 2020),
-    (203999, 2015, 2026),
-    (204001, 2015, 2026),
-    (204002, 2015, 2016),
-    (204014, 2014, 2016),
-    (204020, 2014, 2021),
-    (204021, 2014, 2014),
-    (204022, 2014, 2017),
-    (204025, 2014, 2021),
-    (204028, 2014, 2017),
-    (204033, 2014, 2014),
-    (204037, 2014, 2017),
-    (204038, 2014, 2021),
-    (204054, 2014, 2014),
-    (204060, 2014, 2026),
-    (204065, 2014, 2017),
-    (204066, 2015, 2018),
-    (204067, 2015, 2017),
-    (204079, 2014, 2014),
-    (204098, 2015, 2017),
-    (204179, 2017, 2017),
-    (204222, 2020, 2020),
-    (204456, 2015, 2026),
-    (600001, 1963, 1976),
-    (600003, 1950, 1969),
-    (600005, 1970, 1983),
-    (600006, 1967, 1979),
-    (600009, 1980, 1991),
-    (600010, 1976, 1983),
-    (600011, 1969, 1974),
-    (600012, 1948, 1955),
-    (600013, 1965, 1979),
-    (600014, 1976, 1987),
-    (600015, 1960, 1973),
-    (600016, 1955, 1957),
-    (1626143, 2015, 2024),
-    (1626144, 2015, 2021),
-    (1626145, 2015, 2026),
-    (1626146, 2015, 2015),
-    (1626147, 2015, 2021),
-    (1626148, 2015, 2017),
-    (1626149, 2015, 2022),
-    (1626150, 2016, 2018),
-    (1626151, 2015, 2017),
-    (1626153, 2015, 2024),
-    (1626154, 2015, 2018),
-    (1626155, 2015, 2021),
-    (1626156, 2015, 2026),
-    (1626157, 2015, 2026),
-    (1626158, 2015, 2024),
-    (1626159, 2015, 2022),
-    (1626161, 2015, 2022),
-    (1626162, 2015, 2026),
-    (1626163, 2015, 2022),
-    (1626164, 2015, 2026),
-    (1626166, 2015, 2025),
-    (1626167, 2015, 2026),
-    (1626168, 2015, 2024),
-    (1626169, 2015, 2022),
-    (1626170, 2015, 2019),
-    (1626171, 2015, 2026),
-    (1626172, 2015, 2026),
-    (1626173, 2015, 2017),
-    (1626174, 2015, 2023),
-    (1626175, 2015, 2017),
-    (1626176, 2015, 2016),
-    (1626177, 2017, 2017),
-    (1626178, 2015, 2020),
-    (1626179, 2015, 2024),
-    (1626181, 2015, 2026),
-    (1626183, 2015, 2015),
-    (1626184, 2016, 2020),
-    (1626185, 2015, 2018),
-    (1626187, 2018, 2019),
-    (1626188, 2016, 2020),
-    (1626191, 2015, 2017),
-    (1626192, 2015, 2026),
-    (1626195, 2016, 2022),
-    (1626196, 2015, 2024),
-    (1626199, 2015, 2017),
-    (1626202, 2015, 2017),
-    (1626203, 2016, 2019),
-    (1626204, 2015, 2026),
-    (1626205, 2017, 2017),
-    (1626208, 2021, 2021),
-    (1626209, 2015, 2019),
-    (1626210, 2015, 2018),
-    (1626214, 2015, 2015),
-    (1626220, 2017, 2026),
-    (1626224, 2017, 2023),
-    (1626242, 2015, 2017),
-    (1626245, 2015, 2020),
-    (1626246, 2015, 2023),
-    (1626251, 2015, 2015),
-    (1626253, 2015, 2020),
-    (1626254, 2016, 2016),
-    (1626257, 2015, 2018),
-    (1626259, 2017, 2019),
-    (1626262, 2015, 2015),
-    (1626266, 2015, 2015),
-    (1626273, 2015, 2016),
-    (1626296, 2018, 2018),
-    (1626643, 2017, 2017),
-    (1626780, 2016, 2018),
-    (1627098, 2016, 2017),
-    (1627215, 2017, 2018),
-    (1627293, 2015, 2015),
-    (1627362, 2015, 2017),
-    (1627395, 2018, 2018),
-    (1627732, 2016, 2024),
-    (1627733, 2016, 2019),
-    (1627734, 2016, 2026),
-    (1627735, 2016, 2018),
-    (1627736, 2016, 2024),
-    (1627737, 2016, 2021),
-    (1627738, 2016, 2018),
-    (1627739, 2016, 2026),
-    (1627740, 2016, 2020),
-    (1627741, 2016, 2026),
-    (1627742, 2016, 2026),
-    (1627743, 2016, 2018),
-    (1627744, 2016, 2017),
-    (1627745, 2016, 2023),
-    (1627746, 2016, 2025),
-    (1627747, 2016, 2026),
-    (1627748, 2016, 2020),
-    (1627749, 2016, 2026),
-    (1627750, 2016, 2026),
-    (1627751, 2016, 2026),
-    (1627752, 2016, 2026),
-    (1627753, 2017, 2018),
-    (1627754, 2016, 2016),
-    (1627755, 2016, 2018),
-    (1627756, 2016, 2021),
-    (1627757, 2016, 2016),
-    (1627758, 2016, 2018),
-    (1627759, 2016, 2026),
-    (1627760, 2021, 2021),
-    (1627761, 2016, 2021),
-    (1627762, 2016, 2017),
-    (1627763, 2016, 2024),
-    (1627767, 2016, 2021),
-    (1627770, 2016, 2017),
-    (1627771, 2016, 2016),
-    (1627772, 2017, 2018),
-    (1627773, 2016, 2016),
-    (1627774, 2016, 2021),
-    (1627775, 2016, 2020),
-    (1627777, 2016, 2024),
-    (1627778, 2016, 2017),
-    (1627779, 2017, 2017),
-    (1627780, 2016, 2026),
-    (1627781, 2016, 2018),
-    (1627782, 2016, 2021),
-    (1627783, 2016, 2026),
-    (1627784, 2016, 2019),
-    (1627785, 2016, 2018),
-    (1627786, 2016, 2018),
-    (1627787, 2016, 2016),
-    (1627788, 2017, 2023),
-    (1627789, 2016, 2021),
-    (1627790, 2017, 2019),
-    (1627791, 2016, 2016),
-    (1627812, 2016, 2020),
-    (1627814, 2017, 2024),
-    (1627815, 2016, 2016),
-    (1627816, 2016, 2018),
-    (1627817, 2016, 2017),
-    (1627819, 2016, 2017),
-    (1627820, 2017, 2021),
-    (1627821, 2017, 2017),
-    (1627822, 2021, 2021),
-    (1627823, 2016, 2022),
-    (1627824, 2017, 2026),
-    (1627826, 2016, 2026),
-    (1627827, 2016, 2026),
-    (1627832, 2016, 2026),
-    (1627834, 2016, 2017),
-    (1627835, 2016, 2017),
-    (1627846, 2017, 2021),
-    (1627848, 2016, 2016),
-    (1627849, 2016, 2016),
-    (1627850, 2016, 2017),
-    (1627851, 2016, 2017),
-    (1627852, 2016, 2017),
-    (1627853, 2017, 2023),
-    (1627854, 2016, 2022),
-    (1627855, 2016, 2018),
-    (1627856, 2017, 2017),
-    (1627858, 2017, 2017),
-    (1627861, 2016, 2016),
-    (1627863, 2016, 2023),
-    (1627866, 2017, 2017),
-    (1627868, 2016, 2016),
-    (1627875, 2016, 2017),
-    (1627879, 2016, 2016),
-    (1627883, 2017, 2018),
-    (1627884, 2016, 2026),
-    (1627885, 2017, 2023),
-    (1627936, 2017, 2026),
-    (1627982, 2017, 2019),
-    (1627988, 2017, 2017),
-    (1628021, 2016, 2021),
-    (1628035, 2017, 2021),
-    (1628070, 2018, 2018),
-    (1628221, 2021, 2022),
-    (1628238, 2021, 2021),
-    (1628249, 2018, 2018),
-    (1628365, 2017, 2025),
-    (1628366, 2017, 2025),
-    (1628367, 2017, 2021),
-    (1628368, 2017, 2026),
-    (1628369, 2017, 2026),
-    (1628370, 2017, 2026),
-    (1628371, 2017, 2026),
-    (1628372, 2017, 2023),
-    (1628373, 2017, 2023),
-    (1628374, 2017, 2026),
-    (1628378, 2017, 2026),
-    (1628379, 2017, 2026),
-    (1628380, 2017, 2026),
-    (1628381, 2017, 2026),
-    (1628382, 2017, 2023),
-    (1628383, 2017, 2020),
-    (1628384, 2017, 2026),
-    (1628385, 2017, 2023),
-    (1628386, 2017, 2026),
-    (1628387, 2017, 2018),
-    (1628388, 2017, 2020),
-    (1628389, 2017, 2026),
-    (1628390, 2017, 2020),
-    (1628391, 2017, 2023),
-    (1628392, 2018, 2026),
-    (1628393, 2017, 2018),
-    (1628394, 2019, 2020),
-    (1628395, 2017, 2021),
-    (1628396, 2017, 2026),
-    (1628397, 2017, 2018),
-    (1628398, 2017, 2026),
-    (1628399, 2017, 2018),
-    (1628400, 2017, 2021),
-    (1628401, 2017, 2026),
-    (1628402, 2017, 2022),
-    (1628403, 2017, 2019),
-    (1628404, 2017, 2026),
-    (1628405, 2017, 2019),
-    (1628407, 2017, 2020),
-    (1628408, 2017, 2024),
-    (1628409, 2017, 2017),
-    (1628410, 2017, 2022),
-    (1628411, 2017, 2021),
-    (1628412, 2017, 2020),
-    (1628413, 2018, 2019),
-    (1628414, 2017, 2020),
-    (1628415, 2017, 2026),
-    (1628416, 2017, 2022),
-    (1628417, 2018, 2018),
-    (1628418, 2017, 2026),
-    (1628419, 2020, 2021),
-    (1628420, 2017, 2025),
-    (1628421, 2017, 2018),
-    (1628422, 2017, 2021),
-    (1628424, 2017, 2023),
-    (1628425, 2017, 2022),
-    (1628426, 2023, 2023),
-    (1628427, 2019, 2024),
-    (1628429, 2017, 2017),
-    (1628430, 2019, 2019),
-    (1628432, 2017, 2022),
-    (1628435, 2022, 2022),
-    (1628436, 2017, 2026),
-    (1628439, 2017, 2018),
-    (1628443, 2017, 2019),
-    (1628444, 2017, 2017),
-    (1628449, 2017, 2025),
-    (1628450, 2019, 2019),
-    (1628451, 2017, 2017),
-    (1628455, 2017, 2020),
-    (1628462, 2017, 2018),
-    (1628463, 2017, 2018),
-    (1628464, 2017, 2024),
-    (1628467, 2017, 2026),
-    (1628469, 2017, 2018),
-    (1628470, 2017, 2024),
-    (1628475, 2017, 2017),
-    (1628476, 2017, 2021),
-    (1628492, 2017, 2017),
-    (1628493, 2017, 2017),
-    (1628495, 2017, 2017),
-    (1628499, 2017, 2019),
-    (1628500, 2017, 2018),
-    (1628502, 2017, 2025),
-    (1628503, 2017, 2017),
-    (1628504, 2017, 2017),
-    (1628505, 2018, 2018),
-    (1628506, 2017, 2017),
-    (1628510, 2017, 2017),
-    (1628513, 2017, 2019),
-    (1628515, 2018, 2018),
-    (1628518, 2017, 2019),
-    (1628537, 2017, 2021),
-    (1628539, 2019, 2021),
-    (1628571, 2017, 2017),
-    (1628578, 2020, 2020),
-    (1628591, 2021, 2021),
-    (1628605, 2018, 2019),
-    (1628656, 2018, 2018),
-    (1628681, 2017, 2017),
-    (1628769, 2018, 2018),
-    (1628778, 2019, 2021),
-    (1628935, 2017, 2017),
-    (1628959, 2018, 2018),
-    (1628960, 2018, 2026),
-    (1628961, 2018, 2020),
-    (1628962, 2020, 2023),
-    (1628963, 2018, 2026),
-    (1628964, 2018, 2025),
-    (1628966, 2018, 2023),
-    (1628968, 2019, 2020),
-    (1628969, 2018, 2026),
-    (1628970, 2018, 2026),
-    (1628971, 2018, 2026),
-    (1628972, 2018, 2023),
-    (1628973, 2018, 2026),
-    (1628975, 2018, 2026),
-    (1628976, 2018, 2026),
-    (1628977, 2018, 2023),
-    (1628978, 2018, 2026),
-    (1628979, 2018, 2018),
-    (1628980, 2018, 2019),
-    (1628981, 2019, 2024),
-    (1628982, 2018, 2021),
-    (1628983, 2018, 2026),
-    (1628984, 2018, 2023),
-    (1628985, 2019, 2019),
-    (1628987, 2019, 2019),
-    (1628988, 2018, 2026),
-    (1628989, 2018, 2026),
-    (1628990, 2018, 2021),
-    (1628991, 2018, 2026),
-    (1628993, 2018, 2022),
-    (1628994, 2018, 2021),
-    (1628995, 2018, 2024),
-    (1628997, 2019, 2026),
-    (1628998, 2019, 2025),
-    (1628999, 2018, 2018),
-    (1629001, 2018, 2026),
-    (1629002, 2018, 2023),
-    (1629003, 2018, 2024),
-    (1629004, 2018, 2026),
-    (1629005, 2019, 2021),
-    (1629006, 2018, 2026),
-    (1629007, 2019, 2023),
-    (1629008, 2018, 2026),
-    (1629010, 2018, 2023),
-    (1629011, 2018, 2026),
-    (1629012, 2018, 2026),
-    (1629013, 2018, 2026),
-    (1629014, 2018, 2026),
-    (1629015, 2018, 2019),
-    (1629016, 2018, 2019),
-    (1629017, 2018, 2020),
-    (1629018, 2018, 2026),
-    (1629019, 2018, 2019),
-    (1629020, 2018, 2026),
-    (1629021, 2018, 2026),
-    (1629022, 2018, 2024),
-    (1629023, 2019, 2026),
-    (1629026, 2018, 2026),
-    (1629027, 2018, 2026),
-    (1629028, 2018, 2026),
-    (1629029, 2018, 2026),
-    (1629033, 2018, 2022),
-    (1629034, 2018, 2020),
-    (1629035, 2019, 2021),
-    (1629044, 2019, 2019),
-    (1629045, 2018, 2018),
-    (1629048, 2019, 2026),
-    (1629052, 2019, 2024),
-    (1629053, 2018, 2018),
-    (1629055, 2018, 2018),
-    (1629056, 2019, 2024),
-    (1629057, 2018, 2026),
-    (1629058, 2018, 2019),
-    (1629059, 2018, 2019),
-    (1629060, 2019, 2026),
-    (1629061, 2018, 2018),
-    (1629065, 2019, 2019),
-    (1629066, 2018, 2020),
-    (1629067, 2018, 2021),
-    (1629076, 2019, 2021),
-    (1629083, 2021, 2021),
-    (1629091, 2020, 2020),
-    (1629093, 2018, 2018),
-    (1629094, 2018, 2018),
-    (1629098, 2024, 2024),
-    (1629102, 2018, 2018),
-    (1629103, 2019, 2021),
-    (1629109, 2018, 2021),
-    (1629111, 2021, 2026),
-    (1629116, 2018, 2018),
-    (1629117, 2018, 2023),
-    (1629118, 2018, 2018),
-    (1629121, 2018, 2020),
-    (1629122, 2018, 2019),
-    (1629123, 2018, 2018),
-    (1629126, 2018, 2022),
-    (1629129, 2018, 2018),
-    (1629130, 2018, 2026),
-    (1629133, 2018, 2019),
-    (1629134, 2018, 2022),
-    (1629139, 2018, 2023),
-    (1629140, 2018, 2019),
-    (1629147, 2018, 2019),
-    (1629150, 2018, 2021),
-    (1629151, 2018, 2019),
-    (1629152, 2018, 2018),
-    (1629155, 2018, 2018),
-    (1629162, 2019, 2026),
-    (1629164, 2018, 2021),
-    (1629168, 2018, 2021),
-    (1629185, 2018, 2021),
-    (1629203, 2018, 2021),
-    (1629216, 2019, 2026),
-    (1629232, 2023, 2023),
-    (1629234, 2018, 2026),
-    (1629244, 2018, 2020),
-    (1629308, 2019, 2023),
-    (1629309, 2021, 2021),
-    (1629312, 2018, 2026),
-    (1629341, 2018, 2018),
-    (1629346, 2019, 2020),
-    (1629353, 2018, 2018),
-    (1629541, 2018, 2018),
-    (1629597, 2019, 2021),
-    (1629598, 2019, 2019),
-    (1629599, 2019, 2026),
-    (1629600, 2021, 2021),
-    (1629602, 2021, 2021),
-    (1629603, 2020, 2023),
-    (1629604, 2020, 2021),
-    (1629605, 2019, 2021),
-    (1629606, 2020, 2020),
-    (1629607, 2019, 2021),
-    (1629608, 2019, 2019),
-    (1629610, 2019, 2025),
-    (1629611, 2019, 2026),
-    (1629614, 2022, 2026),
-    (1629617, 2020, 2021),
-    (1629618, 2023, 2026),
-    (1629619, 2021, 2021),
-    (1629620, 2019, 2021),
-    (1629621, 2019, 2019),
-    (1629622, 2019, 2026),
-    (1629623, 2021, 2023),
-    (1629624, 2019, 2019),
-    (1629625, 2019, 2019),
-    (1629626, 2019, 2024),
-    (1629627, 2019, 2026),
-    (1629628, 2019, 2026),
-    (1629629, 2019, 2024),
-    (1629630, 2019, 2026),
-    (1629631, 2019, 2026),
-    (1629632, 2019, 2026),
-    (1629633, 2019, 2022),
-    (1629634, 2019, 2025),
-    (1629635, 2019, 2021),
-    (1629636, 2019, 2026),
-    (1629637, 2019, 2026),
-    (1629638, 2019, 2026),
-    (1629639, 2019, 2026),
-    (1629640, 2019, 2026),
-    (1629641, 2019, 2022),
-    (1629642, 2019, 2023),
-    (1629643, 2020, 2024),
-    (1629644, 2019, 2022),
-    (1629645, 2019, 2026),
-    (1629646, 2021, 2026),
-    (1629647, 2019, 2023),
-    (1629648, 2019, 2020),
-    (1629649, 2019, 2021),
-    (1629650, 2019, 2024),
-    (1629651, 2019, 2026),
-    (1629652, 2019, 2026),
-    (1629653, 2020, 2022),
-    (1629655, 2019, 2026),
-    (1629656, 2021, 2026),
-    (1629657, 2019, 2021),
-    (1629658, 2019, 2021),
-    (1629659, 2019, 2024),
-    (1629660, 2019, 2026),
-    (1629661, 2019, 2026),
-    (1629662, 2019, 2022),
-    (1629663, 2019, 2022),
-    (1629665, 2019, 2020),
-    (1629667, 2019, 2024),
-    (1629668, 2019, 2019),
-    (1629669, 2019, 2024),
-    (1629670, 2020, 2023),
-    (1629671, 2019, 2021),
-    (1629672, 2019, 2021),
-    (1629673, 2019, 2026),
-    (1629674, 2021, 2026),
-    (1629675, 2019, 2026),
-    (1629676, 2019, 2022),
-    (1629677, 2019, 2023),
-    (1629678, 2019, 2023),
-    (1629680, 2019, 2026),
-    (1629681, 2020, 2021),
-    (1629682, 2019, 2021),
-    (1629683, 2019, 2021),
-    (1629684, 2019, 2026),
-    (1629685, 2019, 2023),
-    (1629686, 2020, 2021),
-    (1629690, 2019, 2020),
-    (1629712, 2020, 2021),
-    (1629713, 2019, 2020),
-    (1629714, 2019, 2022),
-    (1629716, 2019, 2023),
-    (1629717, 2020, 2023),
-    (1629718, 2019, 2023),
-    (1629719, 2019, 2021),
-    (1629723, 2019, 2026),
-    (1629724, 2019, 2019),
-    (1629725, 2019, 2020),
-    (1629726, 2019, 2025),
-    (1629729, 2019, 2019),
-    (1629730, 2019, 2021),
-    (1629731, 2019, 2026),
-    (1629734, 2019, 2019),
-    (1629735, 2019, 2022),
-    (1629738, 2019, 2020),
-    (1629739, 2019, 2019),
-    (1629740, 2019, 2020),
-    (1629741, 2019, 2019),
-    (1629742, 2019, 2019),
-    (1629743, 2019, 2020),
-    (1629744, 2019, 2021),
-    (1629745, 2019, 2019),
-    (1629750, 2019, 2026),
-    (1629751, 2020, 2021),
-    (1629752, 2019, 2021),
-    (1629755, 2021, 2021),
-    (1629760, 2019, 2021),
-    (1629783, 2021, 2021),
-    (1629788, 2021, 2021),
-    (1629833, 2020, 2021),
-    (1629873, 2021, 2021),
-    (1629875, 2021, 2023),
-    (1629958, 2021, 2021),
-    (1629962, 2020, 2021),
-    (1630162, 2020, 2026),
-    (1630163, 2020, 2026),
-    (1630164, 2020, 2025),
-    (1630165, 2020, 2026),
-    (1630166, 2020, 2026),
-    (1630167, 2020, 2026),
-    (1630168, 2020, 2026),
-    (1630169, 2020, 2026),
-    (1630170, 2020, 2026),
-    (1630171, 2020, 2026),
-    (1630172, 2020, 2026),
-    (1630173, 2020, 2026),
-    (1630174, 2020, 2026),
-    (1630175, 2020, 2025),
-    (1630176, 2020, 2022),
-    (1630177, 2020, 2023),
-    (1630178, 2020, 2026),
-    (1630179, 2020, 2021),
-    (1630180, 2020, 2026),
-    (1630181, 2020, 2023),
-    (1630182, 2020, 2026),
-    (1630183, 2020, 2026),
-    (1630184, 2020, 2023),
-    (1630185, 2020, 2020),
-    (1630186, 2020, 2023),
-    (1630187, 2020, 2021),
-    (1630188, 2020, 2026),
-    (1630189, 2020, 2020),
-    (1630190, 2020, 2021),
-    (1630191, 2020, 2026),
-    (1630192, 2020, 2026),
-    (1630193, 2020, 2026),
-    (1630194, 2020, 2026),
-    (1630195, 2021, 2022),
-    (1630196, 2023, 2023),
-    (1630197, 2020, 2023),
-    (1630198, 2020, 2026),
-    (1630199, 2020, 2021),
-    (1630200, 2020, 2026),
-    (1630201, 2020, 2024),
-    (1630202, 2020, 2026),
-    (1630203, 2020, 2020),
-    (1630204, 2020, 2023),
-    (1630205, 2020, 2024),
-    (1630206, 2020, 2022),
-    (1630207, 2020, 2023),
-    (1630208, 2020, 2026),
-    (1630209, 2020, 2025),
-    (1630210, 2020, 2021),
-    (1630211, 2020, 2020),
-    (1630214, 2020, 2026),
-    (1630215, 2021, 2024),
-    (1630216, 2020, 2021),
-    (1630217, 2020, 2026),
-    (1630218, 2020, 2021),
-    (1630219, 2020, 2023),
-    (1630221, 2020, 2020),
-    (1630222, 2020, 2024),
-    (1630223, 2020, 2020),
-    (1630224, 2021, 2026),
-    (1630225, 2021, 2022),
-    (1630227, 2021, 2024),
-    (1630228, 2021, 2026),
-    (1630230, 2020, 2026),
-    (1630231, 2020, 2024),
-    (1630233, 2020, 2022),
-    (1630234, 2020, 2020),
-    (1630235, 2020, 2023),
-    (1630237, 2020, 2022),
-    (1630238, 2020, 2021),
-    (1630240, 2020, 2023),
-    (1630241, 2020, 2026),
-    (1630243, 2021, 2024),
-    (1630245, 2021, 2026),
-    (1630249, 2021, 2026),
-    (1630250, 2021, 2022),
-    (1630253, 2020, 2020),
-    (1630256, 2020, 2026),
-    (1630257, 2021, 2021),
-    (1630258, 2020, 2020),
-    (1630259, 2023, 2023),
-    (1630264, 2020, 2026),
-    (1630266, 2020, 2020),
-    (1630267, 2020, 2022),
-    (1630268, 2020, 2020),
-    (1630270, 2021, 2022),
-    (1630271, 2020, 2021),
-    (1630273, 2020, 2021),
-    (1630278, 2021, 2021),
-    (1630283, 2024, 2024),
-    (1630284, 2022, 2023),
-    (1630285, 2021, 2023),
-    (1630286, 2021, 2025),
-    (1630288, 2021, 2024),
-    (1630296, 2021, 2024),
-    (1630306, 2021, 2021),
-    (1630311, 2023, 2026),
-    (1630314, 2021, 2026),
-    (1630322, 2021, 2026),
-    (1630346, 2021, 2024),
-    (1630466, 2020, 2021),
-    (1630492, 2020, 2021),
-    (1630525, 2021, 2021),
-    (1630526, 2021, 2025),
-    (1630527, 2021, 2024),
-    (1630528, 2021, 2024),
-    (1630529, 2021, 2026),
-    (1630530, 2021, 2026),
-    (1630531, 2021, 2024),
-    (1630532, 2021, 2026),
-    (1630533, 2021, 2026),
-    (1630534, 2022, 2025),
-    (1630535, 2021, 2023),
-    (1630536, 2021, 2026),
-    (1630537, 2021, 2024),
-    (1630538, 2021, 2026),
-    (1630539, 2021, 2024),
-    (1630540, 2021, 2026),
-    (1630541, 2021, 2026),
-    (1630542, 2024, 2024),
-    (1630543, 2021, 2026),
-    (1630544, 2021, 2026),
-    (1630545, 2024, 2026),
-    (1630547, 2021, 2023),
-    (1630548, 2022, 2025),
-    (1630549, 2021, 2026),
-    (1630550, 2021, 2024),
-    (1630551, 2021, 2026),
-    (1630552, 2021, 2026),
-    (1630553, 2021, 2024),
-    (1630554, 2021, 2023),
-    (1630555, 2021, 2021),
-    (1630556, 2021, 2024),
-    (1630557, 2021, 2026),
-    (1630558, 2021, 2026),
-    (1630559, 2021, 2026),
-    (1630560, 2021, 2025),
-    (1630561, 2021, 2024),
-    (1630562, 2023, 2023),
-    (1630563, 2021, 2023),
-    (1630564, 2022, 2023),
-    (1630565, 2021, 2021),
-    (1630567, 2021, 2026),
-    (1630568, 2021, 2026),
-    (1630570, 2021, 2026),
-    (1630572, 2021, 2026),
-    (1630573, 2021, 2026),
-    (1630574, 2024, 2026),
-    (1630575, 2021, 2021),
-    (1630577, 2022, 2026),
-    (1630578, 2021, 2026),
-    (1630579, 2021, 2026),
-    (1630580, 2021, 2022),
-    (1630581, 2021, 2026),
-    (1630582, 2021, 2021),
-    (1630583, 2021, 2026),
-    (1630585, 2021, 2024),
-    (1630586, 2021, 2023),
-    (1630587, 2021, 2026),
-    (1630589, 2021, 2021),
-    (1630590, 2022, 2026),
-    (1630591, 2021, 2026),
-    (1630592, 2023, 2026),
-    (1630593, 2021, 2022),
-    (1630595, 2021, 2026),
-    (1630596, 2021, 2026),
-    (1630597, 2021, 2021),
-    (1630598, 2021, 2026),
-    (1630600, 2022, 2024),
-    (1630602, 2021, 2021),
-    (1630604, 2022, 2026),
-    (1630605, 2021, 2021),
-    (1630606, 2021, 2023),
-    (1630608, 2023, 2023),
-    (1630610, 2021, 2025),
-    (1630611, 2023, 2026),
-    (1630612, 2021, 2021),
-    (1630613, 2021, 2023),
-    (1630618, 2023, 2024),
-    (1630619, 2025, 2026),
-    (1630620, 2022, 2022),
-    (1630621, 2025, 2026),
-    (1630622, 2023, 2023),
-    (1630623, 2024, 2026),
-    (1630624, 2021, 2021),
-    (1630625, 2021, 2026),
-    (1630631, 2021, 2026),
-    (1630637, 2021, 2022),
-    (1630639, 2022, 2026),
-    (1630640, 2021, 2021),
-    (1630641, 2022, 2023),
-    (1630643, 2021, 2026),
-    (1630644, 2021, 2026),
-    (1630647, 2021, 2023),
-    (1630648, 2021, 2022),
-    (1630649, 2022, 2025),
-    (1630658, 2023, 2026),
-    (1630678, 2021, 2024),
-    (1630679, 2024, 2026),
-    (1630686, 2021, 2021),
-    (1630688, 2021, 2023),
-    (1630691, 2021, 2021),
-    (1630692, 2021, 2026),
-    (1630693, 2021, 2021),
-    (1630695, 2021, 2026),
-    (1630696, 2022, 2026),
-    (1630698, 2021, 2021),
-    (1630699, 2022, 2026),
-    (1630700, 2022, 2026),
-    (1630701, 2022, 2022),
-    (1630702, 2022, 2026),
-    (1630703, 2023, 2026),
-    (1630758, 2021, 2021),
-    (1630762, 2024, 2024),
-    (1630787, 2021, 2021),
-    (1630792, 2021, 2023),
-    (1630811, 2024, 2026),
-    (1630828, 2025, 2026),
-    (1630846, 2021, 2026),
-    (1630929, 2023, 2023),
-    (1630994, 2021, 2021),
-    (1631093, 2022, 2025),
-    (1631094, 2022, 2026),
-    (1631095, 2022, 2026),
-    (1631096, 2022, 2026),
-    (1631097, 2022, 2026),
-    (1631098, 2022, 2024),
-    (1631099, 2022, 2026),
-    (1631100, 2022, 2023),
-    (1631101, 2022, 2026),
-    (1631102, 2022, 2026),
-    (1631103, 2022, 2025),
-    (1631104, 2022, 2026),
-    (1631105, 2022, 2026),
-    (1631106, 2022, 2026),
-    (1631107, 2022, 2026),
-    (1631108, 2022, 2026),
-    (1631109, 2022, 2026),
-    (1631110, 2022, 2026),
-    (1631111, 2022, 2026),
-    (1631112, 2022, 2023),
-    (1631113, 2022, 2025),
-    (1631114, 2022, 2026),
-    (1631115, 2022, 2025),
-    (1631116, 2022, 2026),
-    (1631117, 2022, 2026),
-    (1631119, 2022, 2026),
-    (1631120, 2022, 2026),
-    (1631121, 2022, 2026),
-    (1631123, 2022, 2026),
-    (1631124, 2023, 2026),
-    (1631126, 2025, 2026),
-    (1631127, 2024, 2026),
-    (1631128, 2022, 2026),
-    (1631131, 2023, 2026),
-    (1631132, 2022, 2026),
-    (1631133, 2022, 2026),
-    (1631157, 2022, 2026),
-    (1631159, 2023, 2026),
-    (1631160, 2022, 2022),
-    (1631165, 2022, 2026),
-    (1631166, 2024, 2026),
-    (1631167, 2023, 2023),
-    (1631169, 2022, 2026),
-    (1631170, 2023, 2026),
-    (1631171, 2022, 2022),
-    (1631172, 2022, 2026),
-    (1631173, 2023, 2023),
-    (1631174, 2025, 2025),
-    (1631197, 2022, 2024),
-    (1631199, 2022, 2026),
-    (1631200, 2023, 2026),
-    (1631204, 2023, 2026),
-    (1631205, 2022, 2025),
-    (1631207, 2022, 2026),
-    (1631209, 2023, 2024),
-    (1631210, 2023, 2025),
-    (1631211, 2022, 2026),
-    (1631212, 2022, 2026),
-    (1631213, 2022, 2026),
-    (1631214, 2022, 2025),
-    (1631216, 2022, 2025),
-    (1631217, 2022, 2026),
-    (1631218, 2023, 2026),
-    (1631219, 2022, 2022),
-    (1631220, 2022, 2023),
-    (1631221, 2022, 2026),
-    (1631222, 2022, 2026),
-    (1631223, 2022, 2026),
-    (1631230, 2022, 2026),
-    (1631232, 2024, 2024),
-    (1631241, 2023, 2023),
-    (1631243, 2023, 2026),
-    (1631245, 2022, 2026),
-    (1631246, 2022, 2025),
-    (1631247, 2024, 2025),
-    (1631248, 2024, 2026),
-    (1631250, 2023, 2025),
-    (1631254, 2022, 2023),
-    (1631255, 2024, 2026),
-    (1631257, 2023, 2023),
-    (1631260, 2022, 2026),
-    (1631262, 2023, 2023),
-    (1631288, 2022, 2026),
-    (1631298, 2022, 2023),
-    (1631301, 2024, 2024),
-    (1631303, 2022, 2024),
-    (1631306, 2022, 2024),
-    (1631309, 2022, 2022),
-    (1631311, 2022, 2024),
-    (1631320, 2022, 2022),
-    (1631321, 2023, 2026),
-    (1631323, 2022, 2026),
-    (1631338, 2023, 2026),
-    (1631342, 2024, 2026),
-    (1631351, 2025, 2025),
-    (1631367, 2022, 2023),
-    (1631376, 2023, 2023),
-    (1631386, 2023, 2024),
-    (1631451, 2025, 2025),
-    (1631457, 2025, 2026),
-    (1631466, 2022, 2026),
-    (1631495, 2022, 2022),
-    (1641645, 2022, 2022),
-    (1641705, 2023, 2026),
-    (1641706, 2023, 2026),
-    (1641707, 2023, 2026),
-    (1641708, 2023, 2026),
-    (1641709, 2023, 2026),
-    (1641710, 2023, 2026),
-    (1641711, 2023, 2026),
-    (1641712, 2023, 2026),
-    (1641713, 2023, 2026),
-    (1641715, 2023, 2026),
-    (1641716, 2023, 2026),
-    (1641717, 2023, 2026),
-    (1641718, 2023, 2026),
-    (1641720, 2023, 2024),
-    (1641721, 2023, 2024),
-    (1641722, 2023, 2026),
-    (1641723, 2023, 2025),
-    (1641724, 2023, 2026),
-    (1641725, 2024, 2026),
-    (1641726, 2023, 2026),
-    (1641727, 2023, 2025),
-    (1641729, 2023, 2026),
-    (1641730, 2023, 2026),
-    (1641731, 2023, 2026),
-    (1641732, 2023, 2025),
-    (1641733, 2023, 2026),
-    (1641734, 2023, 2024),
-    (1641735, 2023, 2023),
-    (1641736, 2024, 2024),
-    (1641737, 2024, 2026),
-    (1641738, 2023, 2026),
-    (1641739, 2023, 2026),
-    (1641740, 2023, 2026),
-    (1641741, 2023, 2024),
-    (1641744, 2024, 2026),
-    (1641745, 2023, 2026),
-    (1641747, 2024, 2026),
-    (1641748, 2023, 2026),
-    (1641749, 2023, 2023),
-    (1641750, 2025, 2026),
-    (1641752, 2024, 2025),
-    (1641753, 2023, 2025),
-    (1641754, 2023, 2024),
-    (1641755, 2024, 2026),
-    (1641757, 2023, 2026),
-    (1641759, 2026, 2026),
-    (1641761, 2025, 2025),
-    (1641763, 2023, 2026),
-    (1641764, 2023, 2026),
-    (1641765, 2023, 2026),
-    (1641766, 2023, 2024),
-    (1641767, 2023, 2026),
-    (1641771, 2023, 2026),
-    (1641772, 2024, 2026),
-    (1641774, 2023, 2026),
-    (1641775, 2023, 2026),
-    (1641778, 2023, 2025),
-    (1641779, 2024, 2024),
-    (1641780, 2025, 2026),
-    (1641783, 2024, 2026),
-    (1641787, 2023, 2025),
-    (1641788, 2023, 2023),
-    (1641789, 2024, 2024),
-    (1641790, 2024, 2026),
-    (1641793, 2023, 2023),
-    (1641794, 2024, 2026),
-    (1641796, 2024, 2026),
-    (1641798, 2023, 2024),
-    (1641801, 2024, 2026),
-    (1641803, 2024, 2026),
-    (1641806, 2023, 2023),
-    (1641807, 2025, 2026),
-    (1641809, 2023, 2025),
-    (1641810, 2024, 2026),
-    (1641813, 2025, 2025),
-    (1641815, 2024, 2026),
-    (1641816, 2023, 2025),
-    (1641817, 2024, 2024),
-    (1641824, 2024, 2026),
-    (1641831, 2026, 2026),
-    (1641842, 2024, 2026),
-    (1641847, 2023, 2023),
-    (1641851, 2023, 2023),
-    (1641854, 2023, 2026),
-    (1641857, 2024, 2024),
-    (1641869, 2025, 2026),
-    (1641871, 2023, 2025),
-    (1641877, 2023, 2023),
-    (1641878, 2024, 2024),
-    (1641879, 2024, 2024),
-    (1641890, 2024, 2026),
-    (1641926, 2023, 2023),
-    (1641931, 2023, 2023),
-    (1641936, 2024, 2024),
-    (1641945, 2023, 2023),
-    (1641970, 2023, 2023),
-    (1641989, 2024, 2026),
-    (1641998, 2023, 2026),
-    (1642013, 2023, 2023),
-    (1642024, 2024, 2024),
-    (1642050, 2024, 2024),
-    (1642066, 2025, 2026),
-    (1642258, 2024, 2026),
-    (1642259, 2024, 2026),
-    (1642260, 2024, 2026),
-    (1642261, 2024, 2026),
-    (1642262, 2024, 2026),
-    (1642263, 2024, 2026),
-    (1642264, 2024, 2026),
-    (1642265, 2024, 2026),
-    (1642266, 2024, 2026),
-    (1642267, 2024, 2026),
-    (1642268, 2024, 2026),
-    (1642269, 2024, 2026),
-    (1642270, 2024, 2026),
-    (1642271, 2024, 2026),
-    (1642272, 2024, 2026),
-    (1642273, 2024, 2026),
-    (1642274, 2024, 2026),
-    (1642275, 2024, 2026),
-    (1642276, 2024, 2026),
-    (1642277, 2024, 2026),
-    (1642278, 2024, 2026),
-    (1642279, 2024, 2024),
-    (1642280, 2024, 2025),
-    (1642281, 2024, 2026),
-    (1642282, 2025, 2025),
-    (1642284, 2026, 2026),
-    (1642285, 2024, 2026),
-    (1642345, 2024, 2026),
-    (1642346, 2024, 2026),
-    (1642347, 2024, 2026),
-    (1642348, 2024, 2026),
-    (1642349, 2024, 2026),
-    (1642350, 2026, 2026),
-    (1642352, 2024, 2026),
-    (1642353, 2024, 2026),
-    (1642354, 2024, 2026),
-    (1642355, 2024, 2026),
-    (1642357, 2025, 2026),
-    (1642358, 2024, 2026),
-    (1642359, 2024, 2026),
-    (1642362, 2025, 2025),
-    (1642363, 2025, 2026),
-    (1642364, 2025, 2026),
-    (1642366, 2024, 2025),
-    (1642367, 2024, 2026),
-    (1642368, 2024, 2025),
-    (1642369, 2026, 2026),
-    (1642377, 2024, 2026),
-    (1642379, 2024, 2024),
-    (1642380, 2025, 2025),
-    (1642382, 2024, 2026),
-    (1642383, 2025, 2026),
-    (1642384, 2024, 2026),
-    (1642385, 2024, 2024),
-    (1642389, 2024, 2026),
-    (1642391, 2026, 2026),
-    (1642394, 2026, 2026),
-    (1642396, 2025, 2026),
-    (1642399, 2024, 2024),
-    (1642400, 2025, 2026),
-    (1642402, 2024, 2026),
-    (1642403, 2024, 2026),
-    (1642404, 2025, 2026),
-    (1642419, 2024, 2026),
-    (1642422, 2024, 2024),
-    (1642434, 2024, 2026),
-    (1642439, 2024, 2024),
-    (1642443, 2024, 2026),
-    (1642449, 2024, 2026),
-    (1642450, 2024, 2026),
-    (1642461, 2024, 2026),
-    (1642468, 2025, 2025),
-    (1642484, 2024, 2026),
-    (1642490, 2025, 2026),
-    (1642502, 2024, 2026),
-    (1642504, 2025, 2026),
-    (1642505, 2024, 2024),
-    (1642530, 2024, 2026),
-    (1642843, 2025, 2026),
-    (1642844, 2025, 2026),
-    (1642845, 2025, 2026),
-    (1642846, 2025, 2026),
-    (1642847, 2025, 2026),
-    (1642848, 2025, 2026),
-    (1642849, 2025, 2026),
-    (1642850, 2025, 2026),
-    (1642851, 2025, 2026),
-    (1642852, 2025, 2026),
-    (1642853, 2025, 2026),
-    (1642854, 2025, 2026),
-    (1642855, 2025, 2026),
-    (1642856, 2025, 2026),
-    (1642857, 2025, 2026),
-    (1642859, 2025, 2026),
-    (1642860, 2025, 2026),
-    (1642862, 2025, 2026),
-    (1642863, 2025, 2026),
-    (1642864, 2025, 2026),
-    (1642865, 2026, 2026),
-    (1642866, 2025, 2026),
-    (1642867, 2025, 2026),
-    (1642868, 2025, 2026),
-    (1642869, 2025, 2026),
-    (1642873, 2025, 2026),
-    (1642874, 2025, 2026),
-    (1642875, 2025, 2026),
-    (1642876, 2025, 2026),
-    (1642877, 2025, 2026),
-    (1642878, 2025, 2026),
-    (1642879, 2025, 2026),
-    (1642880, 2025, 2026),
-    (1642881, 2026, 2026),
-    (1642882, 2025, 2026),
-    (1642883, 2025, 2026),
-    (1642884, 2025, 2026),
-    (1642885, 2025, 2026),
-    (1642886, 2025, 2026),
-    (1642889, 2026, 2026),
-    (1642892, 2026, 2026),
-    (1642905, 2025, 2026),
-    (1642907, 2025, 2026),
-    (1642910, 2025, 2026),
-    (1642911, 2025, 2026),
-    (1642912, 2026, 2026),
-    (1642914, 2025, 2026),
-    (1642917, 2025, 2026),
-    (1642918, 2025, 2026),
-    (1642920, 2025, 2026),
-    (1642923, 2026, 2026),
-    (1642926, 2026, 2026),
-    (1642928, 2025, 2026),
-    (1642933, 2025, 2026),
-    (1642935, 2025, 2026),
-    (1642938, 2025, 2026),
-    (1642939, 2025, 2025),
-    (1642942, 2025, 2026),
-    (1642948, 2025, 2026),
-    (1642949, 2025, 2026),
-    (1642950, 2025, 2026),
-    (1642951, 2025, 2026),
-    (1642954, 2025, 2026),
-    (1642955, 2025, 2025),
-    (1642959, 2025, 2026),
-    (1642962, 2025, 2026),
-    (1642964, 2025, 2026),
-    (1642967, 2025, 2026),
-    (1643007, 2025, 2026),
-    (1643016, 2025, 2026),
-    (1643018, 2025, 2026),
-    (1643024, 2025, 2026),
-    (1643047, 2025, 2026),
-    (1643052, 2025, 2026),
-    (1643060, 2025, 2026),
-    (1643133, 2025, 2025),
-    (1643141, 2025, 2025),
-    (1643158, 2025, 2025),
-    (1643253, 2025, 2025),
-    (1643257, 2025, 2026),
-    (1643407, 2026, 2026),
-    (1643408, 2026, 2026),
-    (1643409, 2026, 2026),
-    (1643410, 2026, 2026),
-    (1643411, 2026, 2026),
-    (1643412, 2026, 2026),
-    (1643413, 2026, 2026),
-    (1643414, 2026, 2026),
-    (1643415, 2026, 2026),
-    (1643416, 2026, 2026),
-    (1643417, 2026, 2026),
-    (1643418, 2026, 2026),
-    (1643419, 2026, 2026),
-    (1643509, 2026, 2026),
-    (1643510, 2026, 2026),
-    (1643512, 2026, 2026),
-    (1643515, 2026, 2026),
-    (1643516, 2026, 2026),
-    (1643517, 2026, 2026),
-    (1643519, 2026, 2026),
-    (1643520, 2026, 2026),
-    (1643530, 2026, 2026),
-    (1643536, 2026, 2026),
-    (1643538, 2026, 2026),
-    (1643539, 2026, 2026),
-    (1643542, 2026, 2026),
-    (1643544, 2026, 2026),
-    (1643547, 2026, 2026),
-    (1643548, 2026, 2026),
-    (1643551, 2026, 2026),
-    (1643552, 2026, 2026),
-    (1643553, 2026, 2026),
-    (1643555, 2026, 2026),
-    (1643558, 2026, 2026),
-    (1643563, 2026, 2026),
-    (1643567, 2026, 2026),
-    (1643568, 2026, 2026),
-    (1643570, 2026, 2026),
-    (1643573, 2026, 2026),
-    (1643576, 2026, 2026),
-    (1643583, 2026, 2026),
-    (1643585, 2026, 2026),
-    (1643588, 2026, 2026),
-    (1643589, 2026, 2026),
-    (1643590, 2026, 2026),
-    (1643591, 2026, 2026),
-    (1643593, 2026, 2026),
-    (1643614, 2026, 2026),
-    (1643621, 2026, 2026),
-    (1643624, 2026, 2026),
-    (1643626, 2026, 2026),
-    (1643637, 2026, 2026),
-    (1643640, 2026, 2026),
-    (1643650, 2026, 2026),
-    (1643712, 2026, 2026),
-    (1643717, 2026, 2026),
-    (1643758, 2026, 2026),
-)
+SNAPSHOT_PATH = Path(__file__).with_name("player_directory_snapshot.parquet")
+
+
+@lru_cache(maxsize=1)
+def player_year_windows() -> pl.DataFrame:
+    """Load the snapshot's ``person_id``/``from_year``/``to_year`` windows."""
+    import polars as pl
+
+    return pl.read_parquet(SNAPSHOT_PATH)
+
+
+def build_player_year_windows(directory: pl.DataFrame) -> pl.DataFrame:
+    """Reduce a ``common_all_players`` frame to sorted, typed year windows.
+
+    Rows without a usable ``person_id``/``from_year``/``to_year`` are dropped,
+    as are duplicates; the stable sort keeps regenerated files byte-identical
+    when the directory has not changed.
+    """
+    import polars as pl
+
+    return (
+        directory.select(
+            pl.col("person_id").cast(pl.Int64, strict=False),
+            pl.col("from_year").cast(pl.Int16, strict=False),
+            pl.col("to_year").cast(pl.Int16, strict=False),
+        )
+        .drop_nulls()
+        .filter((pl.col("person_id") > 0) & (pl.col("from_year") <= pl.col("to_year")))
+        .unique()
+        .sort("from_year", "to_year", "person_id")
+    )
+
+
+def write_player_year_windows(directory: pl.DataFrame, path: Path = SNAPSHOT_PATH) -> pl.DataFrame:
+    """Write the year windows of *directory* to *path* and return them.
+
+    Raises ``ValueError`` instead of replacing the snapshot with an empty file.
+    """
+    windows = build_player_year_windows(directory)
+    if windows.is_empty():
+        msg = "player directory has no usable year windows"
+        raise ValueError(msg)
+    windows.write_parquet(path, compression="zstd")
+    if path == SNAPSHOT_PATH:
+        player_year_windows.cache_clear()
+    return windows
 
 
 def _season_start_year(season: str) -> int | None:
@@ -5216,16 +80,30 @@ def _season_start_year(season: str) -> int | None:
 
 
 def player_ids_by_season_from_snapshot(seasons: list[str]) -> dict[str, list[int]]:
-    ids_by_season: dict[str, list[int]] = {}
+    import polars as pl
+
+    start_years: dict[str, int] = {}
     for season in sorted({season for season in seasons if season}):
         start_year = _season_start_year(season)
-        if start_year is None or start_year > SNAPSHOT_COMPLETE_THROUGH_YEAR:
-            continue
-        ids = sorted(
-            person_id
-            for person_id, from_year, to_year in PLAYER_YEAR_WINDOWS
-            if from_year <= start_year <= to_year
+        if start_year is not None and start_year <= SNAPSHOT_COMPLETE_THROUGH_YEAR:
+            start_years[season] = start_year
+    if not start_years:
+        return {}
+
+    requested = pl.DataFrame(
+        {"season": list(start_years), "start_year": list(start_years.values())},
+        schema={"season": pl.String, "start_year": pl.Int16},
+    )
+    # One interval join answers every requested season at once.
+    matches = (
+        player_year_windows()
+        .join_where(
+            requested,
+            pl.col("from_year") <= pl.col("start_year"),
+            pl.col("to_year") >= pl.col("start_year"),
         )
-        if ids:
-            ids_by_season[season] = ids
-    return ids_by_season
+        .group_by("season")
+        .agg(pl.col("person_id").sort())
+    )
+    ids_by_season = dict(matches.iter_rows())
+    return {season: ids_by_season[season] for season in start_years if season in ids_by_season}
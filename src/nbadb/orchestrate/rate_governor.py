@@ -0,0 +1,436 @@
+"""Hierarchical token-bucket rate governor shared by discovery and extraction.
+
+Every request takes one token from the global bucket and, when configured,
+from its family and endpoint buckets.  Requests waiting on the global
+bucket are granted in weighted-fair order across families, so one busy
+family cannot starve the others, and each grant wakes only the next waiter.
+Back-off and recovery change bucket rates in place, which keeps queued
+waiters and accrued tokens intact.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from loguru import logger
+
+from nbadb.orchestrate.resilience import _AdaptiveThrottle
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+RateScope = Literal["global", "family", "endpoint"]
+
+
+class _TokenBucket:
+    """Token bucket refilled lazily from a monotonic clock.
+
+    *capacity* bounds bursts; the default of one token spaces requests
+    evenly at ``1 / rate`` seconds.
+    """
+
+    __slots__ = ("_rate", "_capacity", "_burst_seconds", "_tokens", "_updated")
+
+    def __init__(self, rate: float, *, burst_seconds: float = 0.0, now: float) -> None:
+        self._rate = max(rate, 1e-6)
+        self._burst_seconds = burst_seconds
+        self._capacity = max(1.0, self._rate * burst_seconds)
+        self._tokens = self._capacity
+        self._updated = now
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def set_rate(self, rate: float, now: float) -> None:
+        """Change the refill rate without discarding accrued tokens."""
+        self._refill(now)
+        self._rate = max(rate, 1e-6)
+        self._capacity = max(1.0, self._rate * self._burst_seconds)
+        self._tokens = min(self._tokens, self._capacity)
+
+    def delay(self, now: float) -> float:
+        """Seconds until one token is available."""
+        self._refill(now)
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self._tokens -= 1.0
+
+
+@dataclass(slots=True, eq=False)
+class _Waiter:
+    tag: float  # weighted-fair virtual finish time
+    seq: int
+    chain: tuple[_TokenBucket, ...]  # family/endpoint buckets, global excluded
+    wake: asyncio.Event
+
+    @property
+    def order(self) -> tuple[float, int]:
+        return (self.tag, self.seq)
+
+
+@dataclass(slots=True)
+class _ScopeCounters:
+    granted: int = 0
+    waiting: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RateScopeStats:
+    """Point-in-time telemetry for one governor bucket."""
+
+    scope: RateScope
+    name: str
+    rate: float
+    base_rate: float
+    granted: int
+    waiting: int
+    wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.wait_seconds / self.granted if self.granted else 0.0
+
+
+class RateGovernor:
+    """Global → family → endpoint token buckets with weighted fair sharing.
+
+    Families and endpoints only get their own bucket when a rate is
+    configured for them; every request always draws from the global
+    bucket, so total throughput never exceeds *global_rate*.  Failures and
+    recoveries adjust the most specific configured bucket for the request.
+    """
+
+    def __init__(
+        self,
+        global_rate: float,
+        *,
+        family_rates: Mapping[str, float] | None = None,
+        endpoint_rates: Mapping[str, float] | None = None,
+        family_weights: Mapping[str, float] | None = None,
+        min_rate: float = 1.0,
+        recovery_threshold: int = 50,
+        burst_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._family_rates = dict(family_rates or {})
+        self._endpoint_rates = dict(endpoint_rates or {})
+        self._family_weights = dict(family_weights or {})
+        self._min_rate = min_rate
+        self._recovery_threshold = recovery_threshold
+        self._burst_seconds = burst_seconds
+        now = clock()
+        self._global = _TokenBucket(global_rate, burst_seconds=burst_seconds, now=now)
+        self._global_adaptive = self._throttle(global_rate)
+        self._buckets: dict[tuple[RateScope, str], _TokenBucket] = {}
+        self._adaptive: dict[tuple[RateScope, str], _AdaptiveThrottle] = {}
+        self._family_counters: dict[str, _ScopeCounters] = {}
+        self._endpoint_counters: dict[str, _ScopeCounters] = {}
+        self._family_finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_settings(cls, settings: object, rate_limit: float | None = None) -> RateGovernor:
+        """Build a governor from ``NbaDbSettings`` rate fields."""
+        return cls(
+            float(rate_limit if rate_limit is not None else getattr(settings, "rate_limit", 10.0)),
+            family_rates=getattr(settings, "family_rate_limits", {}),
+            endpoint_rates=getattr(settings, "endpoint_rate_limits", {}),
+            family_weights=getattr(settings, "family_rate_weights", {}),
+            min_rate=getattr(settings, "adaptive_rate_min", 1.0),
+            recovery_threshold=getattr(settings, "adaptive_rate_recovery", 50),
+        )
+
+    def _throttle(self, base_rate: float) -> _AdaptiveThrottle:
+        return _AdaptiveThrottle(
+            base_rate=float(base_rate),
+            min_rate=self._min_rate,
+            recovery_threshold=self._recovery_threshold,
+        )
+
+    # ── bucket lookup ──────────────────────────────────────────
+
+    def scope(self, endpoint: str, family: str) -> RateScope:
+        """Return the most specific bucket that governs *endpoint*."""
+        if endpoint in self._endpoint_rates:
+            return "endpoint"
+        if family in self._family_rates:
+            return "family"
+        return "global"
+
+    def _bucket(self, scope: RateScope, name: str) -> _TokenBucket | None:
+        if scope == "global":
+            return self._global
+        key = (scope, name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rates = self._endpoint_rates if scope == "endpoint" else self._family_rates
+            if name not in rates:
+                return None
+            bucket = _TokenBucket(
+                float(rates[name]), burst_seconds=self._burst_seconds, now=self._clock()
+            )
+            self._buckets[key] = bucket
+            self._adaptive[key] = self._throttle(float(rates[name]))
+        return bucket
+
+    def _chain(self, endpoint: str, family: str) -> tuple[_TokenBucket, ...]:
+        return tuple(
+            bucket
+            for bucket in (self._bucket("endpoint", endpoint), self._bucket("family", family))
+            if bucket is not None
+        )
+
+    def rate_for(self, endpoint: str, family: str) -> float:
+        """Effective requests/second available to one endpoint."""
+        return min(bucket.rate for bucket in (*self._chain(endpoint, family), self._global))
+
+    @property
+    def current_rate(self) -> float:
+        return self._global.rate
+
+    @property
+    def base_rate(self) -> float:
+        return self._global_adaptive._base_rate
+
+    # ── acquisition ────────────────────────────────────────────
+
+    async def acquire(self, endpoint: str, family: str) -> float:
+        """Wait for a request slot; return the seconds spent waiting.
+
+        Each waiter sleeps on its own event.  Whoever leaves the queue wakes
+        only the next ready waiter in fair order, so a grant never stampedes
+        the whole queue; the timeouts only cover token refills.
+        """
+        started = self._clock()
+        weight = max(float(self._family_weights.get(family, 1.0)), 1e-6)
+        counters = (
+            self._family_counters.setdefault(family, _ScopeCounters()),
+            self._endpoint_counters.setdefault(endpoint, _ScopeCounters()),
+        )
+        tag = max(self._virtual_time, self._family_finish.get(family, 0.0)) + 1.0 / weight
+        self._family_finish[family] = tag
+        waiter = _Waiter(tag, next(self._seq), self._chain(endpoint, family), asyncio.Event())
+        self._waiters.append(waiter)
+        for counter in counters:
+            counter.waiting += 1
+        try:
+            while (timeout := self._try_grant(waiter)) is not None:
+                waiter.wake.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(waiter.wake.wait(), timeout)
+        finally:
+            for counter in counters:
+                counter.waiting -= 1
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self._wake_next()
+        waited = self._clock() - started
+        for counter in counters:
+            counter.granted += 1
+            counter.wait_seconds += waited
+            counter.max_wait_seconds = max(counter.max_wait_seconds, waited)
+        return waited
+
+    def _next_ready(self, now: float) -> _Waiter | None:
+        """Return the earliest waiter in fair order that is not blocked on its own buckets."""
+        head: _Waiter | None = None
+        for waiter in self._waiters:
+            if (head is None or waiter.order < head.order) and all(
+                bucket.delay(now) == 0 for bucket in waiter.chain
+            ):
+                head = waiter
+        return head
+
+    def _wake_next(self) -> None:
+        head = self._next_ready(self._clock())
+        if head is not None:
+            head.wake.set()
+
+    def _try_grant(self, waiter: _Waiter) -> float | None:
+        """Grant *waiter* a slot if it is next in fair order; else return a wait timeout.
+
+        Waiters still blocked on their own family/endpoint bucket are
+        skipped, so they never hold up other families at the global bucket.
+        """
+        now = self._clock()
+        own_delay = max((bucket.delay(now) for bucket in waiter.chain), default=0.0)
+        if own_delay > 0:
+            return own_delay
+        global_delay = self._global.delay(now)
+        if self._next_ready(now) is not waiter:
+            # An earlier ready waiter goes first and wakes the next one once
+            # granted; the fallback timeout scales with the queue so parked
+            # waiters do not poll once per refill.
+            return max(global_delay, 1.0 / self._global.rate) * len(self._waiters)
+        if global_delay > 0:
+            return global_delay
+        self._global.take(now)
+        for bucket in waiter.chain:
+            bucket.take(now)
+        self._virtual_time = max(self._virtual_time, waiter.tag)
+        self._waiters.remove(waiter)
+        return None
+
+    def slot(self, endpoint: str, family: str, *, adaptive: bool = False) -> _GovernorSlot:
+        """Async context manager that acquires one request slot.
+
+        With *adaptive*, leaving the block records a success, or a failure
+        when it raised, for callers that do not report outcomes themselves.
+        """
+        return _GovernorSlot(self, endpoint, family, adaptive=adaptive)
+
+    # ── adaptation ─────────────────────────────────────────────
+
+    def _adapt(self, endpoint: str, family: str, *, success: bool) -> float | None:
+        scope = self.scope(endpoint, family)
+        if scope == "global":
+            throttle, bucket = self._global_adaptive, self._global
+        else:
+            name = endpoint if scope == "endpoint" else family
+            bucket = self._bucket(scope, name)
+            throttle = self._adaptive.get((scope, name))
+            if bucket is None or throttle is None:
+                return None
+        new_rate = throttle.record_success() if success else throttle.record_failure()
+        if new_rate is not None:
+            bucket.set_rate(new_rate, self._clock())
+        return new_rate
+
+    def record_success(self, endpoint: str, family: str) -> float | None:
+        """Count a success; return the governing bucket's new rate if it recovered."""
+        return self._adapt(endpoint, family, success=True)
+
+    def record_failure(self, endpoint: str, family: str) -> float | None:
+        """Back off the governing bucket in place; return its new rate if it changed."""
+        return self._adapt(endpoint, family, success=False)
+
+    # ── telemetry ──────────────────────────────────────────────
+
+    def wait_seconds(self, endpoints: set[str] | frozenset[str] | None = None) -> float:
+        """Total seconds requests for *endpoints* (default: all) spent queued."""
+        if endpoints is None:
+            return sum(counter.wait_seconds for counter in self._family_counters.values())
+        return sum(
+            self._endpoint_counters[endpoint].wait_seconds
+            for endpoint in endpoints
+            if endpoint in self._endpoint_counters
+        )
+
+    def snapshot(self) -> list[RateScopeStats]:
+        """Return rate, queue depth and wait totals for the global bucket and each family.
+
+        Endpoints with their own bucket get a row as well.
+        """
+        families = self._family_counters
+        stats = [
+            _stats(
+                "global",
+                "global",
+                self._global.rate,
+                self.base_rate,
+                list(families.values()),
+            )
+        ]
+        for family, counter in sorted(families.items()):
+            bucket = self._bucket("family", family)
+            throttle = self._adaptive.get(("family", family))
+            stats.append(
+                _stats(
+                    "family",
+                    family,
+                    bucket.rate if bucket is not None else self._global.rate,
+                    throttle._base_rate if throttle is not None else self.base_rate,
+                    [counter],
+                )
+            )
+        for (scope, name), bucket in sorted(self._buckets.items()):
+            if scope != "endpoint":
+                continue
+            stats.append(
+                _stats(
+                    "endpoint",
+                    name,
+                    bucket.rate,
+                    self._adaptive[(scope, name)]._base_rate,
+                    [self._endpoint_counters.get(name, _ScopeCounters())],
+                )
+            )
+        return stats
+
+
+def _stats(
+    scope: RateScope,
+    name: str,
+    rate: float,
+    base_rate: float,
+    counters: list[_ScopeCounters],
+) -> RateScopeStats:
+    return RateScopeStats(
+        scope=scope,
+        name=name,
+        rate=rate,
+        base_rate=base_rate,
+        granted=sum(counter.granted for counter in counters),
+        waiting=sum(counter.waiting for counter in counters),
+        wait_seconds=sum(counter.wait_seconds for counter in counters),
+        max_wait_seconds=max((counter.max_wait_seconds for counter in counters), default=0.0),
+    )
+
+
+class _GovernorSlot:
+    __slots__ = ("_governor", "_endpoint", "_family", "_adaptive")
+
+    def __init__(
+        self, governor: RateGovernor, endpoint: str, family: str, *, adaptive: bool = False
+    ) -> None:
+        self._governor = governor
+        self._endpoint = endpoint
+        self._family = family
+        self._adaptive = adaptive
+
+    async def __aenter__(self) -> None:
+        await self._governor.acquire(self._endpoint, self._family)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> bool:
+        if self._adaptive:
+            if exc is None:
+                new_rate = self._governor.record_success(self._endpoint, self._family)
+            elif isinstance(exc, Exception):
+                new_rate = self._governor.record_failure(self._endpoint, self._family)
+            else:
+                return False
+            if new_rate is not None:
+                logger.debug(
+                    "rate governor: {} ({}) now at {:.1f} req/s",
+                    self._endpoint,
+                    self._family,
+                    new_rate,
+                )
+        return False
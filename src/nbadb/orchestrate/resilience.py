@@ -172,6 +172,11 @@ class _LatencyTracker:
         idx = int(len(s) * p / 100)
         return s[min(idx, len(s) - 1)]
 
+    def samples(self, endpoint: str) -> int:
+        """Return how many latency samples are held for *endpoint*."""
+        buf = self._data.get(endpoint)
+        return len(buf) if buf else 0
+
     def summary(self, endpoint: str) -> dict[str, float] | None:
         """Return p50/p95/p99 for an endpoint, or None."""
         if endpoint not in self._data:
@@ -419,7 +419,7 @@ class DataScanner:
             {"agg_player_season", "agg_player_career", "analytics_player_game_complete"}
         ),
         "gold_team": frozenset({"agg_team_season", "analytics_team_season_summary"}),
-        "gold_shots": frozenset({"agg_shot_zones"}),
+        "gold_shots": frozenset({"agg_shot_chart_bins", "agg_shot_zones"}),
     }
     _FULL_PUBLICATION_CARDINALITY_PAIRS: ClassVar[tuple[tuple[str, str], ...]] = (
         ("stg_static_teams", "fact_static_teams"),
@@ -11,6 +11,7 @@ import polars as pl
 from loguru import logger
 
 from nbadb.core.types import validate_sql_identifier
+from nbadb.load.layout import sort_keys_for
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -247,12 +248,15 @@ class StagingBatchStore:
             internal = self._chunk_table_name(safe_key)
             if not self._table_exists(internal):
                 continue
+            # Play-by-play staging is clustered by game so per-game scans prune row groups.
+            sort_keys = sort_keys_for(safe_key, self._data_columns(internal))
+            order_by = f"{_quoted_csv(sort_keys)}, " if sort_keys else ""
             self._conn.execute(
                 f"""
                 CREATE OR REPLACE TABLE {safe_key} AS
                 SELECT * EXCLUDE (_nbadb_chunk_id, _nbadb_chunk_index, _nbadb_row_index)
                 FROM {internal}
-                ORDER BY _nbadb_chunk_index, _nbadb_row_index, _nbadb_chunk_id
+                ORDER BY {order_by}_nbadb_chunk_index, _nbadb_row_index, _nbadb_chunk_id
                 """
             )
             count += 1
@@ -0,0 +1,156 @@
+"""Season-type kwarg families used by each stats extractor endpoint.
+
+Generated by ``python -m nbadb.orchestrate.staging_capability_scan``; do not
+edit by hand.
+"""
+
+from __future__ import annotations
+
+SEASON_TYPE_PARAM_KEYS_BY_ENDPOINT: dict[str, frozenset[str]] = {
+    "all_time_leaders_grids": frozenset({"season_type"}),
+    "assist_leaders": frozenset({"season_type_playoffs"}),
+    "assist_tracker": frozenset({"season_type_all_star_nullable"}),
+    "box_score_advanced": frozenset(),
+    "box_score_defensive": frozenset(),
+    "box_score_four_factors": frozenset(),
+    "box_score_hustle": frozenset(),
+    "box_score_matchups": frozenset(),
+    "box_score_misc": frozenset(),
+    "box_score_player_track": frozenset(),
+    "box_score_scoring": frozenset(),
+    "box_score_summary": frozenset(),
+    "box_score_summary_v3": frozenset(),
+    "box_score_traditional": frozenset(),
+    "box_score_usage": frozenset(),
+    "common_all_players": frozenset(),
+    "common_player_info": frozenset(),
+    "common_playoff_series": frozenset(),
+    "common_team_roster": frozenset(),
+    "common_team_years": frozenset(),
+    "cume_stats_player": frozenset({"season_type_all_star"}),
+    "cume_stats_player_games": frozenset({"season_type_all_star"}),
+    "cume_stats_team": frozenset({"season_type_all_star"}),
+    "cume_stats_team_games": frozenset({"season_type_all_star"}),
+    "defense_hub": frozenset({"season_type_playoffs"}),
+    "draft_board": frozenset(),
+    "draft_combine_drill_results": frozenset(),
+    "draft_combine_non_stationary_shooting": frozenset(),
+    "draft_combine_player_anthro": frozenset(),
+    "draft_combine_spot_shooting": frozenset(),
+    "draft_combine_stats": frozenset(),
+    "draft_history": frozenset(),
+    "dunk_score_leaders": frozenset({"season_type_all_star"}),
+    "fantasy_widget": frozenset({"season_type_all_star"}),
+    "franchise_history": frozenset(),
+    "franchise_leaders": frozenset(),
+    "franchise_players": frozenset(),
+    "game_rotation": frozenset(),
+    "gl_alum_box_score_similarity_score": frozenset({"person1_season_type", "person2_season_type"}),
+    "gravity_leaders": frozenset({"season_type_all_star"}),
+    "home_page_leaders": frozenset({"season_type_playoffs"}),
+    "home_page_v2": frozenset({"season_type_playoffs"}),
+    "homepage_leaders": frozenset({"season_type_playoffs"}),
+    "homepage_v2": frozenset({"season_type_playoffs"}),
+    "hustle_stats_box_score": frozenset(),
+    "infographic_fanduel_player": frozenset(),
+    "ist_standings": frozenset(),
+    "leaders_tiles": frozenset({"season_type_playoffs"}),
+    "league_dash_lineups": frozenset({"season_type_all_star"}),
+    "league_dash_opp_pt_shot": frozenset({"season_type_all_star"}),
+    "league_dash_player_bio": frozenset({"season_type_all_star"}),
+    "league_dash_player_bio_stats": frozenset({"season_type_all_star"}),
+    "league_dash_player_clutch": frozenset({"season_type_all_star"}),
+    "league_dash_player_pt_shot": frozenset({"season_type_all_star"}),
+    "league_dash_player_shot_locations": frozenset({"season_type_all_star"}),
+    "league_dash_player_stats": frozenset({"season_type_all_star"}),
+    "league_dash_pt_defend": frozenset({"season_type_all_star"}),
+    "league_dash_pt_stats": frozenset({"season_type_all_star"}),
+    "league_dash_pt_team_defend": frozenset({"season_type_all_star"}),
+    "league_dash_team_clutch": frozenset({"season_type_all_star"}),
+    "league_dash_team_pt_shot": frozenset({"season_type_all_star"}),
+    "league_dash_team_shot_locations": frozenset({"season_type_all_star"}),
+    "league_dash_team_stats": frozenset({"season_type_all_star"}),
+    "league_game_finder": frozenset(),
+    "league_game_log": frozenset({"season_type_all_star"}),
+    "league_hustle_player": frozenset({"season_type_all_star"}),
+    "league_hustle_team": frozenset({"season_type_all_star"}),
+    "league_leaders": frozenset({"season_type_all_star"}),
+    "league_lineup_viz": frozenset({"season_type_all_star"}),
+    "league_player_on_details": frozenset({"season_type_all_star"}),
+    "league_season_matchups": frozenset(),
+    "league_standings": frozenset({"season_type"}),
+    "matchups_rollup": frozenset({"season_type_playoffs"}),
+    "play_by_play": frozenset(),
+    "play_by_play_v2": frozenset(),
+    "player_awards": frozenset(),
+    "player_career_by_college": frozenset(),
+    "player_career_by_college_rollup": frozenset(),
+    "player_career_stats": frozenset(),
+    "player_college_rollup": frozenset({"season_type_all_star"}),
+    "player_compare": frozenset({"season_type_playoffs"}),
+    "player_dash_game_splits": frozenset(),
+    "player_dash_general_splits": frozenset(),
+    "player_dash_last_n_games": frozenset(),
+    "player_dash_pt_pass": frozenset({"season_type_all_star"}),
+    "player_dash_pt_reb": frozenset({"season_type_all_star"}),
+    "player_dash_pt_shot_defend": frozenset({"season_type_all_star"}),
+    "player_dash_pt_shots": frozenset({"season_type_all_star"}),
+    "player_dash_shooting_splits": frozenset(),
+    "player_dash_team_perf": frozenset(),
+    "player_dash_yoy": frozenset(),
+    "player_dashboard_clutch": frozenset(),
+    "player_dashboard_game_splits": frozenset(),
+    "player_dashboard_general_splits": frozenset(),
+    "player_dashboard_last_n_games": frozenset(),
+    "player_dashboard_shooting_splits": frozenset(),
+    "player_dashboard_team_performance": frozenset(),
+    "player_dashboard_year_over_year": frozenset(),
+    "player_estimated_metrics": frozenset({"season_type"}),
+    "player_fantasy_profile": frozenset({"season_type_all_star_nullable"}),
+    "player_game_log": frozenset({"season_type_all_star"}),
+    "player_game_logs": frozenset({"season_type_nullable"}),
+    "player_game_logs_v2": frozenset({"season_type_nullable"}),
+    "player_game_streak_finder": frozenset(),
+    "player_index": frozenset(),
+    "player_next_games": frozenset({"season_type_all_star"}),
+    "player_profile_v2": frozenset(),
+    "player_streak_finder": frozenset(),
+    "player_vs_player": frozenset({"season_type_playoffs"}),
+    "playoff_picture": frozenset(),
+    "schedule": frozenset(),
+    "schedule_int": frozenset(),
+    "scoreboard_v2": frozenset(),
+    "scoreboard_v3": frozenset(),
+    "shot_chart_detail": frozenset({"season_type_all_star"}),
+    "shot_chart_league_wide": frozenset(),
+    "shot_chart_lineup": frozenset({"season_type_all_star"}),
+    "shot_chart_lineup_detail": frozenset({"season_type_all_star"}),
+    "synergy_play_types": frozenset({"season_type_all_star"}),
+    "team_and_players_vs": frozenset({"season_type_playoffs"}),
+    "team_and_players_vs_players": frozenset({"season_type_playoffs"}),
+    "team_dash_lineups": frozenset({"season_type_all_star"}),
+    "team_dash_pt_pass": frozenset({"season_type_all_star"}),
+    "team_dash_pt_reb": frozenset({"season_type_all_star"}),
+    "team_dash_pt_shots": frozenset({"season_type_all_star"}),
+    "team_dashboard_general_splits": frozenset({"season_type_all_star"}),
+    "team_dashboard_shooting_splits": frozenset({"season_type_all_star"}),
+    "team_details": frozenset(),
+    "team_estimated_metrics": frozenset({"season_type"}),
+    "team_game_log": frozenset({"season_type_all_star"}),
+    "team_game_logs": frozenset({"season_type_nullable"}),
+    "team_game_streak_finder": frozenset(),
+    "team_historical_leaders": frozenset(),
+    "team_info_common": frozenset({"season_type_nullable"}),
+    "team_player_dashboard": frozenset({"season_type_all_star"}),
+    "team_player_on_off_details": frozenset({"season_type_all_star"}),
+    "team_player_on_off_summary": frozenset({"season_type_all_star"}),
+    "team_vs_player": frozenset({"season_type_playoffs"}),
+    "team_year_by_year": frozenset({"season_type_all_star"}),
+    "team_year_by_year_stats": frozenset({"season_type_all_star"}),
+    "video_details": frozenset(),
+    "video_details_asset": frozenset(),
+    "video_events": frozenset(),
+    "video_events_asset": frozenset(),
+    "video_status": frozenset(),
+    "win_probability": frozenset(),
+}
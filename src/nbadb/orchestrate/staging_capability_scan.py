@@ -0,0 +1,148 @@
+"""Generate the checked-in season-type capability manifest.
+
+The stats extractor wrappers already encode which nba_api season-type kwarg
+family each endpoint uses (``season_type_all_star``, ``season_type_playoffs``,
+etc.).  This module reads that off the extractor sources with ``ast`` and
+renders it as ``staging_capabilities.py``, so ``staging_map`` can resolve
+season-type capabilities at import time without parsing any source.
+
+Regenerate after changing an extractor::
+
+    python -m nbadb.orchestrate.staging_capability_scan
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+from pathlib import Path
+
+MANIFEST_PATH = Path(__file__).with_name("staging_capabilities.py")
+_EXTRACT_ROOT = Path(__file__).resolve().parents[1] / "extract" / "stats"
+
+_MANIFEST_HEADER = '''"""Season-type kwarg families used by each stats extractor endpoint.
+
+Generated by ``python -m nbadb.orchestrate.staging_capability_scan``; do not
+edit by hand.
+"""
+
+from __future__ import annotations
+
+SEASON_TYPE_PARAM_KEYS_BY_ENDPOINT: dict[str, frozenset[str]] = {
+'''
+
+
+def _constant_string(value: ast.AST | None) -> str | None:
+    if isinstance(value, ast.Constant) and isinstance(value.value, str):
+        return value.value
+    return None
+
+
+def scan_season_type_param_keys(extract_root: Path | None = None) -> dict[str, frozenset[str]]:
+    """Infer season-type kwarg families from the stats extractor layer."""
+    root = extract_root if extract_root is not None else _EXTRACT_ROOT
+    if not root.exists():
+        return {}
+
+    endpoint_keys: dict[str, set[str]] = {}
+
+    for path in sorted(root.glob("*.py")):
+        if path.name == "__init__.py":
+            continue
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError):
+            continue
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            endpoint_name: str | None = None
+            season_type_param_keys: set[str] = set()
+
+            for stmt in node.body:
+                if isinstance(stmt, ast.Assign):
+                    for target in stmt.targets:
+                        if isinstance(target, ast.Name) and target.id == "endpoint_name":
+                            endpoint_name = _constant_string(stmt.value)
+                elif (
+                    isinstance(stmt, ast.AnnAssign)
+                    and isinstance(stmt.target, ast.Name)
+                    and stmt.target.id == "endpoint_name"
+                ):
+                    endpoint_name = _constant_string(stmt.value)
+
+            if endpoint_name is None:
+                continue
+
+            for child in ast.walk(node):
+                if not isinstance(child, ast.Call):
+                    if isinstance(child, ast.Dict):
+                        for key in child.keys:
+                            key_name = _constant_string(key)
+                            if key_name and "season_type" in key_name:
+                                season_type_param_keys.add(key_name)
+                    continue
+                func_name = None
+                if isinstance(child.func, ast.Attribute):
+                    func_name = child.func.attr
+                elif isinstance(child.func, ast.Name):
+                    func_name = child.func.id
+                if func_name not in {"_from_nba_api", "_from_nba_api_multi"}:
+                    continue
+
+                for keyword in child.keywords:
+                    if keyword.arg and "season_type" in keyword.arg:
+                        season_type_param_keys.add(keyword.arg)
+                    elif keyword.arg is None and isinstance(keyword.value, ast.Dict):
+                        for key in keyword.value.keys:
+                            key_name = _constant_string(key)
+                            if key_name and "season_type" in key_name:
+                                season_type_param_keys.add(key_name)
+
+            endpoint_keys[endpoint_name] = season_type_param_keys
+
+    return {
+        endpoint_name: frozenset(sorted(keys))
+        for endpoint_name, keys in sorted(endpoint_keys.items())
+    }
+
+
+def render_manifest(keys_by_endpoint: dict[str, frozenset[str]]) -> str:
+    lines = [_MANIFEST_HEADER]
+    for endpoint_name, keys in sorted(keys_by_endpoint.items()):
+        members = ", ".join(f'"{key}"' for key in sorted(keys))
+        value = f"frozenset({{{members}}})" if keys else "frozenset()"
+        lines.append(f'    "{endpoint_name}": {value},\n')
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero instead of writing when the manifest is out of date.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    rendered = render_manifest(scan_season_type_param_keys())
+    current = MANIFEST_PATH.read_text(encoding="utf-8") if MANIFEST_PATH.exists() else None
+    if args.check:
+        if current != rendered:
+            print(f"stale: {MANIFEST_PATH}")
+            return 1
+        return 0
+    if current != rendered:
+        MANIFEST_PATH.write_text(rendered, encoding="utf-8")
+    print(MANIFEST_PATH)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
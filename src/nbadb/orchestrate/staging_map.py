@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import ast
-from dataclasses import dataclass
-from functools import lru_cache
-from pathlib import Path
-from typing import Literal
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
 
 from nbadb.core.types import SeasonType
+from nbadb.orchestrate.staging_capabilities import SEASON_TYPE_PARAM_KEYS_BY_ENDPOINT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
 
 type ParamPattern = Literal[
     "season",
@@ -68,93 +70,8 @@ _PLAYOFF_SEASON_TYPE_PARAM_KEYS: frozenset[str] = frozenset(
 )
 
 
-def _constant_string(value: ast.AST | None) -> str | None:
-    if isinstance(value, ast.Constant) and isinstance(value.value, str):
-        return value.value
-    return None
-
-
-@lru_cache(maxsize=1)
-def _extractor_season_type_param_keys_by_endpoint() -> dict[str, frozenset[str]]:
-    """Infer season-type kwarg families from the stats extractor layer.
-
-    The extractor wrappers already encode which nba_api season-type kwarg family an
-    endpoint uses (`season_type_all_star`, `season_type_playoffs`, etc.).  Reusing
-    that keeps the staging contract explicit without hand-maintaining a large,
-    duplicated endpoint list here.
-    """
-
-    extract_root = Path(__file__).resolve().parents[1] / "extract" / "stats"
-    if not extract_root.exists():
-        return {}
-
-    endpoint_keys: dict[str, set[str]] = {}
-
-    for path in sorted(extract_root.glob("*.py")):
-        if path.name == "__init__.py":
-            continue
-        try:
-            tree = ast.parse(path.read_text(encoding="utf-8"))
-        except (OSError, SyntaxError):
-            continue
-
-        for node in tree.body:
-            if not isinstance(node, ast.ClassDef):
-                continue
-
-            endpoint_name: str | None = None
-            season_type_param_keys: set[str] = set()
-
-            for stmt in node.body:
-                if isinstance(stmt, ast.Assign):
-                    for target in stmt.targets:
-                        if isinstance(target, ast.Name) and target.id == "endpoint_name":
-                            endpoint_name = _constant_string(stmt.value)
-                elif (
-                    isinstance(stmt, ast.AnnAssign)
-                    and isinstance(stmt.target, ast.Name)
-                    and stmt.target.id == "endpoint_name"
-                ):
-                    endpoint_name = _constant_string(stmt.value)
-
-            if endpoint_name is None:
-                continue
-
-            for child in ast.walk(node):
-                if not isinstance(child, ast.Call):
-                    if isinstance(child, ast.Dict):
-                        for key in child.keys:
-                            key_name = _constant_string(key)
-                            if key_name and "season_type" in key_name:
-                                season_type_param_keys.add(key_name)
-                    continue
-                func_name = None
-                if isinstance(child.func, ast.Attribute):
-                    func_name = child.func.attr
-                elif isinstance(child.func, ast.Name):
-                    func_name = child.func.id
-                if func_name not in {"_from_nba_api", "_from_nba_api_multi"}:
-                    continue
-
-                for keyword in child.keywords:
-                    if keyword.arg and "season_type" in keyword.arg:
-                        season_type_param_keys.add(keyword.arg)
-                    elif keyword.arg is None and isinstance(keyword.value, ast.Dict):
-                        for key in keyword.value.keys:
-                            key_name = _constant_string(key)
-                            if key_name and "season_type" in key_name:
-                                season_type_param_keys.add(key_name)
-
-            endpoint_keys[endpoint_name] = season_type_param_keys
-
-    return {
-        endpoint_name: frozenset(sorted(keys))
-        for endpoint_name, keys in sorted(endpoint_keys.items())
-    }
-
-
 def _infer_supported_season_types(endpoint_name: str) -> SupportedSeasonTypes:
-    param_keys = _extractor_season_type_param_keys_by_endpoint().get(endpoint_name, frozenset())
+    param_keys = SEASON_TYPE_PARAM_KEYS_BY_ENDPOINT.get(endpoint_name, frozenset())
     if param_keys & _ALL_STAR_SEASON_TYPE_PARAM_KEYS:
         return _ALL_SEASON_TYPES
     if param_keys & _PLAYOFF_SEASON_TYPE_PARAM_KEYS:
@@ -2740,17 +2657,102 @@ STAGING_MAP: list[StagingEntry] = [
 ]
 
 
+def _group[K](
+    entries: Iterable[StagingEntry], key: Callable[[StagingEntry], K]
+) -> dict[K, tuple[StagingEntry, ...]]:
+    groups: dict[K, list[StagingEntry]] = {}
+    for entry in entries:
+        groups.setdefault(key(entry), []).append(entry)
+    return {name: tuple(members) for name, members in groups.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class StagingRegistry:
+    """Hash indexes over a staging map, built once per map.
+
+    Lookups by staging key, endpoint, pattern and multi-result group are
+    dictionary hits; every grouped view preserves ``STAGING_MAP`` order.
+    """
+
+    entries: tuple[StagingEntry, ...]
+    by_staging_key: Mapping[str, StagingEntry] = field(repr=False)
+    by_endpoint: Mapping[str, tuple[StagingEntry, ...]] = field(repr=False)
+    by_pattern: Mapping[str, tuple[StagingEntry, ...]] = field(repr=False)
+    multi_groups: Mapping[str, tuple[StagingEntry, ...]] = field(repr=False)
+    positions: Mapping[int, int] = field(repr=False)
+    """Map-order position of each entry, keyed by ``id(entry)``."""
+
+    @classmethod
+    def build(cls, entries: Iterable[StagingEntry]) -> StagingRegistry:
+        ordered = tuple(entries)
+        by_staging_key: dict[str, StagingEntry] = {}
+        for entry in ordered:
+            # First entry wins, matching the historical linear scan.
+            by_staging_key.setdefault(entry.staging_key, entry)
+        return cls(
+            entries=ordered,
+            by_staging_key=MappingProxyType(by_staging_key),
+            by_endpoint=MappingProxyType(_group(ordered, lambda e: e.endpoint_name)),
+            by_pattern=MappingProxyType(_group(ordered, lambda e: e.param_pattern)),
+            multi_groups=MappingProxyType(
+                _group((e for e in ordered if e.use_multi), lambda e: e.endpoint_name)
+            ),
+            positions=MappingProxyType({id(entry): index for index, entry in enumerate(ordered)}),
+        )
+
+    def select(
+        self,
+        *,
+        endpoints: Iterable[str] | None = None,
+        patterns: Iterable[str] | None = None,
+    ) -> list[StagingEntry]:
+        """Entries matching any of *endpoints* and any of *patterns*, in map order.
+
+        ``None`` (or an empty filter) leaves that dimension unconstrained.
+        """
+        endpoint_set = set(endpoints) if endpoints else None
+        pattern_set = set(patterns) if patterns else None
+        if endpoint_set is not None:
+            candidates = [e for name in endpoint_set for e in self.by_endpoint.get(name, ())]
+            if pattern_set is not None:
+                candidates = [e for e in candidates if e.param_pattern in pattern_set]
+        elif pattern_set is not None:
+            candidates = [e for name in pattern_set for e in self.by_pattern.get(name, ())]
+        else:
+            return list(self.entries)
+        return sorted(candidates, key=lambda e: self.positions[id(e)])
+
+
+_registry: StagingRegistry | None = None
+_registry_source: list[StagingEntry] | None = None
+
+
+def staging_registry() -> StagingRegistry:
+    """Return the indexed view of ``STAGING_MAP``.
+
+    The index is built on first use and rebuilt only if ``STAGING_MAP`` is
+    rebound or resized.
+    """
+    global _registry, _registry_source
+    registry = _registry
+    if (
+        registry is None
+        or _registry_source is not STAGING_MAP
+        or len(registry.entries) != len(STAGING_MAP)
+    ):
+        registry = _registry = StagingRegistry.build(STAGING_MAP)
+        _registry_source = STAGING_MAP
+    return registry
+
+
 def get_by_pattern(pattern: str) -> list[StagingEntry]:
     """Return all entries matching a given param_pattern."""
-    return [e for e in STAGING_MAP if e.param_pattern == pattern]
+    return list(staging_registry().by_pattern.get(pattern, ()))
 
 
 def get_by_staging_key(key: str) -> StagingEntry | None:
     """Return the entry for a given staging_key, or None."""
-    for e in STAGING_MAP:
-        if e.staging_key == key:
-            return e
-    return None
+    return staging_registry().by_staging_key.get(key)
 
 
 def get_all_staging_keys() -> list[str]:
@@ -2760,23 +2762,19 @@ def get_all_staging_keys() -> list[str]:
 
 def get_multi_entries() -> dict[str, list[StagingEntry]]:
     """Group entries sharing the same endpoint where use_multi=True."""
-    groups: dict[str, list[StagingEntry]] = {}
-    for e in STAGING_MAP:
-        if e.use_multi:
-            groups.setdefault(e.endpoint_name, []).append(e)
-    return groups
+    return {name: list(group) for name, group in staging_registry().multi_groups.items()}
 
 
 def get_by_endpoint(endpoint_name: str) -> list[StagingEntry]:
     """Return all staging entries for the given endpoint_name."""
-    return [e for e in STAGING_MAP if e.endpoint_name == endpoint_name]
+    return list(staging_registry().by_endpoint.get(endpoint_name, ()))
 
 
 def get_unique_endpoints() -> list[str]:
     """Return sorted list of unique endpoint names in STAGING_MAP."""
-    return sorted({e.endpoint_name for e in STAGING_MAP})
+    return sorted(staging_registry().by_endpoint)
 
 
 def get_unique_patterns() -> list[str]:
     """Return sorted list of unique param_patterns in STAGING_MAP."""
-    return sorted({e.param_pattern for e in STAGING_MAP})
+    return sorted(staging_registry().by_pattern)
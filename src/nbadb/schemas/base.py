@@ -207,6 +207,27 @@ class BaseSchema(pa.DataFrameModel):
     def to_schema(cls) -> Any:
         return cls._apply_schema_metadata_policy(super().to_schema())
 
+    @classmethod
+    def strip_unexpected_columns(cls, data: Any) -> Any:
+        """Drop (with a warning) frame columns this schema does not declare."""
+        import polars as pl
+
+        if not isinstance(data, (pl.DataFrame, pl.LazyFrame)):
+            return data
+
+        # Determine the required columns declared in this schema
+        expected_columns: set[str] = set(cls.to_schema().columns)
+        if isinstance(data, pl.LazyFrame):
+            actual_columns = set(data.collect_schema().names())
+        else:
+            actual_columns = set(data.columns)
+
+        extra = sorted(actual_columns - expected_columns)
+        if extra:
+            logger.warning(f"{cls.__name__}: stripping {len(extra)} unexpected column(s): {extra}")
+            data = data.drop(extra)
+        return data
+
     @classmethod
     def validate(  # type: ignore[override]
         cls,
@@ -214,25 +235,7 @@ class BaseSchema(pa.DataFrameModel):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        import polars as pl
-
-        # Determine the required columns declared in this schema
-        schema_obj = cls.to_schema()
-        expected_columns: set[str] = set(schema_obj.columns)
-
-        # Detect extra columns present in the data but not in the schema
-        if isinstance(data, (pl.DataFrame, pl.LazyFrame)):
-            if isinstance(data, pl.LazyFrame):
-                actual_columns = set(data.collect_schema().names())
-            else:
-                actual_columns = set(data.columns)
-
-            extra = sorted(actual_columns - expected_columns)
-            if extra:
-                logger.warning(
-                    f"{cls.__name__}: stripping {len(extra)} unexpected column(s): {extra}"
-                )
-                data = data.drop(extra)
+        data = cls.strip_unexpected_columns(data)
 
         # Pandera validates required columns + types (hard-fail)
         return super().validate(data, *args, **kwargs)
@@ -19,9 +19,16 @@ class AggAllTimeLeadersSchema(BaseSchema):
     reb: int | None = pa.Field(
         nullable=True, ge=0, metadata={"description": "Career total rebounds"}
     )
-    pts_rank: int = pa.Field(ge=1, metadata={"description": "All-time points rank"})
-    ast_rank: int = pa.Field(ge=1, metadata={"description": "All-time assists rank"})
-    reb_rank: int = pa.Field(ge=1, metadata={"description": "All-time rebounds rank"})
+    # Each per-stat leaderboard carries only its own rank.
+    pts_rank: int | None = pa.Field(
+        nullable=True, ge=1, metadata={"description": "All-time points rank"}
+    )
+    ast_rank: int | None = pa.Field(
+        nullable=True, ge=1, metadata={"description": "All-time assists rank"}
+    )
+    reb_rank: int | None = pa.Field(
+        nullable=True, ge=1, metadata={"description": "All-time rebounds rank"}
+    )
 
 
 class AggClutchStatsSchema(BaseSchema):
@@ -537,6 +544,49 @@ class AggShotLocationSeasonSchema(BaseSchema):
     season_fgm_rank: int = pa.Field(ge=1, metadata={"description": "Season FGM rank"})
 
 
+class AggShotChartBinsSchema(BaseSchema):
+    """Shot attempts per court grid cell, zone and season, at each grid resolution."""
+
+    player_id: int = pa.Field(gt=0, metadata={"description": "Unique player identifier"})
+    team_id: int | None = pa.Field(
+        nullable=True, metadata={"description": "Team the shots were taken for"}
+    )
+    season_year: str = pa.Field(metadata={"description": "Season year (e.g. 2024-25)"})
+    season_type: str | None = pa.Field(
+        nullable=True, metadata={"description": "Season type (Regular Season, Playoffs, etc.)"}
+    )
+    resolution_ft: int = pa.Field(gt=0, metadata={"description": "Grid cell edge length in feet"})
+    bin_x: int | None = pa.Field(
+        nullable=True,
+        ge=0,
+        metadata={"description": "Cell column from the left sideline (null without coordinates)"},
+    )
+    bin_y: int | None = pa.Field(
+        nullable=True,
+        ge=0,
+        metadata={"description": "Cell row from behind the baseline (null without coordinates)"},
+    )
+    shot_zone_basic: str | None = pa.Field(
+        nullable=True, metadata={"description": "Basic shot zone classification"}
+    )
+    shot_zone_area: str | None = pa.Field(
+        nullable=True, metadata={"description": "Shot zone area (left, center, right)"}
+    )
+    shot_zone_range: str | None = pa.Field(
+        nullable=True, metadata={"description": "Shot distance range"}
+    )
+    attempts: int = pa.Field(ge=0, metadata={"description": "Shot attempts in the cell"})
+    makes: int | None = pa.Field(
+        nullable=True, ge=0, metadata={"description": "Shots made in the cell"}
+    )
+    distance_sum: int | None = pa.Field(
+        nullable=True, ge=0, metadata={"description": "Sum of shot distances in feet"}
+    )
+    distance_count: int = pa.Field(
+        ge=0, metadata={"description": "Attempts with a recorded shot distance"}
+    )
+
+
 class AggShotZonesSchema(BaseSchema):
     """Player shooting stats aggregated by court zone per season."""
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Annotated
+
 import pandera.polars as pa
+from pandera.engines import polars_engine as pe  # noqa: TC002
 
+from nbadb.core.types import EVENT_TYPE_NAMES
 from nbadb.schemas.base import BaseSchema
 
 
@@ -55,6 +59,14 @@ class FactPlayByPlaySchema(BaseSchema):
             "description": ("Period clock time string"),
         },
     )
+    clock_deciseconds: int | None = pa.Field(
+        nullable=True,
+        ge=0,
+        metadata={
+            "source": "derived.clock_deciseconds",
+            "description": "Period clock remaining, in tenths of a second",
+        },
+    )
     home_description: str | None = pa.Field(
         nullable=True,
         metadata={
@@ -138,7 +150,7 @@ class FactPlayByPlaySchema(BaseSchema):
             "fk_ref": "dim_team.team_id",
         },
     )
-    event_type_name: str | None = pa.Field(
+    event_type_name: Annotated[pe.Enum, EVENT_TYPE_NAMES] | None = pa.Field(
         nullable=True,
         metadata={
             "source": ("derived.event_type_name"),
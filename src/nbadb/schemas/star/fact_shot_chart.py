@@ -109,6 +109,14 @@ class FactShotChartSchema(BaseSchema):
             "description": ("Shot Y-coordinate on court"),
         },
     )
+    shot_bin_id: int | None = pa.Field(
+        nullable=True,
+        ge=0,
+        metadata={
+            "source": "derived.shot_bin_id",
+            "description": "One-foot court grid cell of the shot (see agg_shot_chart_bins)",
+        },
+    )
     shot_made_flag: int | None = pa.Field(
         nullable=True,
         isin=[0, 1],
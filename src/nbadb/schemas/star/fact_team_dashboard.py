@@ -28,6 +28,16 @@ class _TeamDashboardPlayerIdentityMixin(BaseSchema):
     )
 
 
+class _TeamDashboardRosterIdentityMixin(BaseSchema):
+    # Null on the team's overall row, which shares the table with the roster.
+    player_id: int | None = pa.Field(
+        nullable=True, gt=0, metadata={"description": "Player identifier"}
+    )
+    player_name: str | None = pa.Field(
+        nullable=True, metadata={"description": "Player display name"}
+    )
+
+
 class _TeamDashboardReferenceMixin(BaseSchema):
     cfid: int | None = pa.Field(nullable=True, ge=0)
     cfparams: str | None = pa.Field(nullable=True)
@@ -159,7 +169,7 @@ class FactTeamDashboardShootingOverallSchema(
 class FactTeamPlayerDashboardSchema(
     _TeamDashboardSeasonTypeMixin,
     _TeamDashboardGroupSetMixin,
-    _TeamDashboardPlayerIdentityMixin,
+    _TeamDashboardRosterIdentityMixin,
     _TeamDashboardStandardMetricsMixin,
     _TeamDashboardStandardRanksMixin,
     _TeamDashboardFantasyMetricsMixin,
@@ -162,6 +162,13 @@ class FactTeamGameSchema(BaseSchema):
             "description": "Team total points",
         },
     )
+    plus_minus: int | None = pa.Field(
+        nullable=True,
+        metadata={
+            "source": "derived.team_agg.pts",
+            "description": "Team points minus opponent points",
+        },
+    )
     pts_qtr1: int | None = pa.Field(
         nullable=True,
         ge=0,
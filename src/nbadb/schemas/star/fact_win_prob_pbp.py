@@ -108,6 +108,14 @@ class FactWinProbPbpSchema(BaseSchema):
             "description": "Period clock time string (e.g. 12:00)",
         },
     )
+    clock_deciseconds: int | None = pa.Field(
+        nullable=True,
+        ge=0,
+        metadata={
+            "source": "derived.clock_deciseconds",
+            "description": "Period clock remaining, in tenths of a second",
+        },
+    )
     isvisible: int | None = pa.Field(
         nullable=True,
         metadata={
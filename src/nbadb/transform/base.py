@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
 from loguru import logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import duckdb
     import polars as pl
 
@@ -13,6 +16,9 @@ if TYPE_CHECKING:
 class BaseTransformer(ABC):
     output_table: ClassVar[str]
     depends_on: ClassVar[list[str]] = []
+    # ``transform`` keeps ``output_table`` up to date in the database itself,
+    # so loaders only write the returned frame to the file formats.
+    persists_output: ClassVar[bool] = False
 
     def __init__(self) -> None:
         self._conn: duckdb.DuckDBPyConnection | None = None
@@ -37,6 +43,50 @@ class BaseTransformer(ABC):
         return df
 
 
+@dataclass(frozen=True, slots=True)
+class Passthrough:
+    """Source tables of a transformer that only copies or UNIONs them.
+
+    *branches* pairs each discriminator label with its source table; a plain
+    passthrough has a single branch and no *discriminator*.  Knowing this
+    lets the pipeline reuse the source frames instead of running the SQL,
+    and lets the DuckDB loader define the output as a view over the
+    persisted sources instead of copying them.
+    """
+
+    branches: tuple[tuple[str, str], ...]
+    discriminator: str | None = None
+
+    @property
+    def sources(self) -> list[str]:
+        return [source for _, source in self.branches]
+
+    def sql(self, *, catalog: str | None = None) -> str:
+        """The equivalent SQL; *catalog* pins sources to ``<catalog>.main``."""
+        prefix = "" if catalog is None else '"{}".main.'.format(catalog.replace('"', '""'))
+        if self.discriminator is None:
+            return f"SELECT * FROM {prefix}{self.branches[0][1]}"
+        return "\nUNION ALL BY NAME\n".join(
+            f"SELECT *, '{label}' AS {self.discriminator} FROM {prefix}{source}"
+            for label, source in self.branches
+        )
+
+    def frame(self, frames: Mapping[str, pl.DataFrame]) -> pl.DataFrame:
+        """Build the output from already-materialized source *frames* without copying rows."""
+        import polars as pl
+
+        if self.discriminator is None:
+            return frames[self.branches[0][1]]
+        return pl.concat(
+            [
+                frames[source].with_columns(pl.lit(label).alias(self.discriminator))
+                for label, source in self.branches
+            ],
+            how="diagonal_relaxed",
+            rechunk=False,
+        )
+
+
 class SqlTransformer(BaseTransformer):
     """Base for transformers that execute a single SQL query.
 
@@ -45,6 +95,7 @@ class SqlTransformer(BaseTransformer):
     """
 
     _SQL: ClassVar[str] = ""
+    _PASSTHROUGH: ClassVar[Passthrough | None] = None
 
     def transform(self, staging: dict[str, pl.LazyFrame]) -> pl.DataFrame:
         if not self._SQL:
@@ -65,13 +116,15 @@ def make_passthrough(output_table: str, source_table: str) -> type[SqlTransforme
     """Create a SqlTransformer that passes through a staging table unchanged."""
     _validate_identifier(output_table)
     _validate_identifier(source_table)
+    passthrough = Passthrough(branches=(("", source_table),))
     return type(
         f"{''.join(w.title() for w in output_table.split('_'))}Transformer",
         (SqlTransformer,),
         {
             "output_table": output_table,
             "depends_on": [source_table],
-            "_SQL": f"SELECT * FROM {source_table}",
+            "_SQL": passthrough.sql(),
+            "_PASSTHROUGH": passthrough,
         },
     )
 
@@ -84,19 +137,16 @@ def make_union(
     """Create a SqlTransformer that UNIONs staging tables with a discriminator column."""
     _validate_identifier(output_table)
     _validate_identifier(discriminator)
-    parts = []
-    depends = []
-    for label, stg_table in branches.items():
+    for stg_table in branches.values():
         _validate_identifier(stg_table)
-        parts.append(f"SELECT *, '{label}' AS {discriminator} FROM {stg_table}")
-        depends.append(stg_table)
-    sql = "\nUNION ALL BY NAME\n".join(parts)
+    passthrough = Passthrough(branches=tuple(branches.items()), discriminator=discriminator)
     return type(
         f"{''.join(w.title() for w in output_table.split('_'))}Transformer",
         (SqlTransformer,),
         {
             "output_table": output_table,
-            "depends_on": depends,
-            "_SQL": sql,
+            "depends_on": passthrough.sources,
+            "_SQL": passthrough.sql(),
+            "_PASSTHROUGH": passthrough,
         },
     )
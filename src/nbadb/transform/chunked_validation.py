@@ -0,0 +1,424 @@
+"""Bounded-memory validation of large outputs against their pandera schemas.
+
+pandera evaluates every check over the whole frame, building boolean masks and
+failure-case frames as large as the data, which makes validating
+``fact_play_by_play`` or ``fact_shot_chart`` across all seasons the biggest
+memory spike of a build.  Here a schema is split in two:
+
+* column checks that map onto SQL -- nullability, ``ge``/``gt``/``le``/``lt``,
+  ``in_range``, ``isin``/``notin``, uniqueness and (opt-in) foreign-key
+  presence -- are pushed down into one DuckDB aggregate query over the
+  registered frame or table, which DuckDB streams;
+* the residual schema -- dtype checks, coercion and any custom checks --
+  runs per chunk of at most ``chunk_rows`` rows, either zero-copy slices of a
+  frame or record batches streamed from a DuckDB table.
+
+Per-chunk failures are merged into one :class:`ChunkedValidationReport`, so
+peak validation memory is bounded by the chunk size rather than the table.
+"""
+
+from __future__ import annotations
+
+import copy
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+import pandera.errors as pa_errors
+import polars as pl
+from loguru import logger
+
+from nbadb.core.errors import TransformError, ValidationError
+from nbadb.core.types import validate_sql_identifier
+from nbadb.schemas.base import BaseSchema
+
+if TYPE_CHECKING:
+    import pandera.polars as pa
+
+DEFAULT_VALIDATION_CHUNK_ROWS = 500_000
+_MAX_FAILURE_SAMPLES = 5
+# Alias of the checked relation, so correlated subqueries can name its columns.
+_ROW_ALIAS = "_row"
+
+# pandera check name -> (SQL operator that marks a *failing* row, statistic).
+_COMPARISON_CHECKS: dict[str, tuple[str, str]] = {
+    "equal_to": ("<>", "value"),
+    "not_equal_to": ("=", "value"),
+    "greater_than": ("<=", "min_value"),
+    "greater_than_or_equal_to": ("<", "min_value"),
+    "less_than": (">=", "max_value"),
+    "less_than_or_equal_to": (">", "max_value"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Pushdown:
+    """A column check expressed as a SQL predicate that is true for failing rows."""
+
+    column: str
+    check: str
+    predicate: str
+    params: tuple[Any, ...] = ()
+
+
+@dataclass(slots=True)
+class CheckFailure:
+    column: str | None
+    check: str
+    failures: int = 0
+    samples: list[str] = field(default_factory=list)
+
+    def add(self, failures: int, samples: list[Any]) -> None:
+        self.failures += failures
+        room = _MAX_FAILURE_SAMPLES - len(self.samples)
+        self.samples.extend(str(sample) for sample in samples[:room])
+
+
+@dataclass(slots=True)
+class ChunkedValidationReport:
+    """Failures merged across chunks and pushed-down checks for one table."""
+
+    table: str
+    rows: int = 0
+    chunks: int = 0
+    pushed_down: int = 0
+    failures: dict[tuple[str | None, str], CheckFailure] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def record(
+        self, column: str | None, check: str, failures: int, samples: list[Any] | None = None
+    ) -> None:
+        entry = self.failures.setdefault((column, check), CheckFailure(column, check))
+        entry.add(failures, samples or [])
+
+    def record_schema_errors(self, exc: pa_errors.SchemaErrors) -> None:
+        cases = exc.failure_cases
+        if not isinstance(cases, pl.DataFrame) or cases.is_empty():
+            self.record(None, "schema", 1, [str(exc)])
+            return
+        for (context, column, check), group in cases.group_by(
+            ["schema_context", "column", "check"], maintain_order=True
+        ):
+            # Frame-level failures name the schema as their column and embed
+            # the whole dtype map in the check.
+            if context == "DataFrameSchema":
+                column, check = None, str(check).split("(", 1)[0]
+            self.record(column, str(check), group.height, group["failure_case"].to_list())
+
+    def describe(self) -> str:
+        details = "; ".join(
+            f"{failure.column or '<frame>'}: {failure.check} failed for "
+            f"{failure.failures:,} row(s), e.g. {failure.samples}"
+            for failure in self.failures.values()
+        )
+        return (
+            f"{self.table}: {len(self.failures)} check(s) failed over {self.rows:,} rows: {details}"
+        )
+
+    def raise_for_failures(self) -> None:
+        if self.failures:
+            raise ValidationError(self.describe())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "pushed_down": self.pushed_down,
+            "failures": [
+                {
+                    "column": failure.column,
+                    "check": failure.check,
+                    "failures": failure.failures,
+                    "samples": failure.samples,
+                }
+                for failure in self.failures.values()
+            ],
+        }
+
+
+def _quote(name: str) -> str:
+    return f'"{validate_sql_identifier(name)}"'
+
+
+def _column_pushdowns(name: str, column: Any) -> tuple[list[_Pushdown], list[Any]]:
+    """Split one column's checks into SQL pushdowns and residual pandera checks."""
+    quoted = _quote(name)
+    pushdowns: list[_Pushdown] = []
+    residual: list[Any] = []
+    for check in column.checks:
+        stats = check.statistics or {}
+        if check.name in _COMPARISON_CHECKS:
+            operator, statistic = _COMPARISON_CHECKS[check.name]
+            pushdowns.append(
+                _Pushdown(name, check.name, f"{quoted} {operator} ?", (stats[statistic],))
+            )
+        elif check.name == "in_range":
+            low = "<" if stats.get("include_min", True) else "<="
+            high = ">" if stats.get("include_max", True) else ">="
+            pushdowns.append(
+                _Pushdown(
+                    name,
+                    check.name,
+                    f"({quoted} {low} ? OR {quoted} {high} ?)",
+                    (stats["min_value"], stats["max_value"]),
+                )
+            )
+        elif check.name in {"isin", "notin"} and stats.get(
+            "allowed_values", stats.get("forbidden_values")
+        ):
+            values = tuple(stats.get("allowed_values", stats.get("forbidden_values")))
+            placeholders = ", ".join("?" for _ in values)
+            negation = "NOT " if check.name == "isin" else ""
+            pushdowns.append(
+                _Pushdown(name, check.name, f"{quoted} {negation}IN ({placeholders})", values)
+            )
+        else:
+            residual.append(check)
+    if not column.nullable:
+        predicate = f"{quoted} IS NULL"
+        if column.dtype.type.is_float():
+            predicate = f"({predicate} OR isnan({quoted}))"
+        pushdowns.append(_Pushdown(name, "not_nullable", predicate))
+    return pushdowns, residual
+
+
+def split_schema(schema: pa.DataFrameSchema) -> tuple[pa.DataFrameSchema, list[_Pushdown]]:
+    """Return the residual per-chunk schema and the checks pushed down to SQL.
+
+    Regex-selected columns and checks without a SQL equivalent stay in the
+    residual schema; pushed-down columns are relaxed there to nullable and
+    non-unique so chunks do not repeat (or, for uniqueness, miss) them.
+    """
+    pushdowns: list[_Pushdown] = []
+    updates: dict[str, dict[str, Any]] = {}
+    for name, column in schema.columns.items():
+        if column.regex:
+            continue
+        column_pushdowns, residual = _column_pushdowns(name, column)
+        pushdowns.extend(column_pushdowns)
+        if column.unique:
+            pushdowns.append(_Pushdown(name, "field_uniqueness", ""))
+        updates[name] = {"checks": residual, "nullable": True, "unique": False}
+    residual_schema = schema.update_columns(updates) if updates else copy.deepcopy(schema)
+    if schema.unique:
+        columns = [schema.unique] if isinstance(schema.unique, str) else list(schema.unique)
+        pushdowns.append(_Pushdown(",".join(columns), "multiple_fields_uniqueness", ""))
+        residual_schema.unique = None
+    return residual_schema, pushdowns
+
+
+def _relation_exists(conn: duckdb.DuckDBPyConnection, relation: str) -> bool:
+    try:
+        conn.execute(f"SELECT 1 FROM {_quote(relation)} LIMIT 0")
+    except duckdb.CatalogException:
+        return False
+    return True
+
+
+def _foreign_key_pushdowns(
+    conn: duckdb.DuckDBPyConnection, schema: pa.DataFrameSchema
+) -> list[_Pushdown]:
+    """Orphan checks for ``fk_ref`` columns whose dimension is queryable."""
+    pushdowns: list[_Pushdown] = []
+    for name, column in schema.columns.items():
+        fk_ref = (column.metadata or {}).get("fk_ref")
+        if not isinstance(fk_ref, str) or "." not in fk_ref:
+            continue
+        dim_table, dim_column = fk_ref.split(".", 1)
+        if not _relation_exists(conn, dim_table):
+            continue
+        quoted = _quote(name)
+        # NOT IN would be NULL, never true, once the dimension column holds a NULL.
+        pushdowns.append(
+            _Pushdown(
+                name,
+                f"foreign_key({fk_ref})",
+                f"({quoted} IS NOT NULL AND NOT EXISTS (SELECT 1 FROM {_quote(dim_table)} d "
+                f"WHERE d.{_quote(dim_column)} = {_ROW_ALIAS}.{quoted}))",
+            )
+        )
+    return pushdowns
+
+
+def _uniqueness_sql(pushdown: _Pushdown, relation: str) -> tuple[str, str]:
+    columns = ", ".join(_quote(column) for column in pushdown.column.split(","))
+    count_sql = f"SELECT COUNT(*) - COUNT(DISTINCT ({columns})) FROM {relation}"
+    sample_sql = (
+        f"SELECT ({columns}) FROM {relation} GROUP BY {columns} "
+        f"HAVING COUNT(*) > 1 LIMIT {_MAX_FAILURE_SAMPLES}"
+    )
+    return count_sql, sample_sql
+
+
+def _fetch_counts(
+    conn: duckdb.DuckDBPyConnection, sql: str, params: list[Any] | None = None
+) -> tuple[Any, ...]:
+    row = conn.execute(sql, params).fetchone()
+    if row is None:
+        msg = f"Expected pushdown count query to return a row: {sql}"
+        raise TransformError(msg)
+    return row
+
+
+def _run_pushdowns(
+    conn: duckdb.DuckDBPyConnection,
+    relation: str,
+    pushdowns: list[_Pushdown],
+    report: ChunkedValidationReport,
+) -> None:
+    """Evaluate *pushdowns* over *relation* and merge their failures into *report*."""
+    quoted_relation = _quote(relation)
+    aliased = f"{quoted_relation} AS {_ROW_ALIAS}"
+    predicates = [pushdown for pushdown in pushdowns if pushdown.predicate]
+    if predicates:
+        aggregates = ", ".join(
+            f"COUNT(*) FILTER (WHERE {pushdown.predicate})" for pushdown in predicates
+        )
+        params = [param for pushdown in predicates for param in pushdown.params]
+        row = _fetch_counts(conn, f"SELECT {aggregates} FROM {aliased}", params)
+        for pushdown, failures in zip(predicates, row, strict=True):
+            if failures:
+                samples = conn.execute(
+                    f"SELECT {_quote(pushdown.column)} FROM {aliased} "
+                    f"WHERE {pushdown.predicate} LIMIT {_MAX_FAILURE_SAMPLES}",
+                    list(pushdown.params),
+                ).fetchall()
+                report.record(
+                    pushdown.column, pushdown.check, failures, [value for (value,) in samples]
+                )
+    for pushdown in pushdowns:
+        if pushdown.predicate:
+            continue
+        count_sql, sample_sql = _uniqueness_sql(pushdown, quoted_relation)
+        row = _fetch_counts(conn, count_sql)
+        if row[0]:
+            samples = conn.execute(sample_sql).fetchall()
+            report.record(pushdown.column, pushdown.check, row[0], [value for (value,) in samples])
+    report.pushed_down += len(pushdowns)
+
+
+def _validate_chunk(
+    residual: pa.DataFrameSchema,
+    chunk: pl.DataFrame,
+    report: ChunkedValidationReport,
+) -> pl.DataFrame | None:
+    report.chunks += 1
+    report.rows += chunk.height
+    try:
+        validated = residual.validate(chunk, lazy=True)
+    except pa_errors.SchemaErrors as exc:
+        report.record_schema_errors(exc)
+        return None
+    except pa_errors.SchemaError as exc:
+        report.record(None, "schema", 1, [str(exc)])
+        return None
+    if not isinstance(validated, pl.DataFrame):
+        raise TypeError(
+            f"validate() returned {type(validated).__name__}, expected polars.DataFrame"
+        )
+    return validated
+
+
+def validate_frame_in_chunks(
+    schema_cls: type[pa.DataFrameModel],
+    df: pl.DataFrame,
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    table: str,
+    chunk_rows: int = DEFAULT_VALIDATION_CHUNK_ROWS,
+    foreign_keys: bool = False,
+) -> pl.DataFrame:
+    """Validate *df* chunk by chunk and return it, coerced like ``schema_cls.validate``.
+
+    Raises :class:`~nbadb.core.errors.ValidationError` describing every failed
+    check when any chunk or pushed-down check fails.
+    """
+    schema = schema_cls.to_schema()
+    if issubclass(schema_cls, BaseSchema):
+        df = schema_cls.strip_unexpected_columns(df)
+    residual, pushdowns = split_schema(schema)
+    report = ChunkedValidationReport(table)
+
+    coerced: list[pl.DataFrame] = []
+    for offset in range(0, max(df.height, 1), chunk_rows):
+        chunk = df.slice(offset, chunk_rows)
+        validated = _validate_chunk(residual, chunk, report)
+        # Slices share the frame's buffers; only keep coerced chunks when
+        # coercion actually changed a dtype.
+        if validated is not None and (coerced or validated.schema != chunk.schema):
+            coerced.append(validated)
+    # Pushed-down SQL compares against the schema's dtypes, so it only runs
+    # over frames that passed the dtype checks.
+    report.raise_for_failures()
+    if coerced:
+        df = pl.concat(coerced, rechunk=False)
+        del coerced
+
+    if foreign_keys:
+        pushdowns.extend(_foreign_key_pushdowns(conn, schema))
+    relation = f"_validate_{table}_{uuid.uuid4().hex[:8]}"
+    # The newest Arrow layout keeps string views, so DuckDB scans the frame's
+    # own buffers instead of a converted copy.
+    conn.register(relation, df.to_arrow(compat_level=pl.CompatLevel.newest()))
+    try:
+        _run_pushdowns(conn, relation, pushdowns, report)
+    finally:
+        conn.unregister(relation)
+    report.raise_for_failures()
+    logger.debug(
+        "Validated '{}' against {} in {} chunk(s), {} check(s) pushed down",
+        table,
+        schema_cls.__name__,
+        report.chunks,
+        report.pushed_down,
+    )
+    return df
+
+
+def validate_table_in_chunks(
+    schema_cls: type[pa.DataFrameModel],
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    *,
+    chunk_rows: int = DEFAULT_VALIDATION_CHUNK_ROWS,
+    foreign_keys: bool = False,
+) -> ChunkedValidationReport:
+    """Validate a DuckDB table in place, streaming record batches of *chunk_rows*."""
+    schema = schema_cls.to_schema()
+    residual, pushdowns = split_schema(schema)
+    report = ChunkedValidationReport(table)
+    quoted_table = _quote(table)
+    columns = [
+        column
+        for column in conn.execute(f"SELECT * FROM {quoted_table} LIMIT 0").pl().columns
+        if column in schema.columns
+    ]
+    select = ", ".join(_quote(column) for column in columns) or "*"
+    reader = conn.execute(f"SELECT {select} FROM {quoted_table}").to_arrow_reader(chunk_rows)
+    saw_batch = False
+    for batch in reader:
+        saw_batch = True
+        _validate_chunk(residual, pl.DataFrame(batch), report)
+    if not saw_batch:
+        _validate_chunk(residual, pl.DataFrame(reader.schema.empty_table()), report)
+    if not report.passed:
+        return report
+
+    if foreign_keys:
+        pushdowns.extend(_foreign_key_pushdowns(conn, schema))
+    _run_pushdowns(conn, table, pushdowns, report)
+    return report
+
+
+__all__ = [
+    "DEFAULT_VALIDATION_CHUNK_ROWS",
+    "CheckFailure",
+    "ChunkedValidationReport",
+    "split_schema",
+    "validate_frame_in_chunks",
+    "validate_table_in_chunks",
+]
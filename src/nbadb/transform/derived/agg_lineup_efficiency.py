@@ -12,7 +12,7 @@ class AggLineupEfficiencyTransformer(SqlTransformer):
     _SQL: ClassVar[str] = """
         SELECT
             group_id, team_id, season_year,
-            SUM(gp) AS total_gp,
+            SUM(gp)::BIGINT AS total_gp,
             SUM(min) AS total_min,
             SUM(pts)::FLOAT / NULLIF(SUM(min), 0) * 48.0 AS pts_per48,
             AVG(net_rating) AS avg_net_rating,
@@ -12,7 +12,7 @@ class AggPlayerCareerTransformer(SqlTransformer):
     _SQL: ClassVar[str] = """
         SELECT
             player_id,
-            SUM(gp) AS career_gp,
+            SUM(gp)::BIGINT AS career_gp,
             SUM(total_min) AS career_min,
             SUM(total_pts) AS career_pts,
             SUM(total_pts)::FLOAT / NULLIF(SUM(gp), 0) AS career_ppg,
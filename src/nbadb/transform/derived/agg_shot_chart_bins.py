@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, ClassVar
+
+import duckdb
+import polars as pl
+from loguru import logger
+
+from nbadb.load.layout import SORT_KEYS
+from nbadb.transform.base import BaseTransformer
+from nbadb.transform.result_cache import CACHE_SCHEMA, persisted_table
+from nbadb.transform.shot_grid import GRID_COLUMNS, RESOLUTIONS_FT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_SEASONS_VIEW = "_shot_bin_seasons"
+
+# Changes to the grid or the rollup must invalidate every binned season.
+_GRID_VERSION = f"square:{GRID_COLUMNS}:{','.join(map(str, RESOLUTIONS_FT))}:v1"
+
+# fact_shot_chart already carries season_year, so a season's shots are
+# summarized with plain column sums and no join; dim_game is small and only
+# contributes each season's game ids and season types.
+_SEASON_FINGERPRINTS_SQL = """
+    WITH shots AS (
+        SELECT
+            season_year,
+            count(*) AS shots,
+            sum(shot_made_flag) AS makes,
+            sum(shot_bin_id) AS bins,
+            sum(shot_distance) AS distance,
+            sum(player_id) AS players,
+            sum(team_id) AS teams
+        FROM fact_shot_chart
+        WHERE season_year IS NOT NULL
+        GROUP BY season_year
+    ),
+    games AS (
+        SELECT
+            season_year,
+            count(*) AS games,
+            sum(hash(game_id, season_type)::HUGEINT) AS game_types
+        FROM dim_game
+        GROUP BY season_year
+    )
+    SELECT
+        s.season_year,
+        list_value(
+            s.shots, s.makes, s.bins, s.distance, s.players, s.teams, g.games, g.game_types
+        )::VARCHAR AS fingerprint
+    FROM shots s
+    LEFT JOIN games g ON s.season_year = g.season_year
+"""
+
+_RESOLUTIONS = ", ".join(f"({ft})" for ft in RESOLUTIONS_FT)
+
+# Shots are binned once into base cells; every resolution is rolled up from
+# those cells.  Only seasons listed in the seasons view are recomputed.
+_ROLLUP_SQL = f"""
+    WITH cells AS (
+        SELECT
+            s.player_id,
+            s.team_id,
+            g.season_year,
+            g.season_type,
+            s.shot_bin_id % {GRID_COLUMNS} AS bin_x,
+            s.shot_bin_id // {GRID_COLUMNS} AS bin_y,
+            s.shot_zone_basic,
+            s.shot_zone_area,
+            s.shot_zone_range,
+            COUNT(*) AS attempts,
+            SUM(s.shot_made_flag) AS makes,
+            SUM(s.shot_distance) AS distance_sum,
+            COUNT(s.shot_distance) AS distance_count
+        FROM fact_shot_chart s
+        JOIN {_SEASONS_VIEW} k ON s.season_year = k.season_year
+        JOIN dim_game g ON s.game_id = g.game_id
+        GROUP BY ALL
+    )
+    SELECT
+        c.player_id,
+        c.team_id,
+        c.season_year,
+        c.season_type,
+        r.resolution_ft,
+        c.bin_x // r.resolution_ft AS bin_x,
+        c.bin_y // r.resolution_ft AS bin_y,
+        c.shot_zone_basic,
+        c.shot_zone_area,
+        c.shot_zone_range,
+        CAST(SUM(c.attempts) AS BIGINT) AS attempts,
+        CAST(SUM(c.makes) AS BIGINT) AS makes,
+        CAST(SUM(c.distance_sum) AS BIGINT) AS distance_sum,
+        CAST(SUM(c.distance_count) AS BIGINT) AS distance_count
+    FROM cells c
+    CROSS JOIN (VALUES {_RESOLUTIONS}) r(resolution_ft)
+    GROUP BY ALL
+    ORDER BY {", ".join(SORT_KEYS["agg_shot_chart_bins"])}
+"""
+
+
+class AggShotChartBinsTransformer(BaseTransformer):
+    """Shot attempts and makes per court grid cell, at every grid resolution.
+
+    One row per (player, team, season, season type, resolution, cell, zone),
+    so a player-season heatmap is a filter on ``player_id``/``season_year``/
+    ``resolution_ft`` instead of a scan of ``fact_shot_chart``.  The loaded
+    table is maintained in place: a side table in the transform cache schema
+    holds a fingerprint of each season's shots, and a rebuild deletes and
+    rebins only the seasons whose fingerprint changed.
+    """
+
+    output_table: ClassVar[str] = "agg_shot_chart_bins"
+    depends_on: ClassVar[list[str]] = ["fact_shot_chart", "dim_game"]
+    persists_output: ClassVar[bool] = True
+
+    @property
+    def _fingerprint_table(self) -> str:
+        return f"{CACHE_SCHEMA}.{self.output_table}__season_fingerprints"
+
+    def transform(self, staging: dict[str, pl.LazyFrame]) -> pl.DataFrame:
+        target = persisted_table(self.conn, self.output_table)
+        fingerprints = (
+            self.conn.execute(_SEASON_FINGERPRINTS_SQL)
+            .pl()
+            .with_columns(pl.col("fingerprint") + f"|{_GRID_VERSION}")
+        )
+        try:
+            self._refresh(target, fingerprints)
+        except duckdb.Error as exc:
+            logger.debug(
+                "{}: incremental refresh failed ({}), rebinning all seasons",
+                self.output_table,
+                type(exc).__name__,
+            )
+            with suppress(duckdb.Error):
+                self.conn.execute(f"DROP TABLE IF EXISTS {self._fingerprint_table}")
+            with self._seasons(fingerprints):
+                self.conn.execute(f"CREATE OR REPLACE TABLE {target} AS {_ROLLUP_SQL}")
+        return self.conn.execute(f"SELECT * FROM {target}").pl()
+
+    def _refresh(self, target: str, fingerprints: pl.DataFrame) -> None:
+        conn = self.conn
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {CACHE_SCHEMA}")
+        # Earlier builds kept a full copy of the rollup here
+        conn.execute(f"DROP TABLE IF EXISTS {CACHE_SCHEMA}.{self.output_table}__seasons")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._fingerprint_table} "
+            "(season_year VARCHAR PRIMARY KEY, fingerprint VARCHAR NOT NULL)"
+        )
+        recorded: dict[str, str] = {}
+        if self._has_target():
+            recorded = dict(
+                conn.execute(
+                    f"SELECT season_year, fingerprint FROM {self._fingerprint_table}"
+                ).fetchall()
+            )
+        else:
+            with self._seasons(fingerprints.clear()):
+                conn.execute(f"CREATE TABLE {target} AS {_ROLLUP_SQL}")
+        current = dict(fingerprints.iter_rows())
+        kept = [season for season, fp in current.items() if recorded.get(season) == fp]
+        stale = fingerprints.filter(~pl.col("season_year").is_in(kept))
+        logger.debug(
+            "{}: rebinning {} of {} seasons",
+            self.output_table,
+            stale.height,
+            fingerprints.height,
+        )
+        if stale.is_empty() and len(recorded) == len(kept):
+            return
+        conn.begin()
+        try:
+            # Rows of any season not vouched for by an unchanged fingerprint go,
+            # including seasons that no longer have shots.
+            conn.execute(
+                f"DELETE FROM {target} "
+                "WHERE season_year IS NULL OR NOT list_contains(?::VARCHAR[], season_year)",
+                [kept],
+            )
+            if not stale.is_empty():
+                with self._seasons(stale):
+                    conn.execute(f"INSERT INTO {target} {_ROLLUP_SQL}")
+            conn.execute(
+                f"DELETE FROM {self._fingerprint_table} "
+                "WHERE NOT list_contains(?::VARCHAR[], season_year)",
+                [kept],
+            )
+            conn.execute(
+                f"INSERT INTO {self._fingerprint_table} "
+                "SELECT unnest(?::VARCHAR[]), unnest(?::VARCHAR[])",
+                [stale["season_year"].to_list(), stale["fingerprint"].to_list()],
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def _has_target(self) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM duckdb_tables() "
+            "WHERE database_name = current_database() AND schema_name = 'main' "
+            "AND NOT temporary AND table_name = ?",
+            [self.output_table],
+        ).fetchone()
+        return row is not None
+
+    @contextmanager
+    def _seasons(self, seasons: pl.DataFrame) -> Iterator[None]:
+        """Expose *seasons* (``season_year``, ``fingerprint``) to the rollup SQL."""
+        self.conn.register(_SEASONS_VIEW, seasons)
+        try:
+            yield
+        finally:
+            self.conn.unregister(_SEASONS_VIEW)
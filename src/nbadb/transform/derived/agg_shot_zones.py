@@ -3,25 +3,27 @@ from __future__ import annotations
 from typing import ClassVar
 
 from nbadb.transform.base import SqlTransformer
+from nbadb.transform.shot_grid import RESOLUTIONS_FT
 
 
 class AggShotZonesTransformer(SqlTransformer):
     output_table: ClassVar[str] = "agg_shot_zones"
-    depends_on: ClassVar[list[str]] = ["fact_shot_chart", "dim_game"]
+    depends_on: ClassVar[list[str]] = ["agg_shot_chart_bins"]
 
-    _SQL: ClassVar[str] = """
+    # Every resolution covers every shot once, so the base grid alone sums to the zone totals.
+    _SQL: ClassVar[str] = f"""
         SELECT
-            s.player_id,
-            g.season_year,
-            s.shot_zone_basic,
-            s.shot_zone_area,
-            s.shot_zone_range,
-            COUNT(*) AS attempts,
-            SUM(s.shot_made_flag) AS makes,
-            SUM(s.shot_made_flag)::FLOAT / NULLIF(COUNT(*), 0) AS fg_pct,
-            AVG(s.shot_distance) AS avg_distance
-        FROM fact_shot_chart s
-        JOIN dim_game g ON s.game_id = g.game_id
-        GROUP BY s.player_id, g.season_year,
-                 s.shot_zone_basic, s.shot_zone_area, s.shot_zone_range
+            player_id,
+            season_year,
+            shot_zone_basic,
+            shot_zone_area,
+            shot_zone_range,
+            SUM(attempts)::BIGINT AS attempts,
+            SUM(makes)::BIGINT AS makes,
+            SUM(makes)::FLOAT / NULLIF(SUM(attempts), 0) AS fg_pct,
+            SUM(distance_sum)::DOUBLE / NULLIF(SUM(distance_count), 0) AS avg_distance
+        FROM agg_shot_chart_bins
+        WHERE resolution_ft = {RESOLUTIONS_FT[0]}
+        GROUP BY player_id, season_year,
+                 shot_zone_basic, shot_zone_area, shot_zone_range
     """
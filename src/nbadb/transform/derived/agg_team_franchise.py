@@ -11,8 +11,12 @@ class AggTeamFranchiseTransformer(SqlTransformer):
 
     _SQL: ClassVar[str] = """
         SELECT
-            *,
-            end_year - start_year + 1 AS franchise_age_years,
+            * REPLACE (
+                TRY_CAST(start_year AS INTEGER) AS start_year,
+                TRY_CAST(end_year AS INTEGER) AS end_year
+            ),
+            TRY_CAST(end_year AS INTEGER) - TRY_CAST(start_year AS INTEGER) + 1
+                AS franchise_age_years,
             CASE WHEN games > 0
                  THEN ROUND(wins * 1.0 / games, 3)
                  ELSE NULL
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from nbadb.core.types import EVENT_TYPE_NAMES
+
+EVENT_TYPE_ENUM = "ENUM({})".format(", ".join(f"'{name}'" for name in EVENT_TYPE_NAMES))
+
+
+def clock_deciseconds_sql(column: str) -> str:
+    """SQL parsing a period clock (``11:42``, ``0:05.3``, ``PT11M42.00S``) to deciseconds.
+
+    Unparseable clocks become ``NULL``.
+    """
+    parts = f"regexp_extract({column}, '^(?:PT)?(\\d+)[M:](\\d+(?:\\.\\d+)?)S?$', ['m', 's'])"
+    return (
+        f"CAST(round((TRY_CAST(struct_extract({parts}, 'm') AS INTEGER) * 60"
+        f" + TRY_CAST(struct_extract({parts}, 's') AS DOUBLE)) * 10) AS INTEGER)"
+    )
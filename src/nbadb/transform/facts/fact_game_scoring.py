@@ -7,7 +7,7 @@ from nbadb.transform.base import SqlTransformer
 
 class FactGameScoringTransformer(SqlTransformer):
     output_table: ClassVar[str] = "fact_game_scoring"
-    depends_on: ClassVar[list[str]] = ["stg_line_score"]
+    depends_on: ClassVar[list[str]] = ["stg_line_score", "dim_game"]
 
     _SQL: ClassVar[str] = """
         WITH home AS (
@@ -30,7 +30,12 @@ class FactGameScoringTransformer(SqlTransformer):
                 ]) AS pts
             FROM stg_line_score
         )
-        SELECT * FROM home WHERE pts IS NOT NULL
-        UNION ALL
-        SELECT * FROM away WHERE pts IS NOT NULL
+        SELECT s.*, g.season_year
+        FROM (
+            SELECT * FROM home
+            UNION ALL
+            SELECT * FROM away
+        ) s
+        LEFT JOIN dim_game g ON s.game_id = g.game_id
+        WHERE s.pts IS NOT NULL
     """
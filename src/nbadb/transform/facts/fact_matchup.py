@@ -7,15 +7,17 @@ from nbadb.transform.base import SqlTransformer
 
 class FactMatchupTransformer(SqlTransformer):
     output_table: ClassVar[str] = "fact_matchup"
-    depends_on: ClassVar[list[str]] = ["stg_matchup"]
+    depends_on: ClassVar[list[str]] = ["stg_matchup", "dim_game"]
 
     _SQL: ClassVar[str] = """
         SELECT
-            game_id,
-            off_player_id, def_player_id,
-            off_team_id, def_team_id,
-            matchup_min, partial_poss,
-            player_pts,
-            def_fgm, def_fga, def_fg_pct
-        FROM stg_matchup
+            m.game_id,
+            m.off_player_id AS player_id, m.def_player_id,
+            m.off_team_id AS team_id, m.def_team_id,
+            m.matchup_min, m.partial_poss,
+            m.player_pts,
+            m.def_fgm, m.def_fga, m.def_fg_pct,
+            g.season_year
+        FROM stg_matchup m
+        LEFT JOIN dim_game g ON m.game_id = g.game_id
     """
@@ -3,13 +3,14 @@ from __future__ import annotations
 from typing import ClassVar
 
 from nbadb.transform.base import SqlTransformer
+from nbadb.transform.facts._play_by_play import EVENT_TYPE_ENUM, clock_deciseconds_sql
 
 
 class FactPlayByPlayTransformer(SqlTransformer):
     output_table: ClassVar[str] = "fact_play_by_play"
-    depends_on: ClassVar[list[str]] = ["stg_play_by_play"]
+    depends_on: ClassVar[list[str]] = ["stg_play_by_play", "dim_game"]
 
-    _SQL: ClassVar[str] = """
+    _SQL: ClassVar[str] = f"""
         SELECT
             game_id,
             event_num,
@@ -18,6 +19,7 @@ class FactPlayByPlayTransformer(SqlTransformer):
             period,
             wc_time_string,
             pc_time_string,
+            {clock_deciseconds_sql("pc_time_string")} AS clock_deciseconds,
             home_description,
             neutral_description,
             visitor_description,
@@ -26,7 +28,7 @@ class FactPlayByPlayTransformer(SqlTransformer):
             player1_id, player1_team_id,
             player2_id, player2_team_id,
             player3_id, player3_team_id,
-            CASE event_msg_type
+            CAST(CASE event_msg_type
                 WHEN 1 THEN 'made_shot'
                 WHEN 2 THEN 'missed_shot'
                 WHEN 3 THEN 'free_throw'
@@ -41,6 +43,8 @@ class FactPlayByPlayTransformer(SqlTransformer):
                 WHEN 12 THEN 'period_start'
                 WHEN 13 THEN 'period_end'
                 ELSE 'unknown'
-            END AS event_type_name
+            END AS {EVENT_TYPE_ENUM}) AS event_type_name,
+            g.season_year
         FROM stg_play_by_play
+        LEFT JOIN dim_game g USING (game_id)
     """
@@ -10,6 +10,6 @@ class FactPlayerAwardsTransformer(SqlTransformer):
     depends_on: ClassVar[list[str]] = ["stg_player_awards"]
 
     _SQL: ClassVar[str] = """
-        SELECT *
+        SELECT * RENAME (person_id AS player_id)
         FROM stg_player_awards
     """
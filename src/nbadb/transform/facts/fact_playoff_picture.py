@@ -16,14 +16,39 @@ class FactPlayoffPictureTransformer(SqlTransformer):
         "stg_playoff_picture_west_remaining",
     ]
 
+    # The three result sets repeat ``conference`` and the stamped
+    # ``season_type``, and standings and remaining both carry ``team``;
+    # keep one copy of each before joining.
     _SQL: ClassVar[str] = """
+        WITH east AS (
+            SELECT COLUMNS(c -> c <> 'conference') FROM stg_playoff_picture_east
+        ),
+        east_standings AS (
+            SELECT COLUMNS(c -> c NOT IN ('conference', 'season_type'))
+            FROM stg_playoff_picture_east_standings
+        ),
+        east_remaining AS (
+            SELECT COLUMNS(c -> c NOT IN ('conference', 'season_type', 'team'))
+            FROM stg_playoff_picture_east_remaining
+        ),
+        west AS (
+            SELECT COLUMNS(c -> c <> 'conference') FROM stg_playoff_picture_west
+        ),
+        west_standings AS (
+            SELECT COLUMNS(c -> c NOT IN ('conference', 'season_type'))
+            FROM stg_playoff_picture_west_standings
+        ),
+        west_remaining AS (
+            SELECT COLUMNS(c -> c NOT IN ('conference', 'season_type', 'team'))
+            FROM stg_playoff_picture_west_remaining
+        )
         SELECT *, 'East' AS conference
-        FROM stg_playoff_picture_east
-        LEFT JOIN stg_playoff_picture_east_standings USING (team_id)
-        LEFT JOIN stg_playoff_picture_east_remaining USING (team_id)
+        FROM east
+        LEFT JOIN east_standings USING (team_id)
+        LEFT JOIN east_remaining USING (team_id)
         UNION ALL BY NAME
         SELECT *, 'West' AS conference
-        FROM stg_playoff_picture_west
-        LEFT JOIN stg_playoff_picture_west_standings USING (team_id)
-        LEFT JOIN stg_playoff_picture_west_remaining USING (team_id)
+        FROM west
+        LEFT JOIN west_standings USING (team_id)
+        LEFT JOIN west_remaining USING (team_id)
     """
@@ -31,12 +31,26 @@ class FactTeamGameTransformer(SqlTransformer):
             FROM stg_box_score_traditional
             WHERE player_id IS NOT NULL
             GROUP BY game_id, team_id
+        ),
+        margins AS (
+            -- The opponent's points are the game total minus the team's own;
+            -- that only holds when the box score has exactly both teams.
+            SELECT
+                game_id, team_id,
+                CASE WHEN COUNT(*) OVER game = 2
+                     THEN 2 * pts - SUM(pts) OVER game
+                END AS plus_minus
+            FROM team_agg
+            WINDOW game AS (PARTITION BY game_id)
         )
         SELECT
             t.*,
+            m.plus_minus,
             g.season_year,
             l.pts_qtr1, l.pts_qtr2, l.pts_qtr3, l.pts_qtr4
         FROM team_agg t
+        LEFT JOIN margins m
+            ON t.game_id = m.game_id AND t.team_id IS NOT DISTINCT FROM m.team_id
         LEFT JOIN dim_game g ON t.game_id = g.game_id
         LEFT JOIN stg_line_score l
             ON t.game_id = l.game_id AND t.team_id = l.team_id
@@ -3,13 +3,14 @@ from __future__ import annotations
 from typing import ClassVar
 
 from nbadb.transform.base import SqlTransformer
+from nbadb.transform.facts._play_by_play import clock_deciseconds_sql
 
 
 class FactWinProbPbpTransformer(SqlTransformer):
     output_table: ClassVar[str] = "fact_win_prob_pbp"
     depends_on: ClassVar[list[str]] = ["stg_win_prob_pbp"]
 
-    _SQL: ClassVar[str] = """
+    _SQL: ClassVar[str] = f"""
         SELECT
             game_id,
             event_num,
@@ -25,6 +26,7 @@ class FactWinProbPbpTransformer(SqlTransformer):
             description,
             location,
             pctimestring,
+            {clock_deciseconds_sql("pctimestring")} AS clock_deciseconds,
             isvisible
         FROM stg_win_prob_pbp
     """
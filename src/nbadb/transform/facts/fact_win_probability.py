@@ -7,14 +7,16 @@ from nbadb.transform.base import SqlTransformer
 
 class FactWinProbabilityTransformer(SqlTransformer):
     output_table: ClassVar[str] = "fact_win_probability"
-    depends_on: ClassVar[list[str]] = ["stg_win_probability"]
+    depends_on: ClassVar[list[str]] = ["stg_win_probability", "dim_game"]
 
     _SQL: ClassVar[str] = """
         SELECT
-            game_id, event_num, period,
-            pc_time_string,
-            home_pct, visitor_pct,
-            home_pts, visitor_pts,
-            home_score_margin
-        FROM stg_win_probability
+            w.game_id, w.event_num, w.period,
+            w.pc_time_string,
+            w.home_pct, w.visitor_pct,
+            w.home_pts, w.visitor_pts,
+            w.home_score_margin,
+            g.season_year
+        FROM stg_win_probability w
+        LEFT JOIN dim_game g ON w.game_id = g.game_id
     """
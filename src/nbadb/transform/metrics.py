@@ -28,6 +28,7 @@ class TransformerMetric:
     column_count: int = 0
     status: str = "pending"  # pending, success, failed, skipped
     error_message: str | None = None
+    cache_hit: bool | None = None  # None when the transformer is not cacheable
 
     @property
     def duration_seconds(self) -> float:
@@ -57,8 +58,14 @@ class PipelineMetrics:
         table_name: str,
         row_count: int,
         column_count: int,
+        *,
+        cache_hit: bool | None = None,
     ) -> None:
-        """Record successful completion of a transformer."""
+        """Record successful completion of a transformer.
+
+        *cache_hit* is ``True`` when the output was reused from the transform
+        result cache and ``False`` when a cacheable transformer was recomputed.
+        """
         metric = self.transformers.get(table_name)
         if metric is None:
             return
@@ -66,12 +73,14 @@ class PipelineMetrics:
         metric.row_count = row_count
         metric.column_count = column_count
         metric.status = "success"
+        metric.cache_hit = cache_hit
         logger.debug(
-            "metric: {} completed in {:.2f}s ({} rows, {} cols)",
+            "metric: {} completed in {:.2f}s ({} rows, {} cols{})",
             table_name,
             metric.duration_seconds,
             row_count,
             column_count,
+            ", cached" if cache_hit else "",
         )
 
     def fail_transformer(self, table_name: str, error: str) -> None:
@@ -114,6 +123,14 @@ class PipelineMetrics:
     def skipped_count(self) -> int:
         return sum(1 for m in self.transformers.values() if m.status == "skipped")
 
+    @property
+    def cache_hits(self) -> int:
+        return sum(1 for m in self.transformers.values() if m.cache_hit is True)
+
+    @property
+    def cache_misses(self) -> int:
+        return sum(1 for m in self.transformers.values() if m.cache_hit is False)
+
     @property
     def total_rows(self) -> int:
         return sum(m.row_count for m in self.transformers.values())
@@ -132,6 +149,8 @@ class PipelineMetrics:
             "success": self.success_count,
             "failed": self.failed_count,
             "skipped": self.skipped_count,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
             "total_rows": self.total_rows,
             "slowest_5": [
                 {
@@ -164,6 +183,12 @@ class PipelineMetrics:
             s["total_duration_seconds"],
             s["total_rows"],
         )
+        if s["cache_hits"] or s["cache_misses"]:
+            logger.info(
+                "Transform cache: {} hits, {} misses",
+                s["cache_hits"],
+                s["cache_misses"],
+            )
         if s["slowest_5"]:
             logger.info("Slowest transformers:")
             for item in s["slowest_5"]:
@@ -6,6 +6,7 @@ import inspect
 import pkgutil
 import traceback
 import uuid
+from collections import ChainMap
 from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import TYPE_CHECKING, Protocol
@@ -14,14 +15,22 @@ import pandera.polars as pa
 import polars as pl
 from loguru import logger
 
+from nbadb.core.tracing import NOOP_TRACER
 from nbadb.transform.base import SqlTransformer
+from nbadb.transform.chunked_validation import (
+    DEFAULT_VALIDATION_CHUNK_ROWS,
+    validate_frame_in_chunks,
+)
 from nbadb.transform.metrics import PipelineMetrics
-from nbadb.transform.schema_version import SchemaVersionTracker
+from nbadb.transform.result_cache import frame_fingerprint
+from nbadb.transform.schema_version import SchemaVersionTracker, stored_dtype_name
 
 if TYPE_CHECKING:
     import duckdb
 
-    from nbadb.transform.base import BaseTransformer
+    from nbadb.core.tracing import Tracer
+    from nbadb.transform.base import BaseTransformer, Passthrough
+    from nbadb.transform.result_cache import TransformResultCache
 
 
 @dataclass
@@ -33,6 +42,8 @@ class TransformResult:
     """List of (table_name, error_message) tuples for failed transformers."""
     skipped: list[str] = field(default_factory=list)
     """List of table names loaded from checkpoint (skipped re-computation)."""
+    cached: list[str] = field(default_factory=list)
+    """List of table names reused from the cross-run transform result cache."""
 
     @property
     def success_count(self) -> int:
@@ -121,11 +132,24 @@ class TransformPipeline:
         conn: duckdb.DuckDBPyConnection,
         *,
         run_id: str | None = None,
+        cache: TransformResultCache | None = None,
+        tracer: Tracer | None = None,
+        validation_chunk_rows: int = DEFAULT_VALIDATION_CHUNK_ROWS,
     ) -> None:
         self._conn = conn
         self._run_id = run_id or uuid.uuid4().hex
+        self._cache = cache
+        self._tracer = tracer if tracer is not None else NOOP_TRACER
+        # Outputs taller than this are validated chunk by chunk; 0 disables.
+        self._validation_chunk_rows = validation_chunk_rows
         self._transformers: list[BaseTransformer] = []
         self._outputs: dict[str, pl.DataFrame] = {}
+        self._staging_frames: dict[str, pl.DataFrame] = {}
+        self._passthroughs: dict[str, Passthrough] = {}
+        self._persisted: list[str] = []
+        # Input fingerprints, hashed only when a cacheable transformer reads them
+        self._fingerprints: dict[str, str] = {}
+        self._cache_keys: dict[str, str] = {}
         self._last_result: TransformResult | None = None
         self._metrics = PipelineMetrics(run_id=self._run_id)
 
@@ -134,6 +158,36 @@ class TransformPipeline:
         """Access the pass/fail summary from the most recent run."""
         return self._last_result
 
+    @property
+    def passthroughs(self) -> dict[str, Passthrough]:
+        """Outputs built by reusing their source frames, keyed by output table."""
+        return dict(self._passthroughs)
+
+    @property
+    def persisted_tables(self) -> list[str]:
+        """Outputs whose transformer already wrote them to the database this run."""
+        return list(self._persisted)
+
+    @property
+    def cache_keys(self) -> dict[str, str]:
+        """Cache keys of the outputs computed (or reused) this run, keyed by output table.
+
+        Pass each to ``TransformResultCache.record`` once the table is loaded.
+        """
+        return dict(self._cache_keys)
+
+    def _fingerprint(self, name: str) -> str | None:
+        fingerprint = self._fingerprints.get(name)
+        if fingerprint is None:
+            frame = self._outputs.get(name)
+            if frame is None:
+                frame = self._staging_frames.get(name)
+            if frame is None:
+                return None
+            fingerprint = frame_fingerprint(frame)
+            self._fingerprints[name] = fingerprint
+        return fingerprint
+
     def register(self, transformer: BaseTransformer) -> None:
         self._transformers.append(transformer)
 
@@ -236,8 +290,10 @@ class TransformPipeline:
             try:
                 data = val.collect()
                 if validate_input_schemas:
-                    data = self._validate_input_schema(key, data)
+                    with self._tracer.span(key, phase="validation", rows=data.shape[0]):
+                        data = self._validate_input_schema(key, data)
                 prepared[key] = data.lazy()
+                self._staging_frames[key] = data
                 self._conn.register(key, data)
             except Exception as exc:
                 failed.add(key)
@@ -249,11 +305,18 @@ class TransformPipeline:
                 )
         return prepared, failed
 
-    @staticmethod
-    def _validate_output_schema(table: str, df: pl.DataFrame) -> pl.DataFrame:
+    def _validate_output_schema(self, table: str, df: pl.DataFrame) -> pl.DataFrame:
         schema_cls = _star_schema_map().get(table)
         if schema_cls is None:
             return df
+        if 0 < self._validation_chunk_rows < df.height:
+            return validate_frame_in_chunks(
+                schema_cls,
+                df,
+                self._conn,
+                table=table,
+                chunk_rows=self._validation_chunk_rows,
+            )
         validated = schema_cls.validate(df)
         if not isinstance(validated, pl.DataFrame):
             raise TypeError(
@@ -263,6 +326,16 @@ class TransformPipeline:
         logger.debug("Validated '{}' against {}", table, schema_cls.__name__)
         return validated
 
+    def _passthrough_for(self, transformer: BaseTransformer) -> Passthrough | None:
+        """The transformer's passthrough spec when every source frame is in hand."""
+        passthrough = getattr(transformer, "_PASSTHROUGH", None)
+        if passthrough is None:
+            return None
+        for source in passthrough.sources:
+            if source not in self._outputs and source not in self._staging_frames:
+                return None
+        return passthrough
+
     def _record_output_schema_versions(self) -> None:
         if not self._outputs:
             return
@@ -271,7 +344,7 @@ class TransformPipeline:
             table: list(df.columns) for table, df in self._outputs.items() if not df.is_empty()
         }
         dtypes_by_table = {
-            table: [str(dtype) for dtype in df.dtypes]
+            table: [stored_dtype_name(dtype) for dtype in df.dtypes]
             for table, df in self._outputs.items()
             if not df.is_empty()
         }
@@ -291,6 +364,9 @@ class TransformPipeline:
 
         result = TransformResult()
         self._last_result = result
+        self._fingerprints.clear()
+        self._cache_keys.clear()
+        self._persisted.clear()
 
         # Load checkpoint data when resuming
         checkpointed: set[str] = set()
@@ -352,18 +428,60 @@ class TransformPipeline:
                         )
 
                 self._metrics.start_transformer(table)
+                # Passthroughs reuse their source frames, which is cheaper than
+                # reading a cached copy and not worth storing one of.
+                passthrough = self._passthrough_for(transformer)
+                cache_key = (
+                    self._cache.key_for(transformer, self._fingerprint)
+                    if self._cache is not None
+                    else None
+                )
+                if cache_key is not None and self._cache is not None and passthrough is None:
+                    cached_df = self._cache.lookup(table, cache_key)
+                    if cached_df is not None and validate_output_schemas:
+                        try:
+                            with self._tracer.span(table, phase="validation", cached=True):
+                                cached_df = self._validate_output_schema(table, cached_df)
+                        except Exception as exc:
+                            logger.warning(
+                                "Cached output for '{}' failed validation ({}), re-computing",
+                                table,
+                                type(exc).__name__,
+                            )
+                            cached_df = None
+                    if cached_df is not None:
+                        self._outputs[table] = cached_df
+                        self._fingerprints[table] = cache_key
+                        self._cache_keys[table] = cache_key
+                        self._metrics.complete_transformer(
+                            table, cached_df.shape[0], cached_df.shape[1], cache_hit=True
+                        )
+                        self._conn.register(table, cached_df)
+                        result.completed.append(table)
+                        result.cached.append(table)
+                        if on_progress is not None:
+                            on_progress.advance_pattern(success=True)
+                        self._save_checkpoint(table, cached_df.shape[0])
+                        logger.debug(f"Reused {table} from transform cache")
+                        continue
                 try:
                     transformer._conn = self._conn
-                    # SqlTransformers execute SQL directly via conn; skip dict construction
-                    if isinstance(transformer, SqlTransformer):
-                        df = transformer.run({})
-                    else:
-                        combined = {**prepared_staging}
-                        for name, out_df in self._outputs.items():
-                            combined[name] = out_df.lazy()
-                        df = transformer.run(combined)
+                    with self._tracer.span(
+                        table, phase="transform", transformer=type(transformer).__name__
+                    ):
+                        if passthrough is not None:
+                            df = passthrough.frame(ChainMap(self._outputs, self._staging_frames))
+                        # SqlTransformers execute SQL directly via conn; skip dict construction
+                        elif isinstance(transformer, SqlTransformer):
+                            df = transformer.run({})
+                        else:
+                            combined = {**prepared_staging}
+                            for name, out_df in self._outputs.items():
+                                combined[name] = out_df.lazy()
+                            df = transformer.run(combined)
                     if validate_output_schemas:
-                        df = self._validate_output_schema(table, df)
+                        with self._tracer.span(table, phase="validation", rows=df.shape[0]):
+                            df = self._validate_output_schema(table, df)
                 except Exception as exc:
                     tb = traceback.format_exc()
                     error_msg = f"{type(exc).__name__}: {exc}"
@@ -380,9 +498,22 @@ class TransformPipeline:
                         on_progress.advance_pattern(success=False)
                     continue
                 self._outputs[table] = df
-                self._metrics.complete_transformer(table, df.shape[0], df.shape[1])
+                self._metrics.complete_transformer(
+                    table,
+                    df.shape[0],
+                    df.shape[1],
+                    cache_hit=False if cache_key is not None and passthrough is None else None,
+                )
                 # INFRA-006: Only register the NEW output from each completed transformer
                 self._conn.register(table, df)
+                if cache_key is not None:
+                    self._fingerprints[table] = cache_key
+                    if passthrough is None:
+                        self._cache_keys[table] = cache_key
+                if passthrough is not None:
+                    self._passthroughs[table] = passthrough
+                if transformer.persists_output:
+                    self._persisted.append(table)
                 result.completed.append(table)
                 if on_progress is not None:
                     on_progress.advance_pattern(success=True)
@@ -397,6 +528,9 @@ class TransformPipeline:
             if result.failed:
                 logger.warning(f"Failed transformers: {result.failed_tables}")
 
+            if self._cache is not None:
+                self._cache.evict(active_tables=[t.output_table for t in self._transformers])
+
             # Finalize and persist metrics
             self._metrics.finalize()
             self._metrics.log_summary()
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-import hashlib
 from dataclasses import dataclass, field
 from enum import StrEnum
+from typing import TYPE_CHECKING
 
 import duckdb
 from loguru import logger
 
 from nbadb.core.types import validate_sql_identifier
+from nbadb.transform.chunked_validation import (
+    DEFAULT_VALIDATION_CHUNK_ROWS,
+    validate_table_in_chunks,
+)
+from nbadb.transform.schema_version import (
+    SchemaVersionTracker,
+    schema_hash_for_columns,
+    stored_dtype_name,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    import pandera.polars as pa
 
 
 class CheckLayer(StrEnum):
@@ -68,12 +82,7 @@ class DataQualityMonitor:
         current_columns: list[str],
         current_types: list[str] | None = None,
     ) -> QualityResult:
-        if current_types and len(current_types) == len(current_columns):
-            pairs = sorted(zip(current_columns, current_types, strict=True))
-            raw = ",".join(f"{c}:{t}" for c, t in pairs)
-        else:
-            raw = ",".join(sorted(current_columns))
-        current_hash = hashlib.sha256(raw.encode()).hexdigest()[:16]
+        current_hash = schema_hash_for_columns(current_columns, current_types)
         passed = current_hash == expected_hash
         result = QualityResult(
             table=table,
@@ -91,6 +100,73 @@ class DataQualityMonitor:
             logger.warning(result.message)
         return result
 
+    def check_schema_drifts(
+        self,
+        tables: dict[str, list[str]],
+        table_types: Mapping[str, list[str] | None] | None = None,
+    ) -> list[QualityResult]:
+        """Check many tables against their recorded ``_schema_versions`` at once.
+
+        Stored versions are read in a single query; untracked tables are skipped.
+        """
+        tracker = SchemaVersionTracker(self.conn)
+        tracked = tracker.get_current_versions(tables)
+        changed = {
+            change.table_name: change
+            for change in tracker.check_for_changes(
+                {table: columns for table, columns in tables.items() if table in tracked},
+                table_types,
+            )
+        }
+        results: list[QualityResult] = []
+        for table in sorted(tracked):
+            change = changed.get(table)
+            expected_hash = tracked[table][1]
+            current_hash = change.new_hash if change is not None else expected_hash
+            result = QualityResult(
+                table=table,
+                check_type="schema_drift",
+                layer=CheckLayer.STRUCTURAL,
+                passed=change is None,
+                message=(
+                    f"{table}: schema {'unchanged' if change is None else 'CHANGED'} "
+                    f"(expected={expected_hash}, got={current_hash})"
+                ),
+                details={"expected": expected_hash, "actual": current_hash},
+            )
+            self.results.append(result)
+            if change is not None:
+                logger.warning(result.message)
+            results.append(result)
+        return results
+
+    def check_loaded_schema_drifts(
+        self,
+        tables: Iterable[str] | None = None,
+    ) -> list[QualityResult]:
+        """Check loaded tables (default: every tracked one) for schema drift.
+
+        Column types are read back as Polars dtypes from a zero-row query per
+        table and named by ``stored_dtype_name``, as the transform pipeline
+        records them.  A database without ``_schema_versions`` has nothing to
+        drift from.
+        """
+        loaded = self._loaded_tables()
+        if "_schema_versions" not in loaded:
+            return []
+        tracked = set(SchemaVersionTracker(self.conn).get_current_versions(tables))
+        columns: dict[str, list[str]] = {}
+        types: dict[str, list[str] | None] = {}
+        for table in sorted(tracked & loaded):
+            schema = (
+                self.conn.execute(f"SELECT * FROM {validate_sql_identifier(table)} LIMIT 0")
+                .pl()
+                .schema
+            )
+            columns[table] = schema.names()
+            types[table] = [stored_dtype_name(dtype) for dtype in schema.dtypes()]
+        return self.check_schema_drifts(columns, types)
+
     def check_null_rate(
         self,
         table: str,
@@ -161,6 +237,88 @@ class DataQualityMonitor:
             logger.warning(result.message)
         return result
 
+    def check_schema_contract(
+        self,
+        table: str,
+        schema_cls: type[pa.DataFrameModel],
+        *,
+        chunk_rows: int = DEFAULT_VALIDATION_CHUNK_ROWS,
+        foreign_keys: bool = False,
+    ) -> QualityResult:
+        """Validate *table* against its pandera schema without loading it whole.
+
+        SQL-expressible checks run as aggregate queries and dtype checks run
+        over record batches of *chunk_rows*; see :mod:`nbadb.transform.chunked_validation`.
+        """
+        report = validate_table_in_chunks(
+            schema_cls,
+            self.conn,
+            table,
+            chunk_rows=chunk_rows,
+            foreign_keys=foreign_keys,
+        )
+        result = QualityResult(
+            table=table,
+            check_type="schema_contract",
+            layer=CheckLayer.STRUCTURAL,
+            passed=report.passed,
+            message=(
+                f"{table}: {schema_cls.__name__} OK over {report.rows} rows"
+                if report.passed
+                else report.describe()
+            ),
+            details=report.to_dict(),
+        )
+        self.results.append(result)
+        if not result.passed:
+            logger.warning(result.message)
+        return result
+
+    def check_loaded_schema_contracts(
+        self,
+        tables: Iterable[str] | None = None,
+        *,
+        chunk_rows: int = DEFAULT_VALIDATION_CHUNK_ROWS,
+    ) -> list[QualityResult]:
+        """Run :meth:`check_schema_contract` on loaded star tables (default: all of them).
+
+        Only tables with a registered output schema are checked.  A table whose
+        check cannot run is recorded as a failed result instead of aborting the
+        remaining tables.
+        """
+        from nbadb.schemas.registry import get_output_schema
+
+        loaded = self._loaded_tables()
+        candidates = loaded if tables is None else loaded & set(tables)
+        results: list[QualityResult] = []
+        for table in sorted(candidates):
+            schema_cls = get_output_schema(table)
+            if schema_cls is None:
+                continue
+            try:
+                results.append(self.check_schema_contract(table, schema_cls, chunk_rows=chunk_rows))
+            except Exception as exc:
+                result = QualityResult(
+                    table=table,
+                    check_type="schema_contract",
+                    layer=CheckLayer.STRUCTURAL,
+                    passed=False,
+                    message=f"{table}: schema contract check errored ({type(exc).__name__})",
+                )
+                self.results.append(result)
+                logger.warning(result.message)
+                results.append(result)
+        return results
+
+    def _loaded_tables(self) -> set[str]:
+        return {
+            row[0]
+            for row in self.conn.execute(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = 'main' AND table_type = 'BASE TABLE'"
+            ).fetchall()
+        }
+
     # -- Layer 2: Relational (cross-table) ------------------------------------
 
     def check_referential_integrity(
@@ -0,0 +1,224 @@
+"""Cross-run reuse of pure SQL transform outputs.
+
+A ``SqlTransformer`` that only defines ``_SQL`` is a pure function of its SQL
+text and the tables listed in ``depends_on``.  The cache keys each output by
+(transformer class, SQL hash, input fingerprints) and records, per star table,
+the key its loaded contents were built from and a hash of those contents.  A
+later run whose key matches, and whose table still hashes the same, reads the
+star table back instead of re-executing the query, so no second copy of any
+output is kept and the table is not loaded again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, TypeGuard
+
+import polars as pl
+from loguru import logger
+
+from nbadb.core.types import validate_sql_identifier
+from nbadb.transform.base import SqlTransformer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    import duckdb
+
+    from nbadb.transform.base import BaseTransformer
+
+# Schema for state transformers keep between runs, such as per-season fingerprints.
+CACHE_SCHEMA = "transform_cache"
+
+
+def sql_hash(sql: str) -> str:
+    """Return a whitespace-insensitive hash of a transformer's SQL text."""
+    normalized = " ".join(sql.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def frame_fingerprint(df: pl.DataFrame) -> str:
+    """Fingerprint a frame's schema and row content.
+
+    Uses Polars row hashing (seeded, so stable within a Polars version) rather
+    than serializing the frame; the Polars version is part of the digest so an
+    upgrade invalidates fingerprints instead of silently colliding.
+    """
+    digest = hashlib.sha256()
+    schema_payload = json.dumps(
+        [pl.__version__, df.height, [(n, str(t)) for n, t in df.schema.items()]],
+        separators=(",", ":"),
+    )
+    digest.update(schema_payload.encode("utf-8"))
+    if df.height and df.width:
+        digest.update(df.hash_rows(seed=0).to_numpy().tobytes())
+    return digest.hexdigest()[:32]
+
+
+def persisted_table(conn: duckdb.DuckDBPyConnection, table: str) -> str:
+    """Qualify *table* in the database file, past frames registered under its name."""
+    validate_sql_identifier(table)
+    catalog_row = conn.execute("SELECT current_database()").fetchone()
+    catalog = str(catalog_row[0]) if catalog_row is not None else "memory"
+    return '"' + catalog.replace('"', '""') + f'".main.{table}'
+
+
+def is_cacheable(transformer: BaseTransformer) -> TypeGuard[SqlTransformer]:
+    """Return ``True`` for SQL-only transformers whose output depends on inputs alone."""
+    return (
+        isinstance(transformer, SqlTransformer)
+        and type(transformer).transform is SqlTransformer.transform
+        and bool(transformer._SQL)
+    )
+
+
+class TransformResultCache:
+    """Reuse loaded star tables whose SQL and inputs have not changed.
+
+    ``_transform_cache`` (created by ``DBManager``) holds one row per star
+    table: the cache key of the output currently loaded into it and a hash of
+    its contents.  The orchestrator calls :meth:`forget` before loading a table
+    and :meth:`record` once the load succeeded, so a row never outlives the
+    contents it vouches for; tables reused from the cache are not reloaded.
+    All operations are non-fatal: a cache failure only costs a recomputation.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        self._conn = conn
+
+    @staticmethod
+    def key_for(
+        transformer: BaseTransformer,
+        fingerprint: Callable[[str], str | None],
+    ) -> str | None:
+        """Return the cache key for *transformer*, or ``None`` if it cannot be cached.
+
+        *fingerprint* maps a ``depends_on`` input to its fingerprint; it is
+        only asked for cacheable transformers, so inputs nothing cacheable reads
+        are never hashed.  A transformer is uncacheable when it is not SQL-only
+        or when any input has no fingerprint in this run.
+        """
+        if not is_cacheable(transformer):
+            return None
+        inputs: dict[str, str] = {}
+        for dep in transformer.depends_on:
+            value = fingerprint(dep)
+            if value is None:
+                return None
+            inputs[dep] = value
+        cls = type(transformer)
+        payload = json.dumps(
+            {
+                "transformer": f"{cls.__module__}.{cls.__qualname__}",
+                "table": transformer.output_table,
+                "sql": sql_hash(transformer._SQL),
+                "inputs": inputs,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def lookup(self, table: str, cache_key: str) -> pl.DataFrame | None:
+        """Return the loaded star table when it was built from *cache_key*, else ``None``.
+
+        The table is read from the database file, not from a frame registered
+        on the connection under the same name, and is rejected when its
+        content hash no longer matches the recorded one.
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT content_hash FROM _transform_cache WHERE table_name = ? AND cache_key = ?",
+                [table, cache_key],
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] != self._content_hash(table):
+                logger.debug("transform cache: '{}' changed since it was recorded", table)
+                return None
+            df = self._conn.execute(f"SELECT * FROM {self._persisted(table)}").pl()
+            self._conn.execute(
+                "UPDATE _transform_cache SET hit_count = hit_count + 1 WHERE table_name = ?",
+                [table],
+            )
+        except Exception as exc:
+            logger.debug(
+                "transform cache: lookup failed for '{}' ({}), recomputing",
+                table,
+                type(exc).__name__,
+            )
+            return None
+        return df
+
+    def record(self, table: str, cache_key: str, row_count: int) -> None:
+        """Note that star table *table* now holds the output for *cache_key*.
+
+        The content hash of the loaded table is stored alongside, so a later
+        edit of the table, even one that keeps its row count, voids the record.
+        """
+        try:
+            self._conn.execute(
+                "INSERT INTO _transform_cache (table_name, cache_key, row_count, content_hash) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (table_name) DO UPDATE SET "
+                "cache_key = EXCLUDED.cache_key, row_count = EXCLUDED.row_count, "
+                "content_hash = EXCLUDED.content_hash, hit_count = 0, recorded_at = now()",
+                [table, cache_key, row_count, self._content_hash(table)],
+            )
+        except Exception as exc:
+            logger.debug(
+                "transform cache: record failed for '{}' ({}) (non-fatal)",
+                table,
+                type(exc).__name__,
+            )
+
+    def forget(self, table: str) -> None:
+        """Drop the record for *table* before its contents change."""
+        try:
+            self._conn.execute("DELETE FROM _transform_cache WHERE table_name = ?", [table])
+        except Exception as exc:
+            logger.debug(
+                "transform cache: forget failed for '{}' ({}) (non-fatal)",
+                table,
+                type(exc).__name__,
+            )
+
+    def evict(self, *, active_tables: Iterable[str]) -> int:
+        """Drop records for tables no transformer produces anymore; return how many."""
+        active = sorted(set(active_tables))
+        try:
+            retired = self._conn.execute(
+                "DELETE FROM _transform_cache WHERE NOT list_contains(?, table_name) "
+                "RETURNING table_name",
+                [active],
+            ).fetchall()
+        except Exception:
+            logger.debug("transform cache: eviction failed (non-fatal)")
+            return 0
+        if retired:
+            logger.info("transform cache: dropped {} records for retired tables", len(retired))
+        return len(retired)
+
+    def _content_hash(self, table: str) -> str:
+        """Hash the persisted table's column layout and rows inside DuckDB.
+
+        Row hashes are combined order-insensitively (XOR and sum), so the
+        table is scanned once and never leaves the database.
+        """
+        source = self._persisted(table)
+        description = self._conn.execute(f"SELECT * FROM {source} LIMIT 0").description or []
+        totals = self._conn.execute(
+            f"SELECT count(*), bit_xor(hash(t)), sum(hash(t)::HUGEINT) FROM {source} t"
+        ).fetchone()
+        payload = json.dumps(
+            [
+                [(column[0], str(column[1])) for column in description],
+                [str(v) for v in totals or ()],
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _persisted(self, table: str) -> str:
+        return persisted_table(self._conn, table)
@@ -15,9 +15,16 @@ from typing import TYPE_CHECKING, Any, Protocol
 from loguru import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
     import duckdb
+    import polars as pl
+    from polars.datatypes import DataTypeClass
+
+# Zips parallel (table, version, hash, columns_json) lists into rows in one statement.
+_BATCH_SELECT = (
+    "SELECT unnest($1::VARCHAR[]), unnest($2::INT[]), unnest($3::VARCHAR[]), unnest($4::VARCHAR[])"
+)
 
 
 class _ColumnFrame(Protocol):
@@ -36,6 +43,35 @@ def schema_hash_for_columns(columns: list[str], dtypes: list[str] | None = None)
     return SchemaVersionTracker._hash_columns(columns)
 
 
+def stored_dtype_name(dtype: pl.DataType) -> str:
+    """Name *dtype* as it reads back from a DuckDB table the loader wrote.
+
+    Loaded tables store Enum and Categorical columns as DuckDB ENUMs, which
+    read back as ``Categorical``, and untyped (``Null``) columns as INTEGER.
+    Schema versions record this form so the pipeline's frames and the loaded
+    tables hash alike.
+    """
+    return str(_stored_dtype(dtype))
+
+
+def _stored_dtype(dtype: pl.DataType | DataTypeClass) -> pl.DataType:
+    import polars as pl
+
+    if isinstance(dtype, type):
+        dtype = dtype()
+    if isinstance(dtype, (pl.Enum, pl.Categorical)):
+        return pl.Categorical()
+    if isinstance(dtype, pl.Null):
+        return pl.Int32()
+    if isinstance(dtype, pl.List):
+        return pl.List(_stored_dtype(dtype.inner))
+    if isinstance(dtype, pl.Array):
+        return pl.Array(_stored_dtype(dtype.inner), dtype.shape)
+    if isinstance(dtype, pl.Struct):
+        return pl.Struct([pl.Field(f.name, _stored_dtype(f.dtype)) for f in dtype.fields])
+    return dtype
+
+
 def schema_hash_for_frame(df: _ColumnFrame) -> str:
     """Hash a Polars frame's column names and dtypes for metadata/versioning."""
     return schema_hash_for_columns(list(df.columns), [str(dt) for dt in df.dtypes])
@@ -59,7 +95,7 @@ class SchemaVersionTracker:
 
     After each pipeline run, call ``record_schemas()`` to snapshot
     current column layouts.  Call ``check_for_changes()`` to detect
-    drift between runs.
+    drift between runs without recording it.
     """
 
     def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
@@ -75,13 +111,22 @@ class SchemaVersionTracker:
 
     def get_current_version(self, table_name: str) -> tuple[int, str, list[str]] | None:
         """Return (version, hash, columns) for a table, or None if untracked."""
-        row = self._conn.execute(
-            "SELECT version, column_hash, columns_json FROM _schema_versions WHERE table_name = $1",
-            [table_name],
-        ).fetchone()
-        if row is None:
-            return None
-        return (row[0], row[1], json.loads(row[2]))
+        return self.get_current_versions([table_name]).get(table_name)
+
+    def get_current_versions(
+        self, table_names: Iterable[str] | None = None
+    ) -> dict[str, tuple[int, str, list[str]]]:
+        """Return {table_name: (version, hash, columns)} in one query.
+
+        Limited to *table_names* when given; every tracked table otherwise.
+        """
+        query = "SELECT table_name, version, column_hash, columns_json FROM _schema_versions"
+        params: list[Any] = []
+        if table_names is not None:
+            query += " WHERE table_name IN (SELECT unnest($1::VARCHAR[]))"
+            params.append(sorted(set(table_names)))
+        rows = self._conn.execute(query, params).fetchall()
+        return {r[0]: (r[1], r[2], json.loads(r[3])) for r in rows}
 
     def record_schema(
         self, table_name: str, columns: list[str], dtypes: list[str] | None = None
@@ -94,100 +139,120 @@ class SchemaVersionTracker:
         Returns a SchemaChange if the schema differs from the stored version,
         or None if unchanged (or first recording).
         """
-        if dtypes and len(dtypes) == len(columns):
-            typed_cols = [f"{c}:{t}" for c, t in zip(columns, dtypes, strict=True)]
-            return self._record(table_name, columns, self._hash_columns(typed_cols))
-        return self._record(table_name, columns, self._hash_columns(columns))
-
-    def _record(self, table_name: str, columns: list[str], new_hash: str) -> SchemaChange | None:
-        columns_json = json.dumps(columns)
-        existing = self.get_current_version(table_name)
-
-        if existing is None:
-            self._conn.execute(
-                """INSERT INTO _schema_versions (table_name, version, column_hash, columns_json)
-                   VALUES ($1, 1, $2, $3)
-                   ON CONFLICT (table_name) DO UPDATE SET
-                       version = 1, column_hash = EXCLUDED.column_hash,
-                       columns_json = EXCLUDED.columns_json, recorded_at = now()""",
-                [table_name, new_hash, columns_json],
-            )
-            self._conn.execute(
-                """INSERT INTO _schema_version_history
-                   (table_name, version, column_hash, columns_json)
-                   VALUES ($1, 1, $2, $3)
-                   ON CONFLICT (table_name, version) DO NOTHING""",
-                [table_name, new_hash, columns_json],
-            )
-            logger.debug("schema_version: {} registered (v1, {} columns)", table_name, len(columns))
-            return None
+        changes = self._record_batch(
+            {table_name: columns}, {table_name: dtypes} if dtypes is not None else {}
+        )
+        return changes[0] if changes else None
 
-        old_version, old_hash, old_columns = existing
+    def record_schemas(
+        self,
+        tables: dict[str, list[str]],
+        table_dtypes: Mapping[str, list[str] | None] | None = None,
+    ) -> list[SchemaChange]:
+        """Record schemas for multiple tables. Returns list of detected changes.
+
+        When *table_dtypes* is provided, type information is included in
+        the schema hash so type-only changes are also detected.  Stored
+        versions are read in one query and every new or changed version is
+        written in one batch; on failure nothing is recorded and no changes
+        are returned.
+        """
+        try:
+            return self._record_batch(tables, table_dtypes or {})
+        except Exception as exc:
+            logger.warning(
+                "schema_version: failed to record {} tables: {}",
+                len(tables),
+                type(exc).__name__,
+            )
+            return []
 
-        if old_hash == new_hash:
-            return None
+    def check_for_changes(
+        self,
+        tables: dict[str, list[str]],
+        table_dtypes: Mapping[str, list[str] | None] | None = None,
+    ) -> list[SchemaChange]:
+        """Diff *tables* against their stored versions without recording anything.
 
-        new_version = old_version + 1
-        added = sorted(set(columns) - set(old_columns))
-        removed = sorted(set(old_columns) - set(columns))
+        Untracked tables are not reported.
+        """
+        changes, _ = self._diff(tables, table_dtypes or {}, self.get_current_versions(tables))
+        return changes
 
+    def _record_batch(
+        self,
+        tables: dict[str, list[str]],
+        table_dtypes: Mapping[str, list[str] | None],
+    ) -> list[SchemaChange]:
+        changes, rows = self._diff(tables, table_dtypes, self.get_current_versions(tables))
+        if not rows:
+            return changes
+        batch = [list(column) for column in zip(*rows, strict=True)]
         self._conn.execute(
-            """UPDATE _schema_versions
-               SET version = $1, column_hash = $2, columns_json = $3,
-                   recorded_at = CURRENT_TIMESTAMP
-               WHERE table_name = $4""",
-            [new_version, new_hash, columns_json, table_name],
+            f"""INSERT INTO _schema_versions (table_name, version, column_hash, columns_json)
+               {_BATCH_SELECT}
+               ON CONFLICT (table_name) DO UPDATE SET
+                   version = EXCLUDED.version, column_hash = EXCLUDED.column_hash,
+                   columns_json = EXCLUDED.columns_json, recorded_at = now()""",
+            batch,
         )
         self._conn.execute(
-            """INSERT INTO _schema_version_history (table_name, version, column_hash, columns_json)
-               VALUES ($1, $2, $3, $4)
+            f"""INSERT INTO _schema_version_history (table_name, version, column_hash, columns_json)
+               {_BATCH_SELECT}
                ON CONFLICT (table_name, version) DO NOTHING""",
-            [table_name, new_version, new_hash, columns_json],
-        )
-
-        change = SchemaChange(
-            table_name=table_name,
-            old_version=old_version,
-            new_version=new_version,
-            added_columns=added,
-            removed_columns=removed,
-            old_hash=old_hash,
-            new_hash=new_hash,
-        )
-        logger.warning(
-            "schema_version: {} changed v{} -> v{} (added={}, removed={})",
-            table_name,
-            old_version,
-            new_version,
-            added,
-            removed,
+            batch,
         )
-        return change
+        for change in changes:
+            logger.warning(
+                "schema_version: {} changed v{} -> v{} (added={}, removed={})",
+                change.table_name,
+                change.old_version,
+                change.new_version,
+                change.added_columns,
+                change.removed_columns,
+            )
+        registered = len(rows) - len(changes)
+        if registered:
+            logger.debug("schema_version: registered {} new tables (v1)", registered)
+        return changes
 
-    def record_schemas(
-        self,
+    @staticmethod
+    def _diff(
         tables: dict[str, list[str]],
-        table_dtypes: dict[str, list[str]] | None = None,
-    ) -> list[SchemaChange]:
-        """Record schemas for multiple tables. Returns list of detected changes.
-
-        When *table_dtypes* is provided, type information is included in
-        the schema hash so type-only changes are also detected.
+        table_dtypes: Mapping[str, list[str] | None],
+        current: Mapping[str, tuple[int, str, list[str]]],
+    ) -> tuple[list[SchemaChange], list[tuple[str, int, str, str]]]:
+        """Compare *tables* with *current* versions in memory.
+
+        Returns the changes and the ``(table, version, hash, columns_json)``
+        rows to write: version 1 for untracked tables, the next version for
+        changed ones.
         """
-        changes = []
-        dtypes_map = table_dtypes or {}
+        changes: list[SchemaChange] = []
+        rows: list[tuple[str, int, str, str]] = []
         for table_name, columns in tables.items():
-            try:
-                change = self.record_schema(table_name, columns, dtypes=dtypes_map.get(table_name))
-                if change is not None:
-                    changes.append(change)
-            except Exception as exc:
-                logger.warning(
-                    "schema_version: failed to record {}: {}",
-                    table_name,
-                    type(exc).__name__,
+            new_hash = schema_hash_for_columns(columns, table_dtypes.get(table_name))
+            existing = current.get(table_name)
+            if existing is None:
+                rows.append((table_name, 1, new_hash, json.dumps(columns)))
+                continue
+            old_version, old_hash, old_columns = existing
+            if old_hash == new_hash:
+                continue
+            new_version = old_version + 1
+            rows.append((table_name, new_version, new_hash, json.dumps(columns)))
+            changes.append(
+                SchemaChange(
+                    table_name=table_name,
+                    old_version=old_version,
+                    new_version=new_version,
+                    added_columns=sorted(set(columns) - set(old_columns)),
+                    removed_columns=sorted(set(old_columns) - set(columns)),
+                    old_hash=old_hash,
+                    new_hash=new_hash,
                 )
-        return changes
+            )
+        return changes, rows
 
     # -- Schema evolution guardrails ------------------------------------------
 
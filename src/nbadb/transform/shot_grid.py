@@ -0,0 +1,30 @@
+"""Square court grid used to bin shot-chart coordinates.
+
+``loc_x``/``loc_y`` are tenths of a foot relative to the basket, with the
+sidelines at ``loc_x = ±250`` and the baseline just below ``loc_y = -47``.
+The base grid has one-foot cells laid out row-major from the baseline-left
+corner, so a shot's ``shot_bin_id`` decodes to
+``(bin_x, bin_y) = (id % GRID_COLUMNS, id // GRID_COLUMNS)``.  Coarser
+resolutions are integer divisions of the base cell indices, which is what
+lets them be rolled up from the base cells instead of from the shots.
+"""
+
+from __future__ import annotations
+
+GRID_ORIGIN_X = -250
+GRID_ORIGIN_Y = -50
+CELL_SIZE = 10  # loc units (tenths of a foot) per base cell
+GRID_COLUMNS = 50
+
+# Cell edge lengths in feet; each must divide GRID_COLUMNS.
+RESOLUTIONS_FT: tuple[int, ...] = (1, 2, 5)
+
+
+def shot_bin_id_sql(loc_x: str, loc_y: str) -> str:
+    """SQL for the base-grid bin of a shot; off-court shots clamp to the edge cells."""
+    column = f"least({GRID_COLUMNS - 1}, greatest(0, ({loc_x} - ({GRID_ORIGIN_X})) // {CELL_SIZE}))"
+    row = f"greatest(0, ({loc_y} - ({GRID_ORIGIN_Y})) // {CELL_SIZE})"
+    return (
+        f"CASE WHEN {loc_x} IS NULL OR {loc_y} IS NULL THEN NULL "
+        f"ELSE {row} * {GRID_COLUMNS} + {column} END"
+    )
@@ -34,8 +34,8 @@ class AnalyticsHeadToHeadTransformer(SqlTransformer):
             t1.abbreviation AS team_abbr,
             t2.abbreviation AS opponent_abbr,
             COUNT(*) AS games_played,
-            SUM(CASE WHEN m.wl = 'W' THEN 1 ELSE 0 END) AS wins,
-            SUM(CASE WHEN m.wl = 'L' THEN 1 ELSE 0 END) AS losses,
+            SUM(CASE WHEN m.wl = 'W' THEN 1 ELSE 0 END)::BIGINT AS wins,
+            SUM(CASE WHEN m.wl = 'L' THEN 1 ELSE 0 END)::BIGINT AS losses,
             AVG(m.pts) AS avg_pts_scored,
             AVG(m.pts_against) AS avg_pts_allowed,
             AVG(m.pts - m.pts_against) AS avg_margin
@@ -36,4 +36,6 @@ class AnalyticsPlayerMatchupTransformer(SqlTransformer):
         LEFT JOIN dim_player p1 ON m.player_id = p1.player_id AND p1.is_current = TRUE
         LEFT JOIN dim_player p2 ON m.vs_player_id = p2.player_id AND p2.is_current = TRUE
         LEFT JOIN dim_team tm ON m.team_id = tm.team_id
+        -- player_compare rows carry no player pair
+        WHERE m.player_id IS NOT NULL AND m.vs_player_id IS NOT NULL
     """
@@ -156,6 +156,13 @@ def duckdb_memory_with_pipeline_tables() -> duckdb.DuckDBPyConnection:
             rows_extracted BIGINT,
             error_message VARCHAR,
             retry_count INTEGER DEFAULT 0,
+            params_digest VARCHAR,
+            season VARCHAR,
+            season_type VARCHAR,
+            game_id VARCHAR,
+            player_id BIGINT,
+            team_id BIGINT,
+            game_date VARCHAR,
             PRIMARY KEY (endpoint, params)
         )
     """)
@@ -10,7 +10,7 @@ import pytest
 if TYPE_CHECKING:
     from pathlib import Path
 
-from nbadb.agent.context import SchemaContext
+from nbadb.agent.context import SchemaContext, schema_index
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -156,3 +156,56 @@ class TestBuildPromptContext:
         ctx = SchemaContext(populated_db)
         result = ctx.build_prompt_context()
         assert "_pipeline_metadata" not in result
+
+
+# ---------------------------------------------------------------------------
+# TestSchemaIndex
+# ---------------------------------------------------------------------------
+
+
+class TestSchemaIndex:
+    def test_index_is_cached_per_file_version(self, populated_db: Path) -> None:
+        first = schema_index(populated_db)
+        assert schema_index(populated_db) is first
+
+        with duckdb.connect(str(populated_db)) as conn:
+            conn.execute("CREATE TABLE fact_game (game_id INTEGER, pts INTEGER)")
+        refreshed = schema_index(populated_db)
+        assert refreshed is not first
+        assert "fact_game" in refreshed.table_names
+
+    def test_rank_prefers_question_overlap(self, populated_db: Path) -> None:
+        ranked = schema_index(populated_db).rank("team abbreviation by city")
+        assert ranked[0].name == "dim_team"
+
+    def test_rank_puts_hinted_tables_first(self, populated_db: Path) -> None:
+        ranked = schema_index(populated_db).rank("team city", hinted=("dim_player",))
+        assert ranked[0].name == "dim_player"
+
+
+class TestContextBudget:
+    def test_tables_beyond_budget_are_listed_by_name(self, populated_db: Path) -> None:
+        ctx = SchemaContext(populated_db, max_tokens=75)
+        result = ctx.build_prompt_context("team abbreviation by city")
+        assert len(result) <= 75 * 4
+        assert "abbreviation (VARCHAR)" in result
+        assert "full_name" not in result
+        assert result.endswith("dim_player")
+
+    def test_omitted_table_list_is_truncated_with_a_count(self, populated_db: Path) -> None:
+        with duckdb.connect(str(populated_db)) as conn:
+            for index in range(40):
+                conn.execute(f"CREATE TABLE fact_filler_{index:02d} (filler_id INTEGER)")
+        ctx = SchemaContext(populated_db, max_tokens=80)
+
+        result = ctx.build_prompt_context("team abbreviation by city")
+
+        assert len(result) <= 80 * 4
+        assert "columns omitted):" in result
+        assert result.endswith(" more")
+
+    def test_large_budget_includes_every_column(self, populated_db: Path) -> None:
+        ctx = SchemaContext(populated_db, max_tokens=10_000)
+        result = ctx.build_prompt_context("team abbreviation by city")
+        assert "full_name (VARCHAR)" in result
+        assert "columns omitted" not in result
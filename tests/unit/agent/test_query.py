@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import duckdb
+import pyarrow as pa
 import pytest
 
 if TYPE_CHECKING:
@@ -19,6 +20,11 @@ from nbadb.agent.safety import MAX_RESULT_ROWS
 # ---------------------------------------------------------------------------
 
 
+def _arrow_rows(description: list[tuple[str]], rows: list[tuple]) -> pa.Table:
+    names = [desc[0] for desc in description]
+    return pa.Table.from_pylist([dict(zip(names, row, strict=True)) for row in rows])
+
+
 @pytest.fixture
 def tmp_db(tmp_path: Path) -> Path:
     """Create a minimal DuckDB file with a test table."""
@@ -158,7 +164,9 @@ class TestQueryAgentExecution:
         mock_explain = MagicMock()
         mock_result = MagicMock()
         mock_result.description = [("player_id",), ("full_name",), ("total_pts",)]
-        mock_result.fetchall.return_value = [(1, "Test Player", 2500)]
+        mock_result.to_arrow_table.return_value = _arrow_rows(
+            mock_result.description, [(1, "Test Player", 2500)]
+        )
 
         mock_conn = MagicMock()
         # Calls: enable_external_access, EXPLAIN, actual query
@@ -177,7 +185,7 @@ class TestQueryAgentExecution:
         mock_explain = MagicMock()
         mock_result = MagicMock()
         mock_result.description = [("player_id",), ("full_name",), ("total_pts",)]
-        mock_result.fetchall.return_value = []
+        mock_result.to_arrow_table.return_value = _arrow_rows(mock_result.description, [])
 
         mock_conn = MagicMock()
         mock_conn.execute.side_effect = [None, mock_explain, mock_result]
@@ -193,7 +201,9 @@ class TestQueryAgentExecution:
         mock_explain = MagicMock()
         mock_result = MagicMock()
         mock_result.description = [("col_a",), ("col_b",)]
-        mock_result.fetchall.return_value = [("x", "y"), ("a", "b")]
+        mock_result.to_arrow_table.return_value = _arrow_rows(
+            mock_result.description, [("x", "y"), ("a", "b")]
+        )
 
         mock_conn = MagicMock()
         mock_conn.execute.side_effect = [None, mock_explain, mock_result]
@@ -215,7 +225,8 @@ class TestQueryAgentExecution:
         assert result.ok is True
         assert result.route == "player_season_scoring"
         assert result.columns == ("player_id", "full_name", "total_pts")
-        assert result.rows == ((1, "Test Player", 2500),)
+        assert result.row_count == 1
+        assert result.fetch_rows() == ((1, "Test Player", 2500),)
 
 
 # ---------------------------------------------------------------------------
@@ -257,7 +268,9 @@ class TestQueryAgentSafety:
             mock_conn = MagicMock()
             mock_result = MagicMock()
             mock_result.description = [("col1",)]
-            mock_result.fetchall.return_value = [("val1",)]
+            mock_result.to_arrow_table.return_value = _arrow_rows(
+                mock_result.description, [("val1",)]
+            )
             mock_conn.execute.return_value = mock_result
             mock_conn.__enter__ = MagicMock(return_value=mock_conn)
             mock_conn.__exit__ = MagicMock(return_value=False)
@@ -286,7 +299,7 @@ class TestQueryAgentSafety:
             mock_conn = MagicMock()
             mock_result = MagicMock()
             mock_result.description = [("c",)]
-            mock_result.fetchall.return_value = [("v",)]
+            mock_result.to_arrow_table.return_value = _arrow_rows(mock_result.description, [("v",)])
             mock_conn.execute.side_effect = [None, MagicMock(), mock_result]
             mock_conn.__enter__ = MagicMock(return_value=mock_conn)
             mock_conn.__exit__ = MagicMock(return_value=False)
@@ -305,7 +318,7 @@ class TestQueryAgentSafety:
             mock_conn = MagicMock()
             mock_result = MagicMock()
             mock_result.description = [("c",)]
-            mock_result.fetchall.return_value = [("v",)]
+            mock_result.to_arrow_table.return_value = _arrow_rows(mock_result.description, [("v",)])
             mock_conn.execute.side_effect = [None, MagicMock(), mock_result]
             mock_conn.__enter__ = MagicMock(return_value=mock_conn)
             mock_conn.__exit__ = MagicMock(return_value=False)
@@ -323,7 +336,7 @@ class TestQueryAgentSafety:
             mock_conn = MagicMock()
             mock_result = MagicMock()
             mock_result.description = [("c",)]
-            mock_result.fetchall.return_value = [("v",)]
+            mock_result.to_arrow_table.return_value = _arrow_rows(mock_result.description, [("v",)])
             mock_conn.execute.side_effect = [None, MagicMock(), mock_result]
             mock_conn.__enter__ = MagicMock(return_value=mock_conn)
             mock_conn.__exit__ = MagicMock(return_value=False)
@@ -340,7 +353,7 @@ class TestQueryAgentSafety:
             mock_conn = MagicMock()
             mock_result = MagicMock()
             mock_result.description = [("c",)]
-            mock_result.fetchall.return_value = [("v",)]
+            mock_result.to_arrow_table.return_value = _arrow_rows(mock_result.description, [("v",)])
             mock_conn.execute.side_effect = [None, MagicMock(), mock_result]
             mock_conn.__enter__ = MagicMock(return_value=mock_conn)
             mock_conn.__exit__ = MagicMock(return_value=False)
@@ -364,7 +377,7 @@ class TestQueryAgentSafety:
             mock_conn = MagicMock()
             mock_result = MagicMock()
             mock_result.description = [("c",)]
-            mock_result.fetchall.return_value = [("v",)]
+            mock_result.to_arrow_table.return_value = _arrow_rows(mock_result.description, [("v",)])
             mock_conn.execute.return_value = mock_result
             mock_conn.__enter__ = MagicMock(return_value=mock_conn)
             mock_conn.__exit__ = MagicMock(return_value=False)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import duckdb
+import pytest
 
 from nbadb.chat.catalog import default_catalog, load_catalog
 from nbadb.transform.pipeline import _star_schema_map
@@ -122,7 +123,7 @@ def test_catalog_match_route_uses_sql_template() -> None:
     entry = catalog.match_route("show the shot chart")
     assert entry is not None
     assert entry.route == "shot_chart"
-    assert "fact_shot_chart" in entry.sql_template
+    assert "agg_shot_chart_bins" in entry.sql_template
 
 
 def test_catalog_routed_sql_templates_bind_to_declared_tables() -> None:
@@ -149,3 +150,55 @@ def test_load_catalog_merges_json_overrides() -> None:
     catalog = load_catalog()
     entry = next(item for item in catalog.entries if item.route == "team_pace")
     assert "pace" in entry.aliases
+
+
+def test_load_agent_catalog_export_is_cached_until_file_changes(tmp_path) -> None:
+    import os
+
+    from nbadb.chat.catalog import load_agent_catalog_export
+
+    export_path = tmp_path / "agent-catalog.json"
+    export_path.write_text('{"version": 1, "tables": [{"table": "a"}]}', encoding="utf-8")
+    first = load_agent_catalog_export(export_path)
+    assert load_agent_catalog_export(export_path) is first
+
+    export_path.write_text('{"version": 2, "tables": [{"table": "b"}]}', encoding="utf-8")
+    stat = export_path.stat()
+    os.utime(export_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = load_agent_catalog_export(export_path)
+    assert reloaded is not first
+    assert reloaded["tables"][0]["table"] == "b"
+
+
+def test_export_table_index_is_cached_for_a_passed_export(tmp_path) -> None:
+    import os
+
+    from nbadb.chat.catalog import export_table_index, load_agent_catalog_export
+
+    export_path = tmp_path / "agent-catalog.json"
+    export_path.write_text('{"tables": [{"table": "a"}]}', encoding="utf-8")
+    export = load_agent_catalog_export(export_path)
+    index = export_table_index(export)
+    assert export_table_index(export) is index
+    assert list(index) == ["a"]
+
+    export_path.write_text('{"tables": [{"table": "b"}]}', encoding="utf-8")
+    stat = export_path.stat()
+    os.utime(export_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert list(export_table_index(load_agent_catalog_export(export_path))) == ["b"]
+
+
+def test_load_agent_catalog_export_is_read_only(tmp_path) -> None:
+    from nbadb.chat.catalog import load_agent_catalog_export
+
+    export_path = tmp_path / "agent-catalog.json"
+    export_path.write_text('{"tables": [{"table": "a", "agent_intents": ["x"]}]}', "utf-8")
+    payload = load_agent_catalog_export(export_path)
+    with pytest.raises(TypeError):
+        payload["tables"][0]["table"] = "b"  # type: ignore[index]
+    assert payload["tables"][0]["agent_intents"] == ("x",)
+
+
+def test_load_catalog_is_cached() -> None:
+    assert load_catalog() is load_catalog()
+    assert default_catalog() is load_catalog()
@@ -12,9 +12,9 @@ def test_runtime_promotes_query_response_to_finding(tmp_path) -> None:
         memory_store=MemoryStore(root=tmp_path / "memory"),
         artifact_store=ArtifactStore(root=tmp_path / "artifacts"),
     )
-    response = QueryResponse(
-        question="Who led scoring?",
-        route="player_season_scoring",
+    response = QueryResponse.from_rows(
+        "Who led scoring?",
+        "player_season_scoring",
         sql="SELECT 1",
         metadata={"sql_hash": "abc123", "catalog_entry": "player season scoring"},
         tables=("agg_player_season", "dim_player"),
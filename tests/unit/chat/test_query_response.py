@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pyarrow as pa
+
+from nbadb.chat.sql import QueryResponse
+
+
+def _response(n: int) -> QueryResponse:
+    table = pa.table({"player_id": list(range(n)), "pts": [i * 10 for i in range(n)]})
+    return QueryResponse(
+        question="q",
+        route="r",
+        columns=("player_id", "pts"),
+        arrow=table,
+    )
+
+
+def test_arrow_backed_response_counts_without_materializing_rows() -> None:
+    response = _response(1_000)
+
+    assert response.row_count == 1_000
+    assert response.fetch_rows(10, 2) == ((10, 100), (11, 110))
+    assert response.rows[999] == (999, 9_990)
+
+
+def test_page_cursor_walks_the_full_result() -> None:
+    response = _response(5)
+
+    first = response.page(0, 2)
+    second = response.page(first.next_offset, 2)
+    last = response.page(second.next_offset, 2)
+
+    assert [row[0] for row in first.rows + second.rows + last.rows] == [0, 1, 2, 3, 4]
+    assert last.next_offset is None
+
+
+def test_render_text_formats_only_the_visible_page() -> None:
+    text = _response(100).render_text(limit=3)
+
+    lines = text.splitlines()
+    assert lines[0] == "player_id | pts"
+    assert len(lines) == 6  # header + separator + 3 rows + remainder note
+    assert lines[-1] == "... 97 more rows"
+
+
+def test_columnar_json_and_arrow_ipc_round_trip() -> None:
+    response = _response(4)
+
+    payload = response.to_columnar_json(offset=1, limit=2)
+    assert payload["data"] == {"player_id": [1, 2], "pts": [10, 20]}
+    assert payload["next_offset"] == 3
+    assert payload["row_count"] == 4
+
+    restored = pa.ipc.open_stream(response.to_arrow_ipc()).read_all()
+    assert restored.equals(response.arrow)
+
+
+def test_small_responses_built_from_rows_are_arrow_backed() -> None:
+    response = QueryResponse.from_rows("q", "r", columns=("a",), rows=((1,), (2,)))
+
+    assert response.arrow is not None
+    assert response.rows == ((1,), (2,))
+    assert response.row_count == 2
+    assert response.to_columnar_json()["data"] == {"a": [1, 2]}
+    assert pa.ipc.open_stream(response.to_arrow_ipc()).read_all().num_rows == 2
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from nbadb.chat.runtime import ChatRuntime, build_runtime
+from nbadb.chat.runtime import AsyncQueryService, ChatRuntime, build_runtime
 
 
 def test_chat_runtime_delegates_to_query_agent() -> None:
@@ -25,3 +26,129 @@ def test_build_runtime_requires_duckdb_path() -> None:
         get_settings.return_value.duckdb_path = None
         with pytest.raises(RuntimeError, match="NBADB_DUCKDB_PATH"):
             build_runtime()
+
+
+def _scoring_db(tmp_path: Path) -> Path:
+    import duckdb
+
+    db_path = tmp_path / "chat.duckdb"
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute(
+            "CREATE TABLE dim_player (player_id INTEGER, full_name VARCHAR, is_current BOOLEAN)"
+        )
+        conn.execute("CREATE TABLE agg_player_season (player_id INTEGER, total_pts INTEGER)")
+        conn.execute("INSERT INTO dim_player VALUES (1, 'Test Player', TRUE)")
+        conn.execute("INSERT INTO agg_player_season VALUES (1, 2500)")
+    return db_path
+
+
+class _SlowAgent:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    def ask_result(self, question: str, limit: int = 10, *, conn=None):
+        import time
+
+        from nbadb.chat.sql import QueryResponse
+
+        self.calls += 1
+        time.sleep(self.delay)
+        return QueryResponse(question=question, route="slow")
+
+
+async def test_ask_async_closes_its_read_only_connections(tmp_path: Path) -> None:
+    import duckdb
+
+    db_path = _scoring_db(tmp_path)
+    service = AsyncQueryService(db_path, max_workers=2)
+    runtime = ChatRuntime(duckdb_path=tmp_path / "chat.duckdb", query_service=service)
+    try:
+        results = await asyncio.gather(
+            runtime.ask_async("who led scoring?", session_id="a"),
+            runtime.ask_async("who led scoring?", session_id="b"),
+        )
+    finally:
+        service.close()
+
+    assert [r.fetch_rows() for r in results] == [((1, "Test Player", 2500),)] * 2
+    # A writer can open the file once the questions are answered.
+    with duckdb.connect(str(db_path)) as writer:
+        writer.execute("INSERT INTO agg_player_season VALUES (2, 100)")
+
+
+async def test_ask_async_times_out_without_blocking_the_loop(tmp_path: Path) -> None:
+    service = AsyncQueryService(tmp_path / "unused.duckdb", timeout=0.05)
+    service._query_agent = lambda: _SlowAgent(delay=0.5)
+    service._open_connection = MagicMock()
+    try:
+        response = await service.ask("slow question", session_id="s1")
+    finally:
+        service.close()
+
+    assert response.route == "timeout"
+    assert response.error is not None
+    assert "timed out" in response.error
+
+
+async def test_session_concurrency_limit_serializes_same_session(tmp_path: Path) -> None:
+    service = AsyncQueryService(tmp_path / "unused.duckdb", max_workers=4, timeout=None)
+    agent = _SlowAgent(delay=0.05)
+    service._query_agent = lambda: agent
+    service._open_connection = MagicMock()
+    try:
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(*(service.ask("q", session_id="same") for _ in range(3)))
+        elapsed = asyncio.get_running_loop().time() - started
+    finally:
+        service.close()
+
+    assert agent.calls == 3
+    assert elapsed >= 0.15
+
+
+async def test_anonymous_questions_are_not_serialized_together(tmp_path: Path) -> None:
+    service = AsyncQueryService(tmp_path / "unused.duckdb", max_workers=3, timeout=None)
+    service._query_agent = lambda: _SlowAgent(delay=0.1)
+    service._open_connection = MagicMock()
+    try:
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(*(service.ask("q") for _ in range(3)))
+        elapsed = asyncio.get_running_loop().time() - started
+    finally:
+        service.close()
+
+    assert elapsed < 0.25
+    assert service.cancel_session(None) == 0
+    assert service._session_slots == {}
+
+
+def test_each_worker_thread_gets_its_own_agent(tmp_path: Path) -> None:
+    import threading
+
+    service = AsyncQueryService(tmp_path / "unused.duckdb")
+    agents: list[object] = []
+    with patch("nbadb.chat.runtime.service.QueryAgent", side_effect=lambda path: object()):
+        agents.append(service._query_agent())
+        agents.append(service._query_agent())
+        worker = threading.Thread(target=lambda: agents.append(service._query_agent()))
+        worker.start()
+        worker.join()
+    service.close()
+
+    assert agents[0] is agents[1]
+    assert agents[2] is not agents[0]
+
+
+async def test_cancel_session_cancels_in_flight_questions(tmp_path: Path) -> None:
+    service = AsyncQueryService(tmp_path / "unused.duckdb", timeout=None)
+    service._query_agent = lambda: _SlowAgent(delay=0.2)
+    service._open_connection = MagicMock()
+    try:
+        task = asyncio.create_task(service.ask("q", session_id="gone"))
+        await asyncio.sleep(0.01)
+        assert service.cancel_session("gone") == 1
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    finally:
+        service.close()
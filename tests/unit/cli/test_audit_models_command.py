@@ -11,6 +11,7 @@ from typer.testing import CliRunner
 
 from nbadb.cli.app import app
 from nbadb.core.model_audit import AuditFailureError, AuditMode, AuditStrictness
+from nbadb.core.probe_store import ProbeCacheMode
 
 runner = CliRunner()
 
@@ -186,3 +187,19 @@ def test_audit_models_require_result_table_contract_exits_when_failures_remain(
 
     assert result.exit_code == 1
     assert "require-result-table-contract check failed" in result.output
+
+
+def test_audit_models_builds_probe_store_for_probe_cache_mode(tmp_path: Path) -> None:
+    written = _write_inventory_artifact(tmp_path)
+    store_dir = tmp_path / "probes"
+    with patch(_ENGINE_PATH) as mock_engine:
+        mock_engine.return_value.write.return_value = written
+        result = runner.invoke(
+            app,
+            ["audit-models", "--probe-cache", "replay", "--probe-cache-dir", str(store_dir)],
+        )
+
+    assert result.exit_code == 0, result.output
+    probe_store = mock_engine.call_args.kwargs["probe_store"]
+    assert probe_store.mode is ProbeCacheMode.REPLAY
+    assert probe_store.root == store_dir
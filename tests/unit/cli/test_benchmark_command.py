@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from nbadb.cli.app import app
+from nbadb.core.benchmark import BenchmarkMeasurement
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+runner = CliRunner()
+
+
+def _run(baseline: Path, wall_seconds: float, *args: str):
+    measurement = BenchmarkMeasurement("transform", wall_seconds, 100 * 2**20, 1_000)
+    with patch(
+        "nbadb.cli.commands.benchmark.iter_benchmarks", return_value=iter([measurement])
+    ) as mock_iter:
+        result = runner.invoke(
+            app, ["benchmark", "--case", "transform", "--baseline", str(baseline), *args]
+        )
+    return result, mock_iter
+
+
+def test_benchmark_writes_a_baseline_when_none_exists(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+
+    result, mock_iter = _run(baseline, 2.0)
+
+    assert result.exit_code == 0, result.output
+    assert "Baseline written" in result.output
+    payload = json.loads(baseline.read_text(encoding="utf-8"))
+    assert payload["cases"]["transform"]["wall_seconds"] == 2.0
+    assert payload["scale"]["games_per_season"] == 40
+    assert mock_iter.call_args.kwargs["cases"] == ["transform"]
+
+
+def test_benchmark_exits_nonzero_on_regression(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    _run(baseline, 2.0)
+
+    result, _ = _run(baseline, 4.0)
+
+    assert result.exit_code == 1
+    assert "transform: wall_seconds" in result.output
+
+
+def test_benchmark_passes_within_threshold(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    _run(baseline, 2.0)
+
+    result, _ = _run(baseline, 2.2)
+
+    assert result.exit_code == 0, result.output
+    assert "No regressions" in result.output
+
+
+def test_benchmark_rejects_unknown_case(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["benchmark", "--case", "nope", "--baseline", str(tmp_path / "b.json")]
+    )
+
+    assert result.exit_code == 2
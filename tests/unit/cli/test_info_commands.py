@@ -171,6 +171,48 @@ class TestStatusCommand:
         assert entry["table"] == "dim_date"
         assert entry["value"] == "2025-26"
 
+    def test_status_phase_breakdown_across_traced_runs(self, tmp_path: object) -> None:
+        """Span rollups are aggregated per phase in pipeline order."""
+        db_path = tmp_path / "nba.duckdb"
+        _make_db_with_tables(db_path)
+        conn = duckdb.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE _pipeline_spans ("
+            "  run_id VARCHAR, run_mode VARCHAR, phase VARCHAR, started_at TIMESTAMP,"
+            "  span_count BIGINT, busy_seconds DOUBLE, wall_seconds DOUBLE,"
+            "  max_span_seconds DOUBLE, PRIMARY KEY (run_id, phase)"
+            ")"
+        )
+        conn.execute(
+            "INSERT INTO _pipeline_spans VALUES "
+            "('r1', 'daily', 'transform', '2025-01-01', 1, 2.0, 2.0, 2.0),"
+            "('r1', 'daily', 'run', '2025-01-01', 1, 10.0, 10.0, 10.0),"
+            "('r2', 'daily', 'transform', '2025-01-02', 1, 4.0, 4.0, 4.0),"
+            "('r2', 'daily', 'run', '2025-01-02', 1, 10.0, 10.0, 10.0)"
+        )
+        conn.close()
+
+        result = runner.invoke(app, ["status", "--data-dir", str(tmp_path)])
+        assert result.exit_code == 0
+        assert "Phase Timing" in result.output
+        assert "transform: avg 3.0s" in result.output
+        assert "30% of run time" in result.output
+
+        result = runner.invoke(
+            app, ["status", "--data-dir", str(tmp_path), "--output-format", "json"]
+        )
+        phases = json.loads(result.output)["phases"]
+        assert [p["phase"] for p in phases] == ["run", "transform"]
+        assert phases[1]["runs"] == 2
+        assert phases[1]["share_of_run"] == 0.3
+
+    def test_status_without_trace_data(self, tmp_path: object) -> None:
+        db_path = tmp_path / "nba.duckdb"
+        _make_db_with_tables(db_path)
+        result = runner.invoke(app, ["status", "--data-dir", str(tmp_path)])
+        assert result.exit_code == 0
+        assert "(no trace data" in result.output
+
     def test_journal_summary_json_output_structure(self, tmp_path: object) -> None:
         """journal-summary JSON includes observability fields used by docs admin."""
         db_path = tmp_path / "nba.duckdb"
@@ -470,6 +470,34 @@ def test_ask_verbose_renders_query_details() -> None:
     assert "Query details" in result.output
 
 
+def test_ask_json_and_arrow_formats_serialize_the_result() -> None:
+    """--output-format json/arrow use the columnar JSON and Arrow IPC serializers."""
+    import pyarrow as pa
+
+    from nbadb.chat.sql import QueryResponse
+
+    mock_settings = MagicMock()
+    mock_settings.duckdb_path = Path("/tmp/test.duckdb")
+    response = QueryResponse.from_rows(
+        "Who scored the most?", "scoring", columns=("player", "pts"), rows=(("A", 30),)
+    )
+
+    with (
+        patch(_GET_SETTINGS, return_value=mock_settings),
+        patch(_QUERY_AGENT) as mock_agent_cls,
+    ):
+        mock_agent_cls.return_value.ask_result.return_value = response
+        as_json = runner.invoke(app, ["ask", "-f", "json", "Who scored the most?"])
+        as_arrow = runner.invoke(app, ["ask", "-f", "arrow", "Who scored the most?"])
+
+    assert as_json.exit_code == 0, as_json.output
+    payload = json.loads(as_json.output)
+    assert payload["route"] == "scoring"
+    assert payload["data"] == {"player": ["A"], "pts": [30]}
+    assert as_arrow.exit_code == 0, as_arrow.output
+    assert pa.ipc.open_stream(as_arrow.stdout_bytes).read_all().equals(response.arrow)
+
+
 def test_ask_with_results_prints_output() -> None:
     """Non-empty QueryAgent response produces non-empty stdout."""
     mock_settings = MagicMock()
@@ -66,6 +66,10 @@ class TestRunQualityChecks:
 
         calls = " ".join(str(c) for c in mock_echo.call_args_list)
         assert "Scan:" in calls
+        assert "Schema drift: 0/0 tracked tables changed" in calls
+        # The stub dim_player lacks most of its contract columns.
+        assert "Schema contracts: 1/1 tables violated" in calls
+        assert "CONTRACT: dim_player" in calls
 
     def test_quality_check_empty_table_reports_failure(self, tmp_path: Path) -> None:
         """Empty table triggers a warning in quality output."""
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from nbadb.core.benchmark import (
+    BenchmarkMeasurement,
+    BenchmarkReport,
+    compare_reports,
+    iter_benchmarks,
+)
+from nbadb.core.synthetic import SyntheticUniverse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_SCALE = {"seed": 0, "seasons": 1, "games_per_season": 4}
+
+
+def _report(*measurements: BenchmarkMeasurement, scale: dict[str, int] = _SCALE) -> BenchmarkReport:
+    return BenchmarkReport(scale=scale, latency_seconds=0.0, measurements=list(measurements))
+
+
+def test_report_round_trips_through_json(tmp_path: Path) -> None:
+    report = _report(BenchmarkMeasurement("transform", 2.0, 300 * 2**20, 1_000, errors=3))
+
+    loaded = BenchmarkReport.load(report.write(tmp_path / "bench" / "baseline.json"))
+
+    assert loaded.scale == _SCALE
+    assert loaded.measurements == report.measurements
+    assert loaded.to_dict()["cases"]["transform"]["rows_per_second"] == 500.0
+
+
+def test_compare_flags_slower_and_hungrier_cases_beyond_threshold() -> None:
+    baseline = _report(
+        BenchmarkMeasurement("transform", 2.0, 300 * 2**20, 1_000),
+        BenchmarkMeasurement("load_csv", 1.0, 300 * 2**20, 1_000),
+    )
+    current = _report(
+        BenchmarkMeasurement("transform", 3.0, 300 * 2**20, 1_000),
+        BenchmarkMeasurement("load_csv", 1.1, 500 * 2**20, 1_000),
+    )
+
+    regressions = compare_reports(baseline, current, threshold=0.25)
+
+    assert [(r.case, r.metric) for r in regressions] == [
+        ("transform", "wall_seconds"),
+        ("load_csv", "peak_rss_bytes"),
+    ]
+    assert "+50%" in regressions[0].describe()
+
+
+def test_compare_ignores_changes_below_the_noise_floor() -> None:
+    baseline = _report(BenchmarkMeasurement("chat", 0.01, 300 * 2**20, 10))
+    current = _report(BenchmarkMeasurement("chat", 0.04, 310 * 2**20, 10))
+
+    assert compare_reports(baseline, current, threshold=0.25) == []
+
+
+def test_compare_flags_lower_throughput_when_row_counts_change() -> None:
+    baseline = _report(BenchmarkMeasurement("staging", 10.0, 300 * 2**20, 10_000))
+    current = _report(BenchmarkMeasurement("staging", 10.0, 300 * 2**20, 5_000))
+
+    regressions = compare_reports(baseline, current, threshold=0.25)
+
+    assert [r.metric for r in regressions] == ["rows_per_second"]
+
+
+def test_compare_flags_any_error_outside_extract_and_more_extract_errors() -> None:
+    baseline = _report(
+        BenchmarkMeasurement("extract", 1.0, 300 * 2**20, 1_000, errors=5),
+        BenchmarkMeasurement("transform", 1.0, 300 * 2**20, 1_000, errors=1),
+    )
+    current = _report(
+        BenchmarkMeasurement("extract", 1.0, 300 * 2**20, 1_000, errors=6),
+        BenchmarkMeasurement("transform", 1.0, 300 * 2**20, 1_000, errors=1),
+        BenchmarkMeasurement("chat", 1.0, 300 * 2**20, 10, errors=2),
+    )
+
+    regressions = compare_reports(baseline, current)
+
+    assert [(r.case, r.metric, r.baseline, r.current) for r in regressions] == [
+        ("extract", "errors", 5, 6),
+        ("transform", "errors", 1, 1),
+        ("chat", "errors", 0, 2),
+    ]
+    assert compare_reports(baseline, _report(baseline.measurements[0])) == []
+
+
+def test_compare_refuses_a_baseline_at_another_scale() -> None:
+    baseline = _report(BenchmarkMeasurement("chat", 1.0, 1, 1))
+    current = _report(BenchmarkMeasurement("chat", 1.0, 1, 1), scale={**_SCALE, "seasons": 2})
+
+    with pytest.raises(ValueError, match="different scale"):
+        compare_reports(baseline, current)
+
+
+def test_iter_benchmarks_measures_selected_cases_in_order(tmp_path: Path) -> None:
+    universe = SyntheticUniverse(games_per_season=2, teams=2, players_per_team=1)
+    calls: list[str] = []
+
+    def _case(name: str, rows: int):
+        def run(_run: object) -> tuple[int, int]:
+            calls.append(name)
+            return rows, 0
+
+        return run
+
+    cases = {"staging": _case("staging", 10), "load_csv": _case("load_csv", 0)}
+    with (
+        patch("nbadb.core.benchmark.BENCHMARK_CASES", cases),
+        patch.object(SyntheticUniverse, "staging_frames", return_value={}),
+        patch("nbadb.core.benchmark._prepare"),
+    ):
+        measurements = list(iter_benchmarks(universe, tmp_path, cases=["load_csv", "staging"]))
+
+    assert calls == ["staging", "load_csv"]
+    assert [m.rows for m in measurements] == [10, 0]
+    assert all(m.wall_seconds >= 0 and m.peak_rss_bytes > 0 for m in measurements)
+
+
+def test_iter_benchmarks_rejects_unknown_cases(tmp_path: Path) -> None:
+    universe = SyntheticUniverse(games_per_season=2, teams=2, players_per_team=1)
+
+    with pytest.raises(ValueError, match="unknown benchmark case"):
+        list(iter_benchmarks(universe, tmp_path, cases=["warp_speed"]))
@@ -87,7 +87,9 @@ class TestPipelineTables:
         "_pipeline_metadata",
         "_pipeline_metrics",
         "_lane_metrics",
+        "_pipeline_spans",
         "_staging_chunk_journal",
+        "_transform_cache",
         "_transform_checkpoints",
         "_transform_metrics",
         "_schema_versions",
@@ -108,6 +110,35 @@ class TestPipelineTables:
         ).fetchall()
         assert len(rows) == len(self.EXPECTED_TABLES)
 
+    def test_journal_key_columns_backfilled_from_params(self, db, tmp_path):
+        conn = duckdb.connect(str(tmp_path / "test.duckdb"))
+        conn.execute("""
+            CREATE TABLE _extraction_journal (
+                endpoint VARCHAR NOT NULL,
+                params VARCHAR,
+                status VARCHAR NOT NULL,
+                PRIMARY KEY (endpoint, params)
+            )
+        """)
+        conn.execute(
+            "INSERT INTO _extraction_journal VALUES "
+            """('ep', '{"season": "2024-25", "season_type": "Playoffs", "player_id": 23}',"""
+            " 'done'),"
+            "('legacy', 'not-json', 'done')"
+        )
+        conn.close()
+
+        db.init()
+        rows = db.duckdb.execute(
+            "SELECT endpoint, season, season_type, player_id, params_digest IS NOT NULL "
+            "FROM _extraction_journal ORDER BY endpoint"
+        ).fetchall()
+        db.close()
+        assert rows == [
+            ("ep", "2024-25", "Playoffs", 23, True),
+            ("legacy", None, None, None, True),
+        ]
+
 
 class TestSession:
     def test_session_yields_session(self, initialized_db):
@@ -5,18 +5,24 @@ from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import polars as pl
+import pytest
+
 if TYPE_CHECKING:
     from pathlib import Path
 
 from nbadb.core import model_audit as model_audit_module
 from nbadb.core.model_audit import (
     AuditDecision,
+    AuditFailureError,
     AuditMode,
     AuditRecord,
     AuditStrictness,
     ModelAuditEngine,
+    ProbeRequest,
     compare_baseline,
 )
+from nbadb.core.probe_store import ProbeCacheMode, ProbeStore
 from nbadb.orchestrate.staging_map import StagingEntry
 
 
@@ -573,3 +579,137 @@ def test_compare_baseline_empty_baseline() -> None:
     assert comparison["current_problem_count"] == 0
     assert comparison["baseline_problem_count"] == 0
     assert comparison["new_result_table_failure_keys"] == []
+
+
+class _CountingExtractor:
+    endpoint_name = "box_score_traditional"
+    calls = 0
+
+    async def extract(self, **params: object) -> pl.DataFrame:
+        type(self).calls += 1
+        return pl.DataFrame({"game_id": [params["game_id"]], "pts": [101]})
+
+
+class _TimingOutExtractor:
+    endpoint_name = "box_score_traditional"
+    calls = 0
+
+    async def extract(self, **params: object) -> pl.DataFrame:
+        type(self).calls += 1
+        raise TimeoutError("read timed out")
+
+
+def _probe_requests(*game_ids: str) -> list[ProbeRequest]:
+    return [
+        ProbeRequest(
+            key=f"stats:box_score_traditional:{index}",
+            source_kind="stats",
+            endpoint_name="box_score_traditional",
+            result_set_index=None,
+            staging_key="stg_box_score_traditional_player",
+            params={"game_id": game_id},
+            probe_context="current_regular",
+            use_multi=False,
+        )
+        for index, game_id in enumerate(game_ids or ("0022400001",))
+    ]
+
+
+def _run_probes_with_store(
+    tmp_path: Path,
+    mode: ProbeCacheMode,
+    code_hash: str = "v1",
+    *,
+    requests: list[ProbeRequest] | None = None,
+    extractor: type = _CountingExtractor,
+):
+    engine = ModelAuditEngine(project_root=tmp_path, probe_store=ProbeStore(tmp_path, mode))
+    planned = requests if requests is not None else _probe_requests()
+    with (
+        patch.object(model_audit_module, "registry", _FakeRegistry([extractor])),
+        patch.object(model_audit_module, "extractor_code_hash", return_value=code_hash),
+        patch.object(engine, "_build_probe_requests", return_value=(planned, [])),
+    ):
+        return model_audit_module.asyncio.run(engine._run_probes())
+
+
+def test_probe_store_replays_recorded_payloads_offline(tmp_path: Path) -> None:
+    _CountingExtractor.calls = 0
+    live_records, live_frames, _ = _run_probes_with_store(tmp_path, ProbeCacheMode.RECORD)
+    assert _CountingExtractor.calls == 1
+
+    records, frames, payload = _run_probes_with_store(tmp_path, ProbeCacheMode.REPLAY)
+
+    assert _CountingExtractor.calls == 1
+    assert [r.to_dict() for r in records] == [r.to_dict() for r in live_records]
+    assert frames["stg_box_score_traditional_player"].equals(
+        live_frames["stg_box_score_traditional_player"]
+    )
+    assert payload["summary"]["probe_store"] == {
+        "mode": "replay",
+        "hits": 1,
+        "misses": 0,
+        "recorded": 0,
+    }
+
+
+def test_probe_store_replay_miss_is_a_validation_gap(tmp_path: Path) -> None:
+    _run_probes_with_store(tmp_path, ProbeCacheMode.RECORD, code_hash="v1")
+
+    records, frames, _ = _run_probes_with_store(tmp_path, ProbeCacheMode.REPLAY, code_hash="v2")
+
+    assert frames == {}
+    assert records[0].decision == AuditDecision.VALIDATION_GAP.value
+    assert records[0].issues == ["probe_cache_miss"]
+
+
+def test_probe_store_differential_reprobes_only_changed_extractors(tmp_path: Path) -> None:
+    _CountingExtractor.calls = 0
+    _run_probes_with_store(tmp_path, ProbeCacheMode.RECORD, code_hash="v1")
+
+    _, _, unchanged = _run_probes_with_store(tmp_path, ProbeCacheMode.DIFFERENTIAL, "v1")
+    assert _CountingExtractor.calls == 1
+    _, _, changed = _run_probes_with_store(tmp_path, ProbeCacheMode.DIFFERENTIAL, "v2")
+    assert _CountingExtractor.calls == 2
+
+    assert unchanged["summary"]["probe_store"]["hits"] == 1
+    assert changed["summary"]["probe_store"]["recorded"] == 1
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert [entry["code_hash"] for entry in manifest["entries"].values()] == ["v2"]
+
+
+def test_probe_store_replay_requires_recorded_plan(tmp_path: Path) -> None:
+    with pytest.raises(AuditFailureError, match="no recorded plan"):
+        _run_probes_with_store(tmp_path, ProbeCacheMode.REPLAY)
+
+
+def test_probe_store_differential_rebuilds_the_plan_from_the_registry(tmp_path: Path) -> None:
+    _CountingExtractor.calls = 0
+    _run_probes_with_store(tmp_path, ProbeCacheMode.RECORD)
+
+    records, _, payload = _run_probes_with_store(
+        tmp_path,
+        ProbeCacheMode.DIFFERENTIAL,
+        requests=_probe_requests("0022400001", "0022400002"),
+    )
+
+    assert _CountingExtractor.calls == 2
+    assert len(records) == 2
+    assert payload["summary"]["probe_store"]["plan_changes"] == {"added": 1, "removed": 0}
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert len(manifest["plan"]["requests"]) == 2
+
+
+def test_probe_store_never_records_transient_failures(tmp_path: Path) -> None:
+    _TimingOutExtractor.calls = 0
+    records, _, payload = _run_probes_with_store(
+        tmp_path, ProbeCacheMode.RECORD, extractor=_TimingOutExtractor
+    )
+    assert records[0].issues == ["probe_exception"]
+    assert payload["summary"]["probe_store"]["transient_skipped"] == 1
+
+    _run_probes_with_store(tmp_path, ProbeCacheMode.DIFFERENTIAL, extractor=_TimingOutExtractor)
+    assert _TimingOutExtractor.calls == 2
+
+    replayed, _, _ = _run_probes_with_store(tmp_path, ProbeCacheMode.REPLAY)
+    assert replayed[0].issues == ["probe_cache_miss"]
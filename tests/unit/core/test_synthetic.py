@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import duckdb
+import pytest
+from nba_api.library.http import NBAHTTP
+from polars.testing import assert_frame_equal
+
+from nbadb.core.synthetic import SyntheticTransport, SyntheticUniverse
+from nbadb.extract.base import BaseExtractor
+from nbadb.extract.stats.game_log import LeagueGameLogExtractor
+from nbadb.orchestrate.extractor_runner import _sync_extract
+from nbadb.orchestrate.staging_map import get_by_endpoint, get_by_staging_key
+from nbadb.orchestrate.transformers import discover_all_transformers
+from nbadb.schemas.registry import get_input_schema
+from nbadb.transform.pipeline import TransformPipeline
+
+
+def _universe(seed: int = 7) -> SyntheticUniverse:
+    return SyntheticUniverse(
+        seed=seed, games_per_season=6, teams=4, players_per_team=3, events_per_game=12
+    )
+
+
+@pytest.mark.parametrize(
+    "staging_key",
+    [
+        "stg_league_game_log",
+        "stg_schedule",
+        "stg_play_by_play",
+        "stg_box_score_traditional",
+        "stg_shot_chart",
+    ],
+)
+def test_staging_frames_satisfy_their_input_schema(staging_key: str) -> None:
+    entry = get_by_staging_key(staging_key)
+    assert entry is not None
+    frame = _universe().staging_frames([entry])[staging_key]
+
+    assert frame.height > 0
+    get_input_schema(staging_key).validate(frame)
+
+
+def test_staging_frames_run_every_transform() -> None:
+    universe = SyntheticUniverse(
+        seed=1, seasons=1, games_per_season=4, teams=4, players_per_team=3, events_per_game=10
+    )
+    staging = {key: frame.lazy() for key, frame in universe.staging_frames().items()}
+
+    with duckdb.connect() as conn:
+        pipeline = TransformPipeline(conn)
+        pipeline.register_all(discover_all_transformers())
+        pipeline.run(staging, validate_output_schemas=False)
+
+    result = pipeline.last_result
+    assert result is not None
+    assert result.failed == []
+    assert result.success_count == len(discover_all_transformers())
+
+
+def test_same_seed_and_scale_reproduce_identical_frames() -> None:
+    entry = get_by_staging_key("stg_league_game_log")
+    assert entry is not None
+
+    first = _universe().staging_frames([entry])["stg_league_game_log"]
+    again = _universe().staging_frames([entry])["stg_league_game_log"]
+    other = _universe(seed=8).staging_frames([entry])["stg_league_game_log"]
+
+    assert_frame_equal(first, again)
+    assert not first.equals(other)
+
+
+def test_identifiers_come_from_the_universe() -> None:
+    universe = _universe()
+    entry = get_by_staging_key("stg_play_by_play")
+    assert entry is not None
+    game = universe.games[0][0]
+
+    frame = universe.frame(entry, {"game_id": game.game_id})
+
+    assert frame.height == universe.events_per_game
+    assert frame["game_id"].unique().to_list() == [game.game_id]
+    assert frame["action_number"].to_list() == list(range(1, universe.events_per_game + 1))
+    home, visitor = game.team_ids
+    roster = set(universe.roster[home]) | set(universe.roster[visitor])
+    assert set(frame["person_id"].to_list()) <= roster
+
+
+def test_transport_serves_every_result_set_of_a_multi_endpoint() -> None:
+    transport = SyntheticTransport(_universe())
+
+    frames = transport.result_sets("schedule", {"season": "2023-24"})
+
+    indexes = {entry.result_set_index for entry in get_by_endpoint("schedule")}
+    assert len(frames) == max(indexes) + 1
+    assert all(frames[index].width for index in indexes)
+
+
+def test_installed_transport_feeds_extractors_and_blocks_the_network() -> None:
+    transport = SyntheticTransport(_universe())
+    original = BaseExtractor._call_nba_api
+
+    with transport.installed():
+        frame = _sync_extract(LeagueGameLogExtractor(), season="2023-24")
+        with pytest.raises(ConnectionError):
+            NBAHTTP().send_api_request("leaguegamelog", {})
+
+    assert transport.calls == 1
+    assert frame.height == 2 * transport.universe.games_per_season
+    assert BaseExtractor._call_nba_api is original
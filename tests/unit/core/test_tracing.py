@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import duckdb
+import pytest
+
+from nbadb.core.db import DBManager
+from nbadb.core.tracing import NOOP_TRACER, Tracer
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    tracer = Tracer(enabled=False)
+
+    with tracer.span("discover", phase="discovery"):
+        pass
+
+    assert tracer.spans == ()
+    assert tracer.rollup() == []
+    assert tracer.span("a") is NOOP_TRACER.span("b")
+
+
+def test_nested_spans_inherit_phase_and_roll_up_outermost_only() -> None:
+    tracer = Tracer(run_mode="daily")
+
+    with tracer.span("transform pipeline", phase="transform"):
+        with tracer.span("dim_player"):
+            time.sleep(0.01)
+        with tracer.span("stg_player", phase="validation"):
+            pass
+
+    phases = {span.name: span.phase for span in tracer.spans}
+    assert phases == {
+        "dim_player": "transform",
+        "stg_player": "validation",
+        "transform pipeline": "transform",
+    }
+    rollup = {r.phase: r for r in tracer.rollup()}
+    assert [r.phase for r in tracer.rollup()] == ["transform", "validation"]
+    assert rollup["transform"].span_count == 1
+    assert rollup["transform"].busy_seconds >= 0.01
+
+
+def test_span_records_exception_type() -> None:
+    tracer = Tracer()
+
+    with pytest.raises(ValueError), tracer.span("load", phase="load"):
+        raise ValueError("boom")
+
+    assert tracer.spans[0].attrs == {"error": "ValueError"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_spans_get_separate_tracks_and_union_wall_time() -> None:
+    tracer = Tracer()
+
+    async def _pattern(name: str) -> None:
+        with tracer.span(name, phase="extraction"):
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(_pattern("game"), _pattern("season"))
+
+    assert len({span.track for span in tracer.spans}) == 2
+    (rollup,) = tracer.rollup()
+    assert rollup.busy_seconds >= 0.1
+    assert rollup.wall_seconds < rollup.busy_seconds
+
+
+def test_chrome_trace_and_rollup_persistence(tmp_path) -> None:
+    tracer = Tracer(run_mode="init")
+    with tracer.span("init", phase="run"), tracer.span("discover entities", phase="discovery"):
+        pass
+
+    path = tracer.write_chrome_trace(tmp_path / tracer.trace_filename())
+    payload = json.loads(path.read_text())
+    complete = [event for event in payload["traceEvents"] if event["ph"] == "X"]
+    assert [event["cat"] for event in complete] == ["run", "discovery"]
+    assert payload["otherData"]["run_id"] == tracer.run_id
+
+    db = DBManager(sqlite_path=tmp_path / "test.sqlite", duckdb_path=tmp_path / "test.duckdb")
+    db.init()
+    try:
+        assert tracer.persist(db.duckdb) == 2
+        assert tracer.persist(db.duckdb) == 2
+        rows = db.duckdb.execute(
+            "SELECT phase, run_mode, span_count FROM _pipeline_spans ORDER BY phase"
+        ).fetchall()
+    finally:
+        db.close()
+    assert rows == [("discovery", "init", 1), ("run", "init", 1)]
+
+
+def test_persist_requires_span_table() -> None:
+    tracer = Tracer()
+    with tracer.span("x", phase="load"):
+        pass
+
+    with pytest.raises(duckdb.CatalogException):
+        tracer.persist(duckdb.connect())
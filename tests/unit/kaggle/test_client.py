@@ -14,6 +14,7 @@ import pytest
 
 from nbadb.core.config import NbaDbSettings
 from nbadb.kaggle.client import KaggleClient
+from nbadb.kaggle.package import PACKAGE_MANIFEST_NAME
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -595,6 +596,7 @@ def test_stage_file_capacity_checks_cross_device_copy(tmp_path: Path) -> None:
 
     with (
         patch("nbadb.kaggle.client.os.link", side_effect=OSError(errno.EXDEV, "cross-device")),
+        patch.object(client, "_reflink_file", return_value=False),
         patch.object(client, "_require_disk_capacity") as capacity,
     ):
         client._stage_file_from_inventory(
@@ -607,6 +609,74 @@ def test_stage_file_capacity_checks_cross_device_copy(tmp_path: Path) -> None:
     assert destination.read_bytes() == source.read_bytes()
 
 
+def test_stage_file_prefers_reflink_over_capacity_checked_copy(tmp_path: Path) -> None:
+    source = tmp_path / "source.sqlite"
+    destination = tmp_path / "staged" / "nba.sqlite"
+    source.write_bytes(b"database")
+    inventory = {
+        "path": "nba.sqlite",
+        "bytes": source.stat().st_size,
+        "sha256": hashlib.sha256(source.read_bytes()).hexdigest(),
+    }
+    client = KaggleClient()
+
+    def clone(source_path: Path, target: Path) -> bool:
+        shutil.copyfile(source_path, target)
+        return True
+
+    with (
+        patch("nbadb.kaggle.client.os.link", side_effect=OSError(errno.EXDEV, "cross-device")),
+        patch.object(client, "_reflink_file", side_effect=clone) as reflink,
+        patch.object(client, "_require_disk_capacity") as capacity,
+    ):
+        client._stage_file_from_inventory(
+            source_path=source,
+            destination=destination,
+            inventory=inventory,
+        )
+
+    reflink.assert_called_once_with(source, destination)
+    capacity.assert_not_called()
+    assert destination.read_bytes() == source.read_bytes()
+
+
+@patch("nbadb.kaggle.client.get_settings")
+def test_snapshot_reuses_digests_of_unchanged_resources_across_runs(
+    mock_settings: MagicMock, tmp_path: Path
+) -> None:
+    data_dir = tmp_path / "data"
+    (data_dir / "csv").mkdir(parents=True)
+    mock_settings.return_value = NbaDbSettings(data_dir=data_dir, log_dir=tmp_path / "logs")
+    resources = [{"path": f"csv/t{index}.csv"} for index in range(3)]
+    (data_dir / "dataset-metadata.json").write_text(
+        json.dumps({"id": "wyattowalsh/basketball", "resources": resources}),
+        encoding="utf-8",
+    )
+    past = 1_700_000_000
+    for index in range(3):
+        path = data_dir / "csv" / f"t{index}.csv"
+        path.write_text(f"a\n{index}\n", encoding="utf-8")
+        os.utime(path, (past, past))
+    first = KaggleClient()
+    first_preflight = first._snapshot_upload_bundle(data_dir)
+    delta = first._package_delta(first_preflight)
+    assert delta["added"] == [f"csv/t{index}.csv" for index in range(3)]
+    # Nothing is persisted until the upload succeeds.
+    assert not (tmp_path / "logs" / "kaggle" / PACKAGE_MANIFEST_NAME).exists()
+    first._commit_package(first_preflight)
+
+    (data_dir / "csv" / "t1.csv").write_text("a\n42\n", encoding="utf-8")
+    second = KaggleClient()
+    with patch.object(second, "_file_sha256", wraps=second._file_sha256) as file_sha256:
+        preflight = second._snapshot_upload_bundle(data_dir)
+    delta = second._package_delta(preflight)
+
+    assert [call.args[0].name for call in file_sha256.call_args_list] == ["t1.csv"]
+    assert delta["changed"] == ["csv/t1.csv"]
+    assert delta["unchanged"] == ["csv/t0.csv", "csv/t2.csv"]
+    assert delta["reused_digests"] == 2
+
+
 @patch("nbadb.kaggle.client.get_settings")
 def test_publication_preflight_accepts_valid_marker_with_agreeing_exact_version(
     mock_settings: MagicMock,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
@@ -174,6 +175,14 @@ class TestGenerateMetadata:
         data = json.loads(output.read_text(encoding="utf-8"))
         assert "id" in data
 
+    def test_leaves_unchanged_file_untouched(self, tmp_path: Path, settings: NbaDbSettings) -> None:
+        output = tmp_path / "dataset-metadata.json"
+        with patch("nbadb.kaggle.metadata.get_settings", return_value=settings):
+            generate_metadata(output)
+            os.utime(output, ns=(1, 1))
+            generate_metadata(output)
+        assert output.stat().st_mtime_ns == 1
+
     def test_description_is_markdown(self, tmp_path: Path, settings: NbaDbSettings) -> None:
         data = _generate_metadata_json(tmp_path, settings)
         desc = data["description"]
@@ -199,7 +208,7 @@ class TestBuildResources:
 
     def test_full_publication_resource_universe_is_exact(self) -> None:
         paths = expected_full_publication_resource_paths()
-        assert len(paths) == 1_344
+        assert len(paths) == 1_346
         assert {"nba.duckdb", "nba.sqlite"} <= paths
         assert {
             "assured-artifact-manifest.json",
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from nbadb.kaggle.package import PackageManifest, resource_schema_hash
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _settled(path: Path, content: bytes) -> Path:
+    """Write *content* with an mtime outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    past = time.time() - 60
+    os.utime(path, (past, past))
+    return path
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_unchanged_file_is_hashed_once_and_shared_with_hardlinks(tmp_path: Path) -> None:
+    source = _settled(tmp_path / "csv" / "dim_team.csv", b"team_id\n1\n")
+    staged = tmp_path / "staged" / "dim_team.csv"
+    staged.parent.mkdir()
+    os.link(source, staged)
+    compute = MagicMock(side_effect=_sha256)
+    manifest = PackageManifest()
+
+    digests = {manifest.sha256(path, compute=compute) for path in (source, staged, source)}
+
+    assert digests == {_sha256(source)}
+    assert compute.call_count == 1
+    assert (manifest.hashed, manifest.reused) == (1, 2)
+
+
+def test_changed_and_freshly_written_files_are_rehashed(tmp_path: Path) -> None:
+    path = _settled(tmp_path / "nba.sqlite", b"first")
+    compute = MagicMock(side_effect=_sha256)
+    manifest = PackageManifest()
+    manifest.sha256(path, compute=compute)
+
+    _settled(path, b"second!")
+    assert manifest.sha256(path, compute=compute) == _sha256(path)
+    path.write_bytes(b"third!!")
+    manifest.sha256(path, compute=compute)
+    manifest.sha256(path, compute=compute)
+
+    assert compute.call_count == 4
+
+
+def test_validation_is_reused_until_the_declared_schema_changes(tmp_path: Path) -> None:
+    path = _settled(tmp_path / "csv" / "dim_team.csv", b"team_id\n1\n")
+    validate = MagicMock(return_value={"engine": "csv", "row_count": 1})
+    manifest = PackageManifest()
+
+    manifest.validation(path, "csv", validate, schema_hash="a")
+    manifest.validation(path, "csv", validate, schema_hash="a")
+    manifest.validation(path, "csv", validate, schema_hash="b")
+
+    assert validate.call_count == 2
+
+
+def test_manifest_persists_seen_files_and_previous_resources(tmp_path: Path) -> None:
+    kept = _settled(tmp_path / "kept.csv", b"a\n1\n")
+    dropped = _settled(tmp_path / "dropped.csv", b"a\n2\n")
+    manifest_path = tmp_path / "logs" / "kaggle-package-manifest.json"
+    first = PackageManifest.load(manifest_path)
+    first.sha256(kept, compute=_sha256)
+    first.sha256(dropped, compute=_sha256)
+    first.record([{"path": "kept.csv", "kind": "file", "bytes": 4, "sha256": _sha256(kept)}])
+    first.save()
+
+    second = PackageManifest.load(manifest_path)
+    second.sha256(kept, compute=_sha256)
+    second.save()
+    third = PackageManifest.load(manifest_path)
+    third.sha256(dropped, compute=_sha256)
+
+    assert (second.hashed, second.reused) == (0, 1)
+    assert (third.hashed, third.reused) == (1, 0)
+
+
+def test_diff_reports_content_schema_and_inventory_changes() -> None:
+    manifest = PackageManifest()
+    manifest.record(
+        [
+            {"path": "a.csv", "kind": "file", "bytes": 1, "sha256": "1", "schema_hash": "s"},
+            {"path": "b.csv", "kind": "file", "bytes": 1, "sha256": "2", "schema_hash": "s"},
+            {"path": "c.csv", "kind": "file", "bytes": 1, "sha256": "3", "schema_hash": "s"},
+            {"path": "gone.csv", "kind": "file", "bytes": 1, "sha256": "4"},
+        ]
+    )
+
+    delta = manifest.diff(
+        [
+            {"path": "a.csv", "kind": "file", "bytes": 1, "sha256": "1", "schema_hash": "s"},
+            {"path": "b.csv", "kind": "file", "bytes": 2, "sha256": "9", "schema_hash": "s"},
+            {"path": "c.csv", "kind": "file", "bytes": 1, "sha256": "3", "schema_hash": "t"},
+            {"path": "new.csv", "kind": "file", "bytes": 1, "sha256": "5"},
+        ]
+    )
+
+    assert delta.to_dict() == {
+        "added": ["new.csv"],
+        "changed": ["b.csv", "c.csv"],
+        "removed": ["gone.csv"],
+        "unchanged": ["a.csv"],
+    }
+
+
+def test_unreadable_manifest_starts_empty(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "kaggle-package-manifest.json"
+    manifest_path.write_text("{not json", encoding="utf-8")
+
+    manifest = PackageManifest.load(manifest_path)
+
+    assert manifest.diff([{"path": "a.csv", "kind": "file", "sha256": "1"}]).added == ["a.csv"]
+
+
+def test_resource_schema_hash_tracks_field_names_and_types() -> None:
+    resource = {"schema": {"fields": [{"name": "team_id", "type": "integer"}]}}
+    retyped = {"schema": {"fields": [{"name": "team_id", "type": "string"}]}}
+
+    assert resource_schema_hash(resource) == resource_schema_hash(dict(resource))
+    assert resource_schema_hash(resource) != resource_schema_hash(retyped)
+    assert resource_schema_hash({"path": "nba.sqlite"}) is None
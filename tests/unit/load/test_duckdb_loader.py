@@ -39,6 +39,32 @@ class TestDuckDBLoader:
         assert count == 2
         conn.close()
 
+    def test_replace_sorts_play_by_play_and_dictionary_codes_enums(self) -> None:
+        conn = duckdb.connect()
+        loader = DuckDBLoader(conn)
+        df = pl.DataFrame(
+            {
+                "game_id": ["002", "001", "001"],
+                "event_num": [1, 7, 2],
+                "event_type_name": pl.Series(
+                    ["foul", "made_shot", "foul"], dtype=pl.Enum(["made_shot", "foul"])
+                ),
+                "location": pl.Series(["h", "v", "h"], dtype=pl.Categorical),
+            }
+        )
+        loader.load("fact_play_by_play", df, mode="replace")
+        rows = conn.execute("SELECT game_id, event_num FROM fact_play_by_play").fetchall()
+        assert rows == [("001", 2), ("001", 7), ("002", 1)]
+        types = dict(
+            conn.execute(
+                "SELECT column_name, data_type FROM information_schema.columns "
+                "WHERE table_name = 'fact_play_by_play'"
+            ).fetchall()
+        )
+        assert types["event_type_name"] == "ENUM('made_shot', 'foul')"
+        assert types["location"] == "ENUM('h', 'v')"
+        conn.close()
+
     # ------------------------------------------------------------------
     # Arrow path (_load_via_arrow) — triggered when rows >= 100K
     # ------------------------------------------------------------------
@@ -109,3 +135,40 @@ class TestDuckDBLoader:
         rows = conn.execute("SELECT id FROM pa_overwrite").fetchall()
         assert rows == [(99,)]
         conn.close()
+
+    def test_passthrough_view_over_persisted_sources(self) -> None:
+        from nbadb.transform.base import Passthrough
+
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE stg_src AS SELECT * FROM range(3) t(id)")
+        df = conn.execute("SELECT * FROM stg_src").pl()
+        # Frames registered under the source name must not satisfy the check.
+        conn.register("stg_src", df.head(1))
+        loader = DuckDBLoader(conn)
+        loader.load("fact_src", df.head(1), mode="replace")
+
+        passthrough = Passthrough(branches=(("", "stg_src"),))
+        assert loader.load_passthrough_view("fact_src", df.head(1), passthrough) is False
+        assert loader.load_passthrough_view("fact_src", df, passthrough) is True
+
+        conn.unregister("stg_src")
+        kind = conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = 'fact_src'"
+        ).fetchone()[0]
+        assert kind == "VIEW"
+        assert conn.execute("SELECT COUNT(*) FROM fact_src").fetchone()[0] == 3
+
+        loader.load("fact_src", df.head(2), mode="replace")
+        kind = conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = 'fact_src'"
+        ).fetchone()[0]
+        assert kind == "BASE TABLE"
+
+        # A view left by an earlier run is found by a fresh loader too.
+        assert loader.load_passthrough_view("fact_src", df, passthrough) is True
+        DuckDBLoader(conn).load("fact_src", df.head(2), mode="replace")
+        kind = conn.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_name = 'fact_src'"
+        ).fetchone()[0]
+        assert kind == "BASE TABLE"
+        conn.close()
@@ -53,6 +53,33 @@ class TestMultiLoader:
         assert len(result) == 1
         conn.close()
 
+    def test_passthrough_becomes_duckdb_view_while_files_get_frame(self, tmp_path: Path) -> None:
+        from nbadb.transform.base import Passthrough
+
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE stg_src AS SELECT * FROM range(2) t(id)")
+        df = conn.execute("SELECT * FROM stg_src").pl()
+        loader = MultiLoader([DuckDBLoader(conn), ParquetLoader(tmp_path / "parquet")])
+
+        loader.load("fact_src", df, passthrough=Passthrough(branches=(("", "stg_src"),)))
+
+        assert conn.execute(
+            "SELECT COUNT(*) FROM duckdb_views() WHERE view_name = 'fact_src'"
+        ).fetchone() == (1,)
+        assert (tmp_path / "parquet" / "fact_src" / "fact_src.parquet").exists()
+        conn.close()
+
+    def test_persisted_table_is_only_written_to_files(self, tmp_path: Path) -> None:
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE fact_src AS SELECT 7 AS id")
+        loader = MultiLoader([DuckDBLoader(conn), ParquetLoader(tmp_path / "parquet")])
+
+        loader.load("fact_src", pl.DataFrame({"id": [1, 2]}), persisted=True)
+
+        assert conn.execute("SELECT id FROM fact_src").fetchall() == [(7,)]
+        assert (tmp_path / "parquet" / "fact_src" / "fact_src.parquet").exists()
+        conn.close()
+
 
 class TestMultiLoaderErrorHandling:
     def test_secondary_loader_failure_does_not_raise(self) -> None:
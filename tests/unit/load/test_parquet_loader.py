@@ -51,6 +51,19 @@ class TestParquetLoader:
         assert (tmp_path / table / "season_year=2023-24" / "part0.parquet").exists()
         assert (tmp_path / table / "season_year=2024-25" / "part0.parquet").exists()
 
+    def test_play_by_play_sorted_within_partitions(self, tmp_path: Path) -> None:
+        loader = ParquetLoader(tmp_path)
+        df = pl.DataFrame(
+            {
+                "game_id": ["002", "001", "001", "003"],
+                "event_num": [1, 7, 2, 4],
+                "season_year": ["2024-25", "2024-25", "2024-25", "2023-24"],
+            }
+        )
+        loader.load("fact_play_by_play", df)
+        part = pl.read_parquet(tmp_path / "fact_play_by_play" / "season_year=2024-25")
+        assert part.select("game_id", "event_num").rows() == [("001", 2), ("001", 7), ("002", 1)]
+
     def test_partitioned_replace_removes_stale_partitions(self, tmp_path: Path) -> None:
         table = PARTITIONED_SAMPLE_TABLE
         loader = ParquetLoader(tmp_path)
@@ -5,8 +5,9 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from nbadb.orchestrate.backfill import BackfillPlanner
+from nbadb.orchestrate.backfill import BackfillPlanner, restrict_plan_to_missing
 from nbadb.orchestrate.journal import PipelineJournal
+from nbadb.orchestrate.planning import ExtractionPlanItem
 from nbadb.orchestrate.workload_contract import PlayerTeamSeasonWorkloadStore
 
 if TYPE_CHECKING:
@@ -730,6 +731,133 @@ class TestGapDetectionEntityDate:
         assert game_gaps[0].expected == 2  # only 2024-25 games
 
 
+class TestExactMissingKeys:
+    @pytest.fixture
+    def game_log(self, conn: duckdb.DuckDBPyConnection) -> None:
+        conn.execute("""
+            CREATE TABLE stg_league_game_log AS
+            SELECT * FROM (VALUES
+                ('001', '2024-25', '2024-10-01'),
+                ('002', '2024-25', '2024-10-02'),
+                ('003', '2024-25', '2024-10-03'),
+                ('004', '2023-24', '2024-01-01')
+            ) AS t(game_id, season_id, game_date)
+        """)
+
+    def test_missing_keys_is_anti_join(
+        self,
+        game_log: None,
+        journal: PipelineJournal,
+        planner: BackfillPlanner,
+    ) -> None:
+        _seed_done(journal, "box_score_traditional", {"game_id": "002"})
+        _seed_failed(journal, "box_score_traditional", {"game_id": "003"})
+        _seed_done(journal, "box_score_advanced", {"game_id": "001"})
+
+        missing = planner.missing_keys("box_score_traditional", "game", seasons=["2024-25"])
+
+        assert missing == ["001", "003"]
+
+    def test_gap_report_carries_missing_keys(
+        self,
+        game_log: None,
+        journal: PipelineJournal,
+        planner: BackfillPlanner,
+    ) -> None:
+        _seed_done(journal, "box_score_traditional", {"game_id": "001"})
+
+        report = planner.detect_gaps(
+            endpoints=["box_score_traditional"],
+            patterns=["game"],
+            seasons=["2024-25"],
+        )
+
+        (gap,) = report.gaps
+        assert gap.missing_keys == ("002", "003")
+        assert (gap.expected, gap.actual, gap.missing) == (3, 1, 2)
+
+    def test_player_keys_match_typed_journal_column(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        journal: PipelineJournal,
+        planner: BackfillPlanner,
+    ) -> None:
+        conn.execute("""
+            CREATE TABLE stg_common_all_players AS
+            SELECT * FROM (VALUES (101), (102)) AS t(person_id)
+        """)
+        _seed_done(journal, "common_player_info", {"player_id": 101})
+
+        assert planner.missing_keys("common_player_info", "player") == [102]
+
+    def test_missing_keys_unknown_without_reference_table(
+        self,
+        planner: BackfillPlanner,
+    ) -> None:
+        assert planner.missing_keys("box_score_traditional", "game") is None
+
+    def test_build_plan_schedules_only_missing_keys(
+        self,
+        game_log: None,
+        journal: PipelineJournal,
+        planner: BackfillPlanner,
+    ) -> None:
+        _seed_done(journal, "box_score_traditional", {"game_id": "001"})
+
+        plan = planner.build_plan(
+            seasons=["2024-25"],
+            endpoints=["box_score_traditional"],
+            patterns=["game"],
+        )
+
+        (item,) = plan.items
+        assert {entry.endpoint_name for entry in item.entries} == {"box_score_traditional"}
+        assert item.params == [{"game_id": "002"}, {"game_id": "003"}]
+
+    def test_build_plan_force_schedules_every_key(
+        self,
+        game_log: None,
+        journal: PipelineJournal,
+        planner: BackfillPlanner,
+    ) -> None:
+        _seed_done(journal, "box_score_traditional", {"game_id": "001"})
+
+        plan = planner.build_plan(
+            seasons=["2024-25"],
+            endpoints=["box_score_traditional"],
+            patterns=["game"],
+            force=True,
+        )
+
+        (item,) = plan.items
+        assert item.params == [{"game_id": "001"}, {"game_id": "002"}, {"game_id": "003"}]
+
+    def test_restrict_plan_to_missing_splits_by_endpoint(
+        self,
+        journal: PipelineJournal,
+        planner: BackfillPlanner,
+    ) -> None:
+        entries = planner._filter_entries(
+            endpoints=["box_score_traditional", "box_score_advanced"],
+            patterns=["game"],
+        )
+        item = ExtractionPlanItem(
+            label="game",
+            pattern="game",
+            entries=entries,
+            params=[{"game_id": "001"}, {"game_id": "002"}],
+            priority=2,
+        )
+        _seed_done(journal, "box_score_traditional", {"game_id": "001"})
+        _seed_done(journal, "box_score_advanced", {"game_id": "001"})
+        _seed_done(journal, "box_score_advanced", {"game_id": "002"})
+
+        (restricted,) = restrict_plan_to_missing([item], journal)
+
+        assert {entry.endpoint_name for entry in restricted.entries} == {"box_score_traditional"}
+        assert restricted.params == [{"game_id": "002"}]
+
+
 # ── rowcount fix verification ────────────────────────────────────
 
 
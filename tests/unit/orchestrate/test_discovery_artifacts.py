@@ -286,6 +286,8 @@ def test_discovery_artifact_store_rejects_tampered_artifact_content(tmp_path) ->
         variant="historical",
     )
     store.upsert_ids(scope, [1], provenance="test")
+    # Exercise the per-season artifact path that predates the season-ID index.
+    store._season_index_manifest_path().unlink()
     pl.DataFrame({"value": [2]}).write_parquet(_generation_path(store, scope))
 
     assert (
@@ -651,3 +653,107 @@ def test_discovery_artifact_store_does_not_count_zero_row_player_scope_as_comple
         )
         is None
     )
+
+
+def _seed_historical_player_seasons(store: DiscoveryArtifactStore, count: int) -> tuple[str, ...]:
+    seasons = tuple(f"{year}-{(year + 1) % 100:02d}" for year in range(1946, 1946 + count))
+    for offset, season in enumerate(seasons):
+        store.upsert_ids(
+            DiscoveryArtifactScope(kind="player_ids_all", seasons=(season,), variant="historical"),
+            [offset + 1, offset + 2],
+            provenance="test",
+        )
+    return seasons
+
+
+def test_season_index_answers_multi_season_lookups_without_per_season_reads(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    store = DiscoveryArtifactStore.from_duckdb_path(tmp_path / "planner.duckdb")
+    seasons = _seed_historical_player_seasons(store, 5)
+
+    def _no_per_season_reads(_scope):
+        raise AssertionError("per-season artifact read")
+
+    monkeypatch.setattr(store, "load_frame", _no_per_season_reads)
+
+    assert store.load_ids_for_seasons(
+        kind="player_ids_all",
+        seasons=seasons,
+        variant="historical",
+    ) == [1, 2, 3, 4, 5, 6]
+    assert store.load_ids_by_season(
+        kind="player_ids_all",
+        seasons=(seasons[0], "2030-31"),
+        variant="historical",
+    ) == {seasons[0]: [1, 2]}
+
+
+def test_season_index_promotes_per_season_artifacts_on_first_lookup(tmp_path) -> None:
+    store = DiscoveryArtifactStore.from_duckdb_path(tmp_path / "planner.duckdb")
+    seasons = _seed_historical_player_seasons(store, 3)
+    store._season_index_manifest_path().unlink()
+
+    assert store.load_ids_for_seasons(
+        kind="player_ids_all",
+        seasons=seasons,
+        variant="historical",
+    ) == [1, 2, 3, 4]
+    assert set(
+        store.load_ids_by_season(kind="player_ids_all", seasons=seasons, variant="historical")
+    ) == set(seasons)
+    assert len(list(store._season_index_manifest_path().parent.glob("season-ids.*.parquet"))) == 1
+
+
+def test_tampered_season_index_falls_back_to_per_season_artifacts(tmp_path) -> None:
+    store = DiscoveryArtifactStore.from_duckdb_path(tmp_path / "planner.duckdb")
+    seasons = _seed_historical_player_seasons(store, 2)
+    manifest = json.loads(store._season_index_manifest_path().read_text(encoding="utf-8"))
+    index_path = store._season_index_manifest_path().with_name(manifest["content"]["path"])
+    tampered = {"kind": ["player_ids_all"], "variant": ["historical"], "season": [seasons[0]]}
+    pl.DataFrame({**tampered, "value": [9]}).write_parquet(index_path)
+
+    assert store.load_ids_for_seasons(
+        kind="player_ids_all",
+        seasons=seasons,
+        variant="historical",
+    ) == [1, 2, 3]
+
+
+def test_deferred_season_index_batches_upserts_into_one_rewrite(tmp_path, monkeypatch) -> None:
+    store = DiscoveryArtifactStore.from_duckdb_path(tmp_path / "planner.duckdb")
+    writes: list[int] = []
+    write_season_index = store._write_season_index
+
+    def _counting_write(updates):
+        writes.append(sum(len(ids_by_season) for ids_by_season in updates.values()))
+        write_season_index(updates)
+
+    monkeypatch.setattr(store, "_write_season_index", _counting_write)
+
+    with store.deferred_season_index():
+        seasons = _seed_historical_player_seasons(store, 4)
+        with store.deferred_season_index():
+            store.upsert_ids(
+                DiscoveryArtifactScope(kind="team_ids", seasons=(seasons[0],)),
+                [1610612737],
+                provenance="test",
+            )
+        assert writes == []
+        assert store.load_ids_by_season(
+            kind="player_ids_all",
+            seasons=seasons[:2],
+            variant="historical",
+        ) == {seasons[0]: [1, 2], seasons[1]: [2, 3]}
+
+    assert writes == [5]
+    monkeypatch.setattr(store, "load_frame", lambda _scope: pytest.fail("per-season read"))
+    assert store.load_ids_for_seasons(
+        kind="player_ids_all",
+        seasons=seasons,
+        variant="historical",
+    ) == [1, 2, 3, 4, 5]
+    assert store.load_ids_by_season(kind="team_ids", seasons=(seasons[0],)) == {
+        seasons[0]: [1610612737]
+    }
@@ -19,7 +19,6 @@ from nbadb.extract.base import BaseExtractor
 from nbadb.orchestrate.execution_policy import build_execution_policy
 from nbadb.orchestrate.extractor_runner import (
     ExtractorRunner,
-    _AdaptiveThrottle,
     _DeferredExtraction,
     _ExtractionTaskResult,
     _FailedExtraction,
@@ -27,7 +26,7 @@ from nbadb.orchestrate.extractor_runner import (
     _record_chunk_completion_heartbeat,
     _sync_extract,
 )
-from nbadb.orchestrate.resilience import _CircuitBreaker, _LatencyTracker
+from nbadb.orchestrate.resilience import _AdaptiveThrottle, _CircuitBreaker, _LatencyTracker
 from nbadb.orchestrate.staging_map import StagingEntry
 
 # ---------------------------------------------------------------------------
@@ -397,6 +396,56 @@ class TestRunPattern:
         assert result["stg_ep1"].shape[0] == 2
         assert set(result["stg_ep1"].columns) == {"a", "b", "c"}
 
+    @pytest.mark.asyncio
+    async def test_run_pattern_unions_spooled_chunks_with_schema_drift(self):
+        class _SchemaDriftExtractor:
+            category = "default"
+
+            async def extract(self, **kwargs):
+                if kwargs["season"] == "2024-25":
+                    return pl.DataFrame({"a": [1], "b": [2]})
+                return pl.DataFrame({"a": [3.5], "c": ["x"]})
+
+        settings = _make_settings(
+            default_chunk_size=1, adaptive_chunk_min_size=1, adaptive_chunk_max_size=1
+        )
+        runner = ExtractorRunner(_make_registry(_SchemaDriftExtractor), settings, _make_journal())
+
+        entry = StagingEntry("ep1", "stg_ep1", "season")
+        result = await runner.run_pattern_result(
+            "season",
+            [{"season": "2024-25"}, {"season": "2025-26"}],
+            [entry],
+        )
+
+        frame = result.frames["stg_ep1"]
+        assert frame.shape[0] == 2
+        assert set(frame.columns) == {"a", "b", "c"}
+        assert frame["a"].dtype == pl.Float64
+        assert result.staging_keys == ("stg_ep1",)
+
+    @pytest.mark.asyncio
+    async def test_run_pattern_without_retained_frames_only_persists_chunks(self):
+        df = pl.DataFrame({"col": [10, 20]})
+        runner = ExtractorRunner(
+            _make_registry(_make_extractor(df=df)), _make_settings(), _make_journal()
+        )
+        persisted: list[dict[str, pl.DataFrame]] = []
+
+        entry = StagingEntry("ep1", "stg_ep1", "season")
+        result = await runner.run_pattern_result(
+            "season",
+            [{"season": "2024-25"}],
+            [entry],
+            persist_chunk_results=lambda frames, **_metadata: persisted.append(frames),
+            retain_frames=False,
+        )
+
+        assert result.frames == {}
+        assert result.staging_keys == ("stg_ep1",)
+        assert result.row_count == 2
+        assert persisted[0]["stg_ep1"].shape[0] == 2
+
     @pytest.mark.asyncio
     async def test_run_pattern_explicit_skip_does_not_increment_journal_skip_counter(self):
         df = pl.DataFrame({"col": [10, 20]})
@@ -864,19 +913,18 @@ class TestAdaptiveThrottle:
 class TestAdaptiveThrottleIntegration:
     @pytest.mark.asyncio
     async def test_runner_backs_off_on_failure(self):
-        """Verify the runner replaces its rate limiter after extraction failure."""
+        """Verify the runner slows the shared governor in place after a failure."""
         journal = _make_journal(already_done=False)
         settings = _make_settings(adaptive_rate_recovery=5)
         registry = _make_registry(_make_extractor(exc=TimeoutError("boom")))
         runner = ExtractorRunner(registry, settings, journal, rate_limit=10.0)
 
-        original_limiter = runner._rate_limiter
+        governor = runner.rate_governor
         entry = StagingEntry("ep1", "stg_ep1", "season")
         await runner._extract_single(entry, {"season": "2024-25"})
 
-        # Rate limiter should have been replaced with a slower one
-        assert runner._rate_limiter is not original_limiter
-        assert runner._adaptive.current_rate < 10.0
+        assert runner.rate_governor is governor
+        assert governor.current_rate < 10.0
 
     @pytest.mark.asyncio
     async def test_prepare_extractor_sets_endpoint_timeout_override(self):
@@ -907,18 +955,19 @@ class TestAdaptiveThrottleIntegration:
         settings = _make_settings(adaptive_rate_recovery=3)
         registry = _make_registry(_make_extractor(df=df))
         runner = ExtractorRunner(registry, settings, journal, rate_limit=10.0)
+        governor = runner.rate_governor
 
         # First: drive rate down
-        runner._adaptive.record_failure()
-        runner._adaptive.record_failure()
-        low_rate = runner._adaptive.current_rate
+        governor.record_failure("ep0", "default")
+        governor.record_failure("ep0", "default")
+        low_rate = governor.current_rate
 
         # Now: run 3 successful extractions to trigger recovery
         for i in range(3):
             entry = StagingEntry(f"ep{i}", f"stg_ep{i}", "season")
             await runner._extract_single(entry, {"season": "2024-25"})
 
-        assert runner._adaptive.current_rate > low_rate
+        assert governor.current_rate > low_rate
 
     @pytest.mark.asyncio
     async def test_isolated_endpoint_failure_does_not_back_off_global_rate(self):
@@ -926,46 +975,34 @@ class TestAdaptiveThrottleIntegration:
         settings = _make_settings(endpoint_rate_limits={"ep1": 2.0})
         registry = _make_registry(_make_extractor(exc=TimeoutError("boom")))
         runner = ExtractorRunner(registry, settings, journal, rate_limit=10.0)
-        original_limiter = runner._rate_limiter
 
         entry = StagingEntry("ep1", "stg_ep1", "season")
         await runner._extract_single(entry, {"season": "2024-25"})
 
-        assert runner._rate_limiter is original_limiter
-        assert runner._adaptive.current_rate == 10.0
+        governor = runner.rate_governor
+        assert governor.current_rate == 10.0
+        assert governor.rate_for("ep1", "default") < 2.0
 
     @pytest.mark.asyncio
-    async def test_isolated_endpoint_uses_endpoint_limiter_instead_of_global_limiter(self):
-        class _TrackedAsyncContext:
-            def __init__(self):
-                self.entered = 0
-
-            async def __aenter__(self):
-                self.entered += 1
-                return self
-
-            async def __aexit__(self, exc_type, exc, tb):
-                return False
-
+    async def test_isolated_endpoint_draws_from_endpoint_and_global_buckets(self):
         df = pl.DataFrame({"a": [1]})
         journal = _make_journal(already_done=False)
         settings = _make_settings(endpoint_rate_limits={"ep1": 2.0})
         registry = _make_registry(_make_extractor(df=df))
         runner = ExtractorRunner(registry, settings, journal, rate_limit=10.0)
-        global_limiter = _TrackedAsyncContext()
-        endpoint_limiter = _TrackedAsyncContext()
-        runner._rate_limiter = global_limiter
-        runner._endpoint_rate_limiters["ep1"] = endpoint_limiter
 
         entry = StagingEntry("ep1", "stg_ep1", "season")
         result = await runner._extract_single(entry, {"season": "2024-25"})
 
         assert result is not None
-        assert global_limiter.entered == 0
-        assert endpoint_limiter.entered == 1
+        granted = {
+            (stats.scope, stats.name): stats.granted for stats in runner.rate_governor.snapshot()
+        }
+        assert granted[("global", "global")] == 1
+        assert granted[("endpoint", "ep1")] == 1
 
     @pytest.mark.asyncio
-    async def test_family_isolation_uses_family_limiter_without_backing_off_global_rate(self):
+    async def test_family_isolation_backs_off_family_without_backing_off_global_rate(self):
         journal = _make_journal(already_done=False)
         settings = _make_settings(
             endpoint_family_overrides={"ep1": "player_history"},
@@ -973,14 +1010,14 @@ class TestAdaptiveThrottleIntegration:
         )
         registry = _make_registry(_make_extractor(exc=TimeoutError("boom")))
         runner = ExtractorRunner(registry, settings, journal, rate_limit=10.0)
-        original_limiter = runner._rate_limiter
 
         entry = StagingEntry("ep1", "stg_ep1", "season")
         await runner._extract_single(entry, {"season": "2024-25"})
 
-        assert runner._rate_limiter is original_limiter
-        assert runner._adaptive.current_rate == 10.0
-        assert "player_history" in runner._family_rate_limiters
+        governor = runner.rate_governor
+        assert governor.current_rate == 10.0
+        assert governor.scope("ep1", "player_history") == "family"
+        assert governor.rate_for("ep1", "player_history") < 2.0
 
     def test_endpoint_semaphore_override_takes_precedence(self):
         journal = _make_journal(already_done=False)
@@ -1068,6 +1105,44 @@ class TestAdaptiveThrottleIntegration:
 
         assert chunk_size == 10
 
+    def test_chunk_size_follows_live_latency(self):
+        journal = _make_journal(already_done=False)
+        settings = _make_settings(
+            endpoint_family_overrides={"ep1": "player_history"},
+            family_chunk_multipliers={"player_history": 0.25},
+            adaptive_chunk_min_size=10,
+            adaptive_chunk_max_size=1000,
+            adaptive_chunk_target_seconds=100.0,
+            default_chunk_size=400,
+        )
+        runner = ExtractorRunner(_make_registry(_make_extractor()), settings, journal)
+        entries = [StagingEntry("ep1", "stg_ep1", "player")]
+
+        assert runner._chunk_size_for_entries("player", entries) == 100
+        for _ in range(5):
+            runner._latency.record("ep1", 2.0)
+
+        # 2.0s per call across 5 slots is 0.4s of lane time per param set
+        assert runner._chunk_size_for_entries("player", entries) == 250
+
+    def test_live_chunk_size_respects_rate_limit(self):
+        journal = _make_journal(already_done=False)
+        settings = _make_settings(
+            adaptive_chunk_min_size=1,
+            adaptive_chunk_max_size=1000,
+            adaptive_chunk_target_seconds=10.0,
+            endpoint_rate_limits={"ep1": 0.5},
+        )
+        runner = ExtractorRunner(_make_registry(_make_extractor()), settings, journal)
+        for _ in range(5):
+            runner._latency.record("ep1", 0.01)
+
+        chunk_size = runner._chunk_size_for_entries(
+            "player", [StagingEntry("ep1", "stg_ep1", "player")]
+        )
+
+        assert chunk_size == 5
+
     def test_default_settings_isolate_slow_player_history_endpoints(self):
         settings = NbaDbSettings()
 
@@ -1588,6 +1663,33 @@ class TestCircuitBreaker:
 # ---------------------------------------------------------------------------
 
 
+class TestExpectedCostOrdering:
+    def test_slowest_endpoint_first_and_ties_interleaved(self):
+        journal = _make_journal()
+        journal.endpoint_latency_p95.return_value = {"slow": 9.0}
+        runner = ExtractorRunner(_make_registry(_make_extractor()), _make_settings(), journal)
+        scheduled = [
+            ("a", "a1"),
+            ("a", "a2"),
+            ("b", "b1"),
+            ("b", "b2"),
+            ("slow", "slow1"),
+        ]
+
+        assert runner._order_by_expected_cost(scheduled) == ["slow1", "a1", "b1", "a2", "b2"]
+
+    def test_live_latency_overrides_recorded_prior(self):
+        journal = _make_journal()
+        journal.endpoint_latency_p95.return_value = {"ep1": 9.0}
+        runner = ExtractorRunner(_make_registry(_make_extractor()), _make_settings(), journal)
+
+        assert runner._expected_cost("ep1") == 9.0
+        runner._latency.record("ep1", 0.5)
+        assert runner._expected_cost("ep1") == 0.5
+        assert runner._expected_cost("unseen") == 1.0
+        journal.endpoint_latency_p95.assert_called_once()
+
+
 class TestBuildChunkTasksDeprecated:
     def test_deprecated_entry_is_skipped(self):
         import asyncio
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from nbadb.orchestrate.frame_spool import FrameSpool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_append_spills_frames_and_scan_unions_them(tmp_path: Path) -> None:
+    spool = FrameSpool(tmp_path)
+    spool.append("stg_pbp", pl.DataFrame({"game_id": ["g1"], "event": [1]}))
+    spool.append("stg_pbp", pl.DataFrame({"game_id": ["g2", "g3"], "event": [2, 3]}))
+    spool.append("stg_shots", pl.DataFrame({"x": [1.0]}))
+
+    assert list(spool) == ["stg_pbp", "stg_shots"]
+    assert spool.rows("stg_pbp") == 3
+    assert len(list(tmp_path.rglob("*.arrow"))) == 3
+
+    scan = spool.scan("stg_pbp")
+    assert isinstance(scan, pl.LazyFrame)
+    assert scan.collect()["game_id"].to_list() == ["g1", "g2", "g3"]
+
+
+def test_scan_unifies_drifted_schemas_lazily() -> None:
+    with FrameSpool() as spool:
+        spool.append("k", pl.DataFrame({"a": [1], "b": ["x"]}))
+        spool.append("k", pl.DataFrame({"a": [2.5], "c": [True]}))
+
+        assert spool.drifted_columns("k") == {"b", "c"}
+        frame = spool.scan("k").collect()
+
+    assert set(frame.columns) == {"a", "b", "c"}
+    assert frame["a"].dtype == pl.Float64
+
+
+def test_empty_frames_are_ignored_and_close_removes_files(tmp_path: Path) -> None:
+    spool = FrameSpool(tmp_path)
+    spool.append("k", pl.DataFrame())
+    assert "k" not in spool
+    assert spool.scan("k").collect().is_empty()
+
+    spool.append("k", pl.DataFrame({"a": [1]}))
+    spool.close()
+
+    assert list(spool) == []
+    assert not any(tmp_path.iterdir())
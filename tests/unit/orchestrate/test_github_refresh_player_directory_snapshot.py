@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+if TYPE_CHECKING:
+    import pytest
+
+MODULE_PATH = (
+    Path(__file__).resolve().parents[3]
+    / ".github"
+    / "scripts"
+    / "refresh_player_directory_snapshot.py"
+)
+MODULE_CODE = compile(MODULE_PATH.read_text(encoding="utf-8"), str(MODULE_PATH), "exec")
+
+
+def _load_module():
+    module = types.ModuleType("github_refresh_player_directory_snapshot")
+    module.__file__ = str(MODULE_PATH)
+    exec(MODULE_CODE, module.__dict__)
+    return module
+
+
+def test_fetch_player_directory_disables_the_static_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_module()
+    calls: list[dict[str, object]] = []
+
+    class _Extractor:
+        async def extract(self, **params: object) -> pl.DataFrame:
+            calls.append(params)
+            return pl.DataFrame({"person_id": [1]})
+
+    monkeypatch.setattr(module.registry, "get", lambda _name: _Extractor)
+
+    asyncio.run(module.fetch_player_directory(timeout=5.0))
+
+    assert calls == [{"is_only_current_season": 0, "allow_static_fallback": False, "timeout": 5.0}]
+
+
+def test_refresh_snapshot_writes_windows_and_reports_module_constants(tmp_path) -> None:
+    module = _load_module()
+    directory = pl.DataFrame(
+        {
+            "person_id": [2544, 76001, 203999],
+            "from_year": ["2003", "1990", "2014"],
+            "to_year": ["2026", "1994", "2025"],
+        }
+    )
+    output_path = tmp_path / "player_directory_snapshot.parquet"
+
+    summary = module.refresh_snapshot(directory, output_path=output_path)
+
+    assert pl.read_parquet(output_path).rows() == [
+        (76001, 1990, 1994),
+        (2544, 2003, 2026),
+        (203999, 2014, 2025),
+    ]
+    assert summary["rows"] == 3
+    assert summary["dropped_rows"] == 0
+    assert summary["SNAPSHOT_COMPLETE_THROUGH_SEASON"] == "2026-27"
+    assert summary["SNAPSHOT_COMPLETE_THROUGH_YEAR"] == 2026
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from nbadb.orchestrate.journal import PipelineJournal
+from nbadb.orchestrate.journal import PipelineJournal, journal_key_values, params_digest
 from nbadb.transform.schema_version import schema_hash_for_columns
 
 if TYPE_CHECKING:
@@ -51,6 +51,17 @@ class TestJournalExtraction:
         )
         assert journal.was_extracted("box_score", '{"game_id": "001"}')
 
+    def test_record_start_populates_key_columns(self, journal: PipelineJournal) -> None:
+        params = '{"game_id": "0022400001", "season": "2024-25", "team_id": "1610612747"}'
+        journal.record_start("box_score", params)
+        row = journal._conn.execute(
+            "SELECT params_digest, season, game_id, team_id, player_id FROM _extraction_journal"
+        ).fetchone()
+        assert row == (params_digest(params), "2024-25", "0022400001", 1610612747, None)
+
+    def test_journal_key_values_ignores_non_json(self) -> None:
+        assert journal_key_values("p1") == (None,) * 6
+
     def test_record_failure(self, journal: PipelineJournal) -> None:
         journal.record_start("ep", "p")
         journal.record_failure("ep", "p", "timeout")
@@ -177,6 +188,19 @@ class TestJournalMetrics:
         assert row[2] == 100
         assert row[3] == 0
 
+    def test_endpoint_latency_p95_ignores_failed_calls(self, journal: PipelineJournal) -> None:
+        journal._conn.execute(
+            "INSERT INTO _pipeline_metrics "
+            "(endpoint, run_timestamp, duration_seconds, rows_extracted, error_count) "
+            "SELECT 'ep', TIMESTAMP '2024-01-01' + INTERVAL (i) SECOND, i, 1, 0 "
+            "FROM range(1, 101) t(i)"
+        )
+        journal.record_metric("ep", duration=999.0, rows=0, errors=1)
+
+        p95 = journal.endpoint_latency_p95()
+
+        assert p95 == {"ep": pytest.approx(95.05)}
+
 
 class TestJournalSeasonTypeCounts:
     def test_count_done_by_endpoint_season_type(self, journal: PipelineJournal) -> None:
@@ -255,6 +279,36 @@ class TestJournalBatch:
         result = journal.was_extracted_batch(all_items)
         assert result == set(done_items)
 
+    def test_was_extracted_batch_loads_history_once(self, journal: PipelineJournal) -> None:
+        journal.record_start("ep1", "p1")
+        journal.record_success("ep1", "p1", 10)
+        assert journal.was_extracted_batch([("ep1", "p1")]) == {("ep1", "p1")}
+
+        # Rows written behind the journal's back are not re-read ...
+        journal._conn.execute(
+            "INSERT INTO _extraction_journal (endpoint, params, status) "
+            "VALUES ('ep9', 'p9', 'done')"
+        )
+        assert journal.was_extracted_batch([("ep9", "p9")]) == set()
+        # ... until the index is explicitly invalidated.
+        journal.invalidate_done_index()
+        assert journal.was_extracted_batch([("ep9", "p9")]) == {("ep9", "p9")}
+
+    def test_was_extracted_batch_tracks_recorded_outcomes(self, journal: PipelineJournal) -> None:
+        assert journal.was_extracted_batch([("ep1", "p1")]) == set()
+        journal.record_start("ep1", "p1")
+        journal.record_success("ep1", "p1", 10)
+        assert journal.was_extracted_batch([("ep1", "p1")]) == {("ep1", "p1")}
+        journal.record_failure("ep1", "p1", "boom")
+        assert journal.was_extracted_batch([("ep1", "p1")]) == set()
+
+    def test_reset_entries_invalidates_index(self, journal: PipelineJournal) -> None:
+        journal.record_start("ep1", "p1")
+        journal.record_success("ep1", "p1", 10)
+        assert journal.was_extracted_batch([("ep1", "p1")]) == {("ep1", "p1")}
+        journal.reset_entries(endpoint="ep1")
+        assert journal.was_extracted_batch([("ep1", "p1")]) == set()
+
 
 # ---------------------------------------------------------------------------
 # log_summary
@@ -70,6 +70,53 @@ class _FakeBoxScore:
         self.away_team_player_stats = _FakeDataSet([{"personId": 2, "points": 18}])
 
 
+def _play_by_play(action_count: int):
+    class _PlayByPlay:
+        def __init__(self, **kwargs):
+            self.actions = _FakeDataSet(
+                [
+                    {
+                        "actionNumber": number,
+                        "period": 4,
+                        "clock": f"PT0{10 - number}M00.00S",
+                        "teamId": 1610612738,
+                        "personId": 1,
+                        "actionType": "shot",
+                        "description": "Player makes jumper",
+                        "pointsTotal": 2 * number,
+                        "actionId": 1000 + number,
+                    }
+                    for number in range(1, action_count + 1)
+                ]
+            )
+
+    return _PlayByPlay
+
+
+def _box_score(home_score: int):
+    class _BoxScore(_FakeBoxScore):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.home_team_stats = _FakeDataSet({"teamId": 1610612738, "score": home_score})
+
+    return _BoxScore
+
+
+class _UnexpectedPlayByPlay:
+    def __init__(self, **kwargs):
+        raise AssertionError("play-by-play should not be fetched for a finished game")
+
+
+def _settings(tmp_path, formats: list[str]) -> NbaDbSettings:
+    return NbaDbSettings(
+        data_dir=tmp_path / "data",
+        log_dir=tmp_path / "logs",
+        formats=formats,
+        sqlite_path=tmp_path / "data" / "live.sqlite",
+        duckdb_path=tmp_path / "data" / "live.duckdb",
+    )
+
+
 class _FakeFinalScoreBoard:
     def __init__(self, **kwargs):
         self.games = _FakeDataSet(
@@ -79,94 +126,137 @@ class _FakeFinalScoreBoard:
         )
 
 
-def test_live_snapshot_warehouse_appends_staging_and_star_tables(tmp_path) -> None:
-    settings = NbaDbSettings(
-        data_dir=tmp_path / "data",
-        log_dir=tmp_path / "logs",
-        formats=["duckdb"],
-        sqlite_path=tmp_path / "data" / "live.sqlite",
-        duckdb_path=tmp_path / "data" / "live.duckdb",
-    )
+def test_live_snapshot_warehouse_merges_changed_rows_and_skips_unchanged_games(
+    tmp_path,
+) -> None:
+    settings = _settings(tmp_path, ["duckdb"])
     warehouse = LiveSnapshotWarehouse(settings=settings)
 
     first_snapshot = datetime(2026, 4, 17, 12, 0, tzinfo=UTC)
     second_snapshot = datetime(2026, 4, 17, 12, 5, tzinfo=UTC)
+    third_snapshot = datetime(2026, 4, 17, 12, 10, tzinfo=UTC)
+    fourth_snapshot = datetime(2026, 4, 17, 12, 15, tzinfo=UTC)
 
     with (
         patch("nbadb.extract.live.endpoints.ScoreBoard", _FakeScoreBoard),
         patch("nbadb.extract.live.endpoints.Odds", _FakeOdds),
-        patch("nbadb.extract.live.endpoints.PlayByPlay", _FakePlayByPlay),
-        patch("nbadb.extract.live.endpoints.BoxScore", _FakeBoxScore),
     ):
-        first_result = warehouse.run(game_ids=["001"], snapshot_at=first_snapshot)
-        second_result = warehouse.run(game_ids=["001"], snapshot_at=second_snapshot)
+        with (
+            patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(1)),
+            patch("nbadb.extract.live.endpoints.BoxScore", _box_score(110)),
+        ):
+            first_result = warehouse.run(game_ids=["001"], snapshot_at=first_snapshot)
+        with (
+            patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(2)),
+            patch("nbadb.extract.live.endpoints.BoxScore", _box_score(112)),
+        ):
+            second_result = warehouse.run(game_ids=["001"], snapshot_at=second_snapshot)
+        with (
+            patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(2)),
+            patch("nbadb.extract.live.endpoints.BoxScore", _box_score(112)),
+        ):
+            third_result = warehouse.run(game_ids=["001"], snapshot_at=third_snapshot)
+        # A box-score correction with no new action still counts as a change.
+        with (
+            patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(2)),
+            patch("nbadb.extract.live.endpoints.BoxScore", _box_score(113)),
+        ):
+            fourth_result = warehouse.run(game_ids=["001"], snapshot_at=fourth_snapshot)
 
     assert first_result.game_ids == ["001"]
     assert first_result.staging_tables_persisted == 10
     assert first_result.star_tables_loaded == 8
-    assert second_result.staging_tables_persisted == 10
-    assert second_result.star_tables_loaded == 8
+    assert second_result.game_ids == ["001"]
+    assert second_result.staging_tables_persisted == 2
+    assert second_result.staging_rows_persisted == 2
+    assert second_result.star_tables_loaded == 2
+    assert third_result.game_ids == []
+    assert third_result.skipped_game_ids == ["001"]
+    assert third_result.star_tables_loaded == 0
+    assert fourth_result.game_ids == ["001"]
+    assert fourth_result.star_tables_loaded == 1
 
     import duckdb
 
     conn = duckdb.connect(str(settings.duckdb_path))
     try:
-        assert conn.execute("SELECT COUNT(*) FROM stg_live_score_board").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM stg_live_score_board").fetchone()[0] == 1
         assert conn.execute("SELECT COUNT(*) FROM stg_live_play_by_play").fetchone()[0] == 2
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_score_board").fetchone()[0] == 2
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_odds").fetchone()[0] == 2
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_play_by_play").fetchone()[0] == 2
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_box_score_game").fetchone()[0] == 2
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_box_score_arena").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM fact_live_score_board").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM fact_live_odds").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM fact_live_box_score_game").fetchone()[0] == 1
         assert (
-            conn.execute("SELECT COUNT(*) FROM bridge_live_box_score_official").fetchone()[0] == 2
+            conn.execute("SELECT COUNT(*) FROM bridge_live_box_score_official").fetchone()[0] == 1
         )
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_box_score_team").fetchone()[0] == 4
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_box_score_player").fetchone()[0] == 4
-        snapshot_values = conn.execute(
-            "SELECT DISTINCT snapshot_at FROM fact_live_score_board ORDER BY snapshot_at"
+        assert conn.execute("SELECT COUNT(*) FROM fact_live_box_score_player").fetchone()[0] == 2
+        play_by_play = conn.execute(
+            "SELECT action_number, snapshot_at FROM fact_live_play_by_play ORDER BY 1"
+        ).fetchall()
+        team_rows = conn.execute(
+            "SELECT team_side, score, snapshot_at FROM fact_live_box_score_team ORDER BY 1"
+        ).fetchall()
+        watermark = conn.execute(
+            "SELECT last_action_number, period, clock, game_status FROM _live_game_watermarks"
         ).fetchall()
     finally:
         conn.close()
 
-    assert [row[0] for row in snapshot_values] == [
-        first_snapshot.replace(tzinfo=None),
-        second_snapshot.replace(tzinfo=None),
-    ]
+    first_at = first_snapshot.replace(tzinfo=None)
+    second_at = second_snapshot.replace(tzinfo=None)
+    fourth_at = fourth_snapshot.replace(tzinfo=None)
+    assert play_by_play == [(1, first_at), (2, second_at)]
+    assert team_rows == [("away", 108, first_at), ("home", 113, fourth_at)]
+    assert watermark == [(2, 4, "PT08M00.00S", 2)]
 
 
-def test_live_snapshot_append_updates_duckdb_when_secondary_formats_are_replace_only(
+def test_live_snapshot_merge_updates_duckdb_when_secondary_formats_are_replace_only(
     tmp_path,
 ) -> None:
-    settings = NbaDbSettings(
-        data_dir=tmp_path / "data",
-        log_dir=tmp_path / "logs",
-        formats=["duckdb", "parquet"],
-        sqlite_path=tmp_path / "data" / "live.sqlite",
-        duckdb_path=tmp_path / "data" / "live.duckdb",
-    )
+    settings = _settings(tmp_path, ["duckdb", "parquet"])
     warehouse = LiveSnapshotWarehouse(settings=settings)
 
-    first_snapshot = datetime(2026, 4, 17, 12, 0, tzinfo=UTC)
-    second_snapshot = datetime(2026, 4, 17, 12, 5, tzinfo=UTC)
-
     with (
         patch("nbadb.extract.live.endpoints.ScoreBoard", _FakeScoreBoard),
         patch("nbadb.extract.live.endpoints.Odds", _FakeOdds),
-        patch("nbadb.extract.live.endpoints.PlayByPlay", _FakePlayByPlay),
         patch("nbadb.extract.live.endpoints.BoxScore", _FakeBoxScore),
     ):
-        warehouse.run(game_ids=["001"], snapshot_at=first_snapshot)
-        warehouse.run(game_ids=["001"], snapshot_at=second_snapshot)
+        for snapshot_minute, action_count in ((0, 1), (5, 3)):
+            with patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(action_count)):
+                warehouse.run(
+                    game_ids=["001"],
+                    snapshot_at=datetime(2026, 4, 17, 12, snapshot_minute, tzinfo=UTC),
+                )
 
     import duckdb
 
     conn = duckdb.connect(str(settings.duckdb_path))
     try:
-        assert conn.execute("SELECT COUNT(*) FROM fact_live_score_board").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM fact_live_play_by_play").fetchone()[0] == 3
     finally:
         conn.close()
-    assert (tmp_path / "data" / "parquet" / "fact_live_score_board").exists()
+    assert (tmp_path / "data" / "parquet" / "fact_live_play_by_play").exists()
+
+
+def test_live_snapshot_skips_finished_games_without_refetching(tmp_path) -> None:
+    warehouse = LiveSnapshotWarehouse(settings=_settings(tmp_path, ["duckdb"]))
+
+    with (
+        patch("nbadb.extract.live.endpoints.ScoreBoard", _FakeFinalScoreBoard),
+        patch("nbadb.extract.live.endpoints.Odds", _FakeOdds),
+        patch("nbadb.extract.live.endpoints.BoxScore", _FakeBoxScore),
+    ):
+        with patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(1)):
+            final = warehouse.run(
+                game_ids=["001"], snapshot_at=datetime(2026, 4, 17, 12, 0, tzinfo=UTC)
+            )
+        with patch("nbadb.extract.live.endpoints.PlayByPlay", _UnexpectedPlayByPlay):
+            again = warehouse.run(
+                game_ids=["001"], snapshot_at=datetime(2026, 4, 17, 12, 5, tzinfo=UTC)
+            )
+
+    assert final.game_ids == ["001"]
+    assert again.game_ids == []
+    assert again.skipped_game_ids == ["001"]
 
 
 def test_live_snapshot_warehouse_noops_when_no_active_games(tmp_path) -> None:
@@ -190,3 +280,17 @@ def test_live_snapshot_warehouse_noops_when_no_active_games(tmp_path) -> None:
     assert result.star_tables_loaded == 0
     assert result.staging_rows_persisted == 0
     assert result.star_rows_loaded == 0
+
+
+def test_live_snapshot_discovers_active_games_from_the_score_board(tmp_path) -> None:
+    warehouse = LiveSnapshotWarehouse(settings=_settings(tmp_path, ["duckdb"]))
+
+    with (
+        patch("nbadb.extract.live.endpoints.ScoreBoard", _FakeScoreBoard),
+        patch("nbadb.extract.live.endpoints.Odds", _FakeOdds),
+        patch("nbadb.extract.live.endpoints.BoxScore", _FakeBoxScore),
+        patch("nbadb.extract.live.endpoints.PlayByPlay", _play_by_play(1)),
+    ):
+        result = warehouse.run(snapshot_at=datetime(2026, 4, 17, 12, 0, tzinfo=UTC))
+
+    assert result.game_ids == ["001"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -53,6 +54,7 @@ def _mock_settings():
     s.endpoint_rate_limits = {}
     s.adaptive_rate_min = 1.0
     s.adaptive_rate_recovery = 50
+    s.transform_cache_enabled = False
     return s
 
 
@@ -1359,6 +1361,33 @@ class TestTransformAndLoad:
         mock_loader.load.assert_called_once()
         assert mock_pipeline.run.call_args.kwargs["validate_input_schemas"] is True
 
+    def test_cache_hits_are_only_written_to_file_formats(self):
+        orch, db, journal = _build_orchestrator_with_mocks()
+
+        mock_outputs = {
+            "dim_cached": pl.DataFrame({"b": [1]}),
+            "dim_fresh": pl.DataFrame({"b": [2]}),
+        }
+        mock_pipeline = MagicMock()
+        mock_pipeline.run.return_value = mock_outputs
+        mock_pipeline.last_result.cached = ["dim_cached"]
+        mock_loader = MagicMock()
+
+        with (
+            patch(_TRANSFORMERS, return_value=[]),
+            patch(_VALIDATE_TRANSFORMERS),
+            patch(_PIPELINE, return_value=mock_pipeline),
+            patch(_LOADER, return_value=mock_loader),
+            patch(_CURRENT_SEASON, return_value="2024-25"),
+        ):
+            tables, _rows, _failed = orch._transform_and_load(db, {}, journal)
+
+        assert tables == 2
+        persisted = {
+            call.args[0]: call.kwargs["persisted"] for call in mock_loader.load.call_args_list
+        }
+        assert persisted == {"dim_cached": True, "dim_fresh": False}
+
     def test_skips_empty_outputs(self):
         orch, db, journal = _build_orchestrator_with_mocks()
 
@@ -1519,6 +1548,44 @@ class TestExtractAllPatterns:
             }
         ]
 
+    def test_skips_frame_retention_when_chunks_are_persisted(self):
+        orch, _db, _journal = _build_orchestrator_with_mocks()
+        runner = MagicMock()
+        runner.run_pattern_result = AsyncMock(
+            return_value=PatternExtractionResult(
+                eligible_calls=1, success_count=1, frames={}, staging_keys=("stg_ep1",)
+            )
+        )
+
+        outcome = asyncio.run(
+            orch._extract_all_patterns(
+                runner,
+                plan=[
+                    ExtractionPlanItem(
+                        label="season",
+                        pattern="season",
+                        entries=[SimpleNamespace(endpoint_name="ep1", param_pattern="season")],
+                        params=[{"season": "2024-25"}],
+                        priority=1,
+                    )
+                ],
+                seasons=[],
+                game_ids=[],
+                player_ids=[],
+                team_ids=[],
+                current_team_ids=[],
+                game_dates=[],
+                player_team_season_params=[],
+                game_log_df=pl.DataFrame(),
+                run_mode="init",
+                persist_results=lambda _frames, **_metadata: None,
+                retain_in_memory=False,
+            )
+        )
+
+        assert runner.run_pattern_result.await_args.kwargs["retain_frames"] is False
+        assert outcome.raw == {}
+
     def test_forwards_source_results_to_chunk_persistence(self):
         orch, _db, _journal = _build_orchestrator_with_mocks()
         runner = MagicMock()
@@ -2584,6 +2651,35 @@ class TestRunBackfill:
         mock_discovery.discover_all_player_ids.assert_awaited_once_with(season="1946-47")
         mock_runner.run_pattern_result.assert_not_called()
 
+    def test_traced_transform_only_backfill_writes_trace_and_span_rollup(self, tmp_path):
+        orch, db, _journal = _build_orchestrator_with_mocks()
+        orch._settings.trace_enabled = True
+        orch._settings.trace_dir = tmp_path
+
+        mock_pipeline = MagicMock()
+        mock_pipeline.run.return_value = {"dim_test": pl.DataFrame({"b": [1, 2]})}
+
+        with (
+            patch("nbadb.orchestrate.orchestrator.StagingBatchStore"),
+            patch.object(orch, "_load_staging_from_duckdb", return_value={}),
+            patch(_TRANSFORMERS, return_value=[]),
+            patch(_VALIDATE_TRANSFORMERS),
+            patch(_PIPELINE, return_value=mock_pipeline) as mock_pipeline_cls,
+            patch(_LOADER),
+            patch(_CURRENT_SEASON, return_value="2024-25"),
+        ):
+            asyncio.run(orch.run_backfill(transform_only=True))
+
+        (trace_file,) = tmp_path.glob("backfill-*.trace.json")
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        phases = {event["cat"] for event in events if event["ph"] == "X"}
+        assert {"run", "materialize", "transform", "load", "quality"} <= phases
+        spans_insert = db.duckdb.executemany.call_args
+        assert "_pipeline_spans" in spans_insert.args[0]
+        assert {row[2] for row in spans_insert.args[1]} == phases
+        assert mock_pipeline_cls.call_args.kwargs["tracer"].enabled
+        assert not orch._tracer.enabled
+
 
 # ---------------------------------------------------------------------------
 # run_daily tests
@@ -2719,6 +2815,44 @@ class TestRunDaily:
         mock_discovery.discover_player_ids.assert_not_awaited()
         mock_discovery.discover_player_team_season_params_result.assert_not_awaited()
 
+    def test_run_daily_cancels_sibling_lookups_when_one_fails(self):
+        orch, _db, _journal = _build_orchestrator_with_mocks()
+        mock_discovery = AsyncMock()
+        mock_discovery.discover_game_ids_result.return_value = _game_discovery_result(
+            game_ids=["0022400001"],
+            seasons=("2025-26",),
+            season_types=_ALL_SEASON_TYPES,
+        )
+        mock_discovery.discover_team_ids.side_effect = ExtractionError("team index down")
+        cancelled: list[str] = []
+
+        async def _slow_current_teams(*_args, **_kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append("current_teams")
+                raise
+
+        async def _run_daily() -> list[str]:
+            with pytest.raises(ExtractionError, match="team index down"):
+                await orch.run_daily()
+            # Snapshot before asyncio.run() reaps leftover tasks on shutdown.
+            return list(cancelled)
+
+        mock_extract = AsyncMock()
+
+        with (
+            patch(_CURRENT_SEASON, return_value="2025-26"),
+            patch(_DISCOVERY, return_value=mock_discovery),
+            patch(_REGISTRY),
+            patch.object(orch, "_build_runner", return_value=_mock_runner()),
+            patch.object(orch, "_discover_current_team_ids", _slow_current_teams),
+            patch.object(orch, "_extract_all_patterns", mock_extract),
+        ):
+            assert asyncio.run(_run_daily()) == ["current_teams"]
+
+        mock_extract.assert_not_awaited()
+
     def test_run_daily_disables_static_in_shared_helper(self):
         orch, db, journal = _build_orchestrator_with_mocks()
 
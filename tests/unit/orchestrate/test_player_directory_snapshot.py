@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import polars as pl
+import pytest
+
 from nbadb.orchestrate.player_directory_snapshot import (
     SNAPSHOT_COMPLETE_THROUGH_SEASON,
+    SNAPSHOT_PATH,
+    build_player_year_windows,
     player_ids_by_season_from_snapshot,
+    player_year_windows,
+    write_player_year_windows,
 )
 
 
@@ -26,3 +33,53 @@ def test_player_directory_snapshot_stops_at_declared_complete_season() -> None:
 
     assert SNAPSHOT_COMPLETE_THROUGH_SEASON in ids_by_season
     assert "2026-27" not in ids_by_season
+
+
+def test_player_directory_snapshot_matches_brute_force_window_scan() -> None:
+    seasons = [f"{year}-{(year + 1) % 100:02d}" for year in range(1946, 2026)]
+    windows = list(player_year_windows().iter_rows())
+
+    ids_by_season = player_ids_by_season_from_snapshot(seasons)
+
+    assert list(ids_by_season) == seasons
+    for season, ids in ids_by_season.items():
+        start_year = int(season[:4])
+        assert ids == sorted(
+            person_id
+            for person_id, from_year, to_year in windows
+            if from_year <= start_year <= to_year
+        )
+
+
+def test_build_player_year_windows_reproduces_the_shipped_snapshot() -> None:
+    shipped = player_year_windows()
+    directory = shipped.select(
+        pl.col("person_id"),
+        pl.lit("Player").alias("display_first_last"),
+        pl.col("from_year").cast(pl.String),
+        pl.col("to_year").cast(pl.String),
+    ).reverse()
+
+    assert build_player_year_windows(directory).equals(shipped)
+
+
+def test_write_player_year_windows_drops_unusable_rows_and_refuses_empty_output(
+    tmp_path,
+) -> None:
+    directory = pl.DataFrame(
+        {
+            "person_id": [3, 2, 2, 0, 4, None],
+            "from_year": ["1990", "1985", "1985", "1990", "x", "1990"],
+            "to_year": ["1999", "1988", "1988", "1991", "1999", "1991"],
+        }
+    )
+    path = tmp_path / "windows.parquet"
+
+    written = write_player_year_windows(directory, path)
+
+    assert written.rows() == [(2, 1985, 1988), (3, 1990, 1999)]
+    assert pl.read_parquet(path).equals(written)
+    with pytest.raises(ValueError, match="no usable year windows"):
+        write_player_year_windows(directory.head(0), tmp_path / "empty.parquet")
+    assert not (tmp_path / "empty.parquet").exists()
+    assert SNAPSHOT_PATH.exists()
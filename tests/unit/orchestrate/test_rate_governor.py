@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from nbadb.orchestrate.rate_governor import RateGovernor
+
+
+async def _grant_order(governor: RateGovernor, requests: list[tuple[str, str]]) -> list[str]:
+    order: list[str] = []
+
+    async def _one(label: str, family: str) -> None:
+        await governor.acquire(label, family)
+        order.append(label)
+
+    await asyncio.gather(*(_one(label, family) for label, family in requests))
+    return order
+
+
+@pytest.mark.asyncio
+async def test_global_bucket_spaces_requests_without_bursts() -> None:
+    governor = RateGovernor(50.0)
+
+    started = time.monotonic()
+    for _ in range(5):
+        await governor.acquire("ep", "default")
+
+    # First token is free; the next four are spaced 20ms apart.
+    assert time.monotonic() - started >= 0.075
+
+
+@pytest.mark.asyncio
+async def test_endpoint_bucket_limits_below_global_rate() -> None:
+    governor = RateGovernor(1_000.0, endpoint_rates={"slow": 20.0})
+
+    started = time.monotonic()
+    for _ in range(3):
+        await governor.acquire("slow", "default")
+
+    assert time.monotonic() - started >= 0.095
+    assert governor.scope("slow", "default") == "endpoint"
+    assert governor.rate_for("slow", "default") == 20.0
+
+
+@pytest.mark.asyncio
+async def test_late_family_is_not_starved_by_queued_family() -> None:
+    governor = RateGovernor(100.0)
+    requests = [(f"a{i}", "a") for i in range(10)] + [("b0", "b"), ("b1", "b")]
+
+    order = await _grant_order(governor, requests)
+
+    assert order.index("b0") < 4
+    assert order.index("b1") < 6
+
+
+@pytest.mark.asyncio
+async def test_family_weights_split_the_global_rate() -> None:
+    governor = RateGovernor(200.0, family_weights={"a": 3.0})
+    requests = [(f"a{i}", "a") for i in range(12)] + [(f"b{i}", "b") for i in range(12)]
+
+    order = await _grant_order(governor, requests)
+
+    first = order[:12]
+    assert sum(label.startswith("a") for label in first) >= 8
+
+
+@pytest.mark.asyncio
+async def test_blocked_family_does_not_hold_up_other_families() -> None:
+    governor = RateGovernor(100.0, family_rates={"slow": 2.0})
+    await governor.acquire("s0", "slow")
+
+    started = time.monotonic()
+    slow = asyncio.create_task(governor.acquire("s1", "slow"))
+    await asyncio.sleep(0)
+    for i in range(3):
+        await governor.acquire(f"f{i}", "fast")
+
+    assert time.monotonic() - started < 0.3
+    assert not slow.done()
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+
+
+def test_failures_adjust_the_governing_bucket_in_place() -> None:
+    governor = RateGovernor(10.0, family_rates={"history": 4.0}, min_rate=1.0)
+
+    assert governor.record_failure("ep", "history") == pytest.approx(2.8)
+    assert governor.rate_for("ep", "history") == pytest.approx(2.8)
+    assert governor.current_rate == 10.0
+
+    assert governor.record_failure("other", "default") == pytest.approx(7.0)
+    assert governor.current_rate == pytest.approx(7.0)
+    assert governor.base_rate == 10.0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reports_rates_queue_depth_and_waits() -> None:
+    governor = RateGovernor(20.0, endpoint_rates={"ep": 20.0})
+    await governor.acquire("ep", "box_score")
+    waiting = asyncio.create_task(governor.acquire("ep", "box_score"))
+    await asyncio.sleep(0)
+
+    queued = {(s.scope, s.name): s for s in governor.snapshot()}
+    assert queued[("global", "global")].waiting == 1
+    assert queued[("family", "box_score")].waiting == 1
+
+    await waiting
+    stats = {(s.scope, s.name): s for s in governor.snapshot()}
+    assert stats[("global", "global")].granted == 2
+    assert stats[("endpoint", "ep")].rate == 20.0
+    assert stats[("family", "box_score")].waiting == 0
+    assert stats[("family", "box_score")].max_wait_seconds > 0
+    assert governor.wait_seconds({"ep"}) == pytest.approx(
+        stats[("family", "box_score")].wait_seconds
+    )
+
+
+@pytest.mark.asyncio
+async def test_grant_wakes_only_the_next_waiter() -> None:
+    governor = RateGovernor(50.0)
+    await governor.acquire("ep", "default")
+    tasks = [asyncio.create_task(governor.acquire(f"ep{i}", "default")) for i in range(4)]
+    await asyncio.sleep(0)
+
+    governor._wake_next()
+
+    assert [waiter.wake.is_set() for waiter in governor._waiters] == [True, False, False, False]
+    await asyncio.gather(*tasks)
+    assert not governor._waiters
+
+
+@pytest.mark.asyncio
+async def test_adaptive_slot_reports_outcomes_to_the_governor() -> None:
+    governor = RateGovernor(1_000.0, family_rates={"discovery": 10.0}, min_rate=1.0)
+
+    with pytest.raises(RuntimeError):
+        async with governor.slot("ep", "discovery", adaptive=True):
+            raise RuntimeError("boom")
+    assert governor.rate_for("ep", "discovery") == pytest.approx(7.0)
+
+    async with governor.slot("ep", "discovery"):
+        pass
+    with pytest.raises(RuntimeError):
+        async with governor.slot("ep", "discovery"):
+            raise RuntimeError("boom")
+    assert governor.rate_for("ep", "discovery") == pytest.approx(7.0)
@@ -61,6 +61,32 @@ def test_replaying_same_chunk_does_not_duplicate_rows() -> None:
     assert rows == [("001", 1)]
 
 
+def test_materialize_clusters_play_by_play_by_game_and_action() -> None:
+    conn = duckdb.connect(":memory:")
+    try:
+        store = StagingBatchStore(conn)
+        store.persist_frames(
+            {
+                "stg_play_by_play": pl.DataFrame(
+                    {"game_id": ["002", "001"], "action_number": [1, 9]}
+                )
+            },
+            metadata=_metadata(chunk_index=0),
+            materialize=False,
+        )
+        store.persist_frames(
+            {"stg_play_by_play": pl.DataFrame({"game_id": ["001"], "action_number": [3]})},
+            metadata=_metadata(chunk_index=1),
+            materialize=False,
+        )
+        store.materialize(["stg_play_by_play"])
+        rows = conn.execute("SELECT game_id, action_number FROM stg_play_by_play").fetchall()
+    finally:
+        conn.close()
+
+    assert rows == [("001", 3), ("001", 9), ("002", 1)]
+
+
 def test_same_source_replayed_in_different_chunk_group_does_not_duplicate_rows() -> None:
     conn = duckdb.connect(":memory:")
     try:
@@ -5,13 +5,21 @@ from pathlib import Path
 
 import pytest
 
+from nbadb.orchestrate.staging_capability_scan import (
+    MANIFEST_PATH,
+    render_manifest,
+    scan_season_type_param_keys,
+)
 from nbadb.orchestrate.staging_map import (
     STAGING_MAP,
     StagingEntry,
+    StagingRegistry,
     get_all_staging_keys,
+    get_by_endpoint,
     get_by_pattern,
     get_by_staging_key,
     get_multi_entries,
+    staging_registry,
 )
 
 _AUDITED_MISSING_ENDPOINTS = {
@@ -568,3 +576,56 @@ class TestStagingMap:
     def test_audited_missing_endpoints_are_now_represented(self) -> None:
         staging_names = {e.endpoint_name for e in STAGING_MAP}
         assert sorted(_AUDITED_MISSING_ENDPOINTS - staging_names) == []
+
+
+class TestStagingRegistry:
+    def test_capability_manifest_matches_extractor_sources(self) -> None:
+        rendered = render_manifest(scan_season_type_param_keys())
+        assert MANIFEST_PATH.read_text(encoding="utf-8") == rendered, (
+            "run `python -m nbadb.orchestrate.staging_capability_scan` to regenerate"
+        )
+
+    def test_indexed_lookups_match_linear_scans(self) -> None:
+        for entry in STAGING_MAP:
+            assert get_by_staging_key(entry.staging_key) is entry
+            assert get_by_endpoint(entry.endpoint_name) == [
+                e for e in STAGING_MAP if e.endpoint_name == entry.endpoint_name
+            ]
+        for pattern in {e.param_pattern for e in STAGING_MAP}:
+            assert get_by_pattern(pattern) == [e for e in STAGING_MAP if e.param_pattern == pattern]
+        linear_multi: dict[str, list[StagingEntry]] = {}
+        for e in STAGING_MAP:
+            if e.use_multi:
+                linear_multi.setdefault(e.endpoint_name, []).append(e)
+        assert get_multi_entries() == linear_multi
+
+    def test_select_filters_in_map_order(self) -> None:
+        registry = staging_registry()
+        endpoints = ["box_score_summary", "league_game_log", "player_career_stats"]
+        selected = registry.select(endpoints=endpoints, patterns=["game", "season"])
+
+        assert selected == [
+            e
+            for e in STAGING_MAP
+            if e.endpoint_name in endpoints and e.param_pattern in {"game", "season"}
+        ]
+        assert registry.select(patterns=["static"]) == get_by_pattern("static")
+        assert registry.select(endpoints=[], patterns=None) == list(STAGING_MAP)
+
+    def test_registry_is_built_once_and_rebuilt_when_map_is_replaced(self, monkeypatch) -> None:
+        import nbadb.orchestrate.staging_map as staging_map_module
+
+        assert staging_registry() is staging_registry()
+
+        replacement = [StagingEntry("ep", "stg_ep", "static")]
+        monkeypatch.setattr(staging_map_module, "STAGING_MAP", replacement)
+        assert get_by_staging_key("stg_ep") is replacement[0]
+        assert get_by_pattern("season") == []
+
+    def test_lookup_results_are_copies(self) -> None:
+        get_by_pattern("season").clear()
+        get_multi_entries().clear()
+
+        assert get_by_pattern("season")
+        assert get_multi_entries()
+        assert isinstance(staging_registry(), StagingRegistry)
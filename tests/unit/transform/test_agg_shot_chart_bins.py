@@ -0,0 +1,136 @@
+"""Tests for the shot-chart grid rollups and the zone aggregate built on them."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+
+from nbadb.transform.derived.agg_shot_chart_bins import AggShotChartBinsTransformer
+from nbadb.transform.derived.agg_shot_zones import AggShotZonesTransformer
+
+_DIM_GAME = pl.DataFrame(
+    {
+        "game_id": ["g1", "g2", "g3"],
+        "season_year": ["2023-24", "2023-24", "2024-25"],
+        "season_type": ["Regular Season", "Playoffs", "Regular Season"],
+    }
+)
+
+
+def _shots(*rows: tuple[str, int, int, int, int | None, str]) -> pl.DataFrame:
+    game_id, player_id, loc_x, loc_y, shot_bin_id, zone = zip(*rows, strict=True)
+    seasons = dict(zip(_DIM_GAME["game_id"], _DIM_GAME["season_year"], strict=True))
+    return pl.DataFrame(
+        {
+            "game_id": game_id,
+            "season_year": [seasons[game] for game in game_id],
+            "player_id": player_id,
+            "team_id": [10] * len(rows),
+            "shot_zone_basic": zone,
+            "shot_zone_area": ["Center(C)"] * len(rows),
+            "shot_zone_range": ["Less Than 8 ft."] * len(rows),
+            "shot_distance": [loc_y // 10 for loc_y in loc_y],
+            "loc_x": loc_x,
+            "loc_y": loc_y,
+            "shot_bin_id": shot_bin_id,
+            "shot_made_flag": [1, 0, 1, 1][: len(rows)],
+        },
+        schema_overrides={"shot_bin_id": pl.Int64},
+    )
+
+
+_SHOTS = _shots(
+    ("g1", 1, 10, 10, 326, "Restricted Area"),
+    ("g1", 1, 20, 20, 377, "Restricted Area"),
+    ("g2", 1, 0, 0, 275, "Restricted Area"),
+    ("g3", 1, 0, 0, 275, "Restricted Area"),
+)
+
+
+def _run(conn: duckdb.DuckDBPyConnection, shots: pl.DataFrame) -> pl.DataFrame:
+    conn.register("fact_shot_chart", shots)
+    conn.register("dim_game", _DIM_GAME)
+    transformer = AggShotChartBinsTransformer()
+    transformer._conn = conn
+    return transformer.transform({})
+
+
+def test_rolls_up_every_resolution_from_base_cells() -> None:
+    with duckdb.connect() as conn:
+        result = _run(conn, _SHOTS)
+
+    regular = result.filter(
+        (pl.col("season_year") == "2023-24") & (pl.col("season_type") == "Regular Season")
+    )
+    cells = {
+        row["resolution_ft"]: (row["bin_x"], row["bin_y"], row["attempts"], row["makes"])
+        for row in regular.iter_rows(named=True)
+    }
+    assert sorted(regular["resolution_ft"].unique().to_list()) == [1, 2, 5]
+    assert regular.filter(pl.col("resolution_ft") == 1).height == 2
+    assert cells[2] == (13, 3, 2, 1)
+    assert cells[5] == (5, 1, 2, 1)
+
+
+def test_zone_aggregate_matches_shot_level_aggregate() -> None:
+    with duckdb.connect() as conn:
+        conn.register("agg_shot_chart_bins", _run(conn, _SHOTS))
+        transformer = AggShotZonesTransformer()
+        transformer._conn = conn
+        zones = transformer.transform({}).sort("season_year")
+
+    assert zones["attempts"].to_list() == [3, 1]
+    assert zones["makes"].to_list() == [2, 1]
+    assert zones["avg_distance"].to_list() == [1.0, 0.0]
+
+
+def test_rebuild_only_rebins_seasons_whose_shots_changed() -> None:
+    with duckdb.connect() as conn:
+        _run(conn, _SHOTS)
+        # Mark the stored 2024-25 rollup so a recomputation would be visible.
+        conn.execute(
+            "UPDATE memory.main.agg_shot_chart_bins SET attempts = 99 WHERE season_year = '2024-25'"
+        )
+        changed = pl.concat([_SHOTS, _SHOTS.filter(pl.col("game_id") == "g2")])
+        result = _run(conn, changed)
+
+    base = result.filter(pl.col("resolution_ft") == 1)
+    by_season = dict(base.group_by("season_year").agg(pl.col("attempts").sum()).iter_rows())
+    assert by_season == {"2023-24": 4, "2024-25": 99}
+
+
+def test_rollup_is_kept_once_in_the_loaded_table() -> None:
+    with duckdb.connect() as conn:
+        result = _run(conn, _SHOTS)
+        stored = conn.execute("SELECT * FROM memory.main.agg_shot_chart_bins").pl()
+        tables = conn.execute(
+            "SELECT schema_name, table_name FROM duckdb_tables() ORDER BY ALL"
+        ).fetchall()
+        fingerprints = conn.execute(
+            "SELECT season_year FROM transform_cache.agg_shot_chart_bins__season_fingerprints "
+            "ORDER BY season_year"
+        ).fetchall()
+
+    assert stored.sort(stored.columns).equals(result.sort(result.columns))
+    assert tables == [
+        ("main", "agg_shot_chart_bins"),
+        ("transform_cache", "agg_shot_chart_bins__season_fingerprints"),
+    ]
+    assert fingerprints == [("2023-24",), ("2024-25",)]
+
+
+def test_lost_table_is_rebinned_in_full() -> None:
+    with duckdb.connect() as conn:
+        _run(conn, _SHOTS)
+        conn.execute("DROP TABLE memory.main.agg_shot_chart_bins")
+        result = _run(conn, _SHOTS)
+
+    assert sorted(result["season_year"].unique().to_list()) == ["2023-24", "2024-25"]
+
+
+def test_dropped_season_leaves_table() -> None:
+    with duckdb.connect() as conn:
+        _run(conn, _SHOTS)
+        result = _run(conn, _SHOTS.filter(pl.col("game_id") != "g3"))
+
+    assert result["season_year"].unique().to_list() == ["2023-24"]
@@ -4,6 +4,7 @@ import duckdb
 import polars as pl
 import pytest
 
+from nbadb.schemas.star.analytics_views import AnalyticsPlayerMatchupSchema
 from nbadb.transform.views.analytics_clutch_performance import (
     AnalyticsClutchPerformanceTransformer,
 )
@@ -651,6 +652,38 @@ class TestAnalyticsPlayerMatchup:
         assert result["player_name"][0] == "Russell Westbrook"
         assert result["vs_player_name"][0] is None
 
+    def test_player_compare_rows_without_a_pair_are_dropped(self) -> None:
+        """PlayerCompare summary rows carry no player pair, which the schema requires."""
+        fact = pl.DataFrame(
+            {
+                "player_id": [201566, None],
+                "team_id": [1610612738, None],
+                "vs_player_id": [203507, None],
+                "season_year": ["2024-25", "2024-25"],
+                "matchup_type": ["head_to_head", "compare"],
+                "matchup_min": [12.5, 34.0],
+                "player_pts": [8.0, 21.0],
+                **{
+                    column: [1.0, 2.0]
+                    for column in ("team_pts", "ast", "tov", "stl", "blk", "fgm", "fga")
+                },
+                **{column: [0.5, 0.4] for column in ("fg_pct", "fg3m", "fg3a", "fg3_pct")},
+            },
+            schema_overrides={"player_id": pl.Int64, "team_id": pl.Int64},
+        ).lazy()
+        staging = {
+            "fact_player_matchups": fact,
+            "dim_player": pl.DataFrame(
+                {"player_id": [201566], "full_name": ["Russell Westbrook"], "is_current": [True]}
+            ).lazy(),
+            "dim_team": pl.DataFrame({"team_id": [1610612738], "abbreviation": ["BOS"]}).lazy(),
+        }
+
+        result = _run(AnalyticsPlayerMatchupTransformer(), staging)
+
+        assert result.select("player_id", "vs_player_id").rows() == [(201566, 203507)]
+        AnalyticsPlayerMatchupSchema.validate(result)
+
 
 # ---------------------------------------------------------------------------
 # Cross-cutting: all analytics views share SqlTransformer mechanics
@@ -98,3 +98,34 @@ class TestSqlTransformer:
         t = _TestSqlTransformer()
         with pytest.raises(RuntimeError, match="No DuckDB connection injected"):
             t.transform({})
+
+
+class TestPassthrough:
+    def test_union_frame_matches_sql_union_by_name(self) -> None:
+        import duckdb
+
+        from nbadb.transform.base import make_union
+
+        union_cls = make_union("fact_u", "kind", {"a": "stg_a", "b": "stg_b"})
+        frames = {
+            "stg_a": pl.DataFrame({"x": [1, 2], "y": ["p", "q"]}),
+            "stg_b": pl.DataFrame({"y": ["r"], "x": [3.5], "z": [True]}),
+        }
+        conn = duckdb.connect()
+        for name, frame in frames.items():
+            conn.register(name, frame)
+        expected = conn.execute(union_cls._SQL).pl()
+        conn.close()
+
+        assert union_cls._PASSTHROUGH is not None
+        assert union_cls._PASSTHROUGH.frame(frames).equals(expected)
+
+    def test_passthrough_frame_reuses_source(self) -> None:
+        from nbadb.transform.base import make_passthrough
+
+        source = pl.DataFrame({"x": [1]})
+        passthrough_cls = make_passthrough("fact_p", "stg_p")
+
+        assert passthrough_cls._SQL == "SELECT * FROM stg_p"
+        assert passthrough_cls._PASSTHROUGH is not None
+        assert passthrough_cls._PASSTHROUGH.frame({"stg_p": source}) is source
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import duckdb
+import pandera.polars as pa
+import polars as pl
+import pytest
+
+from nbadb.core.errors import ValidationError
+from nbadb.schemas.base import BaseSchema
+from nbadb.transform.chunked_validation import (
+    split_schema,
+    validate_frame_in_chunks,
+    validate_table_in_chunks,
+)
+
+
+class _ShotSchema(BaseSchema):
+    game_id: str = pa.Field(unique=True, metadata={"fk_ref": "dim_game.game_id"})
+    period: int = pa.Field(gt=0)
+    shot_distance: int | None = pa.Field(nullable=True, ge=0, le=94)
+    shot_made_flag: int = pa.Field(isin=[0, 1])
+    loc_x: float | None = pa.Field(nullable=True)
+
+
+def _shots(rows: int = 7) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "game_id": [f"{index:03d}" for index in range(rows)],
+            "period": [1 + index % 4 for index in range(rows)],
+            "shot_distance": [None if index % 3 == 0 else index for index in range(rows)],
+            "shot_made_flag": [index % 2 for index in range(rows)],
+            "loc_x": [float(index) for index in range(rows)],
+        }
+    )
+
+
+def test_split_schema_pushes_sql_checks_down_and_relaxes_the_residual() -> None:
+    residual, pushdowns = split_schema(_ShotSchema.to_schema())
+
+    assert {(pushdown.column, pushdown.check) for pushdown in pushdowns} == {
+        ("game_id", "not_nullable"),
+        ("game_id", "field_uniqueness"),
+        ("period", "greater_than"),
+        ("period", "not_nullable"),
+        ("shot_distance", "greater_than_or_equal_to"),
+        ("shot_distance", "less_than_or_equal_to"),
+        ("shot_made_flag", "isin"),
+        ("shot_made_flag", "not_nullable"),
+    }
+    assert all(not column.checks for column in residual.columns.values())
+    assert all(column.nullable and not column.unique for column in residual.columns.values())
+    assert _ShotSchema.to_schema().columns["period"].checks
+
+
+def test_valid_frame_matches_whole_frame_validation() -> None:
+    df = _shots().with_columns(pl.col("period").cast(pl.Int32), pl.lit("x").alias("extra"))
+
+    validated = validate_frame_in_chunks(
+        _ShotSchema, df, duckdb.connect(), table="fact_shot", chunk_rows=3
+    )
+
+    assert validated.equals(_ShotSchema.validate(df))
+
+
+def test_failures_are_merged_across_chunks_and_pushed_down_checks() -> None:
+    df = _shots().with_columns(
+        pl.when(pl.col("period") == 2).then(0).otherwise(pl.col("period")).alias("period"),
+        pl.when(pl.col("game_id") == "006")
+        .then(pl.lit("000"))
+        .otherwise(pl.col("game_id"))
+        .alias("game_id"),
+    )
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate_frame_in_chunks(_ShotSchema, df, duckdb.connect(), table="fact_shot", chunk_rows=2)
+
+    message = str(excinfo.value)
+    assert "period: greater_than failed for 2 row(s)" in message
+    assert "game_id: field_uniqueness failed for 1 row(s)" in message
+
+
+def test_dtype_failures_are_reported_per_chunk_before_sql_runs() -> None:
+    df = _shots().with_columns(
+        pl.Series("period", ["1", "2", "3", "x", "1", "y", "2"], dtype=pl.String)
+    )
+
+    with pytest.raises(
+        ValidationError, match=r"<frame>: coerce_dtype failed for 2 row\(s\), e\.g\. \['x', 'y'\]"
+    ):
+        validate_frame_in_chunks(_ShotSchema, df, duckdb.connect(), table="fact_shot", chunk_rows=3)
+
+
+def test_table_is_streamed_in_record_batches() -> None:
+    conn = duckdb.connect()
+    shots = _shots().with_columns(
+        pl.when(pl.col("shot_distance") == 4)
+        .then(120)
+        .otherwise(pl.col("shot_distance"))
+        .alias("shot_distance"),
+        pl.when(pl.col("loc_x") == 5.0)
+        .then(float("nan"))
+        .otherwise(pl.col("loc_x"))
+        .alias("loc_x"),
+    )
+    conn.register("shots", shots)
+    conn.execute("CREATE TABLE fact_shot AS SELECT * FROM shots")
+    conn.execute("CREATE TABLE dim_game AS SELECT game_id FROM shots WHERE game_id <> '003'")
+
+    report = validate_table_in_chunks(
+        _ShotSchema, conn, "fact_shot", chunk_rows=2, foreign_keys=True
+    )
+
+    assert (report.rows, report.chunks) == (7, 4)
+    assert {
+        (failure.column, failure.check): failure.samples for failure in report.failures.values()
+    } == {
+        ("shot_distance", "less_than_or_equal_to"): ["120"],
+        ("game_id", "foreign_key(dim_game.game_id)"): ["003"],
+    }
+
+
+def test_orphans_are_counted_when_the_dimension_column_holds_nulls() -> None:
+    conn = duckdb.connect()
+    conn.register("shots", _shots(3))
+    conn.execute("CREATE TABLE fact_shot AS SELECT * FROM shots")
+    conn.execute(
+        "CREATE TABLE dim_game AS SELECT * FROM (VALUES ('000'), ('001'), (NULL)) t(game_id)"
+    )
+
+    report = validate_table_in_chunks(_ShotSchema, conn, "fact_shot", foreign_keys=True)
+
+    failure = report.failures[("game_id", "foreign_key(dim_game.game_id)")]
+    assert (failure.failures, failure.samples) == (1, ["002"])
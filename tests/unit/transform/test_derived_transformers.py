@@ -63,10 +63,10 @@ def test_agg_team_pace_has_dim_game_dependency():
     assert "dim_game" in AggTeamPaceAndEfficiencyTransformer.depends_on
 
 
-def test_agg_shot_zones_has_dim_game_dependency():
+def test_agg_shot_zones_rolls_up_shot_chart_bins():
     from nbadb.transform.derived.agg_shot_zones import AggShotZonesTransformer
 
-    assert "dim_game" in AggShotZonesTransformer.depends_on
+    assert AggShotZonesTransformer.depends_on == ["agg_shot_chart_bins"]
 
 
 def test_agg_player_season_per48_output_table():
@@ -66,7 +66,15 @@ class TestFactWinProbPbp:
     def test_preserves_all_columns(self) -> None:
         staging = {"stg_win_prob_pbp": _frame(SAMPLE_ROW)}
         result = _run(FactWinProbPbpTransformer(), staging)
-        assert set(SAMPLE_ROW.keys()) == set(result.columns)
+        assert set(SAMPLE_ROW.keys()) | {"clock_deciseconds"} == set(result.columns)
+
+    def test_clock_parsed_to_deciseconds(self) -> None:
+        clocks = ["12:00", "0:05.3", "PT11M42.00S", "--"]
+        df = pl.concat([pl.DataFrame(SAMPLE_ROW)] * len(clocks)).with_columns(
+            pctimestring=pl.Series(clocks)
+        )
+        result = _run(FactWinProbPbpTransformer(), {"stg_win_prob_pbp": df.lazy()})
+        assert result["clock_deciseconds"].to_list() == [7200, 53, 7020, None]
 
     def test_multiple_rows(self) -> None:
         df = pl.DataFrame(
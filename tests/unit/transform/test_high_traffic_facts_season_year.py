@@ -1,6 +1,6 @@
 """Tests verifying season_year enrichment via dim_game for high-traffic fact tables.
 
-All six transformers should:
+Every transformer listed here should:
  1. Declare dim_game in depends_on.
  2. Include season_year in the output.
  3. Correctly LEFT JOIN so rows without a dim_game match get NULL season_year.
@@ -12,6 +12,9 @@ import duckdb
 import polars as pl
 import pytest
 
+from nbadb.transform.facts.fact_game_scoring import FactGameScoringTransformer
+from nbadb.transform.facts.fact_matchup import FactMatchupTransformer
+from nbadb.transform.facts.fact_play_by_play import FactPlayByPlayTransformer
 from nbadb.transform.facts.fact_player_game_advanced import (
     FactPlayerGameAdvancedTransformer,
 )
@@ -26,6 +29,7 @@ from nbadb.transform.facts.fact_player_game_tracking import (
 )
 from nbadb.transform.facts.fact_shot_chart import FactShotChartTransformer
 from nbadb.transform.facts.fact_team_game import FactTeamGameTransformer
+from nbadb.transform.facts.fact_win_probability import FactWinProbabilityTransformer
 
 # ---------------------------------------------------------------------------
 # Shared dim_game fixture
@@ -68,6 +72,10 @@ ALL_TRANSFORMERS = [
     FactPlayerGameMiscTransformer,
     FactPlayerGameTrackingTransformer,
     FactShotChartTransformer,
+    FactGameScoringTransformer,
+    FactMatchupTransformer,
+    FactPlayByPlayTransformer,
+    FactWinProbabilityTransformer,
 ]
 
 
@@ -434,3 +442,114 @@ class TestFactShotChartSeasonYear:
         tables["dim_game"] = _DIM_GAME.filter(pl.col("game_id") == -1)
         result = _run_sql(FactShotChartTransformer(), tables)
         assert result["season_year"].null_count() == 1
+
+
+# ---------------------------------------------------------------------------
+# Game-grain facts whose schemas require season_year
+# ---------------------------------------------------------------------------
+
+
+def _line_score() -> pl.DataFrame:
+    row: dict[str, list[object]] = {
+        "game_id": [1001],
+        "team_id_home": [10],
+        "team_id_away": [20],
+    }
+    for side in ("home", "away"):
+        for period in ("qtr1", "qtr2", "qtr3", "qtr4"):
+            row[f"pts_{period}_{side}"] = [25]
+        row[f"pts_ot1_{side}"] = [None]
+        row[f"pts_ot2_{side}"] = [None]
+    overtime = {name: pl.Int64 for name in row if name.startswith("pts_ot")}
+    return pl.DataFrame(row, schema_overrides=overtime)
+
+
+def _play_by_play() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "game_id": [1001],
+            "event_num": [2],
+            "event_msg_type": [1],
+            "event_msg_action_type": [1],
+            "period": [1],
+            "wc_time_string": ["7:10 PM"],
+            "pc_time_string": ["11:42"],
+            "home_description": ["Jump Shot"],
+            "neutral_description": [None],
+            "visitor_description": [None],
+            "score": ["2 - 0"],
+            "score_margin": ["2"],
+            "player1_id": [100],
+            "player1_team_id": [10],
+            "player2_id": [None],
+            "player2_team_id": [None],
+            "player3_id": [None],
+            "player3_team_id": [None],
+        },
+        schema_overrides={"neutral_description": pl.String, "visitor_description": pl.String},
+    )
+
+
+_GAME_GRAIN_CASES = {
+    "fact_game_scoring": (FactGameScoringTransformer, {"stg_line_score": _line_score()}),
+    "fact_matchup": (
+        FactMatchupTransformer,
+        {
+            "stg_matchup": pl.DataFrame(
+                {
+                    "game_id": [1001],
+                    "off_player_id": [100],
+                    "def_player_id": [200],
+                    "off_team_id": [10],
+                    "def_team_id": [20],
+                    "matchup_min": [4.0],
+                    "partial_poss": [12.0],
+                    "player_pts": [6],
+                    "def_fgm": [3],
+                    "def_fga": [5],
+                    "def_fg_pct": [0.6],
+                }
+            )
+        },
+    ),
+    "fact_play_by_play": (FactPlayByPlayTransformer, {"stg_play_by_play": _play_by_play()}),
+    "fact_win_probability": (
+        FactWinProbabilityTransformer,
+        {
+            "stg_win_probability": pl.DataFrame(
+                {
+                    "game_id": [1001],
+                    "event_num": [2],
+                    "period": [1],
+                    "pc_time_string": ["11:42"],
+                    "home_pct": [0.55],
+                    "visitor_pct": [0.45],
+                    "home_pts": [2],
+                    "visitor_pts": [0],
+                    "home_score_margin": [2],
+                }
+            )
+        },
+    ),
+}
+
+
+@pytest.mark.parametrize("table", sorted(_GAME_GRAIN_CASES))
+def test_game_grain_fact_takes_season_year_from_dim_game(table):
+    cls, staging = _GAME_GRAIN_CASES[table]
+
+    result = _run_sql(cls(), {**staging, "dim_game": _DIM_GAME})
+
+    assert result.height > 0
+    assert result["season_year"].to_list() == [2024] * result.height
+
+
+@pytest.mark.parametrize("table", sorted(_GAME_GRAIN_CASES))
+def test_game_grain_fact_keeps_rows_without_dim_game(table):
+    cls, staging = _GAME_GRAIN_CASES[table]
+    expected = _run_sql(cls(), {**staging, "dim_game": _DIM_GAME}).height
+
+    result = _run_sql(cls(), {**staging, "dim_game": _DIM_GAME.filter(pl.col("game_id") == -1)})
+
+    assert result.height == expected
+    assert result["season_year"].null_count() == expected
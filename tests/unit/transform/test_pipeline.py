@@ -219,6 +219,26 @@ class TestTransformPipeline:
         assert any(table == "fact_invalid" for table, _ in result.failed)
         conn.close()
 
+    def test_tall_outputs_are_validated_in_chunks(self, monkeypatch) -> None:
+        conn = duckdb.connect()
+        pipeline = TransformPipeline(conn, validation_chunk_rows=1)
+        pipeline.register(_TransA())
+        monkeypatch.setattr(
+            "nbadb.transform.pipeline._star_schema_map",
+            lambda: {"table_a": _ValidatedInputSchema},
+        )
+
+        outputs = pipeline.run({"raw_input": pl.DataFrame({"val": [3, 0, -1]}).lazy()})
+
+        result = pipeline.last_result
+        assert result is not None
+        assert "table_a" not in outputs
+        [(table, error)] = result.failed
+        assert table == "table_a"
+        assert error.startswith("ValidationError: table_a: 1 check(s) failed over 3 rows")
+        assert "val: greater_than failed for 2 row(s)" in error
+        conn.close()
+
     def test_pipeline_exception_continues_and_logs(self) -> None:
         """When a transformer raises, the pipeline continues and logs the failure."""
         from loguru import logger
@@ -359,3 +379,50 @@ class TestTransformPipeline:
         assert version is not None
         assert version[0] == 1
         assert version[2] == ["val", "val_a"]
+
+    def test_passthrough_reuses_staging_frame_and_skips_cache_record(
+        self,
+        duckdb_memory_with_pipeline_tables: duckdb.DuckDBPyConnection,
+    ) -> None:
+        from nbadb.transform.base import make_passthrough
+        from nbadb.transform.result_cache import TransformResultCache
+
+        conn = duckdb_memory_with_pipeline_tables
+        cache = TransformResultCache(conn)
+        pipeline = TransformPipeline(conn, cache=cache)
+        pipeline.register(make_passthrough("fact_copy", "raw_input")())
+        source = pl.DataFrame({"val": [1, 2, 3]})
+
+        outputs = pipeline.run({"raw_input": source.lazy()}, validate_output_schemas=False)
+
+        assert outputs["fact_copy"].equals(source)
+        assert set(pipeline.passthroughs) == {"fact_copy"}
+        assert pipeline.cache_keys == {}
+        assert conn.execute("SELECT COUNT(*) FROM fact_copy").fetchone()[0] == 3
+
+    def test_outputs_their_transformer_persisted_are_listed(self) -> None:
+        class _PersistedTransB(_TransB):
+            persists_output: ClassVar[bool] = True
+
+        conn = duckdb.connect()
+        pipeline = TransformPipeline(conn)
+        pipeline.register_all([_TransA(), _PersistedTransB()])
+
+        pipeline.run({"raw_input": pl.DataFrame({"val": [1]}).lazy()})
+
+        assert pipeline.persisted_tables == ["table_b"]
+        conn.close()
+
+    def test_passthrough_without_source_frame_falls_back_to_sql(self) -> None:
+        from nbadb.transform.base import make_passthrough
+
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE stg_empty (val INTEGER)")
+        pipeline = TransformPipeline(conn)
+        pipeline.register(make_passthrough("fact_empty", "stg_empty")())
+
+        outputs = pipeline.run({}, validate_output_schemas=False)
+
+        assert outputs["fact_empty"].columns == ["val"]
+        assert pipeline.passthroughs == {}
+        conn.close()
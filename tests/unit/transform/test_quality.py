@@ -3,8 +3,16 @@ from __future__ import annotations
 import hashlib
 
 import duckdb
+import pandera.polars as pa
+import polars as pl
 
+from nbadb.load.duckdb_loader import DuckDBLoader
+from nbadb.schemas.base import BaseSchema
+from nbadb.transform.pipeline import TransformPipeline
 from nbadb.transform.quality import CheckLayer, DataQualityMonitor
+from nbadb.transform.schema_version import SchemaVersionTracker, schema_hash_for_columns
+
+_EVENT_LABELS = ["foul", "timeout", "unknown"]
 
 
 def _make_monitor() -> tuple[duckdb.DuckDBPyConnection, DataQualityMonitor]:
@@ -39,6 +47,13 @@ def _make_monitor() -> tuple[duckdb.DuckDBPyConnection, DataQualityMonitor]:
     return conn, DataQualityMonitor(conn=conn)
 
 
+class _TestFactsSchema(BaseSchema):
+    game_id: str
+    player_id: int = pa.Field(gt=0, metadata={"fk_ref": "test_dims.player_id"})
+    pts: int | None = pa.Field(nullable=True, ge=0)
+    reb: int = pa.Field(ge=0)
+
+
 class TestRowCountAnomaly:
     def test_within_threshold_passes(self) -> None:
         conn, monitor = _make_monitor()
@@ -104,6 +119,47 @@ class TestNullRate:
         conn.close()
 
 
+class TestSchemaContract:
+    def test_streamed_table_passes(self) -> None:
+        conn, monitor = _make_monitor()
+        conn.execute("UPDATE test_facts SET reb = 0 WHERE reb IS NULL")
+        result = monitor.check_schema_contract("test_facts", _TestFactsSchema, chunk_rows=3)
+        assert result.passed
+        assert result.details is not None
+        assert (result.details["rows"], result.details["chunks"]) == (4, 2)
+        conn.close()
+
+    def test_null_and_orphan_rows_fail(self) -> None:
+        conn, monitor = _make_monitor()
+        result = monitor.check_schema_contract(
+            "test_facts", _TestFactsSchema, chunk_rows=3, foreign_keys=True
+        )
+        assert not result.passed
+        assert result.details is not None
+        assert {
+            (failure["column"], failure["check"]) for failure in result.details["failures"]
+        } == {("reb", "not_nullable"), ("player_id", "foreign_key(test_dims.player_id)")}
+        conn.close()
+
+    def test_loaded_tables_are_checked_against_registered_output_schemas(self, monkeypatch) -> None:
+        conn, monitor = _make_monitor()
+        conn.execute("CREATE TABLE test_broken AS SELECT 1 AS unrelated")
+        schemas = {"test_facts": _TestFactsSchema, "test_broken": _TestFactsSchema}
+        monkeypatch.setattr("nbadb.schemas.registry.get_output_schema", schemas.get)
+
+        results = monitor.check_loaded_schema_contracts(chunk_rows=3)
+
+        assert [(r.table, r.passed) for r in results] == [
+            ("test_broken", False),
+            ("test_facts", False),
+        ]
+        assert "errored" in results[0].message
+        assert results[1].details is not None
+        assert monitor.failed() == results
+        assert monitor.check_loaded_schema_contracts(["test_dims"]) == []
+        conn.close()
+
+
 class TestUniqueness:
     def test_unique_columns_pass(self) -> None:
         conn, monitor = _make_monitor()
@@ -356,6 +412,79 @@ class TestSchemaDriftWithTypes:
         conn.close()
 
 
+class TestBulkSchemaDrift:
+    def test_checks_tracked_tables_against_recorded_versions(self) -> None:
+        conn, monitor = _make_monitor()
+        conn.execute(
+            "CREATE TABLE _schema_versions (table_name VARCHAR PRIMARY KEY, version INT, "
+            "column_hash VARCHAR, columns_json VARCHAR, recorded_at TIMESTAMP)"
+        )
+        conn.execute(
+            "CREATE TABLE _schema_version_history (table_name VARCHAR, version INT, "
+            "column_hash VARCHAR, columns_json VARCHAR, recorded_at TIMESTAMP, "
+            "PRIMARY KEY (table_name, version))"
+        )
+        SchemaVersionTracker(conn).record_schemas({"t1": ["a"], "t2": ["b"]})
+
+        results = monitor.check_schema_drifts({"t1": ["a"], "t2": ["b", "c"], "t3": ["z"]})
+
+        assert [(r.table, r.passed) for r in results] == [("t1", True), ("t2", False)]
+        assert results[1].details["expected"] == schema_hash_for_columns(["b"])
+        assert results[1].details["actual"] == schema_hash_for_columns(["b", "c"])
+        conn.close()
+
+    def test_check_loaded_schema_drifts_reads_types_back_from_the_database(self) -> None:
+        conn = duckdb.connect()
+        monitor = DataQualityMonitor(conn)
+        assert monitor.check_loaded_schema_drifts() == []
+
+        _create_schema_version_tables(conn)
+        conn.execute("CREATE TABLE t1 (a BIGINT, b VARCHAR)")
+        conn.execute("CREATE TABLE t2 (a BIGINT)")
+        SchemaVersionTracker(conn).record_schemas(
+            {"t1": ["a", "b"], "t2": ["a"]},
+            table_dtypes={"t1": ["Int64", "String"], "t2": ["String"]},
+        )
+
+        results = monitor.check_loaded_schema_drifts()
+
+        assert [(r.table, r.passed) for r in results] == [("t1", True), ("t2", False)]
+        conn.close()
+
+    def test_check_loaded_schema_drifts_matches_versions_the_pipeline_records(self) -> None:
+        conn = duckdb.connect()
+        _create_schema_version_tables(conn)
+        output = pl.DataFrame(
+            {
+                "game_id": ["001", "002"],
+                "event_type_name": pl.Series(["foul", "timeout"], dtype=pl.Enum(_EVENT_LABELS)),
+                "score": [None, None],
+                "tags": [[None], [None]],
+            }
+        )
+        pipeline = TransformPipeline(conn)
+        pipeline._outputs = {"fact_events": output}
+        pipeline._record_output_schema_versions()
+        DuckDBLoader(conn).load("fact_events", output)
+
+        results = DataQualityMonitor(conn).check_loaded_schema_drifts()
+
+        assert [(r.table, r.passed) for r in results] == [("fact_events", True)]
+        conn.close()
+
+
+def _create_schema_version_tables(conn: duckdb.DuckDBPyConnection) -> None:
+    conn.execute(
+        "CREATE TABLE _schema_versions (table_name VARCHAR PRIMARY KEY, version INT, "
+        "column_hash VARCHAR, columns_json VARCHAR, recorded_at TIMESTAMP)"
+    )
+    conn.execute(
+        "CREATE TABLE _schema_version_history (table_name VARCHAR, version INT, "
+        "column_hash VARCHAR, columns_json VARCHAR, recorded_at TIMESTAMP, "
+        "PRIMARY KEY (table_name, version))"
+    )
+
+
 def _make_staging_monitor(
     stg_tables: dict[str, int],
 ) -> tuple[duckdb.DuckDBPyConnection, DataQualityMonitor]:
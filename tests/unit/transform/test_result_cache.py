@@ -0,0 +1,195 @@
+"""Tests for the cross-run transform result cache."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+import duckdb
+import polars as pl
+import pytest
+
+from nbadb.transform.base import BaseTransformer, SqlTransformer
+from nbadb.transform.pipeline import TransformPipeline
+from nbadb.transform.result_cache import (
+    TransformResultCache,
+    frame_fingerprint,
+    is_cacheable,
+    sql_hash,
+)
+
+
+class _SqlDouble(SqlTransformer):
+    output_table: ClassVar[str] = "table_double"
+    depends_on: ClassVar[list[str]] = ["raw_input"]
+    _SQL: ClassVar[str] = "SELECT val, val * 2 AS val_double FROM raw_input"
+
+
+class _SqlPlusOne(SqlTransformer):
+    output_table: ClassVar[str] = "table_plus_one"
+    depends_on: ClassVar[list[str]] = ["table_double"]
+    _SQL: ClassVar[str] = "SELECT val_double + 1 AS val_plus_one FROM table_double"
+
+
+class _PythonTransform(BaseTransformer):
+    output_table: ClassVar[str] = "table_python"
+    depends_on: ClassVar[list[str]] = ["raw_input"]
+
+    def transform(self, staging: dict[str, pl.LazyFrame]) -> pl.DataFrame:
+        return staging["raw_input"].collect()
+
+
+def _create_cache_table(conn: duckdb.DuckDBPyConnection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS _transform_cache (
+            table_name VARCHAR PRIMARY KEY,
+            cache_key VARCHAR NOT NULL,
+            row_count BIGINT,
+            hit_count BIGINT DEFAULT 0,
+            recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            content_hash VARCHAR
+        )
+    """)
+
+
+@pytest.fixture
+def cache_conn() -> duckdb.DuckDBPyConnection:
+    conn = duckdb.connect(":memory:")
+    _create_cache_table(conn)
+    yield conn
+    conn.close()
+
+
+def _run(
+    conn: duckdb.DuckDBPyConnection,
+    values: list[int],
+    *,
+    load: bool = True,
+    extra_staging: dict[str, pl.DataFrame] | None = None,
+) -> TransformPipeline:
+    """Run the pipeline, then load and record its outputs the way the orchestrator does."""
+    cache = TransformResultCache(conn)
+    pipeline = TransformPipeline(conn, cache=cache)
+    pipeline.register_all([_SqlDouble(), _SqlPlusOne(), _PythonTransform()])
+    staging = {"raw_input": pl.DataFrame({"val": values}), **(extra_staging or {})}
+    outputs = pipeline.run({key: frame.lazy() for key, frame in staging.items()})
+    if load:
+        keys = pipeline.cache_keys
+        reused = set(pipeline.last_result.cached)
+        for table, df in outputs.items():
+            if table in reused:
+                continue
+            cache.forget(table)
+            conn.register("_loading", df)
+            conn.execute(f"CREATE OR REPLACE TABLE memory.main.{table} AS SELECT * FROM _loading")
+            conn.unregister("_loading")
+            if table in keys:
+                cache.record(table, keys[table], df.height)
+    return pipeline
+
+
+class TestHelpers:
+    def test_sql_hash_ignores_whitespace(self) -> None:
+        assert sql_hash("SELECT 1\n  FROM t") == sql_hash("SELECT 1 FROM t")
+        assert sql_hash("SELECT 1 FROM t") != sql_hash("SELECT 2 FROM t")
+
+    def test_frame_fingerprint_tracks_content_and_schema(self) -> None:
+        base = pl.DataFrame({"a": [1, 2]})
+        assert frame_fingerprint(base) == frame_fingerprint(pl.DataFrame({"a": [1, 2]}))
+        assert frame_fingerprint(base) != frame_fingerprint(pl.DataFrame({"a": [1, 3]}))
+        assert frame_fingerprint(base) != frame_fingerprint(base.cast({"a": pl.Int32}))
+
+    def test_only_sql_only_transformers_are_cacheable(self) -> None:
+        assert is_cacheable(_SqlDouble())
+        assert not is_cacheable(_PythonTransform())
+
+    def test_key_requires_fingerprint_for_every_dependency(self) -> None:
+        assert TransformResultCache.key_for(_SqlDouble(), {}.get) is None
+        key = TransformResultCache.key_for(_SqlDouble(), {"raw_input": "abc"}.get)
+        assert key is not None
+        assert key != TransformResultCache.key_for(_SqlDouble(), {"raw_input": "abd"}.get)
+
+
+class TestPipelineCache:
+    def test_second_run_reuses_loaded_star_tables(self, cache_conn) -> None:
+        first = _run(cache_conn, [1, 2])
+        assert first.last_result.cached == []
+        assert first._metrics.cache_misses == 2
+
+        second = _run(cache_conn, [1, 2])
+        result = second.last_result
+        assert sorted(result.cached) == ["table_double", "table_plus_one"]
+        assert "table_python" not in result.cached
+        assert second.get_output("table_plus_one")["val_plus_one"].to_list() == [3, 5]
+        summary = second._metrics.summary()
+        assert summary["cache_hits"] == 2
+        assert summary["cache_misses"] == 0
+
+    def test_outputs_are_not_copied(self, cache_conn) -> None:
+        _run(cache_conn, [1, 2])
+
+        tables = cache_conn.execute(
+            "SELECT schema_name, table_name FROM duckdb_tables() ORDER BY table_name"
+        ).fetchall()
+        assert tables == [
+            ("main", "_transform_cache"),
+            ("main", "table_double"),
+            ("main", "table_plus_one"),
+            ("main", "table_python"),
+        ]
+
+    def test_changed_input_invalidates_downstream_chain(self, cache_conn) -> None:
+        _run(cache_conn, [1, 2])
+        rerun = _run(cache_conn, [1, 5])
+        assert rerun.last_result.cached == []
+        assert rerun.get_output("table_plus_one")["val_plus_one"].to_list() == [3, 11]
+
+    def test_unloaded_or_edited_tables_are_recomputed(self, cache_conn) -> None:
+        _run(cache_conn, [1, 2], load=False)
+        assert _run(cache_conn, [1, 2]).last_result.cached == []
+
+        cache_conn.execute("INSERT INTO memory.main.table_double VALUES (9, 18)")
+        rerun = _run(cache_conn, [1, 2])
+        assert rerun.last_result.cached == ["table_plus_one"]
+        assert rerun.get_output("table_double")["val_double"].to_list() == [2, 4]
+
+    def test_same_size_edits_are_recomputed(self, cache_conn) -> None:
+        _run(cache_conn, [1, 2])
+
+        cache_conn.execute("UPDATE memory.main.table_double SET val_double = 40 WHERE val = 2")
+        rerun = _run(cache_conn, [1, 2])
+        assert rerun.last_result.cached == ["table_plus_one"]
+        assert rerun.get_output("table_double")["val_double"].to_list() == [2, 4]
+
+    def test_hits_are_not_reloaded(self, cache_conn) -> None:
+        _run(cache_conn, [1, 2])
+        recorded = cache_conn.execute(
+            "SELECT recorded_at FROM _transform_cache WHERE table_name = 'table_plus_one'"
+        ).fetchone()
+
+        _run(cache_conn, [1, 2])
+
+        row = cache_conn.execute(
+            "SELECT recorded_at, hit_count FROM _transform_cache "
+            "WHERE table_name = 'table_plus_one'"
+        ).fetchone()
+        assert row == (recorded[0], 1)
+
+    def test_only_inputs_of_cacheable_transformers_are_fingerprinted(self, cache_conn) -> None:
+        pipeline = _run(cache_conn, [1], extra_staging={"unused": pl.DataFrame({"x": [1]})})
+
+        assert "raw_input" in pipeline._fingerprints
+        assert "unused" not in pipeline._fingerprints
+        assert "table_python" not in pipeline._fingerprints
+
+    def test_eviction_drops_records_for_retired_tables(self, cache_conn) -> None:
+        _run(cache_conn, [1])
+        cache = TransformResultCache(cache_conn)
+        assert cache.evict(active_tables=["table_double"]) == 1
+        rows = cache_conn.execute("SELECT table_name FROM _transform_cache").fetchall()
+        assert rows == [("table_double",)]
+
+    def test_missing_cache_table_is_non_fatal(self) -> None:
+        conn = duckdb.connect(":memory:")
+        pipeline = _run(conn, [4])
+        assert pipeline.get_output("table_double")["val_double"].to_list() == [8]
+        conn.close()
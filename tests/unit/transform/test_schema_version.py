@@ -106,6 +106,28 @@ class TestSchemaVersionTracker:
         assert changes[0].table_name == "t1"
         conn.close()
 
+    def test_record_schemas_batch_writes_versions_and_history(self) -> None:
+        conn = _make_conn()
+        tracker = SchemaVersionTracker(conn)
+        tracker.record_schemas({"t1": ["a"], "t2": ["x"], "t3": ["k"]})
+        changes = tracker.record_schemas({"t1": ["a", "b"], "t2": ["x"], "t3": ["j"], "t4": ["z"]})
+        assert [(c.table_name, c.new_version) for c in changes] == [("t1", 2), ("t3", 2)]
+        assert tracker.get_all_versions() == {"t1": 2, "t2": 1, "t3": 2, "t4": 1}
+        assert [h[0] for h in tracker.get_history("t3")] == [1, 2]
+        assert tracker.get_current_versions(["t1", "t4", "missing"]).keys() == {"t1", "t4"}
+        conn.close()
+
+    def test_check_for_changes_does_not_record(self) -> None:
+        conn = _make_conn()
+        tracker = SchemaVersionTracker(conn)
+        tracker.record_schema("t1", ["a"], dtypes=["Int64"])
+        changes = tracker.check_for_changes(
+            {"t1": ["a"], "t2": ["x"]}, table_dtypes={"t1": ["String"]}
+        )
+        assert [c.table_name for c in changes] == ["t1"]
+        assert tracker.get_all_versions() == {"t1": 1}
+        conn.close()
+
     def test_untracked_table_returns_none(self) -> None:
         conn = _make_conn()
         tracker = SchemaVersionTracker(conn)
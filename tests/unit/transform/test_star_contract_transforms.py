@@ -0,0 +1,241 @@
+"""Transform outputs checked against the star schemas that publish them."""
+
+from __future__ import annotations
+
+import duckdb
+import pandera.errors
+import polars as pl
+import pytest
+
+from nbadb.transform.derived.agg_all_time_leaders import AggAllTimeLeadersTransformer
+from nbadb.transform.facts.bridge_play_player import BridgePlayPlayerTransformer
+from nbadb.transform.facts.fact_matchup import FactMatchupTransformer
+from nbadb.transform.facts.fact_player_awards import FactPlayerAwardsTransformer
+from nbadb.transform.facts.fact_team_game import FactTeamGameTransformer
+from nbadb.transform.facts.fact_team_player_dashboard import (
+    FactTeamPlayerDashboardTransformer,
+)
+from nbadb.transform.pipeline import _star_schema_map
+
+# Errors output validation raises for a frame missing a required column.
+_REJECTED = (
+    pandera.errors.SchemaError,
+    pandera.errors.SchemaErrors,
+    pl.exceptions.ColumnNotFoundError,
+)
+_DIM_GAME = pl.DataFrame({"game_id": ["0022400001"], "season_year": ["2024-25"]})
+
+
+def _run_sql(transformer, tables: dict[str, pl.DataFrame]) -> pl.DataFrame:
+    conn = duckdb.connect()
+    try:
+        for name, df in tables.items():
+            conn.register(name, df)
+        transformer._conn = conn
+        return transformer.transform({})
+    finally:
+        conn.close()
+
+
+def _validate(table: str, df: pl.DataFrame) -> pl.DataFrame:
+    return _star_schema_map()[table].validate(df)
+
+
+class TestPublishedIdentifierNames:
+    """The transforms emit the names the star schemas, ER diagram and docs publish.
+
+    Under the old names output validation rejected every run, so no validated
+    warehouse ever held these tables.
+    """
+
+    def test_fact_matchup_emits_offensive_ids_as_player_and_team(self) -> None:
+        stg_matchup = pl.DataFrame(
+            {
+                "game_id": ["0022400001"],
+                "off_player_id": [201939],
+                "def_player_id": [2544],
+                "off_team_id": [1610612744],
+                "def_team_id": [1610612747],
+                "matchup_min": [6.5],
+                "partial_poss": [18.2],
+                "player_pts": [9],
+                "def_fgm": [2],
+                "def_fga": [5],
+                "def_fg_pct": [0.4],
+            }
+        )
+
+        result = _run_sql(
+            FactMatchupTransformer(), {"stg_matchup": stg_matchup, "dim_game": _DIM_GAME}
+        )
+
+        validated = _validate("fact_matchup", result)
+        assert validated.select("player_id", "team_id", "def_player_id").row(0) == (
+            201939,
+            1610612744,
+            2544,
+        )
+        legacy = result.rename({"player_id": "off_player_id", "team_id": "off_team_id"})
+        with pytest.raises(_REJECTED):
+            _validate("fact_matchup", legacy)
+
+    def test_fact_player_awards_emits_person_id_as_player_id(self) -> None:
+        stg_awards = pl.DataFrame(
+            {
+                "person_id": [2544],
+                "description": ["All-NBA"],
+                "all_nba_team_number": ["1"],
+                "season": ["2019-20"],
+            }
+        )
+
+        result = _run_sql(FactPlayerAwardsTransformer(), {"stg_player_awards": stg_awards})
+
+        validated = _validate("fact_player_awards", result)
+        assert "person_id" not in validated.columns
+        assert validated["player_id"].to_list() == [2544]
+        with pytest.raises(_REJECTED):
+            _validate("fact_player_awards", result.rename({"player_id": "person_id"}))
+
+
+class TestBridgePlayPlayerRole:
+    def test_each_slot_carries_the_role_the_schema_requires(self) -> None:
+        stg_pbp = pl.DataFrame(
+            {
+                "game_id": ["0022400001", "0022400001"],
+                "event_num": [7, 8],
+                "player1_id": [201939, 2544],
+                "player1_team_id": [1610612744, 1610612747],
+                "player2_id": [203110, None],
+                "player2_team_id": [1610612744, None],
+                "player3_id": [2544, None],
+                "player3_team_id": [1610612747, None],
+            }
+        )
+
+        result = _run_sql(BridgePlayPlayerTransformer(), {"stg_play_by_play": stg_pbp})
+
+        validated = _validate("bridge_play_player", result)
+        assert sorted(validated.select("event_num", "player_id", "player_role").rows()) == [
+            (7, 2544, "tertiary"),
+            (7, 201939, "primary"),
+            (7, 203110, "secondary"),
+            (8, 2544, "primary"),
+        ]
+        with pytest.raises(_REJECTED):
+            _validate("bridge_play_player", result.drop("player_role"))
+
+
+class TestFactTeamGamePlusMinus:
+    """analytics_team_game_complete selects ``fact_team_game.plus_minus``."""
+
+    @staticmethod
+    def _box(points_by_team: dict[int, int]) -> pl.DataFrame:
+        counting = ("fgm", "fga", "fg3m", "fg3a", "ftm", "fta", "oreb", "dreb", "reb")
+        counting += ("ast", "stl", "blk", "tov", "pf")
+        rows = len(points_by_team)
+        return pl.DataFrame(
+            {
+                "game_id": ["0022400001"] * rows,
+                "player_id": list(range(1, rows + 1)),
+                "team_id": list(points_by_team),
+                **{column: [1] * rows for column in counting},
+                "pts": list(points_by_team.values()),
+            }
+        )
+
+    def _run(self, points_by_team: dict[int, int]) -> pl.DataFrame:
+        tables = {
+            "stg_box_score_traditional": self._box(points_by_team),
+            "stg_line_score": pl.DataFrame(
+                {
+                    "game_id": ["0022400001"],
+                    "team_id": [1610612744],
+                    **{f"pts_qtr{quarter}": [28] for quarter in range(1, 5)},
+                }
+            ),
+            "dim_game": _DIM_GAME,
+        }
+        return _run_sql(FactTeamGameTransformer(), tables).sort("team_id")
+
+    def test_margin_comes_from_the_opponent_row(self) -> None:
+        result = self._run({1610612744: 112, 1610612747: 108})
+
+        validated = _validate("fact_team_game", result)
+        assert validated["plus_minus"].to_list() == [4, -4]
+
+    @pytest.mark.parametrize(
+        "points_by_team",
+        [{1610612744: 112}, {1610612744: 112, 1610612747: 108, 1610612738: 99}],
+        ids=["one_team", "three_teams"],
+    )
+    def test_margin_is_null_without_exactly_two_teams(self, points_by_team: dict[int, int]) -> None:
+        result = self._run(points_by_team)
+
+        assert result["plus_minus"].null_count() == result.height
+
+
+class TestAggAllTimeLeadersRanks:
+    """Each per-stat leaderboard carries only its own stat and rank."""
+
+    def test_leaderboard_rows_validate_with_the_other_ranks_null(self) -> None:
+        stats = [
+            table.removeprefix("stg_all_time_")
+            for table in AggAllTimeLeadersTransformer.depends_on
+            if table != "stg_all_time"
+        ]
+        tables = {
+            f"stg_all_time_{stat}": pl.DataFrame(
+                {
+                    "player_id": [2544],
+                    "player_name": ["LeBron James"],
+                    stat: [40474],
+                    f"{stat}_rank": [1],
+                }
+            )
+            for stat in stats
+        }
+        tables["stg_all_time"] = pl.DataFrame(
+            {
+                "player_id": [2544],
+                "player_name": ["LeBron James"],
+                **{column: [1] for column in ("pts_rank", "ast_rank", "reb_rank")},
+            }
+        )
+
+        result = _run_sql(AggAllTimeLeadersTransformer(), tables)
+
+        assert _validate("agg_all_time_leaders", result).height == len(tables)
+        pts_row = result.filter(pl.col("stat_category") == "pts")
+        assert pts_row.select("pts_rank", "ast_rank", "reb_rank").row(0) == (1, None, None)
+        combined = result.filter(pl.col("stat_category") == "combined")
+        assert combined.select("pts_rank", "ast_rank", "reb_rank").row(0) == (1, 1, 1)
+
+
+class TestFactTeamPlayerDashboardOverallRow:
+    """The overall packet is the team's own line, so it has no player."""
+
+    def test_overall_row_validates_without_a_player(self) -> None:
+        def packet(player_id: int | None, player_name: str | None) -> pl.DataFrame:
+            return pl.DataFrame(
+                {
+                    "season_type": ["Regular Season"],
+                    "group_set": ["Overall"],
+                    "player_id": [player_id],
+                    "player_name": [player_name],
+                    "pts": [25.1],
+                },
+                schema_overrides={"player_id": pl.Int64, "player_name": pl.String},
+            )
+
+        tables = {
+            "stg_team_player_dashboard": packet(201939, "Stephen Curry"),
+            "stg_team_player_dash_players": packet(203110, "Draymond Green"),
+            "stg_team_player_dash_overall": packet(None, None),
+        }
+
+        result = _run_sql(FactTeamPlayerDashboardTransformer(), tables)
+
+        assert _validate("fact_team_player_dashboard", result).height == 3
+        overall = result.filter(pl.col("dashboard_type") == "overall")
+        assert overall["player_id"].to_list() == [None]